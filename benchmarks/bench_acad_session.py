@@ -0,0 +1,57 @@
+"""
+Connect-per-call vs one cached AcadSession, on the fake AutoCAD server.
+
+Each "call" is what a utility does to add one line: connect-per-call
+repeats Dispatch("AutoCAD.Application"), ActiveDocument and ModelSpace
+every time; the session does them once and afterwards only probes
+ActiveDocument every --probe-ms.  Latencies mimic a cross-process COM
+call and the Dispatch/type-info cost of connecting.
+
+    python benchmarks/bench_acad_session.py -n 500 --latency-us 150 --connect-ms 5
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, "source"), os.path.join(ROOT, "source", "utils")]
+
+from acad_session import AcadSession
+from fake_acad import FakeAutoCAD
+
+
+def connect_per_call(server, n):
+    for i in range(n):
+        msp = server.connect().ActiveDocument.ModelSpace
+        msp.AddLine((i, 0, 0), (i, 1, 0))
+
+
+def with_session(server, n, probe_interval):
+    session = AcadSession(connect=server.connect, probe_interval=probe_interval)
+    for i in range(n):
+        session.model.AddLine((i, 0, 0), (i, 1, 0))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure the connect overhead a session saves")
+    parser.add_argument("-n", type=int, default=500)
+    parser.add_argument("--latency-us", type=float, default=150.0)
+    parser.add_argument("--connect-ms", type=float, default=5.0)
+    parser.add_argument("--probe-ms", type=float, default=2000.0)
+    args = parser.parse_args()
+
+    print(f"{'Mode':<18} | {'Time (ms)':>10} | {'Connects':>8} | {'Round trips':>11} | {'us / call':>10}")
+    print("-" * 70)
+    results = {}
+    for label, fn in (("connect per call", connect_per_call),
+                      ("AcadSession", lambda s, n: with_session(s, n, args.probe_ms / 1000))):
+        server = FakeAutoCAD(latency=args.latency_us / 1e6, connect_latency=args.connect_ms / 1000)
+        t0 = time.perf_counter()
+        fn(server, args.n)
+        elapsed = time.perf_counter() - t0
+        results[label] = elapsed
+        print(f"{label:<18} | {elapsed * 1000:>10.1f} | {server.connections:>8} | {server.round_trips:>11} | "
+              f"{elapsed / args.n * 1e6:>10.1f}")
+    saved = (results["connect per call"] - results["AcadSession"]) / args.n
+    print(f"\nConnect overhead saved: {saved * 1e6:.0f} us per call")
@@ -0,0 +1,61 @@
+"""
+Per-entity cost of property puts with and without bulk_edit.
+
+Runs against the AutoCAD on this machine (Windows, pywin32): draws -n
+lines on a scratch layer, then moves them to another layer and back,
+once as plain puts and once inside bulk_edit, and erases them again.
+The fake server does not model undo records or display updates, so this
+benchmark needs the real thing.
+
+    python benchmarks/bench_bulk_edit.py -n 20000
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, "source"), os.path.join(ROOT, "source", "utils")]
+
+from acad_session import get_session
+from bulk_edit import bulk_edit
+from bulk_erase import bulk_erase
+from draw_batch import DrawBatch
+from selection_filter import F, select
+
+LAYERS = ("BENCH-A", "BENCH-B")
+
+
+def move_all(entities, layer):
+    t0 = time.perf_counter()
+    for obj in entities:
+        obj.Layer = layer
+    return time.perf_counter() - t0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time property puts with and without bulk_edit")
+    parser.add_argument("-n", type=int, default=20000)
+    args = parser.parse_args()
+
+    session = get_session()
+    doc = session.doc
+    for name in LAYERS:
+        session.layers.Add(name)
+    batch = DrawBatch()
+    for i in range(args.n):
+        batch.line((i, 0), (i, 1), layer=LAYERS[0])
+    batch.run(doc)
+    entities = select(doc, F.layer == LAYERS[0])
+
+    plain = move_all(entities, LAYERS[1])
+    doc.Regen(1)
+    with bulk_edit(doc) as edit:
+        grouped = move_all(entities, LAYERS[0])
+    bulk_erase(doc, F.layer.isin(LAYERS))
+
+    print(f"{'Mode':<12} | {'Time (s)':>9} | {'us / entity':>11}")
+    print("-" * 40)
+    print(f"{'plain puts':<12} | {plain:>9.2f} | {plain / args.n * 1e6:>11.1f}")
+    print(f"{'bulk_edit':<12} | {edit.seconds:>9.2f} | {edit.seconds / args.n * 1e6:>11.1f}"
+          f"   (puts {grouped:.2f}s, regen and restore included)")
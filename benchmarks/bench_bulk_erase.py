@@ -0,0 +1,65 @@
+"""
+clear_layer's old per-object loop vs bulk_erase, on the fake AutoCAD server.
+
+The old loop walks ModelSpace, reads Layer on every entity and calls
+Delete on the matches: about three round trips per entity on the layer
+plus two per other entity.  bulk_erase selects and erases inside AutoCAD
+with a constant number of calls.
+
+    python benchmarks/bench_bulk_erase.py -n 50000 --other 5000 --latency-us 150
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, "source"), os.path.join(ROOT, "source", "utils")]
+
+from bulk_erase import bulk_erase
+from fake_acad import FakeAutoCAD
+from selection_filter import F, MODEL
+
+
+def make_server(n, other, latency):
+    server = FakeAutoCAD()
+    store = server.document
+    store.add_layer("A-DEMO")
+    for i in range(n):
+        store.add_line((i, 0), (i, 1), layer="A-DEMO")
+    for i in range(other):
+        store.add_line((i, 2), (i, 3))
+    server.latency = latency
+    return server
+
+
+def per_object(doc):
+    doomed = [obj for obj in doc.ModelSpace if obj.Layer.upper() == "A-DEMO"]
+    for obj in doomed:
+        obj.Delete()
+    return len(doomed)
+
+
+def bulk(doc):
+    report = bulk_erase(doc, (F.layer == "A-DEMO") & (F.space == MODEL),
+                        to_variants=lambda codes, values: (codes, values), to_objects=list)
+    return report.erased
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare per-object Delete with bulk_erase")
+    parser.add_argument("-n", type=int, default=50000, help="entities on the layer to clear")
+    parser.add_argument("--other", type=int, default=5000, help="entities on other layers")
+    parser.add_argument("--latency-us", type=float, default=150.0)
+    args = parser.parse_args()
+
+    print(f"{'Mode':<12} | {'Erased':>7} | {'Round trips':>11} | {'Time (s)':>9}")
+    print("-" * 50)
+    for label, fn in (("per object", per_object), ("bulk_erase", bulk)):
+        server = make_server(args.n, args.other, args.latency_us / 1e6)
+        doc = server.connect().ActiveDocument
+        server.reset_counters()
+        t0 = time.perf_counter()
+        erased = fn(doc)
+        elapsed = time.perf_counter() - t0
+        print(f"{label:<12} | {erased:>7} | {server.round_trips:>11} | {elapsed:>9.2f}")
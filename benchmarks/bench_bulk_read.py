@@ -0,0 +1,72 @@
+"""
+Bulk property reads vs attribute access on AutoCAD_Wrapper objects.
+
+Both paths run over the same IAcadLWPolyline wrappers whose _oleobj_ is a
+RecordingOle: it answers InvokeTypes from a dict, optionally sleeps to
+mimic a cross-process round trip, and counts every call.  Needs pywin32
+for DispatchBaseClass (run on the Windows workstation).
+
+    python benchmarks/bench_bulk_read.py -n 20000 --latency-us 0
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, "source"), os.path.join(ROOT, "source", "utils")]
+
+import AutoCAD_Wrapper
+from bulk_read import read_properties
+
+PROPS = ["Layer", "ObjectName", "Handle", "Area"]
+
+
+class RecordingOle:
+    """Fake _oleobj_: answers by DISPID and records each call."""
+
+    def __init__(self, values, latency, log):
+        self.values = values
+        self.latency = latency
+        self.log = log
+
+    def InvokeTypes(self, dispid, lcid, flags, ret_type, arg_types, *args):
+        self.log.append(dispid)
+        if self.latency:
+            end = time.perf_counter() + self.latency
+            while time.perf_counter() < end:
+                pass
+        return self.values[dispid]
+
+
+def make_entities(n, latency, log):
+    cls = AutoCAD_Wrapper.IAcadLWPolyline
+    get = cls._prop_map_get_
+    entities = []
+    for i in range(n):
+        values = {get["Layer"][0]: "A-GLAZ", get["ObjectName"][0]: "AcDbPolyline",
+                  get["Handle"][0]: "%X" % (0x200 + i), get["Area"][0]: float(i)}
+        entities.append(cls(RecordingOle(values, latency, log)))
+    return entities
+
+
+def attribute_loop(entities):
+    return [[getattr(e, p) for p in PROPS] for e in entities]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare bulk reads with attribute access")
+    parser.add_argument("-n", type=int, default=20000)
+    parser.add_argument("--latency-us", type=float, default=0.0)
+    args = parser.parse_args()
+
+    print(f"{'Mode':<18} | {'Time (ms)':>10} | {'Calls':>8} | {'us / entity':>11}")
+    print("-" * 56)
+    for label, fn in (("__getattr__", attribute_loop),
+                      ("read_properties", lambda ents: read_properties(ents, PROPS))):
+        log = []
+        entities = make_entities(args.n, args.latency_us / 1e6, log)
+        t0 = time.perf_counter()
+        fn(entities)
+        elapsed = time.perf_counter() - t0
+        print(f"{label:<18} | {elapsed * 1000:>10.1f} | {len(log):>8} | {elapsed / args.n * 1e6:>11.2f}")
@@ -0,0 +1,72 @@
+"""
+Building VT_ARRAY|VT_R8 coordinate arguments: per-vertex Python vs com_arrays.
+
+Times only the argument construction (what happens in Python before the
+call); pywin32's SAFEARRAY conversion happens inside the call either way.
+Runs anywhere, pywin32 not needed.
+
+    python benchmarks/bench_com_arrays.py -n 100000 1000000
+"""
+import argparse
+import array
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "source", "utils"))
+
+import numpy as np
+
+from com_arrays import BufferPool, flat_doubles
+
+
+class APoint(array.array):
+    """Same layout as pyautocad.APoint: an array('d') of x, y, z."""
+
+    def __new__(cls, x=0.0, y=0.0, z=0.0):
+        return super().__new__(cls, "d", (x, y, z))
+
+
+def timed(fn, repeat=3):
+    # Best of `repeat` for time; heap measured in a separate run.
+    best = min(_once(fn) for _ in range(repeat))
+    tracemalloc.start()
+    keep = fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del keep
+    return best, peak
+
+
+def _once(fn):
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Coordinate argument construction")
+    parser.add_argument("-n", type=int, nargs="+", default=[100000, 1000000], help="vertex counts")
+    args = parser.parse_args()
+
+    for n in args.n:
+        xy = np.random.default_rng(0).random((n, 2)) * 1000.0
+        as_tuples = [tuple(p) for p in xy.tolist()]  # what the scripts hold today
+        pool = BufferPool()
+        flat_doubles(xy, pool=pool)  # warm the pool for this shape
+
+        rows = [
+            ("APoint per vertex", lambda: [APoint(x, y) for x, y in as_tuples]),
+            ("flat tuple, Python loop", lambda: tuple(c for p in as_tuples for c in p)),
+            ("ndarray.tolist()", lambda: tuple(xy.ravel().tolist())),
+            ("flat_doubles", lambda: flat_doubles(xy)),
+            ("flat_doubles, pooled", lambda: flat_doubles(xy, pool=pool)),
+            ("flat_doubles, pad to 3D", lambda: flat_doubles(xy, dims=3)),
+        ]
+        print(f"\n{n} vertices")
+        print(f"{'Mode':<26} | {'Time (ms)':>9} | {'Peak heap (MB)':>14}")
+        print("-" * 56)
+        for label, fn in rows:
+            elapsed, peak = timed(fn)
+            print(f"{label:<26} | {elapsed * 1000:>9.2f} | {peak / 2 ** 20:>14.1f}")
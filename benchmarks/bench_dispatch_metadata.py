@@ -0,0 +1,78 @@
+"""
+Dispatch metadata: Python literals vs the mmap'd binary index.
+
+"literals" unmarshals and executes pre-compiled code (what a warm .pyc
+import pays) for every _prop_map_get_/_prop_map_put_ dict and *_vtables_ list
+of AutoCAD_Wrapper.py.  "index" opens AutoCAD_Wrapper.dispidx and decodes
+the interfaces a typical script touches.  Runs anywhere, pywin32 not needed.
+
+    python benchmarks/bench_dispatch_metadata.py
+"""
+import ast
+import marshal
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "source", "utils"))
+
+import dispatch_metadata
+from wrapper_source import WrapperSource
+
+TYPICAL = ["IAcadApplication", "IAcadDocument", "IAcadModelSpace", "IAcadPaperSpace",
+           "IAcadLayers", "IAcadLayer", "IAcadLine", "IAcadLWPolyline", "IAcadSelectionSet"]
+
+
+def literal_code(source):
+    """Marshalled code for the literal statements, as they sit in the .pyc."""
+    codes = []
+    for node in source.tree.body:
+        stmts = []
+        if isinstance(node, ast.ClassDef):
+            stmts = [s for s in node.body if isinstance(s, ast.Assign)
+                     and getattr(s.targets[0], "id", "") in ("_prop_map_get_", "_prop_map_put_")]
+        elif isinstance(node, ast.Assign) and getattr(node.targets[0], "id", "").endswith(
+                ("_vtables_", "_vtables_dispatch_")):
+            stmts = [node]
+        for s in stmts:
+            codes.append(marshal.dumps(compile(ast.Module([s], []), source.path, "exec")))
+    return codes
+
+
+def timed(fn):
+    # Time and heap are measured in separate runs: tracemalloc slows allocation.
+    t0 = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - t0
+    tracemalloc.start()
+    keep = fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del keep
+    return elapsed, peak
+
+
+def run_literals(codes):
+    ns = {"LCID": 0}
+    for code in codes:
+        exec(marshal.loads(code), ns)
+    return ns
+
+
+def run_index():
+    meta = dispatch_metadata.load_metadata()
+    return [meta[name] for name in TYPICAL]
+
+
+if __name__ == "__main__":
+    source = WrapperSource()
+    dispatch_metadata.load_metadata().close()  # build it if needed
+    codes = literal_code(source)
+
+    rows = [("literals (all interfaces)", timed(lambda: run_literals(codes))),
+            (f"index ({len(TYPICAL)} interfaces)", timed(run_index))]
+    print(f"{'Mode':<28} | {'Time (ms)':>9} | {'Peak heap (KB)':>14}")
+    print("-" * 58)
+    for label, (elapsed, peak) in rows:
+        print(f"{label:<28} | {elapsed * 1000:>9.2f} | {peak / 1024:>14.0f}")
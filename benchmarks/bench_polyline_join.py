@@ -0,0 +1,54 @@
+"""
+join_paths on a synthetic segment soup: n squares as four shuffled lines
+each, with endpoints off by up to --jitter.  Snapping and chaining are
+linear, so doubling n should roughly double both times.
+
+    python benchmarks/bench_polyline_join.py -n 25000 50000 100000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, "source"), os.path.join(ROOT, "source", "utils")]
+
+import numpy as np
+
+from polyline_join import join_paths, snap_points
+
+
+def soup(n, jitter, seed=0):
+    rng = random.Random(seed)
+    lines = []
+    for k in range(n):
+        x0, y0 = 3.0 * (k % 1000), 3.0 * (k // 1000)
+        corners = [(x0, y0), (x0 + 1, y0), (x0 + 1, y0 + 1), (x0, y0 + 1)]
+        for i in range(4):
+            p, q = corners[i], corners[(i + 1) % 4]
+            q = (q[0] + rng.uniform(-jitter, jitter), q[1] + rng.uniform(-jitter, jitter))
+            lines.append([q, p] if rng.random() < 0.5 else [p, q])
+    rng.shuffle(lines)
+    return lines
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, nargs="+", default=[25000, 50000, 100000], help="squares")
+    parser.add_argument("--jitter", type=float, default=1e-8)
+    parser.add_argument("--tol", type=float, default=1e-6)
+    args = parser.parse_args()
+
+    for n in args.n:
+        lines = soup(n, args.jitter)
+        ends = np.array([(p[0], p[-1]) for p in lines]).reshape(-1, 2)
+        t = time.perf_counter()
+        snap_points(ends, args.tol)
+        snap = time.perf_counter() - t
+        t = time.perf_counter()
+        result = join_paths(lines, args.tol)
+        total = time.perf_counter() - t
+        assert len(result.paths) == n and result.closed.all()
+        print(f"{4 * n:>8} segments: snap {snap:6.2f}s, join (snap included) {total:6.2f}s "
+              f"-> {len(result.paths)} closed rings")
@@ -0,0 +1,61 @@
+"""
+Import-time benchmark: monolithic AutoCAD_Wrapper vs AutoCAD_Wrapper_lazy
+(and AutoCAD_Wrapper_slim, once utils/shake_wrapper.py has generated it).
+
+Each measurement runs in a fresh interpreter so module caches do not leak
+between runs.  Reported per mode: median wall time to import (and then to
+touch the interfaces a typical script uses) and the peak Python heap seen
+by tracemalloc.  Needs pywin32, i.e. run it on the Windows workstation.
+
+    python benchmarks/bench_wrapper_import.py --runs 7
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SOURCE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "source")
+
+# Interfaces touched by the scripts in source/utils
+TYPICAL = ["IAcadApplication", "IAcadDocument", "IAcadModelSpace", "IAcadPaperSpace",
+           "IAcadLayers", "IAcadLayer", "IAcadLine", "IAcadLWPolyline", "IAcadSelectionSet"]
+
+PROBE = r'''
+import json, sys, time, tracemalloc
+tracemalloc.start()
+t0 = time.perf_counter()
+import win32com.client
+t1 = time.perf_counter()
+mod = __import__(sys.argv[1])
+t2 = time.perf_counter()
+for name in json.loads(sys.argv[2]):
+    getattr(mod, name, None)  # the slim build may have shaken some out
+t3 = time.perf_counter()
+print(json.dumps({"import": t2 - t1, "touch": t3 - t2, "peak": tracemalloc.get_traced_memory()[1]}))
+'''
+
+
+def measure(module, touch, runs):
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", PROBE, module, json.dumps(touch)],
+                             cwd=SOURCE_DIR, capture_output=True, text=True, check=True)
+        samples.append(json.loads(out.stdout))
+    return {key: statistics.median(s[key] for s in samples) for key in samples[0]}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare wrapper import cost")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'Module':<22} | {'Import (ms)':>11} | {'Touch (ms)':>10} | {'Peak heap (KB)':>14}")
+    print("-" * 67)
+    modules = ["AutoCAD_Wrapper", "AutoCAD_Wrapper_lazy"]
+    if os.path.exists(os.path.join(SOURCE_DIR, "AutoCAD_Wrapper_slim.py")):
+        modules.append("AutoCAD_Wrapper_slim")
+    for module in modules:
+        r = measure(module, TYPICAL, args.runs)
+        print(f"{module:<22} | {r['import'] * 1000:>11.1f} | {r['touch'] * 1000:>10.1f} | {r['peak'] / 1024:>14.0f}")
@@ -1,75 +1,199 @@
+"""
+Facade openings (windows, doors, stair glazing) as closed rectangles.
+
+    openings = facade_openings()
+    openings.rings            # (N, 5, 2) float64, closed: ring[4] == ring[0]
+    openings.meta["kind"]     # KIND_WINDOW / KIND_DOOR / KIND_STAIR per opening
+    openings.rects[0]         # [(x, y), ...] for one opening, built on access
+
+The geometry is computed for all openings at once: grid_openings() crosses
+an array of column centers with an array of sill heights and
+opening_rings() scales one unit ring by every opening's size, so a district
+study with a million openings is a handful of array operations.
+get_window_rects() and friends still return the lists of (x, y) tuples the
+drawing tools take.
+"""
 import argparse
 import math
-import cad_tools
+from collections.abc import Sequence
+
+import numpy as np
 
 # --- Constants ---
 WIDTH = 20.0
 X_INSET = 4 * math.sqrt(2)
+SILL_HEIGHTS = (2.5, 5.5, 8.5, 11.5)
 
+KIND_WINDOW, KIND_DOOR, KIND_STAIR = 0, 1, 2
+KINDS = ("window", "door", "stair")
 
-def get_col_centers():
-    return [0.5 * X_INSET, 0.5 * WIDTH, WIDTH - (0.5 * X_INSET)]
+# One row per opening; bay/level index the centers/sills it was built from
+OPENING_DTYPE = np.dtype([("kind", np.int8), ("bay", np.int32), ("level", np.int32),
+                          ("x", np.float64), ("sill", np.float64),
+                          ("width", np.float64), ("height", np.float64)])
 
+# Unit opening, centered on x = 0 and standing on y = 0: bottom left, bottom
+# right, top right, top left, bottom left again
+_UNIT_RING = np.array([[-0.5, 0.0], [0.5, 0.0], [0.5, 1.0], [-0.5, 1.0], [-0.5, 0.0]])
 
-def get_window_rects():
-    w_side = 1.0
-    centers = get_col_centers()
-    sill_heights = [2.5, 5.5, 8.5, 11.5]
-    windows = []
-    for x_c in centers:
-        for y_s in sill_heights:
-            rect = [(x_c - 0.5, y_s), (x_c + 0.5, y_s), (x_c + 0.5, y_s + 1.0), (x_c - 0.5, y_s + 1.0),
-                    (x_c - 0.5, y_s)]
-            windows.append(rect)
-    return windows
 
+def opening_rings(x, sill, width=1.0, height=1.0):
+    """(N, 5, 2) closed rings of openings centered on x, standing on sill; the arguments broadcast."""
+    x, sill, width, height = (a.ravel() for a in np.broadcast_arrays(
+        *(np.asarray(a, dtype=np.float64) for a in (x, sill, width, height))))
+    rings = np.empty((len(x), 5, 2))
+    np.multiply(_UNIT_RING[:, 0], width[:, None], out=rings[:, :, 0])
+    np.multiply(_UNIT_RING[:, 1], height[:, None], out=rings[:, :, 1])
+    rings[:, :, 0] += x[:, None]
+    rings[:, :, 1] += sill[:, None]
+    return rings
 
-def get_door_rects():
-    centers = get_col_centers()
-    doors = []
-    for x_c in centers:
-        rect = [(x_c - 0.5, 0.0), (x_c + 0.5, 0.0), (x_c + 0.5, 2.0), (x_c - 0.5, 2.0), (x_c - 0.5, 0.0)]
-        doors.append(rect)
-    return doors
 
+class RingList(Sequence):
+    """Read-only list view of a ring array: item i is ring i as a list of (x, y) tuples."""
 
-def get_stair_windows():
+    def __init__(self, rings):
+        self.rings = rings
+
+    def __len__(self):
+        return len(self.rings)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return RingList(self.rings[i])
+        return [tuple(point) for point in self.rings[i].tolist()]
+
+    def __repr__(self):
+        return f"<RingList of {len(self)} rings>"
+
+
+class Openings:
+    """rings (N, 5, 2) and meta, an (N,) OPENING_DTYPE array describing the same openings."""
+
+    def __init__(self, rings, meta):
+        self.rings = rings
+        self.meta = meta
+
+    @classmethod
+    def concat(cls, parts):
+        parts = list(parts)
+        if not parts:
+            return cls(np.empty((0, 5, 2)), np.empty(0, dtype=OPENING_DTYPE))
+        return cls(np.concatenate([p.rings for p in parts]), np.concatenate([p.meta for p in parts]))
+
+    def __len__(self):
+        return len(self.rings)
+
+    def select(self, kind):
+        """The openings of one kind (KIND_WINDOW, ... or its name)."""
+        code = KINDS.index(kind) if isinstance(kind, str) else kind
+        mask = self.meta["kind"] == code
+        return Openings(self.rings[mask], self.meta[mask])
+
+    @property
+    def rects(self):
+        return RingList(self.rings)
+
+    def tolist(self):
+        """All rings as lists of (x, y) tuples, in one conversion."""
+        points = list(zip(*self.rings.reshape(-1, 2).T.tolist()))
+        return [points[i:i + 5] for i in range(0, len(points), 5)]
+
+    def __repr__(self):
+        counts = ", ".join(f"{np.count_nonzero(self.meta['kind'] == code)} {name}"
+                           for code, name in enumerate(KINDS))
+        return f"<Openings {len(self)}: {counts}>"
+
+
+def grid_openings(kind, centers, sills, width=1.0, height=1.0):
     """
-    Generates the two tall stairwell windows.
-    Sill: 2.5, Head: 12.5 (Height = 10m)
-    X positions: X_INSET + 1.5 and WIDTH - (X_INSET + 1.5)
+    One opening per (center, sill) pair, center-major: every sill of the
+    first column, then the next column.  width/height are scalars or
+    broadcast against the (len(centers), len(sills)) grid.
     """
-    w_side = 1.0
-    y_sill = 2.5
-    y_head = 12.5
+    centers = np.asarray(centers, dtype=np.float64)
+    sills = np.asarray(sills, dtype=np.float64)
+    shape = (len(centers), len(sills))
+    x = np.repeat(centers, len(sills))
+    sill = np.tile(sills, len(centers))
+    width, height = (np.broadcast_to(np.asarray(a, dtype=np.float64), shape).ravel()
+                     for a in (width, height))
+    meta = np.empty(x.size, dtype=OPENING_DTYPE)
+    meta["kind"] = kind
+    meta["bay"] = np.repeat(np.arange(len(centers), dtype=np.int32), len(sills))
+    meta["level"] = np.tile(np.arange(len(sills), dtype=np.int32), len(centers))
+    meta["x"] = x
+    meta["sill"] = sill
+    meta["width"] = width
+    meta["height"] = height
+    return Openings(opening_rings(x, sill, width, height), meta)
 
-    # Calculate X Centers
-    x_left_stair = X_INSET + 1.5
-    x_right_stair = WIDTH - (X_INSET + 1.5)
 
-    stair_centers = [x_left_stair, x_right_stair]
-    stair_windows = []
+def get_col_centers():
+    return [0.5 * X_INSET, 0.5 * WIDTH, WIDTH - (0.5 * X_INSET)]
 
-    for x_c in stair_centers:
-        rect = [
-            (x_c - 0.5, y_sill),  # Bottom Left
-            (x_c + 0.5, y_sill),  # Bottom Right
-            (x_c + 0.5, y_head),  # Top Right
-            (x_c - 0.5, y_head),  # Top Left
-            (x_c - 0.5, y_sill)  # Close
-        ]
-        stair_windows.append(rect)
-    return stair_windows
+
+def get_stair_centers():
+    return [X_INSET + 1.5, WIDTH - (X_INSET + 1.5)]
+
+
+def window_openings():
+    return grid_openings(KIND_WINDOW, get_col_centers(), SILL_HEIGHTS, 1.0, 1.0)
+
+
+def door_openings():
+    return grid_openings(KIND_DOOR, get_col_centers(), [0.0], 1.0, 2.0)
+
+
+def stair_openings():
+    """The two tall stairwell windows: sill 2.5, head 12.5 (10m high)."""
+    return grid_openings(KIND_STAIR, get_stair_centers(), [2.5], 1.0, 10.0)
+
+
+def facade_openings():
+    return Openings.concat([window_openings(), door_openings(), stair_openings()])
+
+
+def get_window_rects():
+    return window_openings().tolist()
+
+
+def get_door_rects():
+    return door_openings().tolist()
+
+
+def get_stair_windows():
+    return stair_openings().tolist()
 
 
 if __name__ == "__main__":
+    import cad_tools
+
     parser = argparse.ArgumentParser(description="Full Facade Generator")
     parser.add_argument("--draw", action="store_true")
     parser.add_argument("--send", action="store_true")
     parser.add_argument("--clear", type=str)
+    parser.add_argument("--mode", choices=("polyline", "lines", "blocks"), default="polyline",
+                        help="how --send draws: polylines, lines per edge, or block references")
+    parser.add_argument("--spec", help="build from a JSON/TOML facade spec (see facade_spec)")
+    parser.add_argument("--cache", default=".facade_cache", help="geometry cache for --spec")
 
     args = parser.parse_args()
 
+    if args.spec:
+        from facade_spec import GeometryCache, build_facade, load_spec
+
+        layers = build_facade(load_spec(args.spec), GeometryCache(args.cache)).by_layer()
+        if args.clear:
+            cad_tools.clear_layer(args.clear)
+        if args.draw:
+            cad_tools.plot_on_screen([r for rings in layers.values() for r in rings],
+                                     title="Facade Preview: " + args.spec)
+        if args.send:
+            for layer, rings in layers.items():
+                cad_tools.send_to_autocad(rings, layer_name=layer, mode=args.mode)
+        raise SystemExit
+
     # Calculate All Geometry
     windows = get_window_rects()
     doors = get_door_rects()
@@ -89,4 +213,4 @@ if __name__ == "__main__":
         # Layer 2: Doors
         # cad_tools.send_to_autocad(doors, layer_name="A-DOOR")
         # Layer 3: Stairwell Windows
-        cad_tools.send_to_autocad(stair_glaz, layer_name="A-STAIR-GLAZ")
\ No newline at end of file
+        cad_tools.send_to_autocad(stair_glaz, layer_name="A-STAIR-GLAZ", mode=args.mode)
@@ -0,0 +1,271 @@
+"""
+Facades described as data (JSON or TOML) and built through an on-disk cache.
+
+    spec = load_spec("facade.json")
+    cache = GeometryCache(".facade_cache", max_bytes=256 * 2**20)
+    facade = build_facade(spec, cache)
+    facade.openings                  # facade_builder.Openings, all parts
+    for part in facade.parts: part.name, part.layer, part.openings
+
+A spec has column centers (``bays``), sill heights (``levels``), opening
+types and stair cores:
+
+    {
+      "bays": [2.83, 10.0, 17.17],
+      "levels": {"start": 2.5, "spacing": 3.0, "count": 4},
+      "openings": [
+        {"name": "window", "width": 1.0, "height": 1.0, "layer": "A-GLAZ"},
+        {"name": "door", "kind": "door", "sill": 0.0, "width": 1.0, "height": 2.0,
+         "bays": [1], "layer": "A-DOOR"}
+      ],
+      "stair_cores": [{"x": 7.16, "sill": 2.5, "head": 12.5, "layer": "A-STAIR-GLAZ"}]
+    }
+
+An opening type goes on every bay and level unless ``bays``/``levels``
+list the indices it uses; ``sill`` puts it on one height instead of the
+levels.  Every opening type and stair core is a part, built separately
+and cached under the hash of what it was built from (its resolved
+centers, sills and sizes), so a sweep over variants only rebuilds the
+parts whose inputs changed.  The cache keeps the most recently used
+builds up to ``max_bytes`` and deletes the oldest beyond that.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import time
+import tomllib
+import zipfile
+from collections import namedtuple
+
+import numpy as np
+
+import facade_builder as fb
+
+ENGINE_VERSION = 1  # part of every cache key; bump when the geometry code changes
+
+Part = namedtuple("Part", "name kind layer openings key")
+
+
+class Facade:
+    def __init__(self, parts):
+        self.parts = parts
+
+    @property
+    def openings(self):
+        return fb.Openings.concat(part.openings for part in self.parts)
+
+    def by_layer(self):
+        """layer -> list of rings as (x, y) tuples, the input send_to_autocad takes."""
+        layers = {}
+        for part in self.parts:
+            layers.setdefault(part.layer, []).extend(part.openings.tolist())
+        return layers
+
+
+# --- spec ---
+
+def load_spec(path):
+    """Read a spec from a .toml or .json file."""
+    with open(path, "rb") as f:
+        if path.lower().endswith(".toml"):
+            return tomllib.load(f)
+        return json.load(f)
+
+
+def spec_hash(spec):
+    """Content hash of a spec: key order and 1 vs 1.0 do not change it."""
+    return _digest(_canonical(spec))
+
+
+def _canonical(value):
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return value
+
+
+def _digest(value):
+    text = json.dumps([ENGINE_VERSION, value], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _values(spec, key):
+    value = spec.get(key)
+    if isinstance(value, dict):
+        try:
+            return [value["start"] + i * value["spacing"] for i in range(int(value["count"]))]
+        except KeyError as e:
+            raise ValueError(f"{key}: a range needs start, spacing and count (missing {e})") from None
+    if not isinstance(value, list):
+        raise ValueError(f"{key} must be a list of numbers or a start/spacing/count range")
+    return [float(v) for v in value]
+
+
+def _indices(entry, key, count):
+    chosen = entry.get(key)
+    if chosen is None:
+        return list(range(count))
+    bad = [i for i in chosen if not 0 <= i < count]
+    if bad:
+        raise ValueError(f"{entry.get('name', 'opening')}: {key} {bad} out of range (have {count})")
+    return list(chosen)
+
+
+def _kind(entry):
+    kind = entry.get("kind", "window")
+    if kind not in fb.KINDS:
+        raise ValueError(f"{entry.get('name', 'opening')}: unknown kind {kind!r} (kinds: {', '.join(fb.KINDS)})")
+    return kind
+
+
+def plan_parts(spec):
+    """
+    The parts of a spec as (name, kind, layer, inputs) with inputs the
+    resolved arguments of the build: what the cache key is computed from.
+    """
+    centers = _values(spec, "bays")
+    sills = _values(spec, "levels") if "levels" in spec else []
+    plans = []
+    for n, entry in enumerate(spec.get("openings", [])):
+        name = entry.get("name", f"opening-{n}")
+        bays = _indices(entry, "bays", len(centers))
+        if "sill" in entry:
+            levels, heights = [0], [float(entry["sill"])]
+        else:
+            levels = _indices(entry, "levels", len(sills))
+            heights = [sills[i] for i in levels]
+        inputs = {"kind": _kind(entry), "centers": [centers[i] for i in bays], "bays": bays,
+                  "sills": heights, "levels": levels,
+                  "width": float(entry.get("width", 1.0)), "height": float(entry.get("height", 1.0))}
+        plans.append((name, inputs["kind"], entry.get("layer", "0"), inputs))
+    for n, core in enumerate(spec.get("stair_cores", [])):
+        try:
+            x, sill, head = float(core["x"]), float(core["sill"]), float(core["head"])
+        except KeyError as e:
+            raise ValueError(f"stair_cores[{n}] needs x, sill and head (missing {e})") from None
+        inputs = {"kind": "stair", "centers": [x], "bays": [n], "sills": [sill], "levels": [0],
+                  "width": float(core.get("width", 1.0)), "height": head - sill}
+        plans.append((core.get("name", f"stair-{n}"), "stair", core.get("layer", "0"), inputs))
+    return plans
+
+
+def _build_part(inputs):
+    openings = fb.grid_openings(fb.KINDS.index(inputs["kind"]), inputs["centers"], inputs["sills"],
+                                inputs["width"], inputs["height"])
+    # grid_openings numbers the bays/levels it was given; store the spec's indices
+    openings.meta["bay"] = np.asarray(inputs["bays"], dtype=np.int32)[openings.meta["bay"]]
+    openings.meta["level"] = np.asarray(inputs["levels"], dtype=np.int32)[openings.meta["level"]]
+    return openings
+
+
+def build_facade(spec, cache=None):
+    """Facade of spec; parts already in cache (a GeometryCache) are loaded, not rebuilt."""
+    parts = []
+    for name, kind, layer, inputs in plan_parts(spec):
+        key = _digest(inputs)
+        openings = cache.get(key) if cache is not None else None
+        if openings is None:
+            openings = _build_part(inputs)
+            if cache is not None:
+                cache.put(key, openings)
+        parts.append(Part(name, kind, layer, openings, key))
+    return Facade(parts)
+
+
+# --- cache ---
+
+class GeometryCache:
+    """
+    Built Openings stored as <key>.npz files under directory.  A hit
+    refreshes the file's time; put() evicts the least recently used files
+    while the total size is over max_bytes.
+    """
+
+    def __init__(self, directory, max_bytes=64 * 2**20):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".npz")
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with np.load(path) as data:
+                openings = fb.Openings(data["rings"], data["meta"])
+        except (OSError, KeyError, ValueError, EOFError, zipfile.BadZipFile):
+            self.misses += 1  # absent, or a partial/corrupt file: rebuild and overwrite it
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return openings
+
+    def put(self, key, openings):
+        fd, tmp = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, rings=openings.rings, meta=openings.meta)
+            os.replace(tmp, self._path(key))  # readers never see a half-written file
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self.evict()
+
+    def _entries(self):
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(".npz"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        return entries
+
+    def size(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """Delete the least recently used builds until the cache fits max_bytes."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            self.evictions += 1
+
+    def clear(self):
+        for _, _, path in self._entries():
+            os.unlink(path)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build a facade spec through the geometry cache")
+    parser.add_argument("spec")
+    parser.add_argument("--cache", default=".facade_cache")
+    parser.add_argument("--max-mb", type=float, default=64)
+    args = parser.parse_args()
+
+    cache = GeometryCache(args.cache, int(args.max_mb * 2**20))
+    t = time.perf_counter()
+    facade = build_facade(load_spec(args.spec), cache)
+    print(f"{facade.openings!r} in {(time.perf_counter() - t) * 1000:.1f} ms "
+          f"({cache.hits} parts cached, {cache.misses} built)")
+    for part in facade.parts:
+        print(f"  {part.name:<12} {part.layer:<14} {len(part.openings):>6} openings  {part.key[:12]}")
@@ -0,0 +1,137 @@
+"""
+AutoCAD type-library constants, grouped by enum.
+
+makepy flattens the 146 enums of acax25enu.tlb into one 898-attribute
+``constants`` class.  Here each enum is its own group, built from the
+packed strings in AutoCAD_Wrapper_index.py only when first touched, with
+O(1) lookups both ways:
+
+    from AutoCAD_Constants import AcColor
+    AcColor.acRed              # 1
+    AcColor.name_of(7)         # 'acWhite'
+    AcColor[256]               # 'acByLayer'
+
+The flat spelling keeps working through ``constants`` (a lazy mapping that
+AutoCAD_Wrapper_lazy hands to win32com instead of a 900-entry dict):
+
+    from AutoCAD_Constants import constants
+    constants.acRed            # 1
+"""
+import AutoCAD_Wrapper_index as _index
+
+_groups = {}
+_member_to_enum = None
+
+
+class EnumGroup:
+    """Members of one type-library enum, with forward and reverse lookup."""
+
+    def __init__(self, name, packed):
+        self.name = name
+        self._by_name = {}
+        self._by_value = {}
+        for item in packed.split():
+            member, value = item.split("=")
+            value = int(value)
+            self._by_name[member] = value
+            # AcSaveAsType aliases values (ac2000_dwg / acR15_dwg ...); keep the first name.
+            self._by_value.setdefault(value, member)
+
+    def __getattr__(self, member):
+        if member.startswith("_"):
+            raise AttributeError(member)
+        try:
+            return self._by_name[member]
+        except KeyError:
+            raise AttributeError(f"{self.name} has no member {member!r}") from None
+
+    def __getitem__(self, value):
+        """Reverse lookup: value -> member name."""
+        return self._by_value[value]
+
+    def name_of(self, value, default=None):
+        """Member name for value, or default when the value is not in the enum."""
+        return self._by_value.get(value, default)
+
+    def names_of(self, value):
+        """All member names carrying value (aliases included)."""
+        return [m for m, v in self._by_name.items() if v == value]
+
+    def __contains__(self, member):
+        return member in self._by_name
+
+    def __iter__(self):
+        return iter(self._by_name)
+
+    def __len__(self):
+        return len(self._by_name)
+
+    def items(self):
+        return self._by_name.items()
+
+    def __repr__(self):
+        return f"<EnumGroup {self.name}: {len(self._by_name)} members>"
+
+
+def enum(name):
+    """The EnumGroup called name (e.g. 'AcColor'), built on first use."""
+    group = _groups.get(name)
+    if group is None:
+        group = _groups[name] = EnumGroup(name, _index.ENUMS[name])
+    return group
+
+
+def enum_names():
+    return list(_index.ENUMS)
+
+
+def enum_of(member):
+    """Name of the enum that defines member, e.g. 'acRed' -> 'AcColor'."""
+    global _member_to_enum
+    if _member_to_enum is None:
+        # Built once, on the first flat lookup: member names only, no values.
+        _member_to_enum = {}
+        for enum_name, packed in _index.ENUMS.items():
+            for item in packed.split():
+                _member_to_enum[item[:item.index("=")]] = enum_name
+    return _member_to_enum[member]
+
+
+def built_groups():
+    """Names of the enum groups materialized so far."""
+    return sorted(_groups)
+
+
+class _FlatConstants:
+    """
+    Flat view over every enum, shaped like makepy's ``constants`` class.
+
+    Also implements the two mapping operations win32com.client.constants
+    uses on the dicts in its ``__dicts__`` chain (``in`` and ``[]``), so it
+    can sit in that chain without being materialized.
+    """
+
+    def __getattr__(self, member):
+        try:
+            return self[member]
+        except KeyError:
+            raise AttributeError(member) from None
+
+    def __getitem__(self, member):
+        return getattr(enum(enum_of(member)), member)
+
+    def __contains__(self, member):
+        try:
+            enum_of(member)
+        except KeyError:
+            return False
+        return True
+
+
+constants = _FlatConstants()
+
+
+def __getattr__(name):
+    if name in _index.ENUMS:
+        return enum(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
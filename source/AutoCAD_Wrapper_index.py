@@ -0,0 +1,1503 @@
+# Generated by utils/build_lazy_wrapper.py from AutoCAD_Wrapper.py - do not edit.
+# Offsets are byte positions into the wrapper; rebuild after re-running makepy.
+WRAPPER_SIZE = 1811726
+PREAMBLE_SPAN = (258, 817, 7)
+
+# name -> (start, end, lineno, kind, deps)
+CLASS_SPANS = {'Acad3DFace': (1184865, 1185091, 24006, 'coclass', ('IAcad3DFace',)),
+ 'Acad3DPolyline': (1185093, 1185335, 24016, 'coclass', ('IAcad3DPolyline',)),
+ 'Acad3DSolid': (1185337, 1185567, 24026, 'coclass', ('IAcad3DSolid',)),
+ 'AcadAcCmColor': (1185628, 1185867, 24037, 'coclass', ('IAcadAcCmColor',)),
+ 'AcadApplication': (1185930, 1186257, 24048, 'coclass', ('IAcadApplication', '_DAcadApplicationEvents')),
+ 'AcadApplicationMinorVersion1': (1186322, 1186650, 24061, 'coclass', ('IAcadApplication', '_DAcadApplicationEvents')),
+ 'AcadArc': (1186652, 1186866, 24073, 'coclass', ('IAcadArc',)),
+ 'AcadAttribute': (1186868, 1187106, 24083, 'coclass', ('IAcadAttribute',)),
+ 'AcadAttributeReference': (1187108, 1187383, 24093, 'coclass', ('IAcadAttributeReference',)),
+ 'AcadBlock': (1187385, 1187644, 24103, 'coclass', ('IAcadBlock',)),
+ 'AcadBlockReference': (1187646, 1187905, 24113, 'coclass', ('IAcadBlockReference',)),
+ 'AcadBlocks': (1187907, 1188155, 24123, 'coclass', ('IAcadBlocks',)),
+ 'AcadCircle': (1188157, 1188383, 24133, 'coclass', ('IAcadCircle',)),
+ 'AcadComparedReference': (1188385, 1188656, 24143, 'coclass', ('IAcadComparedReference',)),
+ 'AcadDatabase': (1188658, 1188898, 24153, 'coclass', ('IAcadDatabase',)),
+ 'AcadDatabasePreferences': (1188900, 1189211, 24163, 'coclass', ('IAcadDatabasePreferences',)),
+ 'AcadDgnUnderlay': (1189213, 1189423, 24173, 'coclass', ('IAcadUnderlay',)),
+ 'AcadDictionaries': (1189425, 1189697, 24182, 'coclass', ('IAcadDictionaries',)),
+ 'AcadDictionary': (1189699, 1189969, 24192, 'coclass', ('IAcadDictionary',)),
+ 'AcadDim3PointAngular': (1189971, 1190244, 24202, 'coclass', ('IAcadDim3PointAngular',)),
+ 'AcadDimAligned': (1190246, 1190495, 24212, 'coclass', ('IAcadDimAligned',)),
+ 'AcadDimAngular': (1190497, 1190746, 24222, 'coclass', ('IAcadDimAngular',)),
+ 'AcadDimArcLength': (1190748, 1191006, 24232, 'coclass', ('IAcadDimArcLength',)),
+ 'AcadDimDiametric': (1191008, 1191253, 24242, 'coclass', ('IAcadDimDiametric',)),
+ 'AcadDimOrdinate': (1191255, 1191508, 24252, 'coclass', ('IAcadDimOrdinate',)),
+ 'AcadDimRadial': (1191510, 1191755, 24262, 'coclass', ('IAcadDimRadial',)),
+ 'AcadDimRadialLarge': (1191757, 1192017, 24272, 'coclass', ('IAcadDimRadialLarge',)),
+ 'AcadDimRotated': (1192019, 1192268, 24282, 'coclass', ('IAcadDimRotated',)),
+ 'AcadDimStyle': (1192270, 1192556, 24292, 'coclass', ('IAcadDimStyle',)),
+ 'AcadDimStyles': (1192558, 1192825, 24302, 'coclass', ('IAcadDimStyles',)),
+ 'AcadDimension': (1192827, 1193060, 24312, 'coclass', ('IAcadDimension',)),
+ 'AcadDocument': (1193062, 1193354, 24322, 'coclass', ('IAcadDocument', '_DAcadDocumentEvents')),
+ 'AcadDocuments': (1193356, 1193636, 24334, 'coclass', ('IAcadDocuments',)),
+ 'AcadDwfUnderlay': (1193638, 1193868, 24344, 'coclass', ('IAcadDwfUnderlay', 'IAcadUnderlay')),
+ 'AcadDynamicBlockReferenceProperty': (1193870, 1194181, 24354, 'coclass', ('IAcadDynamicBlockReferenceProperty',)),
+ 'AcadEllipse': (1194183, 1194413, 24364, 'coclass', ('IAcadEllipse',)),
+ 'AcadEntity': (1194415, 1194636, 24374, 'coclass', ('IAcadEntity',)),
+ 'AcadExternalReference': (1194638, 1194909, 24384, 'coclass', ('IAcadExternalReference',)),
+ 'AcadExtrudedSurface': (1194911, 1195174, 24394, 'coclass', ('IAcadExtrudedSurface',)),
+ 'AcadGeoPositionMarker': (1195176, 1195434, 24404, 'coclass', ('IAcadGeoPositionMarker',)),
+ 'AcadGeomapImage': (1195436, 1195683, 24414, 'coclass', ('IAcadGeomapImage',)),
+ 'AcadGroup': (1195685, 1195914, 24424, 'coclass', ('IAcadGroup',)),
+ 'AcadGroups': (1195916, 1196164, 24434, 'coclass', ('IAcadGroups',)),
+ 'AcadHatch': (1196166, 1196388, 24444, 'coclass', ('IAcadHatch',)),
+ 'AcadHelix': (1196390, 1196612, 24454, 'coclass', ('IAcadHelix',)),
+ 'AcadHyperlink': (1196614, 1196853, 24464, 'coclass', ('IAcadHyperlink',)),
+ 'AcadHyperlinks': (1196855, 1197123, 24474, 'coclass', ('IAcadHyperlinks',)),
+ 'AcadIdPair': (1197125, 1197454, 24484, 'coclass', ('IAcadIdPair',)),
+ 'AcadLWPolyline': (1197456, 1197708, 24494, 'coclass', ('IAcadLWPolyline',)),
+ 'AcadLayer': (1197710, 1197992, 24504, 'coclass', ('IAcadLayer',)),
+ 'AcadLayerStateManager': (1198065, 1198330, 24515, 'coclass', ('IAcadLayerStateManager',)),
+ 'AcadLayers': (1198332, 1198580, 24525, 'coclass', ('IAcadLayers',)),
+ 'AcadLayout': (1198582, 1198864, 24535, 'coclass', ('IAcadLayout',)),
+ 'AcadLayouts': (1198866, 1199118, 24545, 'coclass', ('IAcadLayouts',)),
+ 'AcadLeader': (1199120, 1199346, 24555, 'coclass', ('IAcadLeader',)),
+ 'AcadLine': (1199348, 1199566, 24565, 'coclass', ('IAcadLine',)),
+ 'AcadLineType': (1199568, 1199858, 24575, 'coclass', ('IAcadLineType',)),
+ 'AcadLineTypes': (1199860, 1200120, 24585, 'coclass', ('IAcadLineTypes',)),
+ 'AcadLoftedSurface': (1200122, 1200377, 24595, 'coclass', ('IAcadLoftedSurface',)),
+ 'AcadMInsertBlock': (1200379, 1200629, 24605, 'coclass', ('IAcadMInsertBlock',)),
+ 'AcadMLeader': (1200631, 1200866, 24615, 'coclass', ('IAcadMLeader',)),
+ 'AcadMLeaderLeader': (1200868, 1201139, 24625, 'coclass', ('IAcadMLeaderLeader',)),
+ 'AcadMLeaderStyle': (1201141, 1201391, 24635, 'coclass', ('IAcadMLeaderStyle',)),
+ 'AcadMLine': (1201393, 1201615, 24645, 'coclass', ('IAcadMLine',)),
+ 'AcadMText': (1201617, 1201839, 24655, 'coclass', ('IAcadMText',)),
+ 'AcadMaterial': (1201841, 1202087, 24665, 'coclass', ('IAcadMaterial',)),
+ 'AcadMaterials': (1202089, 1202299, 24675, 'coclass', ('IAcadMaterials',)),
+ 'AcadMenuBar': (1202301, 1202584, 24684, 'coclass', ('IAcadMenuBar',)),
+ 'AcadMenuGroup': (1202586, 1202821, 24694, 'coclass', ('IAcadMenuGroup',)),
+ 'AcadMenuGroups': (1202823, 1203144, 24704, 'coclass', ('IAcadMenuGroups',)),
+ 'AcadModelSpace': (1203146, 1203421, 24714, 'coclass', ('IAcadModelSpace',)),
+ 'AcadNurbSurface': (1203423, 1203671, 24724, 'coclass', ('IAcadNurbSurface',)),
+ 'AcadObject': (1203673, 1203927, 24734, 'coclass', ('IAcadObject',)),
+ 'AcadOle': (1203929, 1204143, 24744, 'coclass', ('IAcadOle',)),
+ 'AcadPViewport': (1204145, 1204393, 24754, 'coclass', ('IAcadPViewport',)),
+ 'AcadPaperSpace': (1204395, 1204695, 24764, 'coclass', ('IAcadPaperSpace',)),
+ 'AcadPdfUnderlay': (1204697, 1204907, 24774, 'coclass', ('IAcadUnderlay',)),
+ 'AcadPlaneSurface': (1204909, 1205160, 24783, 'coclass', ('IAcadPlaneSurface',)),
+ 'AcadPlot': (1205162, 1205420, 24793, 'coclass', ('IAcadPlot',)),
+ 'AcadPlotConfiguration': (1205422, 1205695, 24803, 'coclass', ('IAcadPlotConfiguration',)),
+ 'AcadPlotConfigurations': (1205697, 1205973, 24813, 'coclass', ('IAcadPlotConfigurations',)),
+ 'AcadPoint': (1205975, 1206197, 24823, 'coclass', ('IAcadPoint',)),
+ 'AcadPointCloud': (1206199, 1206442, 24833, 'coclass', ('IAcadPointCloud',)),
+ 'AcadPointCloudEx': (1206444, 1206695, 24843, 'coclass', ('IAcadPointCloudEx2',)),
+ 'AcadPolyfaceMesh': (1206697, 1206947, 24853, 'coclass', ('IAcadPolyfaceMesh',)),
+ 'AcadPolygonMesh': (1206949, 1207195, 24863, 'coclass', ('IAcadPolygonMesh',)),
+ 'AcadPolyline': (1207197, 1207431, 24873, 'coclass', ('IAcadPolyline',)),
+ 'AcadPopupMenu': (1207433, 1207672, 24883, 'coclass', ('IAcadPopupMenu',)),
+ 'AcadPopupMenuItem': (1207674, 1207947, 24893, 'coclass', ('IAcadPopupMenuItem',)),
+ 'AcadPopupMenus': (1207949, 1208256, 24903, 'coclass', ('IAcadPopupMenus',)),
+ 'AcadPreferences': (1208258, 1208528, 24913, 'coclass', ('IAcadPreferences',)),
+ 'AcadPreferencesDisplay': (1208530, 1208846, 24923, 'coclass', ('IAcadPreferencesDisplay',)),
+ 'AcadPreferencesDrafting': (1208848, 1209168, 24933, 'coclass', ('IAcadPreferencesDrafting',)),
+ 'AcadPreferencesFiles': (1209170, 1209478, 24943, 'coclass', ('IAcadPreferencesFiles',)),
+ 'AcadPreferencesOpenSave': (1209480, 1209805, 24953, 'coclass', ('IAcadPreferencesOpenSave',)),
+ 'AcadPreferencesOutput': (1209807, 1210119, 24963, 'coclass', ('IAcadPreferencesOutput',)),
+ 'AcadPreferencesProfiles': (1210121, 1210441, 24973, 'coclass', ('IAcadPreferencesProfiles',)),
+ 'AcadPreferencesSelection': (1210443, 1210767, 24983, 'coclass', ('IAcadPreferencesSelection',)),
+ 'AcadPreferencesSystem': (1210769, 1211081, 24993, 'coclass', ('IAcadPreferencesSystem',)),
+ 'AcadPreferencesUser': (1211083, 1211387, 25003, 'coclass', ('IAcadPreferencesUser',)),
+ 'AcadRasterImage': (1211389, 1211630, 25013, 'coclass', ('IAcadRasterImage',)),
+ 'AcadRay': (1211632, 1211846, 25023, 'coclass', ('IAcadRay',)),
+ 'AcadRegion': (1211848, 1212074, 25033, 'coclass', ('IAcadRegion',)),
+ 'AcadRegisteredApplication': (1212076, 1212384, 25043, 'coclass', ('IAcadRegisteredApplication',)),
+ 'AcadRegisteredApplications': (1212386, 1212699, 25053, 'coclass', ('IAcadRegisteredApplications',)),
+ 'AcadRevolvedSurface': (1212701, 1212964, 25063, 'coclass', ('IAcadRevolvedSurface',)),
+ 'AcadSection': (1212966, 1213198, 25073, 'coclass', ('IAcadSection2',)),
+ 'AcadSectionManager': (1213200, 1213459, 25083, 'coclass', ('IAcadSectionManager',)),
+ 'AcadSectionSettings': (1213461, 1213724, 25093, 'coclass', ('IAcadSectionSettings',)),
+ 'AcadSectionTypeSettings': (1213726,
+                             1214036,
+                             25103,
+                             'coclass',
+                             ('IAcadSectionTypeSettings', 'IAcadSectionTypeSettings2')),
+ 'AcadSecurityParams': (1214102, 1214357, 25115, 'coclass', ('IAcadSecurityParams',)),
+ 'AcadSelectionSet': (1214359, 1214662, 25125, 'coclass', ('IAcadSelectionSet',)),
+ 'AcadSelectionSets': (1214664, 1214941, 25135, 'coclass', ('IAcadSelectionSets',)),
+ 'AcadShape': (1214943, 1215165, 25145, 'coclass', ('IAcadShape',)),
+ 'AcadSolid': (1215167, 1215389, 25155, 'coclass', ('IAcadSolid',)),
+ 'AcadSortentsTable': (1215391, 1215649, 25165, 'coclass', ('IAcadSortentsTable',)),
+ 'AcadSpline': (1215651, 1215877, 25175, 'coclass', ('IAcadSpline',)),
+ 'AcadState': (1215879, 1216101, 25185, 'coclass', ('IAcadState',)),
+ 'AcadSubDMesh': (1216103, 1216337, 25195, 'coclass', ('IAcadSubDMesh',)),
+ 'AcadSubDMeshEdge': (1216339, 1216590, 25205, 'coclass', ('IAcadSubDMeshEdge',)),
+ 'AcadSubDMeshFace': (1216592, 1216843, 25215, 'coclass', ('IAcadSubDMeshFace',)),
+ 'AcadSubDMeshVertex': (1216845, 1217104, 25225, 'coclass', ('IAcadSubDMeshVertex',)),
+ 'AcadSubEntSolidEdge': (1217106, 1217363, 25235, 'coclass', ('IAcadSubEntSolidEdge',)),
+ 'AcadSubEntSolidFace': (1217365, 1217622, 25245, 'coclass', ('IAcadSubEntSolidFace',)),
+ 'AcadSubEntSolidNode': (1217624, 1217881, 25255, 'coclass', ('IAcadSubEntSolidNode',)),
+ 'AcadSubEntSolidVertex': (1217883, 1218148, 25265, 'coclass', ('IAcadSubEntSolidVertex',)),
+ 'AcadSubEntity': (1218150, 1218383, 25275, 'coclass', ('IAcadSubEntity',)),
+ 'AcadSummaryInfo': (1218385, 1218626, 25285, 'coclass', ('IAcadSummaryInfo',)),
+ 'AcadSurface': (1218628, 1218858, 25295, 'coclass', ('IAcadSurface',)),
+ 'AcadSweptSurface': (1218860, 1219111, 25305, 'coclass', ('IAcadSweptSurface',)),
+ 'AcadTable': (1219113, 1219335, 25315, 'coclass', ('IAcadTable',)),
+ 'AcadTableStyle': (1219337, 1219583, 25325, 'coclass', ('IAcadTableStyle',)),
+ 'AcadText': (1219585, 1219803, 25335, 'coclass', ('IAcadText',)),
+ 'AcadTextStyle': (1219805, 1220106, 25345, 'coclass', ('IAcadTextStyle',)),
+ 'AcadTextStyles': (1220108, 1220373, 25355, 'coclass', ('IAcadTextStyles',)),
+ 'AcadTolerance': (1220375, 1220613, 25365, 'coclass', ('IAcadTolerance',)),
+ 'AcadToolbar': (1220615, 1220841, 25375, 'coclass', ('IAcadToolbar',)),
+ 'AcadToolbarItem': (1220843, 1221105, 25385, 'coclass', ('IAcadToolbarItem',)),
+ 'AcadToolbars': (1221107, 1221417, 25395, 'coclass', ('IAcadToolbars',)),
+ 'AcadTrace': (1221419, 1221641, 25405, 'coclass', ('IAcadTrace',)),
+ 'AcadUCS': (1221643, 1221939, 25415, 'coclass', ('IAcadUCS',)),
+ 'AcadUCSs': (1221941, 1222207, 25425, 'coclass', ('IAcadUCSs',)),
+ 'AcadUtility': (1222209, 1222466, 25435, 'coclass', ('IAcadUtility',)),
+ 'AcadView': (1222468, 1222767, 25445, 'coclass', ('IAcadView',)),
+ 'AcadViewport': (1222769, 1223048, 25455, 'coclass', ('IAcadViewport',)),
+ 'AcadViewports': (1223050, 1223310, 25465, 'coclass', ('IAcadViewports',)),
+ 'AcadViews': (1223312, 1223556, 25475, 'coclass', ('IAcadViews',)),
+ 'AcadWipeout': (1223558, 1223783, 25485, 'coclass', ('IAcadWipeout',)),
+ 'AcadXRecord': (1223785, 1224052, 25495, 'coclass', ('IAcadXRecord',)),
+ 'AcadXline': (1224054, 1224276, 25505, 'coclass', ('IAcadXline',)),
+ 'IAcad3DFace': (65686, 74698, 928, 'dispatch', ()),
+ 'IAcad3DPolyline': (74700, 83378, 1116, 'dispatch', ()),
+ 'IAcad3DSolid': (83380, 93287, 1300, 'dispatch', ()),
+ 'IAcadAcCmColor': (93289, 95173, 1499, 'dispatch', ()),
+ 'IAcadApplication': (95175, 101509, 1546, 'dispatch', ()),
+ 'IAcadArc': (101511, 109888, 1696, 'dispatch', ()),
+ 'IAcadAttribute': (109890, 120354, 1874, 'dispatch', ()),
+ 'IAcadAttributeReference': (120356, 130455, 2092, 'dispatch', ()),
+ 'IAcadBlock': (130457, 160671, 2300, 'dispatch', ()),
+ 'IAcadBlockReference': (160673, 170585, 2900, 'dispatch', ()),
+ 'IAcadBlocks': (170587, 174377, 3110, 'dispatch', ()),
+ 'IAcadCircle': (174379, 182615, 3200, 'dispatch', ()),
+ 'IAcadComparedReference': (182617, 192694, 3375, 'dispatch', ()),
+ 'IAcadDatabase': (192696, 197419, 3588, 'dispatch', ()),
+ 'IAcadDatabasePreferences': (197421, 200230, 3670, 'dispatch', ()),
+ 'IAcadDictionaries': (200232, 203978, 3726, 'dispatch', ()),
+ 'IAcadDictionary': (203980, 209487, 3816, 'dispatch', ()),
+ 'IAcadDim3PointAngular': (209489, 224572, 3951, 'dispatch', ()),
+ 'IAcadDimAligned': (224574, 243030, 4242, 'dispatch', ()),
+ 'IAcadDimAngular': (243032, 258255, 4587, 'dispatch', ()),
+ 'IAcadDimArcLength': (258257, 276940, 4880, 'dispatch', ()),
+ 'IAcadDimDiametric': (276942, 293408, 5231, 'dispatch', ()),
+ 'IAcadDimOrdinate': (293410, 308511, 5543, 'dispatch', ()),
+ 'IAcadDimRadial': (308513, 324640, 5828, 'dispatch', ()),
+ 'IAcadDimRadialLarge': (324642, 340546, 6134, 'dispatch', ()),
+ 'IAcadDimRotated': (340548, 358796, 6437, 'dispatch', ()),
+ 'IAcadDimStyle': (358798, 361319, 6778, 'dispatch', ()),
+ 'IAcadDimStyles': (361321, 365068, 6837, 'dispatch', ()),
+ 'IAcadDimension': (365070, 375802, 6927, 'dispatch', ()),
+ 'IAcadDocument': (375804, 388830, 7141, 'dispatch', ()),
+ 'IAcadDocuments': (388832, 391694, 7385, 'dispatch', ()),
+ 'IAcadDwfUnderlay': (391696, 400827, 7455, 'dispatch', ()),
+ 'IAcadDynamicBlockReferenceProperty': (400829, 402034, 7647, 'dispatch', ()),
+ 'IAcadEllipse': (402036, 410767, 7679, 'dispatch', ()),
+ 'IAcadEntity': (410769, 418191, 7864, 'dispatch', ()),
+ 'IAcadExternalReference': (418193, 428270, 8020, 'dispatch', ()),
+ 'IAcadExtrudedSurface': (428272, 436845, 8233, 'dispatch', ()),
+ 'IAcadGeoPositionMarker': (436847, 446157, 8409, 'dispatch', ()),
+ 'IAcadGeomapImage': (446159, 455702, 8603, 'dispatch', ()),
+ 'IAcadGroup': (455704, 460257, 8803, 'dispatch', ()),
+ 'IAcadGroups': (460259, 463987, 8914, 'dispatch', ()),
+ 'IAcadHatch': (463989, 474900, 9004, 'dispatch', ()),
+ 'IAcadHelix': (474902, 483132, 9230, 'dispatch', ()),
+ 'IAcadHyperlink': (483134, 484097, 9404, 'dispatch', ()),
+ 'IAcadHyperlinks': (484099, 486319, 9432, 'dispatch', ()),
+ 'IAcadIdPair': (486321, 487493, 9488, 'dispatch', ()),
+ 'IAcadLWPolyline': (487495, 497967, 9518, 'dispatch', ()),
+ 'IAcadLayer': (497969, 501536, 9736, 'dispatch', ()),
+ 'IAcadLayerStateManager': (501538, 504242, 9816, 'dispatch', ()),
+ 'IAcadLayers': (504244, 508129, 9880, 'dispatch', ()),
+ 'IAcadLayout': (508131, 515369, 9974, 'dispatch', ()),
+ 'IAcadLayouts': (515371, 519103, 10126, 'dispatch', ()),
+ 'IAcadLeader': (519105, 528704, 10216, 'dispatch', ()),
+ 'IAcadLine': (528706, 536835, 10414, 'dispatch', ()),
+ 'IAcadLineType': (536837, 539262, 10586, 'dispatch', ()),
+ 'IAcadLineTypes': (539264, 543273, 10642, 'dispatch', ()),
+ 'IAcadLoftedSurface': (543275, 552969, 10737, 'dispatch', ()),
+ 'IAcadMInsertBlock': (552971, 563249, 10932, 'dispatch', ()),
+ 'IAcadMLeader': (563251, 577866, 11150, 'dispatch', ()),
+ 'IAcadMLeaderLeader': (577868, 580015, 11446, 'dispatch', ()),
+ 'IAcadMLeaderStyle': (580017, 587187, 11492, 'dispatch', ()),
+ 'IAcadMLine': (587189, 594955, 11632, 'dispatch', ()),
+ 'IAcadMText': (594957, 603858, 11795, 'dispatch', ()),
+ 'IAcadMaterial': (603860, 606241, 11982, 'dispatch', ()),
+ 'IAcadMaterials': (606243, 609933, 12038, 'dispatch', ()),
+ 'IAcadMenuBar': (609935, 612018, 12127, 'dispatch', ()),
+ 'IAcadMenuGroup': (612020, 613912, 12177, 'dispatch', ()),
+ 'IAcadMenuGroups': (613914, 616464, 12219, 'dispatch', ()),
+ 'IAcadModelSpace': (616466, 646686, 12278, 'dispatch', ()),
+ 'IAcadNurbSurface': (646688, 655133, 12878, 'dispatch', ()),
+ 'IAcadObject': (655135, 657355, 13051, 'dispatch', ()),
+ 'IAcadOle': (657357, 665732, 13103, 'dispatch', ()),
+ 'IAcadPViewport': (665734, 677485, 13279, 'dispatch', ()),
+ 'IAcadPaperSpace': (677487, 708175, 13523, 'dispatch', ()),
+ 'IAcadPlaneSurface': (708177, 716513, 14132, 'dispatch', ()),
+ 'IAcadPlot': (716515, 718642, 14303, 'dispatch', ()),
+ 'IAcadPlotConfiguration': (718644, 725623, 14353, 'dispatch', ()),
+ 'IAcadPlotConfigurations': (725625, 729431, 14501, 'dispatch', ()),
+ 'IAcadPoint': (729433, 737125, 14591, 'dispatch', ()),
+ 'IAcadPointCloud': (737127, 745885, 14753, 'dispatch', ()),
+ 'IAcadPointCloudEx': (745887, 754249, 14937, 'dispatch', ()),
+ 'IAcadPointCloudEx2': (754251, 762716, 15114, 'dispatch', ()),
+ 'IAcadPolyfaceMesh': (762718, 771065, 15292, 'dispatch', ()),
+ 'IAcadPolygonMesh': (771067, 780132, 15465, 'dispatch', ()),
+ 'IAcadPolyline': (780134, 790556, 15656, 'dispatch', ()),
+ 'IAcadPopupMenu': (790558, 794381, 15876, 'dispatch', ()),
+ 'IAcadPopupMenuItem': (794383, 796419, 15967, 'dispatch', ()),
+ 'IAcadPopupMenus': (796421, 799351, 16011, 'dispatch', ()),
+ 'IAcadPreferences': (799353, 801529, 16080, 'dispatch', ()),
+ 'IAcadPreferencesDisplay': (801531, 805796, 16117, 'dispatch', ()),
+ 'IAcadPreferencesDrafting': (805798, 808040, 16188, 'dispatch', ()),
+ 'IAcadPreferencesFiles': (808042, 813990, 16229, 'dispatch', ()),
+ 'IAcadPreferencesOpenSave': (813992, 816435, 16336, 'dispatch', ()),
+ 'IAcadPreferencesOutput': (816437, 818930, 16382, 'dispatch', ()),
+ 'IAcadPreferencesProfiles': (818932, 821487, 16427, 'dispatch', ()),
+ 'IAcadPreferencesSelection': (821489, 823529, 16483, 'dispatch', ()),
+ 'IAcadPreferencesSystem': (823531, 825326, 16524, 'dispatch', ()),
+ 'IAcadPreferencesUser': (825328, 827534, 16559, 'dispatch', ()),
+ 'IAcadRasterImage': (827536, 836539, 16600, 'dispatch', ()),
+ 'IAcadRay': (836541, 844257, 16791, 'dispatch', ()),
+ 'IAcadRegion': (844259, 852626, 16953, 'dispatch', ()),
+ 'IAcadRegisteredApplication': (852628, 854948, 17127, 'dispatch', ()),
+ 'IAcadRegisteredApplications': (854950, 858743, 17181, 'dispatch', ()),
+ 'IAcadRevolvedSurface': (858745, 867360, 17271, 'dispatch', ()),
+ 'IAcadSection': (867362, 878396, 17447, 'dispatch', ()),
+ 'IAcadSection2': (878398, 889774, 17670, 'dispatch', ()),
+ 'IAcadSectionManager': (889776, 893637, 17899, 'dispatch', ()),
+ 'IAcadSectionSettings': (893639, 896325, 17994, 'dispatch', ()),
+ 'IAcadSectionTypeSettings': (896327, 904420, 18057, 'dispatch', ()),
+ 'IAcadSectionTypeSettings2': (904422, 912664, 18177, 'dispatch', ()),
+ 'IAcadSecurityParams': (912666, 914179, 18299, 'dispatch', ()),
+ 'IAcadSelectionSet': (914181, 918569, 18338, 'dispatch', ()),
+ 'IAcadSelectionSets': (918571, 920801, 18439, 'dispatch', ()),
+ 'IAcadShadowDisplay': (920803, 921484, 18496, 'dispatch', ()),
+ 'IAcadShape': (921486, 929630, 18516, 'dispatch', ()),
+ 'IAcadSolid': (929632, 937978, 18688, 'dispatch', ()),
+ 'IAcadSortentsTable': (937980, 942336, 18862, 'dispatch', ()),
+ 'IAcadSpline': (942338, 953797, 18962, 'dispatch', ()),
+ 'IAcadState': (953799, 954515, 19208, 'dispatch', ()),
+ 'IAcadSubDMesh': (954517, 962893, 19228, 'dispatch', ()),
+ 'IAcadSubDMeshEdge': (962895, 964377, 19402, 'dispatch', ()),
+ 'IAcadSubDMeshFace': (964379, 965955, 19437, 'dispatch', ()),
+ 'IAcadSubDMeshVertex': (965957, 967541, 19474, 'dispatch', ()),
+ 'IAcadSubEntSolidEdge': (967543, 968852, 19511, 'dispatch', ()),
+ 'IAcadSubEntSolidFace': (968854, 970257, 19542, 'dispatch', ()),
+ 'IAcadSubEntSolidNode': (970259, 971580, 19575, 'dispatch', ()),
+ 'IAcadSubEntSolidVertex': (971582, 972895, 19606, 'dispatch', ()),
+ 'IAcadSubEntity': (972897, 974181, 19637, 'dispatch', ()),
+ 'IAcadSummaryInfo': (974183, 977452, 19668, 'dispatch', ()),
+ 'IAcadSurface': (977454, 985780, 19740, 'dispatch', ()),
+ 'IAcadSweptSurface': (985782, 994510, 19911, 'dispatch', ()),
+ 'IAcadTable': (994512, 1053734, 20091, 'dispatch', ()),
+ 'IAcadTableStyle': (1053736, 1071343, 21181, 'dispatch', ()),
+ 'IAcadText': (1071345, 1080530, 21545, 'dispatch', ()),
+ 'IAcadTextStyle': (1080532, 1084287, 21738, 'dispatch', ()),
+ 'IAcadTextStyles': (1084289, 1088034, 21817, 'dispatch', ()),
+ 'IAcadTolerance': (1088036, 1096484, 21907, 'dispatch', ()),
+ 'IAcadToolbar': (1096486, 1100807, 22083, 'dispatch', ()),
+ 'IAcadToolbarItem': (1100809, 1103441, 22182, 'dispatch', ()),
+ 'IAcadToolbars': (1103443, 1106019, 22236, 'dispatch', ()),
+ 'IAcadTrace': (1106021, 1114367, 22297, 'dispatch', ()),
+ 'IAcadUCS': (1114369, 1117139, 22471, 'dispatch', ()),
+ 'IAcadUCSs': (1117141, 1121043, 22535, 'dispatch', ()),
+ 'IAcadUnderlay': (1121045, 1130080, 22625, 'dispatch', ()),
+ 'IAcadUtility': (1130082, 1138523, 22815, 'dispatch', ()),
+ 'IAcadView': (1138525, 1141687, 22989, 'dispatch', ()),
+ 'IAcadViewport': (1141689, 1146689, 23061, 'dispatch', ()),
+ 'IAcadViewports': (1146691, 1150605, 23173, 'dispatch', ()),
+ 'IAcadViews': (1150607, 1154331, 23268, 'dispatch', ()),
+ 'IAcadWipeout': (1154333, 1163353, 23358, 'dispatch', ()),
+ 'IAcadXRecord': (1163355, 1166367, 23549, 'dispatch', ()),
+ 'IAcadXline': (1166369, 1174303, 23615, 'dispatch', ()),
+ '_DAcadApplicationEvents': (1174305, 1176073, 23782, 'events', ()),
+ '_DAcadDocumentEvents': (1178951, 1180955, 23886, 'events', ()),
+ 'constants': (817, 65638, 27, 'constants', ())}
+
+VTABLE_SPANS = {'IAcad3DFace_vtables_': (1224312, 1226309, 25516),
+ 'IAcad3DFace_vtables_dispatch_': (1224278, 1224311, 25515),
+ 'IAcad3DPolyline_vtables_': (1226349, 1227805, 25538),
+ 'IAcad3DPolyline_vtables_dispatch_': (1226311, 1226348, 25537),
+ 'IAcad3DSolid_vtables_': (1227842, 1230874, 25555),
+ 'IAcad3DSolid_vtables_dispatch_': (1227807, 1227841, 25554),
+ 'IAcadAcCmColor_vtables_': (1230913, 1232882, 25582),
+ 'IAcadAcCmColor_vtables_dispatch_': (1230876, 1230912, 25581),
+ 'IAcadApplication_vtables_': (1232923, 1239176, 25604),
+ 'IAcadApplication_vtables_dispatch_': (1232884, 1232922, 25603),
+ 'IAcadArc_vtables_': (1239209, 1241506, 25661),
+ 'IAcadArc_vtables_dispatch_': (1239178, 1239208, 25660),
+ 'IAcadAttributeReference_vtables_': (1249241, 1255634, 25747),
+ 'IAcadAttributeReference_vtables_dispatch_': (1249195, 1249240, 25746),
+ 'IAcadAttribute_vtables_': (1241545, 1249193, 25684),
+ 'IAcadAttribute_vtables_dispatch_': (1241508, 1241544, 25683),
+ 'IAcadBlockReference_vtables_': (1275178, 1279425, 25965),
+ 'IAcadBlockReference_vtables_dispatch_': (1275136, 1275177, 25964),
+ 'IAcadBlock_vtables_': (1255669, 1275134, 25800),
+ 'IAcadBlock_vtables_dispatch_': (1255636, 1255668, 25799),
+ 'IAcadBlocks_vtables_': (1279461, 1280168, 26001),
+ 'IAcadBlocks_vtables_dispatch_': (1279427, 1279460, 26000),
+ 'IAcadCircle_vtables_': (1280204, 1282123, 26011),
+ 'IAcadCircle_vtables_dispatch_': (1280170, 1280203, 26010),
+ 'IAcadComparedReference_vtables_': (1282170, 1282207, 26031),
+ 'IAcadComparedReference_vtables_dispatch_': (1282125, 1282169, 26030),
+ 'IAcadDatabasePreferences_vtables_': (1286987, 1292111, 26070),
+ 'IAcadDatabasePreferences_vtables_dispatch_': (1286940, 1286986, 26069),
+ 'IAcadDatabase_vtables_': (1282245, 1286938, 26035),
+ 'IAcadDatabase_vtables_dispatch_': (1282209, 1282244, 26034),
+ 'IAcadDictionaries_vtables_': (1292153, 1292830, 26113),
+ 'IAcadDictionaries_vtables_dispatch_': (1292113, 1292152, 26112),
+ 'IAcadDictionary_vtables_': (1292870, 1294986, 26123),
+ 'IAcadDictionary_vtables_dispatch_': (1292832, 1292869, 26122),
+ 'IAcadDim3PointAngular_vtables_': (1295032, 1305399, 26147),
+ 'IAcadDim3PointAngular_vtables_dispatch_': (1294988, 1295031, 26146),
+ 'IAcadDimAligned_vtables_': (1305439, 1323097, 26228),
+ 'IAcadDimAligned_vtables_dispatch_': (1305401, 1305438, 26227),
+ 'IAcadDimAngular_vtables_': (1323137, 1333794, 26363),
+ 'IAcadDimAngular_vtables_dispatch_': (1323099, 1323136, 26362),
+ 'IAcadDimArcLength_vtables_': (1333836, 1352097, 26446),
+ 'IAcadDimArcLength_vtables_dispatch_': (1333796, 1333835, 26445),
+ 'IAcadDimDiametric_vtables_': (1352139, 1365266, 26587),
+ 'IAcadDimDiametric_vtables_dispatch_': (1352099, 1352138, 26586),
+ 'IAcadDimOrdinate_vtables_': (1365307, 1374911, 26689),
+ 'IAcadDimOrdinate_vtables_dispatch_': (1365268, 1365306, 26688),
+ 'IAcadDimRadialLarge_vtables_': (1387308, 1399158, 26860),
+ 'IAcadDimRadialLarge_vtables_dispatch_': (1387266, 1387307, 26859),
+ 'IAcadDimRadial_vtables_': (1374950, 1387264, 26764),
+ 'IAcadDimRadial_vtables_dispatch_': (1374913, 1374949, 26763),
+ 'IAcadDimRotated_vtables_': (1399198, 1416308, 26953),
+ 'IAcadDimRotated_vtables_dispatch_': (1399160, 1399197, 26952),
+ 'IAcadDimStyle_vtables_': (1416346, 1416737, 27084),
+ 'IAcadDimStyle_vtables_dispatch_': (1416310, 1416345, 27083),
+ 'IAcadDimStyles_vtables_': (1416776, 1417450, 27091),
+ 'IAcadDimStyles_vtables_dispatch_': (1416739, 1416775, 27090),
+ 'IAcadDimension_vtables_': (1417489, 1425301, 27101),
+ 'IAcadDimension_vtables_dispatch_': (1417452, 1417488, 27100),
+ 'IAcadDocument_vtables_': (1425339, 1435158, 27163),
+ 'IAcadDocument_vtables_dispatch_': (1425303, 1425338, 27162),
+ 'IAcadDocuments_vtables_': (1435197, 1436498, 27240),
+ 'IAcadDocuments_vtables_dispatch_': (1435160, 1435196, 27239),
+ 'IAcadDwfUnderlay_vtables_': (1436539, 1436815, 27254),
+ 'IAcadDwfUnderlay_vtables_dispatch_': (1436500, 1436538, 27253),
+ 'IAcadDynamicBlockReferenceProperty_vtables_': (1436874, 1437923, 27260),
+ 'IAcadDynamicBlockReferenceProperty_vtables_dispatch_': (1436817, 1436873, 27259),
+ 'IAcadEllipse_vtables_': (1437960, 1441238, 27272),
+ 'IAcadEllipse_vtables_dispatch_': (1437925, 1437959, 27271),
+ 'IAcadEntity_vtables_': (1441274, 1447170, 27302),
+ 'IAcadEntity_vtables_dispatch_': (1441240, 1441273, 27301),
+ 'IAcadExternalReference_vtables_': (1447217, 1447647, 27355),
+ 'IAcadExternalReference_vtables_dispatch_': (1447172, 1447216, 27354),
+ 'IAcadExtrudedSurface_vtables_': (1447692, 1448349, 27362),
+ 'IAcadExtrudedSurface_vtables_dispatch_': (1447649, 1447691, 27361),
+ 'IAcadGeoPositionMarker_vtables_': (1448396, 1453243, 27371),
+ 'IAcadGeoPositionMarker_vtables_dispatch_': (1448351, 1448395, 27370),
+ 'IAcadGeomapImage_vtables_': (1453284, 1454506, 27413),
+ 'IAcadGeomapImage_vtables_dispatch_': (1453245, 1453283, 27412),
+ 'IAcadGroup_vtables_': (1454541, 1456744, 27426),
+ 'IAcadGroup_vtables_dispatch_': (1454508, 1454540, 27425),
+ 'IAcadGroups_vtables_': (1456780, 1457451, 27449),
+ 'IAcadGroups_vtables_dispatch_': (1456746, 1456779, 27448),
+ 'IAcadHatch_vtables_': (1457486, 1463597, 27459),
+ 'IAcadHatch_vtables_dispatch_': (1457453, 1457485, 27458),
+ 'IAcadHelix_vtables_': (1463632, 1465891, 27510),
+ 'IAcadHelix_vtables_dispatch_': (1463599, 1463631, 27509),
+ 'IAcadHyperlink_vtables_': (1465930, 1466939, 27532),
+ 'IAcadHyperlink_vtables_dispatch_': (1465893, 1465929, 27531),
+ 'IAcadHyperlinks_vtables_': (1466979, 1467865, 27544),
+ 'IAcadHyperlinks_vtables_dispatch_': (1466941, 1466978, 27543),
+ 'IAcadIdPair_vtables_': (1467901, 1468667, 27555),
+ 'IAcadIdPair_vtables_dispatch_': (1467867, 1467900, 27554),
+ 'IAcadLWPolyline_vtables_': (1468707, 1472259, 27565),
+ 'IAcadLWPolyline_vtables_dispatch_': (1468669, 1468706, 27564),
+ 'IAcadLayerStateManager_vtables_': (1475805, 1477293, 27633),
+ 'IAcadLayerStateManager_vtables_dispatch_': (1475760, 1475804, 27632),
+ 'IAcadLayer_vtables_': (1472294, 1475758, 27602),
+ 'IAcadLayer_vtables_dispatch_': (1472261, 1472293, 27601),
+ 'IAcadLayers_vtables_': (1477329, 1478093, 27651),
+ 'IAcadLayers_vtables_dispatch_': (1477295, 1477328, 27650),
+ 'IAcadLayout_vtables_': (1478129, 1478568, 27662),
+ 'IAcadLayout_vtables_dispatch_': (1478095, 1478128, 27661),
+ 'IAcadLayouts_vtables_': (1478605, 1479275, 27669),
+ 'IAcadLayouts_vtables_dispatch_': (1478570, 1478604, 27668),
+ 'IAcadLeader_vtables_': (1479311, 1483096, 27679),
+ 'IAcadLeader_vtables_dispatch_': (1479277, 1479310, 27678),
+ 'IAcadLineType_vtables_': (1484723, 1485241, 27730),
+ 'IAcadLineType_vtables_dispatch_': (1484687, 1484722, 27729),
+ 'IAcadLineTypes_vtables_': (1485280, 1486106, 27738),
+ 'IAcadLineTypes_vtables_dispatch_': (1485243, 1485279, 27737),
+ 'IAcadLine_vtables_': (1483130, 1484685, 27713),
+ 'IAcadLine_vtables_dispatch_': (1483098, 1483129, 27712),
+ 'IAcadLoftedSurface_vtables_': (1486149, 1489481, 27750),
+ 'IAcadLoftedSurface_vtables_dispatch_': (1486108, 1486148, 27749),
+ 'IAcadMInsertBlock_vtables_': (1489523, 1490577, 27778),
+ 'IAcadMInsertBlock_vtables_dispatch_': (1489483, 1489522, 27777),
+ 'IAcadMLeaderLeader_vtables_': (1502214, 1504130, 27888),
+ 'IAcadMLeaderLeader_vtables_dispatch_': (1502173, 1502213, 27887),
+ 'IAcadMLeaderStyle_vtables_': (1504172, 1515485, 27906),
+ 'IAcadMLeaderStyle_vtables_dispatch_': (1504132, 1504171, 27905),
+ 'IAcadMLeader_vtables_': (1490614, 1502171, 27790),
+ 'IAcadMLeader_vtables_dispatch_': (1490579, 1490613, 27789),
+ 'IAcadMLine_vtables_': (1515520, 1516440, 27995),
+ 'IAcadMLine_vtables_dispatch_': (1515487, 1515519, 27994),
+ 'IAcadMText_vtables_': (1516475, 1519955, 28006),
+ 'IAcadMText_vtables_dispatch_': (1516442, 1516474, 28005),
+ 'IAcadMaterial_vtables_': (1519993, 1520511, 28037),
+ 'IAcadMaterial_vtables_dispatch_': (1519957, 1519992, 28036),
+ 'IAcadMaterials_vtables_': (1520550, 1521224, 28045),
+ 'IAcadMaterials_vtables_dispatch_': (1520513, 1520549, 28044),
+ 'IAcadMenuBar_vtables_': (1521261, 1522126, 28055),
+ 'IAcadMenuBar_vtables_dispatch_': (1521226, 1521260, 28054),
+ 'IAcadMenuGroup_vtables_': (1522165, 1523777, 28065),
+ 'IAcadMenuGroup_vtables_dispatch_': (1522128, 1522164, 28064),
+ 'IAcadMenuGroups_vtables_': (1523817, 1524948, 28080),
+ 'IAcadMenuGroups_vtables_dispatch_': (1523779, 1523816, 28079),
+ 'IAcadModelSpace_vtables_': (1524988, 1525018, 28092),
+ 'IAcadModelSpace_vtables_dispatch_': (1524950, 1524987, 28091),
+ 'IAcadNurbSurface_vtables_': (1525059, 1525350, 28096),
+ 'IAcadNurbSurface_vtables_dispatch_': (1525020, 1525058, 28095),
+ 'IAcadObjectEvents_vtables_': (1527361, 1527559, 28121),
+ 'IAcadObjectEvents_vtables_dispatch_': (1527321, 1527360, 28120),
+ 'IAcadObject_vtables_': (1525386, 1527319, 28102),
+ 'IAcadObject_vtables_dispatch_': (1525352, 1525385, 28101),
+ 'IAcadOle_vtables_': (1527592, 1530105, 28126),
+ 'IAcadOle_vtables_dispatch_': (1527561, 1527591, 28125),
+ 'IAcadPViewport_vtables_': (1530144, 1538589, 28150),
+ 'IAcadPViewport_vtables_dispatch_': (1530107, 1530143, 28149),
+ 'IAcadPaperSpace_vtables_': (1538629, 1538935, 28221),
+ 'IAcadPaperSpace_vtables_dispatch_': (1538591, 1538628, 28220),
+ 'IAcadPlaneSurface_vtables_': (1538977, 1539009, 28227),
+ 'IAcadPlaneSurface_vtables_dispatch_': (1538937, 1538976, 28226),
+ 'IAcadPlotConfiguration_vtables_': (1541067, 1548084, 28249),
+ 'IAcadPlotConfiguration_vtables_dispatch_': (1541022, 1541066, 28248),
+ 'IAcadPlotConfigurations_vtables_': (1548132, 1548854, 28311),
+ 'IAcadPlotConfigurations_vtables_dispatch_': (1548086, 1548131, 28310),
+ 'IAcadPlot_vtables_': (1539043, 1541020, 28231),
+ 'IAcadPlot_vtables_dispatch_': (1539011, 1539042, 28230),
+ 'IAcadPointCloudEx2_vtables_': (1555792, 1555952, 28388),
+ 'IAcadPointCloudEx2_vtables_dispatch_': (1555751, 1555791, 28387),
+ 'IAcadPointCloudEx_vtables_': (1553181, 1555749, 28363),
+ 'IAcadPointCloudEx_vtables_dispatch_': (1553141, 1553180, 28362),
+ 'IAcadPointCloud_vtables_': (1549711, 1553139, 28331),
+ 'IAcadPointCloud_vtables_dispatch_': (1549673, 1549710, 28330),
+ 'IAcadPoint_vtables_': (1548889, 1549671, 28321),
+ 'IAcadPoint_vtables_dispatch_': (1548856, 1548888, 28320),
+ 'IAcadPolyfaceMesh_vtables_': (1555994, 1556979, 28393),
+ 'IAcadPolyfaceMesh_vtables_dispatch_': (1555954, 1555993, 28392),
+ 'IAcadPolygonMesh_vtables_': (1557020, 1559345, 28406),
+ 'IAcadPolygonMesh_vtables_dispatch_': (1556981, 1557019, 28405),
+ 'IAcadPolyline_vtables_': (1559383, 1563135, 28430),
+ 'IAcadPolyline_vtables_dispatch_': (1559347, 1559382, 28429),
+ 'IAcadPopupMenuItem_vtables_': (1565919, 1568995, 28492),
+ 'IAcadPopupMenuItem_vtables_dispatch_': (1565878, 1565918, 28491),
+ 'IAcadPopupMenu_vtables_': (1563174, 1565876, 28468),
+ 'IAcadPopupMenu_vtables_dispatch_': (1563137, 1563173, 28467),
+ 'IAcadPopupMenus_vtables_': (1569035, 1570457, 28517),
+ 'IAcadPopupMenus_vtables_dispatch_': (1568997, 1569034, 28516),
+ 'IAcadPreferencesDisplay_vtables_': (1572396, 1580368, 28546),
+ 'IAcadPreferencesDisplay_vtables_dispatch_': (1572350, 1572395, 28545),
+ 'IAcadPreferencesDrafting_vtables_': (1580417, 1583895, 28603),
+ 'IAcadPreferencesDrafting_vtables_dispatch_': (1580370, 1580416, 28602),
+ 'IAcadPreferencesFiles_vtables_': (1583941, 1594692, 28630),
+ 'IAcadPreferencesFiles_vtables_dispatch_': (1583897, 1583940, 28629),
+ 'IAcadPreferencesOpenSave_vtables_': (1594741, 1598877, 28709),
+ 'IAcadPreferencesOpenSave_vtables_dispatch_': (1594694, 1594740, 28708),
+ 'IAcadPreferencesOutput_vtables_': (1598924, 1602978, 28741),
+ 'IAcadPreferencesOutput_vtables_dispatch_': (1598879, 1598923, 28740),
+ 'IAcadPreferencesProfiles_vtables_': (1603027, 1604775, 28772),
+ 'IAcadPreferencesProfiles_vtables_dispatch_': (1602980, 1603026, 28771),
+ 'IAcadPreferencesSelection_vtables_': (1604825, 1608168, 28790),
+ 'IAcadPreferencesSelection_vtables_dispatch_': (1604777, 1604824, 28789),
+ 'IAcadPreferencesSystem_vtables_': (1608215, 1610799, 28817),
+ 'IAcadPreferencesSystem_vtables_dispatch_': (1608170, 1608214, 28816),
+ 'IAcadPreferencesUser_vtables_': (1610844, 1614304, 28838),
+ 'IAcadPreferencesUser_vtables_dispatch_': (1610801, 1610843, 28837),
+ 'IAcadPreferences_vtables_': (1570498, 1572348, 28532),
+ 'IAcadPreferences_vtables_dispatch_': (1570459, 1570497, 28531),
+ 'IAcadRasterImage_vtables_': (1614345, 1618276, 28865),
+ 'IAcadRasterImage_vtables_dispatch_': (1614306, 1614344, 28864),
+ 'IAcadRay_vtables_': (1618309, 1619108, 28900),
+ 'IAcadRay_vtables_dispatch_': (1618278, 1618308, 28899),
+ 'IAcadRegion_vtables_': (1619144, 1620703, 28910),
+ 'IAcadRegion_vtables_dispatch_': (1619110, 1619143, 28909),
+ 'IAcadRegisteredApplication_vtables_': (1620754, 1621034, 28926),
+ 'IAcadRegisteredApplication_vtables_dispatch_': (1620705, 1620753, 28925),
+ 'IAcadRegisteredApplications_vtables_': (1621086, 1621771, 28932),
+ 'IAcadRegisteredApplications_vtables_dispatch_': (1621036, 1621085, 28931),
+ 'IAcadRevolvedSurface_vtables_': (1621816, 1622512, 28942),
+ 'IAcadRevolvedSurface_vtables_dispatch_': (1621773, 1621815, 28941),
+ 'IAcadSection2_vtables_': (1627330, 1628107, 28994),
+ 'IAcadSection2_vtables_dispatch_': (1627294, 1627329, 28993),
+ 'IAcadSectionManager_vtables_': (1628151, 1628988, 29004),
+ 'IAcadSectionManager_vtables_dispatch_': (1628109, 1628150, 29003),
+ 'IAcadSectionSettings_vtables_': (1629033, 1629544, 29015),
+ 'IAcadSectionSettings_vtables_dispatch_': (1628990, 1629032, 29014),
+ 'IAcadSectionTypeSettings2_vtables_': (1643996, 1644318, 29125),
+ 'IAcadSectionTypeSettings2_vtables_dispatch_': (1643948, 1643995, 29124),
+ 'IAcadSectionTypeSettings_vtables_': (1629593, 1643946, 29023),
+ 'IAcadSectionTypeSettings_vtables_dispatch_': (1629546, 1629592, 29022),
+ 'IAcadSection_vtables_': (1622549, 1627292, 28951),
+ 'IAcadSection_vtables_dispatch_': (1622514, 1622548, 28950),
+ 'IAcadSecurityParams_vtables_': (1644362, 1647163, 29131),
+ 'IAcadSecurityParams_vtables_dispatch_': (1644320, 1644361, 29130),
+ 'IAcadSelectionSet_vtables_': (1647205, 1649572, 29157),
+ 'IAcadSelectionSet_vtables_dispatch_': (1647165, 1647204, 29156),
+ 'IAcadSelectionSets_vtables_': (1649615, 1650470, 29183),
+ 'IAcadSelectionSets_vtables_dispatch_': (1649574, 1649614, 29182),
+ 'IAcadShadowDisplay_vtables_': (1650513, 1651006, 29194),
+ 'IAcadShadowDisplay_vtables_dispatch_': (1650472, 1650512, 29193),
+ 'IAcadShape_vtables_': (1651041, 1653062, 29201),
+ 'IAcadShape_vtables_dispatch_': (1651008, 1651040, 29200),
+ 'IAcadSolid_vtables_': (1653097, 1654193, 29221),
+ 'IAcadSolid_vtables_dispatch_': (1653064, 1653096, 29220),
+ 'IAcadSortentsTable_vtables_': (1654236, 1655832, 29235),
+ 'IAcadSortentsTable_vtables_dispatch_': (1654195, 1654235, 29234),
+ 'IAcadSpline_vtables_': (1655868, 1661785, 29253),
+ 'IAcadSpline_vtables_dispatch_': (1655834, 1655867, 29252),
+ 'IAcadState_vtables_': (1661820, 1662139, 29309),
+ 'IAcadState_vtables_dispatch_': (1661787, 1661819, 29308),
+ 'IAcadSubDMeshEdge_vtables_': (1663316, 1663838, 29329),
+ 'IAcadSubDMeshEdge_vtables_dispatch_': (1663276, 1663315, 29328),
+ 'IAcadSubDMeshFace_vtables_': (1663880, 1664661, 29337),
+ 'IAcadSubDMeshFace_vtables_dispatch_': (1663840, 1663879, 29336),
+ 'IAcadSubDMeshVertex_vtables_': (1664705, 1665477, 29347),
+ 'IAcadSubDMeshVertex_vtables_dispatch_': (1664663, 1664704, 29346),
+ 'IAcadSubDMesh_vtables_': (1662177, 1663274, 29315),
+ 'IAcadSubDMesh_vtables_dispatch_': (1662141, 1662176, 29314),
+ 'IAcadSubEntSolidEdge_vtables_': (1665522, 1665557, 29357),
+ 'IAcadSubEntSolidEdge_vtables_dispatch_': (1665479, 1665521, 29356),
+ 'IAcadSubEntSolidFace_vtables_': (1665602, 1665896, 29361),
+ 'IAcadSubEntSolidFace_vtables_dispatch_': (1665559, 1665601, 29360),
+ 'IAcadSubEntSolidNode_vtables_': (1665941, 1665976, 29367),
+ 'IAcadSubEntSolidNode_vtables_dispatch_': (1665898, 1665940, 29366),
+ 'IAcadSubEntSolidVertex_vtables_': (1666023, 1666060, 29371),
+ 'IAcadSubEntSolidVertex_vtables_dispatch_': (1665978, 1666022, 29370),
+ 'IAcadSubEntity_vtables_': (1666099, 1667541, 29375),
+ 'IAcadSubEntity_vtables_dispatch_': (1666062, 1666098, 29374),
+ 'IAcadSummaryInfo_vtables_': (1667582, 1670897, 29389),
+ 'IAcadSummaryInfo_vtables_dispatch_': (1667543, 1667581, 29388),
+ 'IAcadSurface_vtables_': (1670934, 1673021, 29422),
+ 'IAcadSurface_vtables_dispatch_': (1670899, 1670933, 29421),
+ 'IAcadSweptSurface_vtables_': (1673063, 1674216, 29441),
+ 'IAcadSweptSurface_vtables_dispatch_': (1673023, 1673062, 29440),
+ 'IAcadTableStyle_vtables_': (1716656, 1729927, 29849),
+ 'IAcadTableStyle_vtables_dispatch_': (1716618, 1716655, 29848),
+ 'IAcadTable_vtables_': (1674251, 1716616, 29454),
+ 'IAcadTable_vtables_dispatch_': (1674218, 1674250, 29453),
+ 'IAcadTextStyle_vtables_': (1734282, 1736738, 30018),
+ 'IAcadTextStyle_vtables_dispatch_': (1734245, 1734281, 30017),
+ 'IAcadTextStyles_vtables_': (1736778, 1737454, 30043),
+ 'IAcadTextStyles_vtables_dispatch_': (1736740, 1736777, 30042),
+ 'IAcadText_vtables_': (1729961, 1734243, 29981),
+ 'IAcadText_vtables_dispatch_': (1729929, 1729960, 29980),
+ 'IAcadTolerance_vtables_': (1737493, 1740127, 30053),
+ 'IAcadTolerance_vtables_dispatch_': (1737456, 1737492, 30052),
+ 'IAcadToolbarItem_vtables_': (1744434, 1747403, 30113),
+ 'IAcadToolbarItem_vtables_dispatch_': (1744395, 1744433, 30112),
+ 'IAcadToolbar_vtables_': (1740164, 1744393, 30077),
+ 'IAcadToolbar_vtables_dispatch_': (1740129, 1740163, 30076),
+ 'IAcadToolbars_vtables_': (1747441, 1748814, 30139),
+ 'IAcadToolbars_vtables_dispatch_': (1747405, 1747440, 30138),
+ 'IAcadTrace_vtables_': (1748849, 1749945, 30153),
+ 'IAcadTrace_vtables_dispatch_': (1748816, 1748848, 30152),
+ 'IAcadUCS_vtables_': (1749978, 1751101, 30167),
+ 'IAcadUCS_vtables_dispatch_': (1749947, 1749977, 30166),
+ 'IAcadUCSs_vtables_': (1751135, 1751911, 30180),
+ 'IAcadUCSs_vtables_dispatch_': (1751103, 1751134, 30179),
+ 'IAcadUnderlay_vtables_': (1751949, 1755878, 30191),
+ 'IAcadUnderlay_vtables_dispatch_': (1751913, 1751948, 30190),
+ 'IAcadUtility_vtables_': (1755915, 1762522, 30226),
+ 'IAcadUtility_vtables_dispatch_': (1755880, 1755914, 30225),
+ 'IAcadView_vtables_': (1762556, 1765055, 30290),
+ 'IAcadView_vtables_dispatch_': (1762524, 1762555, 30289),
+ 'IAcadViewport_vtables_': (1765093, 1769854, 30314),
+ 'IAcadViewport_vtables_dispatch_': (1765057, 1765092, 30313),
+ 'IAcadViewports_vtables_': (1769893, 1770693, 30358),
+ 'IAcadViewports_vtables_dispatch_': (1769856, 1769892, 30357),
+ 'IAcadViews_vtables_': (1770728, 1771396, 30369),
+ 'IAcadViews_vtables_dispatch_': (1770695, 1770727, 30368),
+ 'IAcadWipeout_vtables_': (1771433, 1771460, 30379),
+ 'IAcadWipeout_vtables_dispatch_': (1771398, 1771432, 30378),
+ 'IAcadXRecord_vtables_': (1771497, 1772391, 30383),
+ 'IAcadXRecord_vtables_dispatch_': (1771462, 1771496, 30382),
+ 'IAcadXline_vtables_': (1772426, 1773395, 30395),
+ 'IAcadXline_vtables_dispatch_': (1772393, 1772425, 30394)}
+
+CLSID_TO_NAME = {'{0063BC47-A0C5-44BC-ACC3-50962CA5E9C2}': 'AcadDocument',
+ '{0144DAAD-3628-448E-AF89-82BCC7B8DCD8}': 'AcadBlocks',
+ '{028015A0-4F49-4410-B21E-0B3B6EBC643D}': 'AcadLineType',
+ '{02F41C12-203E-43A0-9D81-25EB2DD196AF}': 'IAcadDictionary',
+ '{032B9C59-A9C9-424D-A0CA-B4D280133758}': 'IAcadSubEntSolidVertex',
+ '{04E0AA2D-D454-45D9-9C22-274416745885}': 'AcadAcCmColor',
+ '{05058D12-4312-45BA-B637-35D9ED4BF8DC}': 'IAcadDynamicBlockReferenceProperty',
+ '{067DFE3B-FB40-4AB8-852E-0948D38FFB04}': 'IAcadPopupMenus',
+ '{0709E286-0B01-4DD4-B3C2-78FC2B81DA46}': 'AcadLayout',
+ '{08BAC354-500F-4060-A7B2-E4F458EA8C3F}': 'AcadOle',
+ '{096E285B-2EDE-4E26-A497-2100024E1AC9}': 'IAcadLayerStateManager',
+ '{0A1C8034-0564-442D-B3CC-EB584503FB2B}': 'IAcadPreferencesProfiles',
+ '{0AB0473A-F643-4403-96F5-837BA8F4BC89}': 'AcadViewport',
+ '{0ABB4C53-7364-4CC3-B8A8-7F341E80909E}': 'AcadSecurityParams',
+ '{0B9DFBAA-64DB-4574-A703-3C019658D654}': 'AcadLine',
+ '{0C3FF8D9-DF63-4B64-8291-B04431B64553}': 'IAcadLine',
+ '{0CA5C41D-F279-4BCB-A53C-5E2F32A11671}': 'AcadComparedReference',
+ '{0DA12866-87FE-4847-9B99-8519BE647A9D}': 'IAcadDatabasePreferences',
+ '{0EEC861A-8D62-48EA-9E3A-6E9F01049413}': 'IAcadMLeaderStyle',
+ '{101F9DFB-8C12-4F0F-A71E-5CFF6B9C5DFE}': 'AcadSubDMeshVertex',
+ '{10F749EA-B550-403D-9388-10BCAB6F24B8}': 'AcadDimArcLength',
+ '{1115399A-AF5E-45E3-923D-949CE6C142D3}': 'IAcadComparedReference',
+ '{13D301B6-7060-47D0-8537-71E4AFFEAB2E}': 'IAcad3DFace',
+ '{13D665E2-124F-419E-A01D-F16AF31E5DBD}': 'IAcadPreferences',
+ '{142D4A82-C577-46CD-BEB8-C48E90DD4AEB}': 'AcadHyperlink',
+ '{152E9E5F-D4ED-41FD-A64D-D7CE3502838C}': 'IAcadPolygonMesh',
+ '{15FAC8B1-0A50-47DE-AB8E-532902B3CA00}': 'AcadToolbars',
+ '{16CC6C90-EC82-4CB9-834E-D25B776DDF3E}': 'IAcadGroups',
+ '{1702345E-1B6A-437B-8841-D104D7034C6F}': 'IAcadAttribute',
+ '{17D9C339-F66F-41F8-B2AA-12ECC480CD65}': 'AcadDatabase',
+ '{1BD99919-914E-4A0F-A5FD-758F838D91C9}': 'IAcadSelectionSet',
+ '{1C0781A1-145D-415F-9CBB-7FC6C42F86C4}': 'AcadPreferencesDrafting',
+ '{1D6FDF5B-A0CA-4689-AB8A-5CC2A5D11A23}': 'AcadPointCloud',
+ '{21B92DEF-43CF-4549-A641-965FB620FFD2}': 'AcadToolbar',
+ '{2410CFB8-BB78-4B1F-85D1-A6EC290681F8}': 'IAcadEllipse',
+ '{24119DE2-E5B8-463F-8D1A-4A6119A245F4}': 'AcadPreferencesOpenSave',
+ '{259D0200-8753-4E10-8046-D7B84A65671F}': 'IAcadPreferencesDrafting',
+ '{26068652-EBBC-413D-9913-6EDA9447ABAC}': 'IAcadMenuGroup',
+ '{261222D4-0361-4A30-B2DE-33CA817B9B41}': 'AcadLineTypes',
+ '{27305D3B-EF3A-470F-B920-806198B54E1C}': 'IAcadViewports',
+ '{2813BF45-AA44-4F79-8CFC-490B2DD876B4}': 'AcadXline',
+ '{2860ADE5-0A64-4A89-841A-5CFF31B7B513}': 'AcadLayouts',
+ '{28E02F28-2DA5-4266-A7DF-E3E601308108}': 'IAcadUCS',
+ '{29141A40-B1DF-40B9-AF5F-1A81C30FFF15}': 'IAcadRasterImage',
+ '{292C9B23-3244-498A-B862-C5BA6D2F0BA5}': 'AcadPreferencesOutput',
+ '{2AA57761-F8DC-4CC4-9438-5D4AF92F2747}': 'AcadSectionTypeSettings',
+ '{2BAAA55A-A189-4072-A6DE-CBB4E281289F}': 'AcadDimStyles',
+ '{2CFFF5CE-FE81-47E1-8FF3-6614B1BF7B2A}': 'AcadSubDMesh',
+ '{2D145760-58B6-4C21-80F2-F90683AA34D6}': 'IAcadObject',
+ '{2F61A748-305D-4030-9740-7D571E8BD65B}': 'IAcadAcCmColor',
+ '{2F976E5F-F8E2-445D-8841-4F2A7167110D}': 'AcadMText',
+ '{30733FB7-DF93-4DBB-B139-6A119362002C}': 'AcadSectionSettings',
+ '{307BD44A-0FFD-4CEF-822B-4BDEA34B4A1D}': 'AcadDimAngular',
+ '{31299D74-0A9D-427B-879D-4AFE119E1D6A}': 'IAcadPreferencesSelection',
+ '{32A08AE9-632C-46F9-936A-7A0D6D02663B}': 'IAcadCircle',
+ '{32EC4949-D442-4B46-B3AB-B97C19E378B9}': 'IAcadHyperlinks',
+ '{33C800EE-ECF8-4602-9A55-2B59DAC0F496}': 'IAcadDocument',
+ '{3480BE6E-DA6F-4915-AFC6-F99BDC5C51A7}': 'AcadDimOrdinate',
+ '{355CCC4C-6B4B-4C7B-BDB9-41F4905000D3}': 'AcadDocuments',
+ '{363E5B47-885D-44C3-89EB-A2AB2129B57E}': 'AcadApplication',
+ '{365FEF00-D730-41E7-BE17-C5767CB27E74}': 'IAcadLWPolyline',
+ '{39121E37-2406-42B0-A36B-C0B86491820E}': 'AcadPreferencesDisplay',
+ '{3921DDB4-5D4B-448E-B5EE-C642725EFF41}': 'AcadUCSs',
+ '{3BEBD0BC-74CC-44B2-9258-1B40C5600387}': 'AcadMInsertBlock',
+ '{3D0B072E-402F-4B4B-A9EF-2AD2095B7EE0}': 'AcadDimStyle',
+ '{3EA31CD5-EF81-41C6-88FE-BA26D45AF1FB}': 'AcadTable',
+ '{3EB36311-9DE6-4B68-8515-66C3D9509EC3}': 'AcadGeoPositionMarker',
+ '{3F25C247-8394-4F65-8714-27E06217A6F9}': 'AcadRegion',
+ '{3FADAC5A-EEF7-4F9D-A3C9-43C788704232}': 'IAcadText',
+ '{40294D17-F10C-4A4C-B73A-53DF64E91750}': 'IAcadMText',
+ '{4116B1E0-E449-46B9-A903-E2A4B85B02F3}': '_DAcadDocumentEvents',
+ '{41BCF9E2-095F-4F15-B82A-30621FFDFF4F}': 'IAcadSection',
+ '{42353532-9E4C-4CB1-8A30-7ACBE9E69624}': 'AcadExtrudedSurface',
+ '{4243348F-38C7-4192-95DD-75B86C0CF747}': 'IAcadPaperSpace',
+ '{42645896-9B09-43F8-8B9B-B19F5F90D39D}': 'IAcadSubEntity',
+ '{430D1544-F5DD-47A3-A660-B53E04DF781C}': 'AcadViewports',
+ '{4387ACAD-56E5-43CC-A527-CBA0CAE2D666}': 'IAcadSection2',
+ '{43AF860C-4BDE-4BF0-92A2-8BEDAE089D3D}': 'AcadLayer',
+ '{43D32A8F-1D5F-4EAC-AA0E-2D51AF3B5166}': 'IAcadLayout',
+ '{43F5347B-0596-497F-9F68-D482B4B2B6FF}': 'AcadPointCloudEx',
+ '{45CD8F3C-2D86-4F0A-9533-765A6BAD532B}': 'AcadText',
+ '{45F7B189-F6A2-4F0A-BBFC-CE93F8707C5D}': 'AcadSubDMeshFace',
+ '{470774D9-BD44-4668-A8FF-70F0AB1813CB}': 'IAcadBlock',
+ '{477AB6A8-9FC0-4F2F-82A4-3D2DD713263D}': 'IAcadSectionSettings',
+ '{49B06252-7B16-4EBF-94D7-E3352CE8FFE2}': 'IAcadSurface',
+ '{4B6BF600-69F2-4174-9681-3FB992DE68AA}': 'IAcadPoint',
+ '{4C9EBAD1-D6D1-4794-B1AF-6536E2D50731}': 'IAcadSectionTypeSettings',
+ '{4CA6AA08-5011-4525-8C44-7FB7C2190CB8}': 'Acad3DSolid',
+ '{50413BFA-4A78-4566-9863-3CFCDECC264C}': 'IAcadSummaryInfo',
+ '{51995227-8BBD-4D35-B0EB-614FC9D1A8A8}': 'IAcadState',
+ '{51DF5AF2-9521-44C8-8F15-F94AF9989FB3}': 'IAcadDimStyles',
+ '{56597E12-3BE1-4A36-BB0F-05C6659D0FF9}': 'AcadSolid',
+ '{565E523E-1EAA-4CDE-B7C0-FE1189D2E7D0}': 'AcadExternalReference',
+ '{56904EF6-6CBB-4FAC-8125-CF3DB480B013}': 'AcadPlotConfiguration',
+ '{57708D68-55CE-4DAD-BFCA-973B6B136783}': 'AcadDimAligned',
+ '{57BA1F1A-D777-4FAF-8BB9-A579C11807BD}': 'AcadSubEntSolidVertex',
+ '{57CA25FF-D62F-4428-B6CB-40DF872B6C00}': 'IAcadPViewport',
+ '{595E70E6-6FC6-41FE-B4FC-DEE5C680C6AD}': 'AcadPlaneSurface',
+ '{5B204236-EC68-434A-8C90-B2F85745A106}': 'IAcadRegisteredApplications',
+ '{5C046358-7A58-4FBC-916E-7663FC6EDD55}': 'IAcadPreferencesOpenSave',
+ '{5C9AC022-4248-4AAB-B49A-8ADAE1E9C53B}': 'AcadMenuBar',
+ '{5DCBC221-5D60-4C84-95DE-E7F91F8AC08A}': 'AcadObject',
+ '{5DE0FD38-8092-4374-94B2-1A490C319E7C}': 'AcadPopupMenuItem',
+ '{5E7DEE74-BB82-4FB9-933A-4B73D122CF63}': 'IAcadUtility',
+ '{5F92E262-E8AC-459E-B000-423D27D6ABFD}': 'IAcadToolbars',
+ '{5FAE2AF4-9E27-487E-87BD-4D431D9830DD}': 'IAcadPointCloudEx2',
+ '{603F2BE2-7F1B-4E30-9952-7BB89BB37FBC}': 'AcadDimRotated',
+ '{607BBE5B-A4EE-47EB-88C9-75FE5F12EAC7}': 'AcadApplicationMinorVersion1',
+ '{6165EB95-5042-4E51-B2BA-C678C9322569}': 'IAcadUnderlay',
+ '{616EE3BB-091A-41D1-B040-6DDF37D10084}': 'IAcadExtrudedSurface',
+ '{62DA3724-7EC5-4B46-A126-C7B58AE24667}': 'IAcadPreferencesUser',
+ '{6410C59E-2E2B-48FD-A348-2A874EA06F1C}': 'AcadLeader',
+ '{64B63491-8F39-4C24-B6C2-BAF50FAB801C}': 'AcadPolyline',
+ '{64DF1C36-9FB3-4D1A-B002-DACDC7150E7A}': 'IAcadSubDMeshFace',
+ '{659D254C-BF3D-4244-BF87-E710C16C8722}': 'Acad3DPolyline',
+ '{6651A2C4-D16D-48E5-B39E-2B6FC1F49EB1}': 'IAcadToolbar',
+ '{66C13FAE-9205-4CC0-8AEA-FEFC13644A4A}': 'IAcadBlocks',
+ '{67D0CE74-35C7-4CDB-A6AF-0E5D6F539FCE}': 'AcadSubEntSolidEdge',
+ '{686E8EB8-9841-41F2-8C1A-EE78FA8D0DCD}': 'IAcadDimOrdinate',
+ '{6938CF0F-988C-4414-B02E-1590AF2D5B70}': 'IAcadMaterial',
+ '{69AA5724-3122-4FFD-9DE6-DAA6593111F3}': 'AcadPreferencesProfiles',
+ '{69DDA82F-B603-48D4-A305-AAE4F44FE12B}': 'AcadRasterImage',
+ '{6AD57E04-DD25-445D-8B0B-9D30731C18F1}': 'AcadDictionaries',
+ '{6B33301A-DA0F-494A-B0B7-409FE008926A}': 'IAcadRegisteredApplication',
+ '{6B9DB813-9A39-4D67-9FA7-882B01E45B85}': 'AcadTextStyle',
+ '{6C384781-8AB6-432A-8B33-BF2BE7C51E29}': 'AcadState',
+ '{6C490300-E8E6-4DF6-90C1-AC3D599505D2}': 'IAcadDimArcLength',
+ '{6C872F03-21B7-43C4-B9A0-370A1ECF8682}': 'IAcadTrace',
+ '{6E0FD7F5-3566-4F1B-9B0A-12480BD967E2}': 'AcadPlot',
+ '{705A1BD7-318F-4773-BFBD-075C83624990}': 'AcadSweptSurface',
+ '{71770D46-9176-47CA-B4C2-BCDE1CB43E50}': 'AcadRevolvedSurface',
+ '{7297824E-3FC3-4071-9F39-250CD3B0B91C}': 'IAcadSubEntSolidEdge',
+ '{7354883A-8F64-4BF2-8ED0-5B8C9831FBD6}': 'IAcadOle',
+ '{73939411-AA70-4D8D-BB1B-6698CB79A03B}': 'IAcadRevolvedSurface',
+ '{74615498-0E34-46DF-A5C7-1793CF2A3171}': 'IAcadDimStyle',
+ '{74A82370-EFAA-4E44-8ECC-B3E4B9BAE220}': 'IAcadMInsertBlock',
+ '{759FB461-6B66-447D-989B-40C4BA0C0188}': 'AcadDynamicBlockReferenceProperty',
+ '{76FF4D98-BD59-402C-A2BD-8D44FCC653A7}': 'IAcadMLeaderLeader',
+ '{778BDCD9-F2A0-4025-8FDF-BC5B8D03713F}': 'AcadTextStyles',
+ '{7881B431-1619-4CF4-8235-CC70CEAEAD8C}': 'IAcadDimDiametric',
+ '{7A8761CD-22B8-4893-B4E9-3A8EBACD8F8F}': 'IAcadMenuBar',
+ '{7B04A8D0-8043-4675-AF42-B6ADC28D847F}': 'AcadWipeout',
+ '{7BB9C1F7-814D-4891-9141-F0814333DBA2}': 'IAcadTable',
+ '{7CBC97A1-0F94-4CAB-B3DF-E75291CAF734}': 'IAcadPreferencesOutput',
+ '{7D3D3E3B-5C66-4FBB-A571-6FBE2E29B352}': 'IAcadViews',
+ '{7E161A14-71DA-420B-8C74-1785EB29EA84}': 'IAcadXRecord',
+ '{7FE1CC3C-FB11-4850-95BA-CC760C25CA61}': 'IAcadPlotConfigurations',
+ '{8056580C-1145-4FB6-9F77-4E4BFDA4EFD7}': 'AcadViews',
+ '{80659E23-A233-471E-9EAE-756A7E86658B}': 'AcadSectionManager',
+ '{80A68D8C-EC85-48AA-A7B5-905EEE05033D}': 'IAcadTolerance',
+ '{82049DA4-1AF2-4195-9971-BD0AE2158171}': 'IAcadRegion',
+ '{82745F2B-AE23-4502-A7C3-9CF394D4E01A}': 'AcadTolerance',
+ '{8435BF60-99BE-4A87-BE03-15EBA7388635}': 'IAcadUCSs',
+ '{84A78EE8-8F24-4A9D-BD08-16CDB0F841B8}': 'AcadSpline',
+ '{85B5B818-DB01-4B34-B95B-F4632D912B48}': 'AcadRay',
+ '{85C22FC1-28E6-44FA-9511-F7786B1E2310}': 'AcadEllipse',
+ '{86E86FE7-07B3-445B-9897-84FDFA1523B9}': 'AcadSortentsTable',
+ '{88D8A5A7-3636-4131-8C7F-220DC9CBCA0D}': 'AcadGroups',
+ '{8B6A8714-3FDE-4237-A7F8-AA953105ADEB}': 'AcadTrace',
+ '{8B7073CF-6130-4B8D-814E-A1067D117BCA}': 'IAcadDwfUnderlay',
+ '{8BEB167C-8682-4EAC-9BE8-D41596F9EE38}': 'AcadPopupMenu',
+ '{8CA4D495-B5A9-4AE0-8E27-950FC98F0074}': 'IAcadPopupMenu',
+ '{8D275808-762F-41F8-A25E-ABD706B4713D}': 'IAcadGeoPositionMarker',
+ '{8D539A4B-DF03-4DA7-B9DC-659C2E764AE4}': 'IAcadModelSpace',
+ '{8D680860-D711-4D3C-A457-F2C27B2485EA}': 'IAcadNurbSurface',
+ '{90B3BA9A-1EAC-4D66-88BB-4B27FE7E0A1A}': 'IAcad3DPolyline',
+ '{91F38DDE-2027-4194-B934-522879589ECE}': 'IAcadPolyfaceMesh',
+ '{91FE107E-1179-427C-9554-3D2BC9E953C1}': 'IAcadDimRadial',
+ '{923778AC-3B43-495A-9E31-AB88BD8A2F19}': 'IAcadSectionTypeSettings2',
+ '{9284DD1F-2C38-4ECD-8F2A-946DF797CB6C}': 'IAcadSecurityParams',
+ '{9421AC82-850C-4150-8D68-7C70E26E2B3B}': 'AcadDwfUnderlay',
+ '{9441B64F-EA94-4868-9B9E-7A95B1327F77}': 'IAcadAttributeReference',
+ '{950BE053-4BB9-48B1-AFAD-F0C0E2B4545B}': 'AcadBlock',
+ '{95D931B7-A9D0-4078-9A4F-484D5AB08AC9}': 'AcadPreferencesUser',
+ '{964D538C-10E6-4D05-A708-E1408C18C6DF}': 'IAcadIdPair',
+ '{96EB6D85-7728-430D-B5E3-DE80B157B340}': 'IAcad3DSolid',
+ '{9738A791-BEAB-4CD7-A8A9-073DD70E6EA8}': 'IAcadSolid',
+ '{9795DB9A-9E35-4375-8319-C921158C1031}': 'IAcadPointCloud',
+ '{9843B548-135F-4D5F-B6D6-D2F5A05CC5BF}': 'IAcadDimRadialLarge',
+ '{9851A647-E643-4843-B238-A100D58A7D02}': 'IAcadExternalReference',
+ '{98BF2929-A20D-48C5-B079-5019882F9080}': 'AcadPaperSpace',
+ '{9950A0BC-5EE1-46AB-BAA4-944C9D08B5EE}': 'IAcadSubEntSolidFace',
+ '{99C34003-A664-4B66-A0BE-796AF232363C}': 'IAcadSortentsTable',
+ '{99E613C9-9B3B-43B2-99B7-76DA8877C37E}': 'IAcadArc',
+ '{9A35FF5D-4A0B-4D39-A7BE-7B3CC8BCF2A5}': 'IAcadHyperlink',
+ '{9BE9F213-EB3D-480F-8607-50E06ED2D2F2}': 'AcadGroup',
+ '{9C06F3CB-EC8E-4867-8206-E82E416FBBB2}': 'IAcadPolyline',
+ '{9C29DB4A-614A-4DB9-B578-2349E4AAE6F7}': 'AcadSubDMeshEdge',
+ '{9DACC9EE-D369-4611-8ABC-A92BBB15E9D1}': 'AcadSummaryInfo',
+ '{9E96260D-1062-425D-BBAC-9EA82B28ECCD}': 'IAcadGeomapImage',
+ '{9EFC13E4-0EAC-4F33-801C-92C58D395A80}': 'IAcadSectionManager',
+ '{9FD0CC74-DC4B-46C8-ABEE-F45D6E26BBEA}': 'IAcadGroup',
+ '{A06DD599-DBB9-4F47-97FA-DE3799CE06AD}': 'AcadBlockReference',
+ '{A094D037-2D1B-4047-8146-9FDB645AF7A0}': 'AcadMLine',
+ '{A4BFDBD0-25EC-4B40-B311-C0DA89FAE8AF}': 'IAcadDimAngular',
+ '{A5056C37-BBC1-45C2-BB47-CE7EAC5FEC71}': 'IAcadPopupMenuItem',
+ '{A586ADDE-BFB1-4721-938D-E43B16EA8D3F}': 'AcadGeomapImage',
+ '{A61EB326-9132-4FBB-8D5E-377A50E74B4A}': 'AcadMenuGroups',
+ '{A6F3E13A-4B40-485A-8D04-0891ABED5C4E}': 'IAcadPreferencesSystem',
+ '{A772C2C9-723B-48E9-8FD4-DF969AED42AF}': 'AcadEntity',
+ '{A7E25D59-8BC6-4436-BE68-04668F9E16DB}': 'AcadMaterials',
+ '{A8831D23-6E0E-4EAE-B25B-DB141DCED07A}': 'IAcadMenuGroups',
+ '{A900427D-E81B-43A3-957A-AD1F5B0D0F1F}': 'AcadSelectionSets',
+ '{A994ADDF-69D4-401B-8ED5-03D0E797AB3B}': 'IAcadEntity',
+ '{A9B25C92-3BA6-4F4B-A4A5-321FBA5DB265}': 'IAcadDim3PointAngular',
+ '{A9B8EA6A-59E1-4866-99C6-A0ADF5C1DB9D}': 'IAcadLineTypes',
+ '{AB20EC5B-A71D-45A7-9081-39ACDD9464B0}': 'AcadPreferencesSystem',
+ '{AB654B1E-E2AD-4F3C-AD12-B7DC215C7CCA}': 'AcadPdfUnderlay',
+ '{AC0E393D-267A-4D41-846A-8108C8F54FA5}': 'AcadDimDiametric',
+ '{ACB59E98-9D60-4894-B1F2-29A88A559DBF}': 'AcadMenuGroup',
+ '{AD1EC292-2871-4402-98A0-BF264DD91CA5}': 'IAcadShadowDisplay',
+ '{ADBA37CB-0653-4643-903E-0BB22B92473F}': 'AcadPreferences',
+ '{AE332C3B-CB38-4587-A2F2-303736253182}': 'AcadArc',
+ '{AE743DBB-452D-445E-B248-448C7154132E}': 'AcadHyperlinks',
+ '{AEC51C60-17CD-4380-B43B-29949333EB31}': 'IAcadSubDMesh',
+ '{AF1A4BE3-A001-4A86-AC6E-934F8F066236}': 'IAcadLoftedSurface',
+ '{B0950565-9D59-432B-BE65-8B32D88DA694}': 'AcadDimension',
+ '{B0EDCB9D-4A42-4259-92DD-3C5C67730649}': 'IAcadHatch',
+ '{B192B42B-55A6-4110-B193-9830A754A203}': 'IAcadApplication',
+ '{B1C3F89C-366A-41D0-9FFD-B49D47D0149B}': 'IAcadBlockReference',
+ '{B2EFC4D0-E9F2-485D-8F4E-9C9D821D57B4}': 'AcadSubEntSolidFace',
+ '{B368459E-48E8-4A81-88CE-6264998BC5DA}': 'AcadSurface',
+ '{B3B11958-6CF4-42BE-BE18-22B6784198BC}': 'AcadDictionary',
+ '{B3DD284E-E57E-4155-B743-646A1D95EADB}': 'IAcadPreferencesFiles',
+ '{B3F1B426-55A0-4DFB-A8C1-6E604B3E253E}': 'IAcadRay',
+ '{B4580F7E-2328-4C97-B820-6AA5C54CEB45}': 'AcadPreferencesSelection',
+ '{B4D2536B-E398-4971-B722-8D2C37D28AE5}': 'AcadHelix',
+ '{B509B16E-8A89-4F9D-AE3F-912F36C72AEF}': 'AcadMLeaderLeader',
+ '{B51B5AA4-EE75-47D3-A298-22D7D80B1384}': 'IAcadPreferencesDisplay',
+ '{B5C35766-BF84-4C7A-81D7-9094A48C9595}': 'IAcadLayer',
+ '{B643DF4D-B90B-4DEC-8F8E-11C961220CA5}': 'AcadPViewport',
+ '{B66B883C-D2FC-4B03-9675-F7C517741630}': 'AcadAttributeReference',
+ '{B7863A95-DBBD-45A5-9F7B-D0C31A52A99B}': 'IAcadViewport',
+ '{B8A5C16D-015F-48E8-A20D-5CAA572827B0}': 'IAcadWipeout',
+ '{BB025CEB-5C3B-4BD2-AAC0-AA4A31593012}': 'IAcadPlaneSurface',
+ '{BB185E31-F8FC-4E83-BD45-51395D522AF5}': 'AcadSection',
+ '{BB798354-9B4D-496A-98F6-C5D80CB74C25}': 'IAcadMLine',
+ '{BBA07C0C-1401-48FE-A08E-2471E3735961}': 'AcadRegisteredApplication',
+ '{BD5A3DB7-0C23-4C12-B3B2-4ACB5BEC7357}': 'AcadPoint',
+ '{BD801B3C-9A15-4D0B-88C4-3EE83793AF9E}': 'AcadLayers',
+ '{BEB07BF0-2EE8-4DD0-9838-36E9FE9CFA62}': 'IAcadShape',
+ '{BF5FB993-04F6-4402-B218-D674CE019C2D}': 'IAcadPointCloudEx',
+ '{BF6E215F-4104-4D1A-ABE5-5916F88B01B8}': 'AcadLoftedSurface',
+ '{C10E0337-8AAD-4715-AFEF-1EB65D622062}': 'AcadCircle',
+ '{C2449FDA-973B-4848-BFE8-6A7A666BB67B}': 'IAcadMaterials',
+ '{C365A0E4-457A-4D87-AE84-6F5EBA15A86A}': 'AcadView',
+ '{C689FDBE-42D1-4DA3-AB0E-70B943C373D3}': 'IAcadHelix',
+ '{C6C560BE-EBF7-4995-96A5-0DDFDDB29ACB}': 'AcadPreferencesFiles',
+ '{C7306010-A8DC-45C2-9A72-5780B5A071B2}': 'AcadXRecord',
+ '{C83F156E-B1CB-4C5F-BD1C-1BA6DAC0DF58}': 'IAcadPlot',
+ '{CA66B1A0-33EE-472A-8639-7B3497B4ACC5}': 'AcadSubEntSolidNode',
+ '{CB4650B7-6967-408A-B46C-A6FA6692CD8C}': 'Acad3DFace',
+ '{CB6632B6-D6C7-488E-99A1-C2C4CB0E6EDA}': 'IAcadLineType',
+ '{CB76E0DB-8EB9-4143-B9EF-9260E929EE75}': 'IAcadDocuments',
+ '{CBED104B-D35B-4C65-B2A3-95E72B2F2E0F}': 'IAcadToolbarItem',
+ '{CD0FFC9A-C624-43C7-99B4-D84911C3C7E5}': 'AcadRegisteredApplications',
+ '{CED2C7FF-7B16-4BC5-A101-9DBFC6078894}': 'IAcadTextStyle',
+ '{CF76D2FB-D581-48A4-B9B6-A27A9A6ED94A}': 'IAcadSubDMeshVertex',
+ '{D04104B6-A160-418F-9783-B138C1FE7D2D}': 'AcadToolbarItem',
+ '{D14872AB-51EC-415F-B9C0-53A501044A0B}': 'IAcadDimension',
+ '{D16AA6A1-9000-4891-A3A6-7CBAAADCA8D6}': 'AcadTableStyle',
+ '{D1CCAA24-C403-4479-AACF-4265D276E7E9}': 'AcadDatabasePreferences',
+ '{D2D87C01-613A-401E-A175-EE3859069EDB}': 'AcadPlotConfigurations',
+ '{D3CDA679-7206-4895-9B57-B57046501748}': 'IAcadMLeader',
+ '{D48AD610-6EE0-4583-B1CB-6E57D159FBEF}': 'IAcadPlotConfiguration',
+ '{D5AE6E12-0DB9-4CA0-87FF-4BC95117FDB2}': '_DAcadApplicationEvents',
+ '{D665B22F-A463-4055-A829-91AA3D70F779}': 'IAcadDimAligned',
+ '{D751968E-EB2B-4867-A895-2C202F7EAFE4}': 'AcadLayerStateManager',
+ '{D8C41B66-00FF-4DA0-854E-3B4B019F5B46}': 'AcadPopupMenus',
+ '{D975A7B1-549A-4B61-AC39-191DC38BC29B}': 'AcadDimRadial',
+ '{DBC22E71-76E8-4383-BA8E-02D74DADCBE4}': 'AcadUtility',
+ '{DCB8E0AA-3454-427B-9A85-776D7EE61C7E}': 'IAcadDatabase',
+ '{DE365AE8-E7B5-4A94-B7C9-FDF9A0749CBF}': 'IAcadLeader',
+ '{DEA79E20-55FA-4440-BA44-74E6C5ABD579}': 'AcadHatch',
+ '{DF6B0563-5640-4C25-A3AF-CBF384E6E55E}': 'AcadMaterial',
+ '{E0D2B3ED-6F94-47FD-9526-598B3C82B13E}': 'IAcadXline',
+ '{E1D6157B-1392-4D3C-BAF3-96843EC5998E}': 'IAcadDictionaries',
+ '{E1F8E208-BA80-46AB-9C38-7B6E436BEA22}': 'IAcadLayers',
+ '{E447E066-98FF-4571-9ACF-716C5DB80C5F}': 'AcadNurbSurface',
+ '{E4A27E8E-396D-4820-8350-ED4AD58FB2F0}': 'AcadUCS',
+ '{E5A9387A-E596-4C2B-97DB-D3B114A16CF4}': 'AcadDim3PointAngular',
+ '{E5E6A16B-0725-453B-A1AD-A78EED9AC8D0}': 'AcadMLeaderStyle',
+ '{E7F9CCFF-F9E8-4DC5-A7C4-54CD5A31BB8C}': 'IAcadSubDMeshEdge',
+ '{E95D8080-A822-4CA3-9198-D69586E950B0}': 'IAcadLayouts',
+ '{E99FECF0-EE68-4314-8D48-D0639B562A5B}': 'IAcadSpline',
+ '{EACCD7BE-5CE7-42C0-BAF6-8BCEF8EE75B5}': 'IAcadView',
+ '{EBE41C9B-1BD0-4B96-8F5A-216B41AC5E7C}': 'IAcadTableStyle',
+ '{EC2F54DB-AFC5-4C70-A541-D098127CF2E2}': 'AcadDimRadialLarge',
+ '{EC8F15F2-55F3-4094-98FA-C8B12C36580E}': 'AcadIdPair',
+ '{ECA13A8A-63EA-416E-A360-813A31B0875E}': 'AcadPolygonMesh',
+ '{EDA86C2F-CD35-479F-917C-97057FCFCD62}': 'IAcadTextStyles',
+ '{F169FD24-2A7D-4EAC-9733-9F3E2AC3B705}': 'IAcadSelectionSets',
+ '{F1AD7AB7-BE4D-4B04-95D0-8BDF9E774DA7}': 'AcadSubEntity',
+ '{F3B5F989-4ABC-4F12-9EAF-12DAF1800653}': 'AcadDgnUnderlay',
+ '{F4EDC475-30BA-4754-9D70-35A1BD07F1A6}': 'AcadModelSpace',
+ '{F65F62C6-D183-45E5-B8A3-5F553D0C0CFF}': 'IAcadDimRotated',
+ '{F95B3EB4-9AE0-4807-BF9C-9059ADF9DD54}': 'IAcadSweptSurface',
+ '{FACABB83-2275-41D0-88AE-1D871E1511C1}': 'IAcadSubEntSolidNode',
+ '{FCDCCFFB-7C79-4F80-A74C-CA1E7C3003AE}': 'AcadAttribute',
+ '{FD028A62-16C3-42B9-8218-E298F8D4C470}': 'AcadLWPolyline',
+ '{FD3BD033-D1D8-48EE-84F6-F0AC7F4F48B7}': 'AcadSelectionSet',
+ '{FDB00B7E-18DC-4593-8A67-3B024A8AD7C3}': 'AcadPolyfaceMesh',
+ '{FDB02BA2-8442-47F1-98C8-F3CABB36CAF9}': 'AcadMLeader',
+ '{FF57FA40-DC9D-4C1E-BBBD-5290B1C5F26C}': 'AcadShape'}
+
+VTablesToClassMap = {'{02F41C12-203E-43A0-9D81-25EB2DD196AF}': 'IAcadDictionary',
+ '{032B9C59-A9C9-424D-A0CA-B4D280133758}': 'IAcadSubEntSolidVertex',
+ '{05058D12-4312-45BA-B637-35D9ED4BF8DC}': 'IAcadDynamicBlockReferenceProperty',
+ '{067DFE3B-FB40-4AB8-852E-0948D38FFB04}': 'IAcadPopupMenus',
+ '{096E285B-2EDE-4E26-A497-2100024E1AC9}': 'IAcadLayerStateManager',
+ '{0A1C8034-0564-442D-B3CC-EB584503FB2B}': 'IAcadPreferencesProfiles',
+ '{0C3FF8D9-DF63-4B64-8291-B04431B64553}': 'IAcadLine',
+ '{0DA12866-87FE-4847-9B99-8519BE647A9D}': 'IAcadDatabasePreferences',
+ '{0EEC861A-8D62-48EA-9E3A-6E9F01049413}': 'IAcadMLeaderStyle',
+ '{1115399A-AF5E-45E3-923D-949CE6C142D3}': 'IAcadComparedReference',
+ '{13D301B6-7060-47D0-8537-71E4AFFEAB2E}': 'IAcad3DFace',
+ '{13D665E2-124F-419E-A01D-F16AF31E5DBD}': 'IAcadPreferences',
+ '{152E9E5F-D4ED-41FD-A64D-D7CE3502838C}': 'IAcadPolygonMesh',
+ '{16CC6C90-EC82-4CB9-834E-D25B776DDF3E}': 'IAcadGroups',
+ '{1702345E-1B6A-437B-8841-D104D7034C6F}': 'IAcadAttribute',
+ '{1BD99919-914E-4A0F-A5FD-758F838D91C9}': 'IAcadSelectionSet',
+ '{1DD64288-95FB-4B3B-AABE-A98047186E7F}': 'IAcadObjectEvents',
+ '{2410CFB8-BB78-4B1F-85D1-A6EC290681F8}': 'IAcadEllipse',
+ '{259D0200-8753-4E10-8046-D7B84A65671F}': 'IAcadPreferencesDrafting',
+ '{26068652-EBBC-413D-9913-6EDA9447ABAC}': 'IAcadMenuGroup',
+ '{27305D3B-EF3A-470F-B920-806198B54E1C}': 'IAcadViewports',
+ '{28E02F28-2DA5-4266-A7DF-E3E601308108}': 'IAcadUCS',
+ '{29141A40-B1DF-40B9-AF5F-1A81C30FFF15}': 'IAcadRasterImage',
+ '{2D145760-58B6-4C21-80F2-F90683AA34D6}': 'IAcadObject',
+ '{2F61A748-305D-4030-9740-7D571E8BD65B}': 'IAcadAcCmColor',
+ '{31299D74-0A9D-427B-879D-4AFE119E1D6A}': 'IAcadPreferencesSelection',
+ '{32A08AE9-632C-46F9-936A-7A0D6D02663B}': 'IAcadCircle',
+ '{32EC4949-D442-4B46-B3AB-B97C19E378B9}': 'IAcadHyperlinks',
+ '{33C800EE-ECF8-4602-9A55-2B59DAC0F496}': 'IAcadDocument',
+ '{365FEF00-D730-41E7-BE17-C5767CB27E74}': 'IAcadLWPolyline',
+ '{3FADAC5A-EEF7-4F9D-A3C9-43C788704232}': 'IAcadText',
+ '{40294D17-F10C-4A4C-B73A-53DF64E91750}': 'IAcadMText',
+ '{41BCF9E2-095F-4F15-B82A-30621FFDFF4F}': 'IAcadSection',
+ '{4243348F-38C7-4192-95DD-75B86C0CF747}': 'IAcadPaperSpace',
+ '{42645896-9B09-43F8-8B9B-B19F5F90D39D}': 'IAcadSubEntity',
+ '{4387ACAD-56E5-43CC-A527-CBA0CAE2D666}': 'IAcadSection2',
+ '{43D32A8F-1D5F-4EAC-AA0E-2D51AF3B5166}': 'IAcadLayout',
+ '{470774D9-BD44-4668-A8FF-70F0AB1813CB}': 'IAcadBlock',
+ '{477AB6A8-9FC0-4F2F-82A4-3D2DD713263D}': 'IAcadSectionSettings',
+ '{49B06252-7B16-4EBF-94D7-E3352CE8FFE2}': 'IAcadSurface',
+ '{4B6BF600-69F2-4174-9681-3FB992DE68AA}': 'IAcadPoint',
+ '{4C9EBAD1-D6D1-4794-B1AF-6536E2D50731}': 'IAcadSectionTypeSettings',
+ '{50413BFA-4A78-4566-9863-3CFCDECC264C}': 'IAcadSummaryInfo',
+ '{51995227-8BBD-4D35-B0EB-614FC9D1A8A8}': 'IAcadState',
+ '{51DF5AF2-9521-44C8-8F15-F94AF9989FB3}': 'IAcadDimStyles',
+ '{57CA25FF-D62F-4428-B6CB-40DF872B6C00}': 'IAcadPViewport',
+ '{5B204236-EC68-434A-8C90-B2F85745A106}': 'IAcadRegisteredApplications',
+ '{5C046358-7A58-4FBC-916E-7663FC6EDD55}': 'IAcadPreferencesOpenSave',
+ '{5E7DEE74-BB82-4FB9-933A-4B73D122CF63}': 'IAcadUtility',
+ '{5F92E262-E8AC-459E-B000-423D27D6ABFD}': 'IAcadToolbars',
+ '{5FAE2AF4-9E27-487E-87BD-4D431D9830DD}': 'IAcadPointCloudEx2',
+ '{6165EB95-5042-4E51-B2BA-C678C9322569}': 'IAcadUnderlay',
+ '{616EE3BB-091A-41D1-B040-6DDF37D10084}': 'IAcadExtrudedSurface',
+ '{62DA3724-7EC5-4B46-A126-C7B58AE24667}': 'IAcadPreferencesUser',
+ '{64DF1C36-9FB3-4D1A-B002-DACDC7150E7A}': 'IAcadSubDMeshFace',
+ '{6651A2C4-D16D-48E5-B39E-2B6FC1F49EB1}': 'IAcadToolbar',
+ '{66C13FAE-9205-4CC0-8AEA-FEFC13644A4A}': 'IAcadBlocks',
+ '{686E8EB8-9841-41F2-8C1A-EE78FA8D0DCD}': 'IAcadDimOrdinate',
+ '{6938CF0F-988C-4414-B02E-1590AF2D5B70}': 'IAcadMaterial',
+ '{6B33301A-DA0F-494A-B0B7-409FE008926A}': 'IAcadRegisteredApplication',
+ '{6C490300-E8E6-4DF6-90C1-AC3D599505D2}': 'IAcadDimArcLength',
+ '{6C872F03-21B7-43C4-B9A0-370A1ECF8682}': 'IAcadTrace',
+ '{7297824E-3FC3-4071-9F39-250CD3B0B91C}': 'IAcadSubEntSolidEdge',
+ '{7354883A-8F64-4BF2-8ED0-5B8C9831FBD6}': 'IAcadOle',
+ '{73939411-AA70-4D8D-BB1B-6698CB79A03B}': 'IAcadRevolvedSurface',
+ '{74615498-0E34-46DF-A5C7-1793CF2A3171}': 'IAcadDimStyle',
+ '{74A82370-EFAA-4E44-8ECC-B3E4B9BAE220}': 'IAcadMInsertBlock',
+ '{76FF4D98-BD59-402C-A2BD-8D44FCC653A7}': 'IAcadMLeaderLeader',
+ '{7881B431-1619-4CF4-8235-CC70CEAEAD8C}': 'IAcadDimDiametric',
+ '{7A8761CD-22B8-4893-B4E9-3A8EBACD8F8F}': 'IAcadMenuBar',
+ '{7BB9C1F7-814D-4891-9141-F0814333DBA2}': 'IAcadTable',
+ '{7CBC97A1-0F94-4CAB-B3DF-E75291CAF734}': 'IAcadPreferencesOutput',
+ '{7D3D3E3B-5C66-4FBB-A571-6FBE2E29B352}': 'IAcadViews',
+ '{7E161A14-71DA-420B-8C74-1785EB29EA84}': 'IAcadXRecord',
+ '{7FE1CC3C-FB11-4850-95BA-CC760C25CA61}': 'IAcadPlotConfigurations',
+ '{80A68D8C-EC85-48AA-A7B5-905EEE05033D}': 'IAcadTolerance',
+ '{82049DA4-1AF2-4195-9971-BD0AE2158171}': 'IAcadRegion',
+ '{8435BF60-99BE-4A87-BE03-15EBA7388635}': 'IAcadUCSs',
+ '{8B7073CF-6130-4B8D-814E-A1067D117BCA}': 'IAcadDwfUnderlay',
+ '{8CA4D495-B5A9-4AE0-8E27-950FC98F0074}': 'IAcadPopupMenu',
+ '{8D275808-762F-41F8-A25E-ABD706B4713D}': 'IAcadGeoPositionMarker',
+ '{8D539A4B-DF03-4DA7-B9DC-659C2E764AE4}': 'IAcadModelSpace',
+ '{8D680860-D711-4D3C-A457-F2C27B2485EA}': 'IAcadNurbSurface',
+ '{90B3BA9A-1EAC-4D66-88BB-4B27FE7E0A1A}': 'IAcad3DPolyline',
+ '{91F38DDE-2027-4194-B934-522879589ECE}': 'IAcadPolyfaceMesh',
+ '{91FE107E-1179-427C-9554-3D2BC9E953C1}': 'IAcadDimRadial',
+ '{923778AC-3B43-495A-9E31-AB88BD8A2F19}': 'IAcadSectionTypeSettings2',
+ '{9284DD1F-2C38-4ECD-8F2A-946DF797CB6C}': 'IAcadSecurityParams',
+ '{9441B64F-EA94-4868-9B9E-7A95B1327F77}': 'IAcadAttributeReference',
+ '{964D538C-10E6-4D05-A708-E1408C18C6DF}': 'IAcadIdPair',
+ '{96EB6D85-7728-430D-B5E3-DE80B157B340}': 'IAcad3DSolid',
+ '{9738A791-BEAB-4CD7-A8A9-073DD70E6EA8}': 'IAcadSolid',
+ '{9795DB9A-9E35-4375-8319-C921158C1031}': 'IAcadPointCloud',
+ '{9843B548-135F-4D5F-B6D6-D2F5A05CC5BF}': 'IAcadDimRadialLarge',
+ '{9851A647-E643-4843-B238-A100D58A7D02}': 'IAcadExternalReference',
+ '{9950A0BC-5EE1-46AB-BAA4-944C9D08B5EE}': 'IAcadSubEntSolidFace',
+ '{99C34003-A664-4B66-A0BE-796AF232363C}': 'IAcadSortentsTable',
+ '{99E613C9-9B3B-43B2-99B7-76DA8877C37E}': 'IAcadArc',
+ '{9A35FF5D-4A0B-4D39-A7BE-7B3CC8BCF2A5}': 'IAcadHyperlink',
+ '{9C06F3CB-EC8E-4867-8206-E82E416FBBB2}': 'IAcadPolyline',
+ '{9E96260D-1062-425D-BBAC-9EA82B28ECCD}': 'IAcadGeomapImage',
+ '{9EFC13E4-0EAC-4F33-801C-92C58D395A80}': 'IAcadSectionManager',
+ '{9FD0CC74-DC4B-46C8-ABEE-F45D6E26BBEA}': 'IAcadGroup',
+ '{A4BFDBD0-25EC-4B40-B311-C0DA89FAE8AF}': 'IAcadDimAngular',
+ '{A5056C37-BBC1-45C2-BB47-CE7EAC5FEC71}': 'IAcadPopupMenuItem',
+ '{A6F3E13A-4B40-485A-8D04-0891ABED5C4E}': 'IAcadPreferencesSystem',
+ '{A8831D23-6E0E-4EAE-B25B-DB141DCED07A}': 'IAcadMenuGroups',
+ '{A994ADDF-69D4-401B-8ED5-03D0E797AB3B}': 'IAcadEntity',
+ '{A9B25C92-3BA6-4F4B-A4A5-321FBA5DB265}': 'IAcadDim3PointAngular',
+ '{A9B8EA6A-59E1-4866-99C6-A0ADF5C1DB9D}': 'IAcadLineTypes',
+ '{AD1EC292-2871-4402-98A0-BF264DD91CA5}': 'IAcadShadowDisplay',
+ '{AEC51C60-17CD-4380-B43B-29949333EB31}': 'IAcadSubDMesh',
+ '{AF1A4BE3-A001-4A86-AC6E-934F8F066236}': 'IAcadLoftedSurface',
+ '{B0EDCB9D-4A42-4259-92DD-3C5C67730649}': 'IAcadHatch',
+ '{B192B42B-55A6-4110-B193-9830A754A203}': 'IAcadApplication',
+ '{B1C3F89C-366A-41D0-9FFD-B49D47D0149B}': 'IAcadBlockReference',
+ '{B3DD284E-E57E-4155-B743-646A1D95EADB}': 'IAcadPreferencesFiles',
+ '{B3F1B426-55A0-4DFB-A8C1-6E604B3E253E}': 'IAcadRay',
+ '{B51B5AA4-EE75-47D3-A298-22D7D80B1384}': 'IAcadPreferencesDisplay',
+ '{B5C35766-BF84-4C7A-81D7-9094A48C9595}': 'IAcadLayer',
+ '{B7863A95-DBBD-45A5-9F7B-D0C31A52A99B}': 'IAcadViewport',
+ '{B8A5C16D-015F-48E8-A20D-5CAA572827B0}': 'IAcadWipeout',
+ '{BB025CEB-5C3B-4BD2-AAC0-AA4A31593012}': 'IAcadPlaneSurface',
+ '{BB798354-9B4D-496A-98F6-C5D80CB74C25}': 'IAcadMLine',
+ '{BEB07BF0-2EE8-4DD0-9838-36E9FE9CFA62}': 'IAcadShape',
+ '{BF5FB993-04F6-4402-B218-D674CE019C2D}': 'IAcadPointCloudEx',
+ '{C2449FDA-973B-4848-BFE8-6A7A666BB67B}': 'IAcadMaterials',
+ '{C689FDBE-42D1-4DA3-AB0E-70B943C373D3}': 'IAcadHelix',
+ '{C83F156E-B1CB-4C5F-BD1C-1BA6DAC0DF58}': 'IAcadPlot',
+ '{CB6632B6-D6C7-488E-99A1-C2C4CB0E6EDA}': 'IAcadLineType',
+ '{CB76E0DB-8EB9-4143-B9EF-9260E929EE75}': 'IAcadDocuments',
+ '{CBED104B-D35B-4C65-B2A3-95E72B2F2E0F}': 'IAcadToolbarItem',
+ '{CED2C7FF-7B16-4BC5-A101-9DBFC6078894}': 'IAcadTextStyle',
+ '{CF76D2FB-D581-48A4-B9B6-A27A9A6ED94A}': 'IAcadSubDMeshVertex',
+ '{D14872AB-51EC-415F-B9C0-53A501044A0B}': 'IAcadDimension',
+ '{D3CDA679-7206-4895-9B57-B57046501748}': 'IAcadMLeader',
+ '{D48AD610-6EE0-4583-B1CB-6E57D159FBEF}': 'IAcadPlotConfiguration',
+ '{D665B22F-A463-4055-A829-91AA3D70F779}': 'IAcadDimAligned',
+ '{DCB8E0AA-3454-427B-9A85-776D7EE61C7E}': 'IAcadDatabase',
+ '{DE365AE8-E7B5-4A94-B7C9-FDF9A0749CBF}': 'IAcadLeader',
+ '{E0D2B3ED-6F94-47FD-9526-598B3C82B13E}': 'IAcadXline',
+ '{E1D6157B-1392-4D3C-BAF3-96843EC5998E}': 'IAcadDictionaries',
+ '{E1F8E208-BA80-46AB-9C38-7B6E436BEA22}': 'IAcadLayers',
+ '{E7F9CCFF-F9E8-4DC5-A7C4-54CD5A31BB8C}': 'IAcadSubDMeshEdge',
+ '{E95D8080-A822-4CA3-9198-D69586E950B0}': 'IAcadLayouts',
+ '{E99FECF0-EE68-4314-8D48-D0639B562A5B}': 'IAcadSpline',
+ '{EACCD7BE-5CE7-42C0-BAF6-8BCEF8EE75B5}': 'IAcadView',
+ '{EBE41C9B-1BD0-4B96-8F5A-216B41AC5E7C}': 'IAcadTableStyle',
+ '{EDA86C2F-CD35-479F-917C-97057FCFCD62}': 'IAcadTextStyles',
+ '{F169FD24-2A7D-4EAC-9733-9F3E2AC3B705}': 'IAcadSelectionSets',
+ '{F65F62C6-D183-45E5-B8A3-5F553D0C0CFF}': 'IAcadDimRotated',
+ '{F95B3EB4-9AE0-4807-BF9C-9059ADF9DD54}': 'IAcadSweptSurface',
+ '{FACABB83-2275-41D0-88AE-1D871E1511C1}': 'IAcadSubEntSolidNode'}
+
+NamesToIIDMap = {'IAcad3DFace': '{13D301B6-7060-47D0-8537-71E4AFFEAB2E}',
+ 'IAcad3DPolyline': '{90B3BA9A-1EAC-4D66-88BB-4B27FE7E0A1A}',
+ 'IAcad3DSolid': '{96EB6D85-7728-430D-B5E3-DE80B157B340}',
+ 'IAcadAcCmColor': '{2F61A748-305D-4030-9740-7D571E8BD65B}',
+ 'IAcadApplication': '{B192B42B-55A6-4110-B193-9830A754A203}',
+ 'IAcadArc': '{99E613C9-9B3B-43B2-99B7-76DA8877C37E}',
+ 'IAcadAttribute': '{1702345E-1B6A-437B-8841-D104D7034C6F}',
+ 'IAcadAttributeReference': '{9441B64F-EA94-4868-9B9E-7A95B1327F77}',
+ 'IAcadBlock': '{470774D9-BD44-4668-A8FF-70F0AB1813CB}',
+ 'IAcadBlockReference': '{B1C3F89C-366A-41D0-9FFD-B49D47D0149B}',
+ 'IAcadBlocks': '{66C13FAE-9205-4CC0-8AEA-FEFC13644A4A}',
+ 'IAcadCircle': '{32A08AE9-632C-46F9-936A-7A0D6D02663B}',
+ 'IAcadComparedReference': '{1115399A-AF5E-45E3-923D-949CE6C142D3}',
+ 'IAcadDatabase': '{DCB8E0AA-3454-427B-9A85-776D7EE61C7E}',
+ 'IAcadDatabasePreferences': '{0DA12866-87FE-4847-9B99-8519BE647A9D}',
+ 'IAcadDictionaries': '{E1D6157B-1392-4D3C-BAF3-96843EC5998E}',
+ 'IAcadDictionary': '{02F41C12-203E-43A0-9D81-25EB2DD196AF}',
+ 'IAcadDim3PointAngular': '{A9B25C92-3BA6-4F4B-A4A5-321FBA5DB265}',
+ 'IAcadDimAligned': '{D665B22F-A463-4055-A829-91AA3D70F779}',
+ 'IAcadDimAngular': '{A4BFDBD0-25EC-4B40-B311-C0DA89FAE8AF}',
+ 'IAcadDimArcLength': '{6C490300-E8E6-4DF6-90C1-AC3D599505D2}',
+ 'IAcadDimDiametric': '{7881B431-1619-4CF4-8235-CC70CEAEAD8C}',
+ 'IAcadDimOrdinate': '{686E8EB8-9841-41F2-8C1A-EE78FA8D0DCD}',
+ 'IAcadDimRadial': '{91FE107E-1179-427C-9554-3D2BC9E953C1}',
+ 'IAcadDimRadialLarge': '{9843B548-135F-4D5F-B6D6-D2F5A05CC5BF}',
+ 'IAcadDimRotated': '{F65F62C6-D183-45E5-B8A3-5F553D0C0CFF}',
+ 'IAcadDimStyle': '{74615498-0E34-46DF-A5C7-1793CF2A3171}',
+ 'IAcadDimStyles': '{51DF5AF2-9521-44C8-8F15-F94AF9989FB3}',
+ 'IAcadDimension': '{D14872AB-51EC-415F-B9C0-53A501044A0B}',
+ 'IAcadDocument': '{33C800EE-ECF8-4602-9A55-2B59DAC0F496}',
+ 'IAcadDocuments': '{CB76E0DB-8EB9-4143-B9EF-9260E929EE75}',
+ 'IAcadDwfUnderlay': '{8B7073CF-6130-4B8D-814E-A1067D117BCA}',
+ 'IAcadDynamicBlockReferenceProperty': '{05058D12-4312-45BA-B637-35D9ED4BF8DC}',
+ 'IAcadEllipse': '{2410CFB8-BB78-4B1F-85D1-A6EC290681F8}',
+ 'IAcadEntity': '{A994ADDF-69D4-401B-8ED5-03D0E797AB3B}',
+ 'IAcadExternalReference': '{9851A647-E643-4843-B238-A100D58A7D02}',
+ 'IAcadExtrudedSurface': '{616EE3BB-091A-41D1-B040-6DDF37D10084}',
+ 'IAcadGeoPositionMarker': '{8D275808-762F-41F8-A25E-ABD706B4713D}',
+ 'IAcadGeomapImage': '{9E96260D-1062-425D-BBAC-9EA82B28ECCD}',
+ 'IAcadGroup': '{9FD0CC74-DC4B-46C8-ABEE-F45D6E26BBEA}',
+ 'IAcadGroups': '{16CC6C90-EC82-4CB9-834E-D25B776DDF3E}',
+ 'IAcadHatch': '{B0EDCB9D-4A42-4259-92DD-3C5C67730649}',
+ 'IAcadHelix': '{C689FDBE-42D1-4DA3-AB0E-70B943C373D3}',
+ 'IAcadHyperlink': '{9A35FF5D-4A0B-4D39-A7BE-7B3CC8BCF2A5}',
+ 'IAcadHyperlinks': '{32EC4949-D442-4B46-B3AB-B97C19E378B9}',
+ 'IAcadIdPair': '{964D538C-10E6-4D05-A708-E1408C18C6DF}',
+ 'IAcadLWPolyline': '{365FEF00-D730-41E7-BE17-C5767CB27E74}',
+ 'IAcadLayer': '{B5C35766-BF84-4C7A-81D7-9094A48C9595}',
+ 'IAcadLayerStateManager': '{096E285B-2EDE-4E26-A497-2100024E1AC9}',
+ 'IAcadLayers': '{E1F8E208-BA80-46AB-9C38-7B6E436BEA22}',
+ 'IAcadLayout': '{43D32A8F-1D5F-4EAC-AA0E-2D51AF3B5166}',
+ 'IAcadLayouts': '{E95D8080-A822-4CA3-9198-D69586E950B0}',
+ 'IAcadLeader': '{DE365AE8-E7B5-4A94-B7C9-FDF9A0749CBF}',
+ 'IAcadLine': '{0C3FF8D9-DF63-4B64-8291-B04431B64553}',
+ 'IAcadLineType': '{CB6632B6-D6C7-488E-99A1-C2C4CB0E6EDA}',
+ 'IAcadLineTypes': '{A9B8EA6A-59E1-4866-99C6-A0ADF5C1DB9D}',
+ 'IAcadLoftedSurface': '{AF1A4BE3-A001-4A86-AC6E-934F8F066236}',
+ 'IAcadMInsertBlock': '{74A82370-EFAA-4E44-8ECC-B3E4B9BAE220}',
+ 'IAcadMLeader': '{D3CDA679-7206-4895-9B57-B57046501748}',
+ 'IAcadMLeaderLeader': '{76FF4D98-BD59-402C-A2BD-8D44FCC653A7}',
+ 'IAcadMLeaderStyle': '{0EEC861A-8D62-48EA-9E3A-6E9F01049413}',
+ 'IAcadMLine': '{BB798354-9B4D-496A-98F6-C5D80CB74C25}',
+ 'IAcadMText': '{40294D17-F10C-4A4C-B73A-53DF64E91750}',
+ 'IAcadMaterial': '{6938CF0F-988C-4414-B02E-1590AF2D5B70}',
+ 'IAcadMaterials': '{C2449FDA-973B-4848-BFE8-6A7A666BB67B}',
+ 'IAcadMenuBar': '{7A8761CD-22B8-4893-B4E9-3A8EBACD8F8F}',
+ 'IAcadMenuGroup': '{26068652-EBBC-413D-9913-6EDA9447ABAC}',
+ 'IAcadMenuGroups': '{A8831D23-6E0E-4EAE-B25B-DB141DCED07A}',
+ 'IAcadModelSpace': '{8D539A4B-DF03-4DA7-B9DC-659C2E764AE4}',
+ 'IAcadNurbSurface': '{8D680860-D711-4D3C-A457-F2C27B2485EA}',
+ 'IAcadObject': '{2D145760-58B6-4C21-80F2-F90683AA34D6}',
+ 'IAcadObjectEvents': '{1DD64288-95FB-4B3B-AABE-A98047186E7F}',
+ 'IAcadOle': '{7354883A-8F64-4BF2-8ED0-5B8C9831FBD6}',
+ 'IAcadPViewport': '{57CA25FF-D62F-4428-B6CB-40DF872B6C00}',
+ 'IAcadPaperSpace': '{4243348F-38C7-4192-95DD-75B86C0CF747}',
+ 'IAcadPlaneSurface': '{BB025CEB-5C3B-4BD2-AAC0-AA4A31593012}',
+ 'IAcadPlot': '{C83F156E-B1CB-4C5F-BD1C-1BA6DAC0DF58}',
+ 'IAcadPlotConfiguration': '{D48AD610-6EE0-4583-B1CB-6E57D159FBEF}',
+ 'IAcadPlotConfigurations': '{7FE1CC3C-FB11-4850-95BA-CC760C25CA61}',
+ 'IAcadPoint': '{4B6BF600-69F2-4174-9681-3FB992DE68AA}',
+ 'IAcadPointCloud': '{9795DB9A-9E35-4375-8319-C921158C1031}',
+ 'IAcadPointCloudEx': '{BF5FB993-04F6-4402-B218-D674CE019C2D}',
+ 'IAcadPointCloudEx2': '{5FAE2AF4-9E27-487E-87BD-4D431D9830DD}',
+ 'IAcadPolyfaceMesh': '{91F38DDE-2027-4194-B934-522879589ECE}',
+ 'IAcadPolygonMesh': '{152E9E5F-D4ED-41FD-A64D-D7CE3502838C}',
+ 'IAcadPolyline': '{9C06F3CB-EC8E-4867-8206-E82E416FBBB2}',
+ 'IAcadPopupMenu': '{8CA4D495-B5A9-4AE0-8E27-950FC98F0074}',
+ 'IAcadPopupMenuItem': '{A5056C37-BBC1-45C2-BB47-CE7EAC5FEC71}',
+ 'IAcadPopupMenus': '{067DFE3B-FB40-4AB8-852E-0948D38FFB04}',
+ 'IAcadPreferences': '{13D665E2-124F-419E-A01D-F16AF31E5DBD}',
+ 'IAcadPreferencesDisplay': '{B51B5AA4-EE75-47D3-A298-22D7D80B1384}',
+ 'IAcadPreferencesDrafting': '{259D0200-8753-4E10-8046-D7B84A65671F}',
+ 'IAcadPreferencesFiles': '{B3DD284E-E57E-4155-B743-646A1D95EADB}',
+ 'IAcadPreferencesOpenSave': '{5C046358-7A58-4FBC-916E-7663FC6EDD55}',
+ 'IAcadPreferencesOutput': '{7CBC97A1-0F94-4CAB-B3DF-E75291CAF734}',
+ 'IAcadPreferencesProfiles': '{0A1C8034-0564-442D-B3CC-EB584503FB2B}',
+ 'IAcadPreferencesSelection': '{31299D74-0A9D-427B-879D-4AFE119E1D6A}',
+ 'IAcadPreferencesSystem': '{A6F3E13A-4B40-485A-8D04-0891ABED5C4E}',
+ 'IAcadPreferencesUser': '{62DA3724-7EC5-4B46-A126-C7B58AE24667}',
+ 'IAcadRasterImage': '{29141A40-B1DF-40B9-AF5F-1A81C30FFF15}',
+ 'IAcadRay': '{B3F1B426-55A0-4DFB-A8C1-6E604B3E253E}',
+ 'IAcadRegion': '{82049DA4-1AF2-4195-9971-BD0AE2158171}',
+ 'IAcadRegisteredApplication': '{6B33301A-DA0F-494A-B0B7-409FE008926A}',
+ 'IAcadRegisteredApplications': '{5B204236-EC68-434A-8C90-B2F85745A106}',
+ 'IAcadRevolvedSurface': '{73939411-AA70-4D8D-BB1B-6698CB79A03B}',
+ 'IAcadSection': '{41BCF9E2-095F-4F15-B82A-30621FFDFF4F}',
+ 'IAcadSection2': '{4387ACAD-56E5-43CC-A527-CBA0CAE2D666}',
+ 'IAcadSectionManager': '{9EFC13E4-0EAC-4F33-801C-92C58D395A80}',
+ 'IAcadSectionSettings': '{477AB6A8-9FC0-4F2F-82A4-3D2DD713263D}',
+ 'IAcadSectionTypeSettings': '{4C9EBAD1-D6D1-4794-B1AF-6536E2D50731}',
+ 'IAcadSectionTypeSettings2': '{923778AC-3B43-495A-9E31-AB88BD8A2F19}',
+ 'IAcadSecurityParams': '{9284DD1F-2C38-4ECD-8F2A-946DF797CB6C}',
+ 'IAcadSelectionSet': '{1BD99919-914E-4A0F-A5FD-758F838D91C9}',
+ 'IAcadSelectionSets': '{F169FD24-2A7D-4EAC-9733-9F3E2AC3B705}',
+ 'IAcadShadowDisplay': '{AD1EC292-2871-4402-98A0-BF264DD91CA5}',
+ 'IAcadShape': '{BEB07BF0-2EE8-4DD0-9838-36E9FE9CFA62}',
+ 'IAcadSolid': '{9738A791-BEAB-4CD7-A8A9-073DD70E6EA8}',
+ 'IAcadSortentsTable': '{99C34003-A664-4B66-A0BE-796AF232363C}',
+ 'IAcadSpline': '{E99FECF0-EE68-4314-8D48-D0639B562A5B}',
+ 'IAcadState': '{51995227-8BBD-4D35-B0EB-614FC9D1A8A8}',
+ 'IAcadSubDMesh': '{AEC51C60-17CD-4380-B43B-29949333EB31}',
+ 'IAcadSubDMeshEdge': '{E7F9CCFF-F9E8-4DC5-A7C4-54CD5A31BB8C}',
+ 'IAcadSubDMeshFace': '{64DF1C36-9FB3-4D1A-B002-DACDC7150E7A}',
+ 'IAcadSubDMeshVertex': '{CF76D2FB-D581-48A4-B9B6-A27A9A6ED94A}',
+ 'IAcadSubEntSolidEdge': '{7297824E-3FC3-4071-9F39-250CD3B0B91C}',
+ 'IAcadSubEntSolidFace': '{9950A0BC-5EE1-46AB-BAA4-944C9D08B5EE}',
+ 'IAcadSubEntSolidNode': '{FACABB83-2275-41D0-88AE-1D871E1511C1}',
+ 'IAcadSubEntSolidVertex': '{032B9C59-A9C9-424D-A0CA-B4D280133758}',
+ 'IAcadSubEntity': '{42645896-9B09-43F8-8B9B-B19F5F90D39D}',
+ 'IAcadSummaryInfo': '{50413BFA-4A78-4566-9863-3CFCDECC264C}',
+ 'IAcadSurface': '{49B06252-7B16-4EBF-94D7-E3352CE8FFE2}',
+ 'IAcadSweptSurface': '{F95B3EB4-9AE0-4807-BF9C-9059ADF9DD54}',
+ 'IAcadTable': '{7BB9C1F7-814D-4891-9141-F0814333DBA2}',
+ 'IAcadTableStyle': '{EBE41C9B-1BD0-4B96-8F5A-216B41AC5E7C}',
+ 'IAcadText': '{3FADAC5A-EEF7-4F9D-A3C9-43C788704232}',
+ 'IAcadTextStyle': '{CED2C7FF-7B16-4BC5-A101-9DBFC6078894}',
+ 'IAcadTextStyles': '{EDA86C2F-CD35-479F-917C-97057FCFCD62}',
+ 'IAcadTolerance': '{80A68D8C-EC85-48AA-A7B5-905EEE05033D}',
+ 'IAcadToolbar': '{6651A2C4-D16D-48E5-B39E-2B6FC1F49EB1}',
+ 'IAcadToolbarItem': '{CBED104B-D35B-4C65-B2A3-95E72B2F2E0F}',
+ 'IAcadToolbars': '{5F92E262-E8AC-459E-B000-423D27D6ABFD}',
+ 'IAcadTrace': '{6C872F03-21B7-43C4-B9A0-370A1ECF8682}',
+ 'IAcadUCS': '{28E02F28-2DA5-4266-A7DF-E3E601308108}',
+ 'IAcadUCSs': '{8435BF60-99BE-4A87-BE03-15EBA7388635}',
+ 'IAcadUnderlay': '{6165EB95-5042-4E51-B2BA-C678C9322569}',
+ 'IAcadUtility': '{5E7DEE74-BB82-4FB9-933A-4B73D122CF63}',
+ 'IAcadView': '{EACCD7BE-5CE7-42C0-BAF6-8BCEF8EE75B5}',
+ 'IAcadViewport': '{B7863A95-DBBD-45A5-9F7B-D0C31A52A99B}',
+ 'IAcadViewports': '{27305D3B-EF3A-470F-B920-806198B54E1C}',
+ 'IAcadViews': '{7D3D3E3B-5C66-4FBB-A571-6FBE2E29B352}',
+ 'IAcadWipeout': '{B8A5C16D-015F-48E8-A20D-5CAA572827B0}',
+ 'IAcadXRecord': '{7E161A14-71DA-420B-8C74-1785EB29EA84}',
+ 'IAcadXline': '{E0D2B3ED-6F94-47FD-9526-598B3C82B13E}',
+ '_DAcadApplicationEvents': '{D5AE6E12-0DB9-4CA0-87FF-4BC95117FDB2}',
+ '_DAcadDocumentEvents': '{4116B1E0-E449-46B9-A903-E2A4B85B02F3}'}
+
+# enum -> 'member=value member=value ...'
+ENUMS = {'Ac3DPolylineType': 'acCubicSpline3DPoly=2 acQuadSpline3DPoly=1 acSimple3DPoly=0',
+ 'AcARXDemandLoad': 'acDemanLoadDisable=0 acDemandLoadCmdInvoke=2 acDemandLoadOnObjectDetect=1',
+ 'AcActiveSpace': 'acModelSpace=1 acPaperSpace=0',
+ 'AcAlignment': 'acAlignmentAligned=3 acAlignmentBottomCenter=13 acAlignmentBottomLeft=12 acAlignmentBottomRight=14 '
+                'acAlignmentCenter=1 acAlignmentFit=5 acAlignmentLeft=0 acAlignmentMiddle=4 acAlignmentMiddleCenter=10 '
+                'acAlignmentMiddleLeft=9 acAlignmentMiddleRight=11 acAlignmentRight=2 acAlignmentTopCenter=7 '
+                'acAlignmentTopLeft=6 acAlignmentTopRight=8',
+ 'AcAlignmentPointAcquisition': 'acAlignPntAcquisitionAutomatic=0 acAlignPntAcquisitionShiftToAcquire=1',
+ 'AcAngleUnits': 'acDegreeMinuteSeconds=1 acDegrees=0 acGrads=2 acRadians=3',
+ 'AcAttachmentPoint': 'acAttachmentPointBottomCenter=8 acAttachmentPointBottomLeft=7 acAttachmentPointBottomRight=9 '
+                      'acAttachmentPointMiddleCenter=5 acAttachmentPointMiddleLeft=4 acAttachmentPointMiddleRight=6 '
+                      'acAttachmentPointTopCenter=2 acAttachmentPointTopLeft=1 acAttachmentPointTopRight=3',
+ 'AcAttributeMode': 'acAttributeModeConstant=2 acAttributeModeInvisible=1 acAttributeModeLockPosition=16 '
+                    'acAttributeModeMultipleLine=32 acAttributeModeNormal=0 acAttributeModePreset=8 '
+                    'acAttributeModeVerify=4',
+ 'AcBlockConnectionType': 'acConnectBase=1 acConnectExtents=0',
+ 'AcBlockScaling': 'acAny=0 acUniform=1',
+ 'AcBoolean': 'acFalse=0 acTrue=1',
+ 'AcBooleanType': 'acIntersection=1 acSubtraction=2 acUnion=0',
+ 'AcCellAlignment': 'acBottomCenter=8 acBottomLeft=7 acBottomRight=9 acMiddleCenter=5 acMiddleLeft=4 acMiddleRight=6 '
+                    'acTopCenter=2 acTopLeft=1 acTopRight=3',
+ 'AcCellContentLayout': 'acCellContentLayoutFlow=1 acCellContentLayoutStackedHorizontal=2 '
+                        'acCellContentLayoutStackedVertical=4',
+ 'AcCellContentType': 'acCellContentTypeBlock=4 acCellContentTypeField=2 acCellContentTypeUnknown=0 '
+                      'acCellContentTypeValue=1',
+ 'AcCellEdgeMask': 'acBottomMask=4 acLeftMask=8 acRightMask=2 acTopMask=1',
+ 'AcCellMargin': 'acCellMarginBottom=4 acCellMarginHorzSpacing=16 acCellMarginLeft=2 acCellMarginRight=8 '
+                 'acCellMarginTop=1 acCellMarginVertSpacing=32',
+ 'AcCellOption': 'kCellOptionNone=0 kInheritCellFormat=1',
+ 'AcCellProperty': 'acAlignmentProperty=32 acAllCellProperties=524287 acAutoScale=32768 acBackgroundColor=128 '
+                   'acBitProperties=245760 acContentColor=64 acContentLayout=262144 acContentProperties=33662 '
+                   'acDataFormat=4 acDataType=2 acDataTypeAndFormat=6 acEnableBackgroundColor=16384 '
+                   'acFlowDirBtoT=131072 acInvalidCellProperty=0 acLock=1 acMarginBottom=8192 acMarginLeft=1024 '
+                   'acMarginRight=4096 acMarginTop=2048 acMergeAll=65536 acRotation=8 acScale=16 acTextHeight=512 '
+                   'acTextStyle=256',
+ 'AcCellState': 'acCellStateContentLocked=1 acCellStateContentModified=32 acCellStateContentReadOnly=2 '
+                'acCellStateFormatLocked=4 acCellStateFormatModified=64 acCellStateFormatReadOnly=8 '
+                'acCellStateLinked=16 acCellStateNone=0',
+ 'AcCellType': 'acBlockCell=2 acTextCell=1 acUnknownCell=0',
+ 'AcColor': 'acBlue=5 acByBlock=0 acByLayer=256 acCyan=4 acGreen=3 acMagenta=6 acRed=1 acWhite=7 acYellow=2',
+ 'AcColorMethod': 'acColorMethodByACI=195 acColorMethodByBlock=193 acColorMethodByLayer=192 acColorMethodByRGB=194 '
+                  'acColorMethodForeground=197',
+ 'AcCoordinateSystem': 'acDisplayDCS=2 acOCS=4 acPaperSpaceDCS=3 acUCS=1 acWorld=0',
+ 'AcDataLinkUpdateDirection': 'acUpdateDataFromSource=1 acUpdateSourceFromData=2',
+ 'AcDataLinkUpdateOption': 'acUpdateOptionIncludeXrefs=1048576 acUpdateOptionNone=0 '
+                           'acUpdateOptionOverwriteContentModifiedAfterUpdate=131072 '
+                           'acUpdateOptionOverwriteFormatModifiedAfterUpdate=262144 '
+                           'acUpdateOptionUpdateFullSourceRange=524288',
+ 'AcDimArcLengthSymbol': 'acSymAbove=1 acSymInFront=0 acSymNone=2',
+ 'AcDimArrowheadType': 'acArrowArchTick=4 acArrowBoxBlank=14 acArrowBoxFilled=15 acArrowClosed=2 acArrowClosedBlank=1 '
+                       'acArrowDatumBlank=16 acArrowDatumFilled=17 acArrowDefault=0 acArrowDot=3 acArrowDotBlank=12 '
+                       'acArrowDotSmall=11 acArrowIntegral=18 acArrowNone=19 acArrowOblique=5 acArrowOpen=6 '
+                       'acArrowOpen30=10 acArrowOpen90=9 acArrowOrigin=7 acArrowOrigin2=8 acArrowSmall=13 '
+                       'acArrowUserDefined=20',
+ 'AcDimCenterType': 'acCenterLine=1 acCenterMark=0 acCenterNone=2',
+ 'AcDimFit': 'acArrowsOnly=1 acBestFit=3 acTextAndArrows=0 acTextOnly=2',
+ 'AcDimFractionType': 'acDiagonal=1 acHorizontal=0 acNotStacked=2',
+ 'AcDimHorizontalJustification': 'acFirstExtensionLine=1 acHorzCentered=0 acOverFirstExtension=3 '
+                                 'acOverSecondExtension=4 acSecondExtensionLine=2',
+ 'AcDimLUnits': 'acDimLArchitectural=4 acDimLDecimal=2 acDimLEngineering=3 acDimLFractional=5 acDimLScientific=1 '
+                'acDimLWindowsDesktop=6',
+ 'AcDimPrecision': 'acDimPrecisionEight=8 acDimPrecisionFive=5 acDimPrecisionFour=4 acDimPrecisionOne=1 '
+                   'acDimPrecisionSeven=7 acDimPrecisionSix=6 acDimPrecisionThree=3 acDimPrecisionTwo=2 '
+                   'acDimPrecisionZero=0',
+ 'AcDimTextMovement': 'acDimLineWithText=0 acMoveTextAddLeader=1 acMoveTextNoLeader=2',
+ 'AcDimToleranceJustify': 'acTolBottom=0 acTolMiddle=1 acTolTop=2',
+ 'AcDimToleranceMethod': 'acTolBasic=4 acTolDeviation=2 acTolLimits=3 acTolNone=0 acTolSymmetrical=1',
+ 'AcDimUnits': 'acDimArchitectural=6 acDimArchitecturalStacked=4 acDimDecimal=2 acDimEngineering=3 acDimFractional=7 '
+               'acDimFractionalStacked=5 acDimScientific=1 acDimWindowsDesktop=8',
+ 'AcDimVerticalJustification': 'acAbove=1 acJIS=3 acOutside=2 acUnder=4 acVertCentered=0',
+ 'AcDragDisplayMode': 'acDragDisplayAutomatically=2 acDragDisplayOnRequest=1 acDragDoNotDisplay=0',
+ 'AcDrawLeaderOrderType': 'acDrawLeaderHeadFirst=0 acDrawLeaderTailFirst=1',
+ 'AcDrawMLeaderOrderType': 'acDrawContentFirst=0 acDrawLeaderFirst=1',
+ 'AcDrawingAreaSCMCommand': 'acEnableSCM=2 acEnableSCMOptions=1 acEnter=0',
+ 'AcDrawingAreaSCMDefault': 'acRepeatLastCommand=0 acSCM=1',
+ 'AcDrawingAreaSCMEdit': 'acEdRepeatLastCommand=0 acEdSCM=1',
+ 'AcDrawingAreaShortCutMenu': 'acNoDrawingAreaShortCutMenu=0 acUseDefaultDrawingAreaShortCutMenu=1',
+ 'AcDrawingDirection': 'acBottomToTop=4 acByStyle=5 acLeftToRight=1 acRightToLeft=2 acTopToBottom=3',
+ 'AcDynamicBlockReferencePropertyUnitsType': 'acAngular=1 acArea=3 acDistance=2 acNoUnits=0',
+ 'AcEntityName': 'ac3dFace=1 ac3dPolyline=2 ac3dSolid=3 acArc=4 acAttribute=5 acAttributeReference=6 '
+                 'acBlockReference=7 acCircle=8 acDgnUnderlay=47 acDim3PointAngular=41 acDimAligned=9 acDimAngular=10 '
+                 'acDimArcLength=44 acDimDiametric=12 acDimOrdinate=13 acDimRadial=14 acDimRadialLarge=45 '
+                 'acDimRotated=15 acDwfUnderlay=46 acEllipse=16 acExternalReference=42 acGroup=37 acHatch=17 '
+                 'acLeader=18 acLine=19 acMInsertBlock=38 acMLeader=48 acMLine=40 acMtext=21 acNurbSurface=51 '
+                 'acPViewport=35 acPdfUnderlay=50 acPoint=22 acPolyfaceMesh=39 acPolyline=23 acPolylineLight=24 '
+                 'acPolymesh=25 acRaster=26 acRay=27 acRegion=28 acShape=29 acSolid=30 acSpline=31 acSubDMesh=49 '
+                 'acTable=43 acText=32 acTolerance=33 acTrace=34 acXline=36',
+ 'AcExtendOption': 'acExtendBoth=3 acExtendNone=0 acExtendOtherEntity=2 acExtendThisEntity=1',
+ 'AcFormatOption': 'acForEditing=1 acForExpression=2 acIgnoreMtextFormat=8 acUseMaximumPrecision=4 kFormatOptionNone=0',
+ 'AcGradientPatternType': 'acPreDefinedGradient=0 acUserDefinedGradient=1',
+ 'AcGridLineStyle': 'acGridLineStyleDouble=2 acGridLineStyleSingle=1',
+ 'AcGridLineType': 'acHorzBottom=4 acHorzInside=2 acHorzTop=1 acInvalidGridLine=0 acVertInside=16 acVertLeft=8 '
+                   'acVertRight=32',
+ 'AcHatchObjectType': 'acGradientObject=1 acHatchObject=0',
+ 'AcHatchStyle': 'acHatchStyleIgnore=2 acHatchStyleNormal=0 acHatchStyleOuter=1',
+ 'AcHelixConstrainType': 'acHeight=2 acTurnHeight=0 acTurns=1',
+ 'AcHelixTwistType': 'acCCW=0 acCW=1',
+ 'AcHorizontalAlignment': 'acHorizontalAlignmentAligned=3 acHorizontalAlignmentCenter=1 acHorizontalAlignmentFit=5 '
+                          'acHorizontalAlignmentLeft=0 acHorizontalAlignmentMiddle=4 acHorizontalAlignmentRight=2',
+ 'AcISOPenWidth': 'acPenWidth013=13 acPenWidth018=18 acPenWidth025=25 acPenWidth035=35 acPenWidth050=50 '
+                  'acPenWidth070=70 acPenWidth100=100 acPenWidth140=140 acPenWidth200=200 acPenWidthUnk=-1',
+ 'AcInsertUnits': 'acInsertUnitsAngstroms=11 acInsertUnitsAstronomicalUnits=18 acInsertUnitsCentimeters=5 '
+                  'acInsertUnitsDecameters=15 acInsertUnitsDecimeters=14 acInsertUnitsFeet=2 '
+                  'acInsertUnitsGigameters=17 acInsertUnitsHectometers=16 acInsertUnitsInches=1 '
+                  'acInsertUnitsKilometers=7 acInsertUnitsLightYears=19 acInsertUnitsMeters=6 '
+                  'acInsertUnitsMicroinches=8 acInsertUnitsMicrons=13 acInsertUnitsMiles=3 acInsertUnitsMillimeters=4 '
+                  'acInsertUnitsMils=9 acInsertUnitsNanometers=12 acInsertUnitsParsecs=20 acInsertUnitsUSSurveyFeet=21 '
+                  'acInsertUnitsUSSurveyInch=22 acInsertUnitsUSSurveyMile=24 acInsertUnitsUSSurveyYard=23 '
+                  'acInsertUnitsUnitless=0 acInsertUnitsYards=10',
+ 'AcInsertUnitsAction': 'acInsertUnitsAutoAssign=1 acInsertUnitsPrompt=0',
+ 'AcKeyboardAccelerator': 'acPreferenceClassic=0 acPreferenceCustom=1',
+ 'AcKeyboardPriority': 'acKeyboardEntry=1 acKeyboardEntryExceptScripts=2 acKeyboardRunningObjSnap=0',
+ 'AcLayerStateMask': 'acLsAll=65535 acLsColor=32 acLsFrozen=2 acLsLineType=64 acLsLineWeight=128 acLsLocked=4 '
+                     'acLsNewViewport=16 acLsNone=0 acLsOn=1 acLsPlot=8 acLsPlotStyle=256',
+ 'AcLeaderType': 'acLineNoArrow=0 acLineWithArrow=2 acSplineNoArrow=1 acSplineWithArrow=3',
+ 'AcLineSpacingStyle': 'acLineSpacingStyleAtLeast=1 acLineSpacingStyleExactly=2',
+ 'AcLineWeight': 'acLnWt000=0 acLnWt005=5 acLnWt009=9 acLnWt013=13 acLnWt015=15 acLnWt018=18 acLnWt020=20 acLnWt025=25 '
+                 'acLnWt030=30 acLnWt035=35 acLnWt040=40 acLnWt050=50 acLnWt053=53 acLnWt060=60 acLnWt070=70 '
+                 'acLnWt080=80 acLnWt090=90 acLnWt100=100 acLnWt106=106 acLnWt120=120 acLnWt140=140 acLnWt158=158 '
+                 'acLnWt200=200 acLnWt211=211 acLnWtByBlock=-2 acLnWtByLayer=-1 acLnWtByLwDefault=-3',
+ 'AcLoadPalette': 'acPaletteByDrawing=0 acPaletteBySession=1',
+ 'AcLoftedSurfaceNormalType': 'acAllNormal=5 acEndsNormal=4 acFirstNormal=2 acLastNormal=3 acRuled=0 acSmooth=1 '
+                              'acUseDraftAngles=6',
+ 'AcLoopType': 'acHatchLoopTypeDefault=0 acHatchLoopTypeDerived=4 acHatchLoopTypeExternal=1 acHatchLoopTypePolyline=2 '
+               'acHatchLoopTypeTextbox=8',
+ 'AcMLeaderContentType': 'acBlockContent=1 acMTextContent=2 acNoneContent=0',
+ 'AcMLeaderType': 'acInVisibleLeader=0 acSplineLeader=2 acStraightLeader=1',
+ 'AcMLineJustification': 'acBottom=2 acTop=0 acZero=1',
+ 'AcMeasurementUnits': 'acEnglish=0 acMetric=1',
+ 'AcMenuFileType': 'acMenuFileCompiled=0 acMenuFileSource=1',
+ 'AcMenuGroupType': 'acBaseMenuGroup=0 acPartialMenuGroup=1',
+ 'AcMenuItemType': 'acMenuItem=0 acMenuSeparator=1 acMenuSubMenu=2',
+ 'AcMergeCellStyleOption': 'acMergeCellStyleConvertDuplicatesToOverrides=4 acMergeCellStyleCopyDuplicates=1 '
+                           'acMergeCellStyleIgnoreNewStyles=8 acMergeCellStyleNone=0 '
+                           'acMergeCellStyleOverwriteDuplicates=2',
+ 'AcMeshCreaseType': 'acAlwaysCrease=1 acCreaseByLevel=2 acNoneCrease=0',
+ 'AcOlePlotQuality': 'acOPQHighGraphics=2 acOPQLowGraphics=1 acOPQMonochrome=0',
+ 'AcOleQuality': 'acOQGraphics=2 acOQHighPhoto=4 acOQLineArt=0 acOQPhoto=3 acOQText=1',
+ 'AcOleType': 'acOTEmbedded=2 acOTLink=1 acOTStatic=3',
+ 'AcOnOff': 'acOff=0 acOn=1',
+ 'AcParseOption': 'acParseOptionNone=0 acPreserveMtextFormat=2 acSetDefaultFormat=1',
+ 'AcPatternType': 'acHatchPatternTypeCustomDefined=2 acHatchPatternTypePreDefined=1 acHatchPatternTypeUserDefined=0',
+ 'AcPlotOrientation': 'acPlotOrientationLandscape=1 acPlotOrientationPortrait=0',
+ 'AcPlotPaperUnits': 'acInches=0 acMillimeters=1 acPixels=2',
+ 'AcPlotPolicy': 'acPolicyLegacy=1 acPolicyNamed=0',
+ 'AcPlotPolicyForLegacyDwgs': 'acPolicyLegacyDefault=0 acPolicyLegacyLegacy=2 acPolicyLegacyQuery=1',
+ 'AcPlotPolicyForNewDwgs': 'acPolicyNewDefault=0 acPolicyNewLegacy=1',
+ 'AcPlotRotation': 'ac0degrees=0 ac180degrees=2 ac270degrees=3 ac90degrees=1',
+ 'AcPlotScale': 'ac100_1=32 ac10_1=31 ac1_1=16 ac1_10=21 ac1_100=27 ac1_128in_1ft=1 ac1_16=22 ac1_16in_1ft=4 ac1_2=17 '
+                'ac1_20=23 ac1_2in_1ft=10 ac1_30=24 ac1_32in_1ft=3 ac1_4=18 ac1_40=25 ac1_4in_1ft=8 ac1_5=19 ac1_50=26 '
+                'ac1_64in_1ft=2 ac1_8=20 ac1_8in_1ft=6 ac1ft_1ft=15 ac1in_1ft=12 ac2_1=28 ac3_16in_1ft=7 '
+                'ac3_32in_1ft=5 ac3_4in_1ft=11 ac3_8in_1ft=9 ac3in_1ft=13 ac4_1=29 ac6in_1ft=14 ac8_1=30 '
+                'acScaleToFit=0',
+ 'AcPlotType': 'acDisplay=0 acExtents=1 acLayout=5 acLimits=2 acView=3 acWindow=4',
+ 'AcPointCloudColorType': 'acByColor=1 acTrueColor=0',
+ 'AcPointCloudExStylizationType': 'acClassification=5 acElevation=4 acIntensities=3 acNormals=2 acObject=1 acRGB=0',
+ 'AcPointCloudIntensityStyle': 'acIntensityBlue=4 acIntensityEditableFlag=5 acIntensityGrayscale=0 acIntensityGreen=3 '
+                               'acIntensityRainbow=1 acIntensityRed=2',
+ 'AcPointCloudStylizationType': 'acIntensity=3 acNormal=2 acObjectColor=1 acScanColor=0',
+ 'AcPolylineType': 'acCubicSplinePoly=3 acFitCurvePoly=1 acQuadSplinePoly=2 acSimplePoly=0',
+ 'AcPolymeshType': 'acBezierSurfaceMesh=8 acCubicSurfaceMesh=6 acQuadSurfaceMesh=5 acSimpleMesh=0',
+ 'AcPredefBlockType': 'acBlockBox=3 acBlockCircle=2 acBlockHexagon=4 acBlockImperial=0 acBlockSlot=1 acBlockTriangle=5 '
+                      'acBlockUserDefined=6',
+ 'AcPreviewMode': 'acFullPreview=1 acPartialPreview=0',
+ 'AcPrinterSpoolAlert': 'acPrinterAlertOnce=1 acPrinterAlwaysAlert=0 acPrinterNeverAlert=3 '
+                        'acPrinterNeverAlertLogOnce=2',
+ 'AcProxyImage': 'acProxyBoundingBox=2 acProxyNotShow=0 acProxyShow=1',
+ 'AcRegenType': 'acActiveViewport=0 acAllViewports=1',
+ 'AcRotationAngle': 'acDegrees000=0 acDegrees090=1 acDegrees180=2 acDegrees270=3 acDegreesUnknown=-1',
+ 'AcRowType': 'acDataRow=1 acHeaderRow=4 acTitleRow=2 acUnknownRow=0',
+ 'AcSaveAsType': 'ac2000_Template=14 ac2000_dwg=12 ac2000_dxf=13 ac2004_Template=26 ac2004_dwg=24 ac2004_dxf=25 '
+                 'ac2007_Template=38 ac2007_dwg=36 ac2007_dxf=37 ac2010_Template=50 ac2010_dwg=48 ac2010_dxf=49 '
+                 'ac2013_Template=62 ac2013_dwg=60 ac2013_dxf=61 ac2018_Template=66 ac2018_dwg=64 ac2018_dxf=65 '
+                 'acNative=64 acR12_dxf=1 acR13_dwg=4 acR13_dxf=5 acR14_dwg=8 acR14_dxf=9 acR15_Template=14 '
+                 'acR15_dwg=12 acR15_dxf=13 acR18_Template=26 acR18_dwg=24 acR18_dxf=25 acUnknown=-1',
+ 'AcSectionGeneration': 'acSectionGenerationDestinationFile=64 acSectionGenerationDestinationNewBlock=16 '
+                        'acSectionGenerationDestinationReplaceBlock=32 acSectionGenerationSourceAllObjects=1 '
+                        'acSectionGenerationSourceSelectedObjects=2',
+ 'AcSectionState': 'acSectionStateBoundary=2 acSectionStatePlane=1 acSectionStateVolume=4',
+ 'AcSectionState2': 'acSectionState2Boundary=4 acSectionState2Plane=1 acSectionState2Slice=2 acSectionState2Volume=8',
+ 'AcSectionSubItem': 'acSectionSubItemBackLine=8 acSectionSubItemBackLineBottom=32 acSectionSubItemBackLineTop=16 '
+                     'acSectionSubItemSectionLine=1 acSectionSubItemSectionLineBottom=4 '
+                     'acSectionSubItemSectionLineTop=2 acSectionSubItemVerticalLineBottom=128 '
+                     'acSectionSubItemVerticalLineTop=64 acSectionSubItemkNone=0',
+ 'AcSectionType': 'acSectionType2dSection=2 acSectionType3dSection=4 acSectionTypeLiveSection=1',
+ 'AcSegmentAngleType': 'acDegrees15=1 acDegrees30=2 acDegrees45=3 acDegrees60=4 acDegrees90=6 acDegreesAny=0 '
+                       'acDegreesHorz=12',
+ 'AcSelect': 'acSelectionSetAll=5 acSelectionSetCrossing=1 acSelectionSetCrossingPolygon=7 acSelectionSetFence=2 '
+             'acSelectionSetLast=4 acSelectionSetPrevious=3 acSelectionSetWindow=0 acSelectionSetWindowPolygon=6',
+ 'AcSelectType': 'acTableSelectCrossing=2 acTableSelectWindow=1',
+ 'AcShadePlot': 'acShadePlotAsDisplayed=0 acShadePlotHidden=2 acShadePlotRendered=3 acShadePlotWireframe=1',
+ 'AcShadowDisplayType': 'acCastsAndReceivesShadows=0 acCastsShadows=1 acIgnoreShadows=3 acReceivesShadows=2',
+ 'AcSplineFrameType': 'acHide=1 acShow=0',
+ 'AcSplineKnotParameterizationType': 'acChord=0 acCustomParameterization=15 acSqrtChord=1 acUniformParam=2',
+ 'AcSplineMethodType': 'acControlVertices=1 acFit=0',
+ 'AcTableDirection': 'acTableBottomToTop=1 acTableTopToBottom=0',
+ 'AcTableFlowDirection': 'acTableFlowDownOrUp=2 acTableFlowLeft=4 acTableFlowRight=1',
+ 'AcTableStyleOverrides': 'acCellAlign=130 acCellBackgroundColor=132 acCellBackgroundFillNone=131 '
+                          'acCellBottomGridColor=138 acCellBottomGridLineWeight=142 acCellBottomVisibility=146 '
+                          'acCellContentColor=133 acCellDataType=148 acCellLeftGridColor=139 '
+                          'acCellLeftGridLineWeight=143 acCellLeftVisibility=147 acCellRightGridColor=137 '
+                          'acCellRightGridLineWeight=141 acCellRightVisibility=145 acCellTextHeight=135 '
+                          'acCellTextStyle=134 acCellTopGridColor=136 acCellTopGridLineWeight=140 '
+                          'acCellTopVisibility=144 acDataHorzBottomColor=54 acDataHorzBottomLineWeight=84 '
+                          'acDataHorzBottomVisibility=114 acDataHorzInsideColor=53 acDataHorzInsideLineWeight=83 '
+                          'acDataHorzInsideVisibility=113 acDataHorzTopColor=52 acDataHorzTopLineWeight=82 '
+                          'acDataHorzTopVisibility=112 acDataRowAlignment=17 acDataRowColor=8 acDataRowDataType=26 '
+                          'acDataRowFillColor=14 acDataRowFillNone=11 acDataRowTextHeight=23 acDataRowTextStyle=20 '
+                          'acDataVertInsideColor=56 acDataVertInsideLineWeight=86 acDataVertInsideVisibility=116 '
+                          'acDataVertLeftColor=55 acDataVertLeftLineWeight=85 acDataVertLeftVisibility=115 '
+                          'acDataVertRightColor=57 acDataVertRightLineWeight=87 acDataVertRightVisibility=117 '
+                          'acFlowDirection=3 acHeaderHorzBottomColor=48 acHeaderHorzBottomLineWeight=78 '
+                          'acHeaderHorzBottomVisibility=108 acHeaderHorzInsideColor=47 acHeaderHorzInsideLineWeight=77 '
+                          'acHeaderHorzInsideVisibility=107 acHeaderHorzTopColor=46 acHeaderHorzTopLineWeight=76 '
+                          'acHeaderHorzTopVisibility=106 acHeaderRowAlignment=16 acHeaderRowColor=7 '
+                          'acHeaderRowDataType=25 acHeaderRowFillColor=13 acHeaderRowFillNone=10 '
+                          'acHeaderRowTextHeight=22 acHeaderRowTextStyle=19 acHeaderSuppressed=2 '
+                          'acHeaderVertInsideColor=50 acHeaderVertInsideLineWeight=80 acHeaderVertInsideVisibility=110 '
+                          'acHeaderVertLeftColor=49 acHeaderVertLeftLineWeight=79 acHeaderVertLeftVisibility=109 '
+                          'acHeaderVertRightColor=51 acHeaderVertRightLineWeight=81 acHeaderVertRightVisibility=111 '
+                          'acHorzCellMargin=4 acTitleHorzBottomColor=42 acTitleHorzBottomLineWeight=72 '
+                          'acTitleHorzBottomVisibility=102 acTitleHorzInsideColor=41 acTitleHorzInsideLineWeight=71 '
+                          'acTitleHorzInsideVisibility=101 acTitleHorzTopColor=40 acTitleHorzTopLineWeight=70 '
+                          'acTitleHorzTopVisibility=100 acTitleRowAlignment=15 acTitleRowColor=6 acTitleRowDataType=24 '
+                          'acTitleRowFillColor=12 acTitleRowFillNone=9 acTitleRowTextHeight=21 acTitleRowTextStyle=18 '
+                          'acTitleSuppressed=1 acTitleVertInsideColor=44 acTitleVertInsideLineWeight=74 '
+                          'acTitleVertInsideVisibility=104 acTitleVertLeftColor=43 acTitleVertLeftLineWeight=73 '
+                          'acTitleVertLeftVisibility=103 acTitleVertRightColor=45 acTitleVertRightLineWeight=75 '
+                          'acTitleVertRightVisibility=105 acVertCellMargin=5',
+ 'AcTextAlignmentType': 'acCenterAlignment=1 acLeftAlignment=0 acRightAlignment=2',
+ 'AcTextAngleType': 'acAlwaysRightReadingAngle=2 acHorizontalAngle=1 acInsertAngle=0',
+ 'AcTextAttachmentDirection': 'acAttachmentHorizontal=0 acAttachmentVertical=1',
+ 'AcTextAttachmentType': 'acAttachmentAllLine=8 acAttachmentBottomLine=7 acAttachmentBottomOfBottom=6 '
+                         'acAttachmentBottomOfTop=2 acAttachmentBottomOfTopLine=3 acAttachmentMiddle=4 '
+                         'acAttachmentMiddleOfBottom=5 acAttachmentMiddleOfTop=1 acAttachmentTopOfTop=0',
+ 'AcTextFontStyle': 'acFontBold=2 acFontBoldItalic=3 acFontItalic=1 acFontRegular=0',
+ 'AcTextGenerationFlag': 'acTextFlagBackward=2 acTextFlagUpsideDown=4',
+ 'AcToolbarDockStatus': 'acToolbarDockBottom=1 acToolbarDockLeft=2 acToolbarDockRight=3 acToolbarDockTop=0 '
+                        'acToolbarFloating=4',
+ 'AcToolbarItemType': 'acToolbarButton=0 acToolbarControl=2 acToolbarFlyout=3 acToolbarSeparator=1',
+ 'AcUnderlayLayerOverrideType': 'acApplied=1 acNoOverrides=0',
+ 'AcUnits': 'acArchitectural=4 acDecimal=2 acDefaultUnits=-1 acEngineering=3 acFractional=5 acScientific=1',
+ 'AcValueDataType': 'acBuffer=128 acDate=8 acDouble=2 acGeneral=512 acLong=1 acObjectId=64 acPoint2d=16 acPoint3d=32 '
+                    'acResbuf=256 acString=4 acUnknownDataType=0',
+ 'AcValueUnitType': 'acUnitAngle=2 acUnitArea=4 acUnitDistance=1 acUnitVolume=8 acUnitless=0',
+ 'AcVerticalAlignment': 'acVerticalAlignmentBaseline=0 acVerticalAlignmentBottom=1 acVerticalAlignmentMiddle=2 '
+                        'acVerticalAlignmentTop=3',
+ 'AcVerticalTextAttachmentType': 'acAttachmentCenter=0 acAttachmentLinedCenter=1',
+ 'AcViewportScale': 'acVp100_1=18 acVp10_1=17 acVp1_1=2 acVp1_10=7 acVp1_100=13 acVp1_128in_1ft=19 acVp1_16=8 '
+                    'acVp1_16in_1ft=22 acVp1_2=3 acVp1_20=9 acVp1_2in_1ft=28 acVp1_30=10 acVp1_32in_1ft=21 acVp1_4=4 '
+                    'acVp1_40=11 acVp1_4in_1ft=26 acVp1_5=5 acVp1_50=12 acVp1_64in_1ft=20 acVp1_8=6 acVp1_8in_1ft=24 '
+                    'acVp1and1_2in_1ft=31 acVp1ft_1ft=34 acVp1in_1ft=30 acVp2_1=14 acVp3_16in_1ft=25 acVp3_32in_1ft=23 '
+                    'acVp3_4in_1ft=29 acVp3_8in_1ft=27 acVp3in_1ft=32 acVp4_1=15 acVp6in_1ft=33 acVp8_1=16 '
+                    'acVpCustomScale=1 acVpScaleToFit=0',
+ 'AcViewportSplitType': 'acViewport2Horizontal=0 acViewport2Vertical=1 acViewport3Above=6 acViewport3Below=7 '
+                        'acViewport3Horizontal=4 acViewport3Left=2 acViewport3Right=3 acViewport3Vertical=5 '
+                        'acViewport4=8',
+ 'AcWindowState': 'acMax=3 acMin=2 acNorm=1',
+ 'AcWireframeType': 'acIsolines=0 acIsoparms=1',
+ 'AcXRefDemandLoad': 'acDemandLoadDisabled=0 acDemandLoadEnabled=1 acDemandLoadEnabledWithCopy=2',
+ 'AcZoomScaleType': 'acZoomScaledAbsolute=0 acZoomScaledRelative=1 acZoomScaledRelativePSpace=2',
+ 'AcadSecurityParamsConstants': 'ACADSECURITYPARAMS_ALGID_RC4=26625',
+ 'AcadSecurityParamsType': 'ACADSECURITYPARAMS_ADD_TIMESTAMP=32 ACADSECURITYPARAMS_ENCRYPT_DATA=1 '
+                           'ACADSECURITYPARAMS_ENCRYPT_PROPS=2 ACADSECURITYPARAMS_SIGN_DATA=16'}
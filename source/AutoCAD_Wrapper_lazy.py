@@ -0,0 +1,129 @@
+"""
+On-demand view of AutoCAD_Wrapper.
+
+Drop-in replacement for ``import AutoCAD_Wrapper``:
+
+    import AutoCAD_Wrapper_lazy as AutoCAD_Wrapper
+
+Only the makepy preamble runs at import.  Each IAcad*/Acad* class (and
+each *_vtables_ list) is compiled from its slice of AutoCAD_Wrapper.py
+the first time it is looked up, either as a module attribute or by IID
+through win32com's CLSID registry, so cold start and resident memory
+follow the interfaces a script actually uses.  ``constants`` is the
+enum-grouped view from AutoCAD_Constants rather than makepy's flat class.
+
+The slices come from AutoCAD_Wrapper_index.py; rebuild it with
+utils/build_lazy_wrapper.py after re-running makepy.
+"""
+import ast
+import mmap
+import os
+
+import win32com.client
+import win32com.client.CLSIDToClass
+from win32com.client import CoClassBaseClass, DispatchBaseClass
+
+import AutoCAD_Wrapper_index as _index
+from AutoCAD_Constants import constants
+
+WRAPPER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "AutoCAD_Wrapper.py")
+
+with open(WRAPPER_PATH, "rb") as _f:
+    # The OS pages the wrapper in as slices are read; nothing else is kept.
+    _source = mmap.mmap(_f.fileno(), 0, access=mmap.ACCESS_READ)
+
+if len(_source) != _index.WRAPPER_SIZE:
+    raise ImportError("AutoCAD_Wrapper_index.py is stale; run utils/build_lazy_wrapper.py")
+
+RecordMap = {}
+CLSIDToPackageMap = {}
+VTablesToPackageMap = {}
+VTablesToClassMap = _index.VTablesToClassMap
+NamesToIIDMap = _index.NamesToIIDMap
+
+
+def _exec_span(start, end, lineno):
+    tree = ast.parse(_source[start:end].decode("ascii"), filename=WRAPPER_PATH)
+    # Keep tracebacks pointing at the real lines of AutoCAD_Wrapper.py
+    ast.increment_lineno(tree, lineno - 1)
+    exec(compile(tree, WRAPPER_PATH, "exec"), globals())
+
+
+_exec_span(*_index.PREAMBLE_SPAN)
+
+
+def _materialize(name):
+    cls = globals().get(name)
+    if cls is not None:
+        return cls
+    start, end, lineno, kind, deps = _index.CLASS_SPANS[name]
+    for dep in deps:
+        _materialize(dep)
+    _exec_span(start, end, lineno)
+    cls = globals()[name]
+    clsid = getattr(cls, "CLSID", None)
+    if clsid is not None and kind != "events":
+        dict.__setitem__(win32com.client.CLSIDToClass.mapCLSIDToClass, str(clsid), cls)
+    return cls
+
+
+def class_for_name(name):
+    """Return the wrapper class called name, building it if needed."""
+    return _materialize(name)
+
+
+def class_for_iid(iid):
+    """Return the wrapper class registered for iid (CLSID or IID)."""
+    name = _index.CLSID_TO_NAME.get(str(iid).upper())
+    if name is None:
+        raise KeyError(iid)
+    return _materialize(name)
+
+
+def loaded_classes():
+    """Names of the classes materialized so far."""
+    return sorted(name for name, span in _index.CLASS_SPANS.items()
+                  if span[3] != "constants" and name in globals())
+
+
+class _LazyClassMap(dict):
+    """
+    Stand-in for win32com.client.CLSIDToClass.mapCLSIDToClass.
+
+    Dispatch() asks the registry for the class of every returned object;
+    answering 'yes' for our CLSIDs and building the class on the first
+    lookup is what lets the registration table stay lazy.
+    """
+
+    def __missing__(self, clsid):
+        name = _index.CLSID_TO_NAME.get(str(clsid))
+        if name is None:
+            raise KeyError(clsid)
+        return _materialize(name)
+
+    def __contains__(self, clsid):
+        return dict.__contains__(self, clsid) or str(clsid) in _index.CLSID_TO_NAME
+
+
+if not isinstance(win32com.client.CLSIDToClass.mapCLSIDToClass, _LazyClassMap):
+    win32com.client.CLSIDToClass.mapCLSIDToClass = _LazyClassMap(
+        win32com.client.CLSIDToClass.mapCLSIDToClass)
+if constants not in win32com.client.constants.__dicts__:
+    # A lazy, enum-grouped view instead of makepy's 898-entry constants.__dict__
+    win32com.client.constants.__dicts__.append(constants)
+
+
+def __getattr__(name):
+    if name in _index.CLASS_SPANS and name != "constants":
+        return _materialize(name)
+    if name in _index.VTABLE_SPANS:
+        _exec_span(*_index.VTABLE_SPANS[name])
+        return globals()[name]
+    if name == "CLSIDToClassMap":
+        # Asking for the whole map means asking for every class.
+        return {clsid: _materialize(cls) for clsid, cls in _index.CLSID_TO_NAME.items()}
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_index.CLASS_SPANS) | set(_index.VTABLE_SPANS))
@@ -0,0 +1,164 @@
+"""
+One AutoCAD connection per thread, reused by every tool.
+
+    session = get_session()
+    session.model.AddLine(p1, p2)
+    for obj in session.model: ...
+    session.layers.Add("A-WALL")
+
+The first use connects (Dispatch("AutoCAD.Application"), ActiveDocument)
+and later uses get the cached Application, ActiveDocument, ModelSpace,
+Layers and Utility objects.  Before handing them out again the session
+checks that AutoCAD is still there with one cheap call (ActiveDocument),
+at most every ``probe_interval`` seconds.  If AutoCAD was restarted the
+probe fails with a disconnected-server HRESULT and the session connects
+again; if the user switched drawings the document objects are refreshed.
+
+COM objects belong to the thread (apartment) that created them, so
+get_session() keeps one session per thread.  run(fn) reconnects and
+retries fn once when AutoCAD went away in the middle of it.
+"""
+import threading
+import time
+
+from com_retry import com_hresult
+
+RPC_S_SERVER_UNAVAILABLE = -2147023174  # 0x800706BA
+RPC_S_CALL_FAILED = -2147023170  # 0x800706BE
+RPC_E_DISCONNECTED = -2147417848  # 0x80010108
+CO_E_OBJNOTCONNECTED = -2147220995  # 0x800401FD
+DEAD_HRESULTS = frozenset({RPC_S_SERVER_UNAVAILABLE, RPC_S_CALL_FAILED, RPC_E_DISCONNECTED,
+                           CO_E_OBJNOTCONNECTED})
+
+
+def is_disconnected(error):
+    """True when the error means the AutoCAD process behind a proxy is gone."""
+    return com_hresult(error) in DEAD_HRESULTS
+
+
+def _dispatch_autocad():
+    import win32com.client
+
+    return win32com.client.Dispatch("AutoCAD.Application")
+
+
+class AcadSession:
+    """
+    connect() returns a new Application object; policy is an optional
+    com_retry.RetryPolicy for connecting while AutoCAD is still busy
+    starting up.
+    """
+
+    def __init__(self, connect=None, probe_interval=2.0, policy=None, clock=time.monotonic):
+        self.connect = connect or _dispatch_autocad
+        self.probe_interval = probe_interval
+        self.policy = policy
+        self.clock = clock
+        self.connects = 0
+        self.probes = 0
+        self.reconnects = 0
+        self._app = None
+        self._doc = None
+        self._cache = {}
+        self._checked = None
+
+    def _connect(self):
+        app = self.policy.call(self.connect) if self.policy is not None else self.connect()
+        doc = app.ActiveDocument
+        self._app = app
+        self._use_document(doc)
+        self.connects += 1
+
+    def _use_document(self, doc):
+        self._doc = doc
+        self._cache = {}
+        self._checked = self.clock()
+
+    def ensure(self):
+        """Connect, or check the cached connection if it was not checked recently."""
+        if self._app is None:
+            self._connect()
+            return self
+        if self.clock() - self._checked < self.probe_interval:
+            return self
+        try:
+            active = self._app.ActiveDocument
+        except Exception as e:
+            if not is_disconnected(e):
+                raise
+            self.reconnects += 1
+            self._connect()
+            return self
+        self.probes += 1
+        if active != self._doc:
+            self._use_document(active)
+        self._checked = self.clock()
+        return self
+
+    def refresh(self):
+        """Check the connection and re-read ActiveDocument now, e.g. after opening a drawing."""
+        if self._app is not None:
+            self._checked = float("-inf")
+        return self.ensure()
+
+    def invalidate(self):
+        """Forget the connection; the next use connects again."""
+        self._app = self._doc = None
+        self._cache = {}
+
+    def _cached(self, name, get):
+        self.ensure()
+        value = self._cache.get(name)
+        if value is None:
+            value = self._cache[name] = get()
+        return value
+
+    @property
+    def app(self):
+        return self.ensure()._app
+
+    @property
+    def doc(self):
+        return self.ensure()._doc
+
+    @property
+    def model(self):
+        return self._cached("model", lambda: self._doc.ModelSpace)
+
+    @property
+    def paper(self):
+        return self._cached("paper", lambda: self._doc.PaperSpace)
+
+    @property
+    def layers(self):
+        return self._cached("layers", lambda: self._doc.Layers)
+
+    @property
+    def utility(self):
+        return self._cached("utility", lambda: self._doc.Utility)
+
+    def run(self, fn, *args, **kwargs):
+        """fn(session, *args, **kwargs); reconnects and retries once if AutoCAD went away."""
+        try:
+            return fn(self.ensure(), *args, **kwargs)
+        except Exception as e:
+            if not is_disconnected(e):
+                raise
+        self.invalidate()
+        self.reconnects += 1
+        return fn(self.ensure(), *args, **kwargs)
+
+
+_local = threading.local()
+
+
+def get_session(**options):
+    """This thread's AcadSession; options are used when it is first created."""
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = _local.session = AcadSession(**options)
+    return session
+
+
+def reset_session():
+    _local.session = None
@@ -1,22 +1,25 @@
-import win32com.client
+from acad_session import get_session
+from bulk_edit import bulk_edit
+from selection_filter import F, PAPER, select
 
 
 def set_viewport_scale():
-    acad = win32com.client.Dispatch("AutoCAD.Application")
-    doc = acad.ActiveDocument
+    session = get_session()
+    doc = session.doc
 
     # 1. Ensure we are in Paper Space
     doc.ActiveSpace = 0  # 0 = acPaperSpace, 1 = acModelSpace
 
-    print(f"Scanning Layout: {doc.ActiveLayout.Name}...")
+    layout = doc.ActiveLayout.Name
+    print(f"Scanning Layout: {layout}...")
 
-    paper_space = doc.PaperSpace
     count = 0
 
-    # 2. Iterate through Paper Space objects
-    for obj in paper_space:
-        # Check if object is a Viewport
-        if "AcDbViewport" in obj.ObjectName:
+    # 2. Let AutoCAD select the viewports of this layout
+    viewports = select(doc, (F.type == "VIEWPORT") & (F.space == PAPER) & (F.layout == layout))
+    # One undo step for all viewports; regenerates once at the end
+    with bulk_edit(doc, regen=bool(viewports)):
+        for obj in viewports:
             # We skip the 'Active Viewport' which is sometimes the Paper itself (ID 1)
             # Viewport ID 1 is the actual "Sheet" definition, we want ID > 1
             # Note: In COM, we catch errors or check properties carefully
@@ -38,8 +41,6 @@ def set_viewport_scale():
 
     if count == 0:
         print("No viewports found! (Did you draw the rectangle with the MVIEW command?)")
-    else:
-        doc.Regen(1)  # Refresh screen
 
 
 if __name__ == "__main__":
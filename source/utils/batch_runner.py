@@ -0,0 +1,333 @@
+"""
+Run a pipeline over many drawings, spread over several AutoCAD instances.
+
+    from batch_runner import NIGHTLY, format_report, run_batch
+
+    results = run_batch(glob.glob(r"D:\\Facades\\*.dwg"), NIGHTLY, workers=4)
+    print(format_report(results))
+
+Each worker is a separate process that starts its own AutoCAD
+(DispatchEx, so the workers do not share one instance) and takes paths
+from a common queue.  For every path it opens the drawing with
+Documents.Open, calls each step of the pipeline as step(doc), saves and
+closes it.  A step is a function or a "module:function" string (imported
+inside the worker); the worker also points its get_session() at the
+opened drawing, so utilities that work on the active document can be
+steps too, as in NIGHTLY.
+
+Failures stay with one file:
+
+- a step raising closes that drawing without saving and the worker goes
+  on with the next path;
+- if AutoCAD itself went away (disconnected-server HRESULT) the worker
+  starts a new AutoCAD and tries the file again, up to ``retries`` times;
+- if the worker process dies, or a file takes longer than
+  ``file_timeout`` seconds, the file is reported failed, the worker (and
+  its AutoCAD, when its process id is known) is terminated and a new
+  worker takes its place, at most ``max_restarts`` times per worker.
+
+Results come back as one FileResult per path, in input order, with the
+seconds spent opening, in each step and saving.  connect= replaces the
+AutoCAD start-up with any picklable function returning an
+Application-like object, e.g. one built on fake_acad.
+"""
+import argparse
+import glob
+import importlib
+import multiprocessing
+import os
+import signal
+import time
+from collections import namedtuple
+from multiprocessing.connection import wait
+
+from acad_session import get_session, is_disconnected, reset_session
+
+POLL = 0.2  # seconds between checks on the workers
+
+FileResult = namedtuple("FileResult", "path ok error worker seconds timings results attempts")
+FileResult.__doc__ = """\
+ok is False when the file was not processed; error says why.  timings is
+a list of (stage, seconds): "open", one entry per step, "save".  results
+holds the step return values (must be picklable)."""
+
+
+def _start_autocad():
+    import win32com.client
+
+    app = win32com.client.DispatchEx("AutoCAD.Application")
+    app.Visible = False
+    return app
+
+
+def _app_pid(app):
+    """Process id of the AutoCAD behind app, if it can be found out."""
+    try:
+        import win32process
+
+        return win32process.GetWindowThreadProcessId(app.HWND)[1]
+    except Exception:
+        return None
+
+
+def _step_name(step):
+    return step if isinstance(step, str) else getattr(step, "__name__", repr(step))
+
+
+def _resolve(step):
+    if isinstance(step, str):
+        module, _, name = step.partition(":")
+        return getattr(importlib.import_module(module), name)
+    return step
+
+
+# --- steps wrapping the existing utilities (they work on get_session().doc) ---
+
+def cleanup(doc):
+    from cleanup_drawing import cleanup_drawing
+
+    cleanup_drawing(raise_errors=True)
+
+
+def fix_geometry(doc):
+    from fix_facade_geometry import fix_facade_geometry_v2
+
+    fix_facade_geometry_v2(raise_errors=True)
+
+
+def report(doc):
+    # One folder per drawing under OUTPUT_DIR, so drawings and workers do not overwrite each other
+    import generate_presentation
+
+    stem = os.path.splitext(doc.Name)[0]
+    generate_presentation.generate_report(os.path.join(generate_presentation.OUTPUT_DIR, stem))
+
+
+NIGHTLY = (cleanup, fix_geometry, report)
+
+
+# --- worker process ---
+
+def _process(app, path, steps, save):
+    """Open, run the steps, save and close one drawing; returns (error, dead, timings, results)."""
+    timings = []
+    results = []
+    doc = None
+    error = None
+    dead = False
+    try:
+        t = time.perf_counter()
+        doc = app.Documents.Open(os.path.abspath(path))
+        get_session().refresh()
+        timings.append(("open", time.perf_counter() - t))
+        for name, step in steps:
+            t = time.perf_counter()
+            results.append(step(doc))
+            timings.append((name, time.perf_counter() - t))
+        if save:
+            t = time.perf_counter()
+            doc.Save()
+            timings.append(("save", time.perf_counter() - t))
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        dead = is_disconnected(e)
+    if doc is not None and not dead:
+        try:
+            doc.Close(False)
+        except Exception as e:
+            dead = is_disconnected(e)
+    return error, dead, timings, results
+
+
+def _worker(slot, conn, connect, pipeline, save, retries, sta, tasks):
+    # conn is this worker's own pipe: a worker dying mid-send cannot block the others
+    pythoncom = None
+    if sta:
+        import pythoncom
+
+        pythoncom.CoInitialize()
+    try:
+        steps = [(_step_name(step), _resolve(step)) for step in pipeline]
+        app = None
+        while True:
+            task = tasks.get()
+            if task is None:
+                return
+            index, path = task
+            conn.send(("start", index, None))
+            t0 = time.perf_counter()
+            for attempt in range(1, retries + 2):
+                if app is None:
+                    try:
+                        app = connect()
+                    except Exception as e:
+                        error, dead, timings, results = f"could not start AutoCAD: {e}", True, [], []
+                        break
+                    reset_session()
+                    get_session(connect=lambda app=app: app)
+                    conn.send(("pid", index, _app_pid(app)))
+                error, dead, timings, results = _process(app, path, steps, save)
+                if dead:
+                    app = None  # gone; start a new one for the retry or the next file
+                if not dead or attempt > retries:
+                    break
+            result = FileResult(path, error is None, error, slot, time.perf_counter() - t0,
+                                timings, results, attempt)
+            conn.send(("done", index, result))
+    finally:
+        reset_session()
+        if pythoncom is not None:
+            pythoncom.CoUninitialize()
+
+
+# --- parent ---
+
+class _Slot:
+    def __init__(self, number):
+        self.number = number
+        self.process = None
+        self.conn = None  # receiving end of its pipe
+        self.index = None  # task in progress
+        self.started = None
+        self.pid = None  # its AutoCAD
+        self.restarts = 0
+
+
+def _kill(pid):
+    try:
+        os.kill(pid, signal.SIGTERM)
+    except OSError:
+        pass
+
+
+def run_batch(paths, pipeline, workers=2, connect=None, save=True, retries=1, file_timeout=None,
+              max_restarts=3, sta=True, on_result=None):
+    """
+    Run pipeline over paths with `workers` processes; returns a FileResult
+    per path in input order.  on_result(result) is called as files finish.
+    sta=False skips CoInitialize, for stand-in applications.
+    """
+    paths = list(paths)
+    if not paths:
+        return []
+    ctx = multiprocessing.get_context("spawn")  # what Windows does anyway
+    tasks = ctx.Queue()
+    for task in enumerate(paths):
+        tasks.put(task)
+    slots = [_Slot(n) for n in range(min(workers, len(paths)))]
+    for _ in slots:
+        tasks.put(None)
+    args = (connect or _start_autocad, tuple(pipeline), save, retries, sta, tasks)
+    done = {}
+
+    def spawn(slot):
+        slot.index = slot.started = slot.pid = None
+        slot.conn, sender = ctx.Pipe(duplex=False)
+        slot.process = ctx.Process(target=_worker, args=(slot.number, sender) + args,
+                                   name=f"batch-worker-{slot.number}", daemon=True)
+        slot.process.start()
+        sender.close()
+
+    def finish(index, result):
+        done[index] = result
+        if on_result is not None:
+            on_result(result)
+
+    def handle(slot, message):
+        kind, index, value = message
+        if kind == "start":
+            slot.index, slot.started = index, time.monotonic()
+        elif kind == "pid":
+            slot.pid = value
+        elif slot.index == index:
+            slot.index = None
+            finish(index, value)
+
+    def receive(slot):
+        try:
+            while slot.conn.poll():
+                handle(slot, slot.conn.recv())
+        except (EOFError, OSError):
+            pass  # the worker has exited; its process is checked below
+
+    def drain(timeout):
+        by_conn = {slot.conn: slot for slot in slots if slot.process is not None}
+        for conn in wait(list(by_conn), timeout):
+            receive(by_conn[conn])
+
+    def fail(slot, error):
+        # The worker is gone or being replaced; its file fails and it restarts
+        if slot.index is not None:
+            finish(slot.index, FileResult(paths[slot.index], False, error, slot.number,
+                                          time.monotonic() - slot.started, [], [], 1))
+        if slot.pid is not None:
+            _kill(slot.pid)
+        slot.conn.close()
+        if slot.restarts < max_restarts:
+            slot.restarts += 1
+            spawn(slot)
+        else:
+            slot.process = None
+
+    for slot in slots:
+        spawn(slot)
+    try:
+        while len(done) < len(paths):
+            drain(POLL)
+            for slot in slots:
+                if slot.process is None:
+                    continue
+                if not slot.process.is_alive():
+                    receive(slot)  # anything it sent before exiting
+                    if slot.index is None and slot.process.exitcode == 0:
+                        slot.process = None  # took its None: no work left
+                        slot.conn.close()
+                        continue
+                    fail(slot, f"worker exited with code {slot.process.exitcode}")
+                elif (file_timeout is not None and slot.index is not None
+                      and time.monotonic() - slot.started > file_timeout):
+                    slot.process.terminate()
+                    slot.process.join()
+                    fail(slot, f"timed out after {file_timeout:g}s")
+            if all(slot.process is None for slot in slots):
+                break
+    finally:
+        for slot in slots:
+            if slot.process is not None:
+                slot.process.join(POLL)
+                if slot.process.is_alive():
+                    slot.process.terminate()
+    for index, path in enumerate(paths):
+        if index not in done:
+            finish(index, FileResult(path, False, "not processed: no workers left", None, 0.0, [], [], 0))
+    return [done[index] for index in range(len(paths))]
+
+
+def format_report(results):
+    lines = []
+    for r in results:
+        stages = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in r.timings)
+        status = "ok" if r.ok else f"FAILED ({r.error})"
+        lines.append(f"{os.path.basename(r.path)}: {status} in {r.seconds:.2f}s [{stages}]")
+    failed = sum(not r.ok for r in results)
+    total = sum(r.seconds for r in results)
+    lines.append(f"{len(results) - failed} of {len(results)} drawings done, {failed} failed, "
+                 f"{total:.1f}s of work")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the nightly pipeline over drawings")
+    parser.add_argument("patterns", nargs="+", help="DWG files or glob patterns")
+    parser.add_argument("-j", "--workers", type=int, default=2)
+    parser.add_argument("--timeout", type=float, default=None, help="seconds allowed per drawing")
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args()
+
+    files = sorted({p for pattern in args.patterns for p in glob.glob(pattern)})
+    print(f"Processing {len(files)} drawings with {args.workers} workers...")
+    results = run_batch(files, NIGHTLY, workers=args.workers, save=not args.no_save,
+                        file_timeout=args.timeout,
+                        on_result=lambda r: print(f"  {os.path.basename(r.path)}: "
+                                                  f"{'ok' if r.ok else r.error} ({r.seconds:.1f}s)"))
+    print(format_report(results))
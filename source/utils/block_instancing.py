@@ -0,0 +1,214 @@
+"""
+Draw repeated shapes as references to one block definition each.
+
+    report = insert_instances(doc, windows + doors, layer="A-GLAZ")
+    print(report)    # 15 shapes -> 2 blocks (0 reused): 0 inserts, 2 minserts, 0 loose in 0.03s
+
+Shapes that are congruent (the same outline, moved and rotated) get the
+same canonical key: the outline is put in a standard pose, first vertex
+on the origin and first edge along +x, with the start vertex chosen so
+the quantized coordinates are lexicographically smallest.  Each key is
+defined once in the Blocks table (as PYBLK_<key>; a drawing that already
+has it reuses it) and every shape becomes an insertion of it.  When all
+shapes of a key share a rotation and sit on a full, evenly spaced grid,
+one AddMInsertBlock draws them all; otherwise each gets an InsertBlock.
+Shapes that occur fewer than ``min_count`` times are drawn as plain
+LWPolylines.
+
+The block geometry is on layer 0 inside the block, so each reference
+shows on the layer it is inserted on.
+"""
+import hashlib
+import math
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from cad_tools import polygon_ring
+from com_arrays import double_variant, point_variant
+
+PREFIX = "PYBLK_"  # name prefix of the block definitions made here
+QUANTUM = 1e-6  # coordinates closer than this are the same in the canonical key
+
+Shape = namedtuple("Shape", "key vertices closed placements")
+Shape.__doc__ = """\
+vertices: the (k, 2) outline in its canonical pose (the block geometry);
+placements: (x, y, angle, index) per input polygon of this shape, the
+insertion point and rotation that put the canonical outline back."""
+
+Grid = namedtuple("Grid", "x y angle rows columns row_spacing column_spacing")
+
+
+def canonical_pose(poly, quantum=QUANTUM):
+    """
+    (key, vertices, closed, (x, y, angle)) of one polygon, or None if it
+    has no edge of non-zero length.  Congruent polygons get the same key.
+    """
+    xy, closed = polygon_ring(poly)
+    if len(xy) < 2:
+        return None
+    if closed:
+        x, y = xy[:, 0], xy[:, 1]
+        if np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)) < 0:
+            xy = xy[::-1]  # clockwise: the same shape, walked the other way
+        starts = [np.roll(xy, -i, axis=0) for i in range(len(xy))]
+    else:
+        starts = [xy, xy[::-1]]  # an open outline starts at one of its ends
+
+    best = None
+    for ordered in starts:
+        dx, dy = ordered[1] - ordered[0]
+        if math.hypot(dx, dy) <= quantum:
+            continue
+        angle = math.atan2(dy, dx)
+        cos, sin = math.cos(-angle), math.sin(-angle)
+        local = ordered - ordered[0]
+        local = np.column_stack((local[:, 0] * cos - local[:, 1] * sin, local[:, 0] * sin + local[:, 1] * cos))
+        rank = tuple(np.rint(local / quantum).astype(np.int64).ravel().tolist())
+        # Same outline from a symmetric start: keep the placement with the smaller rotation
+        if best is None or rank < best[0] or (rank == best[0] and abs(angle) < abs(best[3][2]) - 1e-12):
+            best = (rank, local, closed, (float(ordered[0][0]), float(ordered[0][1]), angle))
+    if best is None:
+        return None
+    rank, local, closed, placement = best
+    key = hashlib.sha1(repr((closed, quantum, rank)).encode()).hexdigest()[:16].upper()
+    return key, local, closed, placement
+
+
+def group_shapes(polygons, quantum=QUANTUM):
+    """(shapes, degenerate): Shape per distinct outline in first-seen order, and unplaceable indices."""
+    shapes = {}
+    degenerate = []
+    for index, poly in enumerate(polygons):
+        pose = canonical_pose(poly, quantum)
+        if pose is None:
+            degenerate.append(index)
+            continue
+        key, vertices, closed, (x, y, angle) = pose
+        shape = shapes.get(key)
+        if shape is None:
+            shape = shapes[key] = Shape(key, vertices, closed, [])
+        shape.placements.append((x, y, angle, index))
+    return list(shapes.values()), degenerate
+
+
+def find_grid(placements, quantum=QUANTUM):
+    """A Grid when the placements fill rows x columns evenly spaced cells at one rotation, else None."""
+    if len(placements) < 2:
+        return None
+    xy = np.array([(x, y) for x, y, _, _ in placements], dtype=np.float64)
+    angles = np.array([a for _, _, a, _ in placements])
+    if np.ptp(angles) > 1e-9:
+        return None
+    angle = float(angles[0])
+    cos, sin = math.cos(-angle), math.sin(-angle)
+    # Rows and columns run along the block's rotated axes
+    u = xy[:, 0] * cos - xy[:, 1] * sin
+    v = xy[:, 0] * sin + xy[:, 1] * cos
+    iu, iv = np.rint(u / quantum).astype(np.int64), np.rint(v / quantum).astype(np.int64)
+    cols, rows = np.unique(iu), np.unique(iv)
+    if len(cols) * len(rows) != len(placements) or len(set(zip(iu.tolist(), iv.tolist()))) != len(placements):
+        return None
+    for steps in (np.diff(rows), np.diff(cols)):
+        if len(steps) and np.ptp(steps) > 1:  # uneven (quantized steps may differ by rounding)
+            return None
+    # Spacing and origin from the coordinates themselves, not their quantized keys
+    row_spacing = (v.max() - v.min()) / (len(rows) - 1) if len(rows) > 1 else 0.0
+    column_spacing = (u.max() - u.min()) / (len(cols) - 1) if len(cols) > 1 else 0.0
+    u0, v0 = u.min(), v.min()
+    # Back from the rotated frame to drawing coordinates
+    x0 = float(u0 * math.cos(angle) - v0 * math.sin(angle))
+    y0 = float(u0 * math.sin(angle) + v0 * math.cos(angle))
+    return Grid(x0, y0, angle, len(rows), len(cols), float(row_spacing), float(column_spacing))
+
+
+class InstanceReport:
+    def __init__(self):
+        self.shapes = 0  # polygons given
+        self.blocks = 0  # block definitions made
+        self.reused = 0  # definitions the drawing already had
+        self.inserts = 0  # InsertBlock references
+        self.minserts = 0  # AddMInsertBlock references
+        self.loose = 0  # polygons drawn as plain polylines
+        self.skipped = 0  # polygons without a non-zero edge, not drawn
+        self.handles = []  # handle of every entity made in model space
+        self.seconds = 0.0
+
+    def as_dict(self):
+        return {"shapes": self.shapes, "blocks": self.blocks, "reused": self.reused,
+                "inserts": self.inserts, "minserts": self.minserts, "loose": self.loose,
+                "skipped": self.skipped, "entities": len(self.handles), "seconds": self.seconds}
+
+    def __str__(self):
+        return (f"{self.shapes} shapes -> {self.blocks + self.reused} blocks ({self.reused} reused): "
+                f"{self.inserts} inserts, {self.minserts} minserts, {self.loose} loose "
+                f"in {self.seconds:.2f}s")
+
+
+def _definition(doc, shape, report, to_point, to_variant):
+    name = PREFIX + shape.key
+    blocks = doc.Blocks
+    try:
+        blocks.Item(name)
+        report.reused += 1
+        return name
+    except Exception:
+        pass
+    block = blocks.Add(to_point(0.0, 0.0), name)
+    pline = block.AddLightWeightPolyline(to_variant(shape.vertices))
+    if shape.closed:
+        pline.Closed = True
+    report.blocks += 1
+    return name
+
+
+def insert_instances(doc, polygons, layer="0", min_count=2, grid=True, quantum=QUANTUM,
+                     to_point=point_variant, to_variant=double_variant):
+    """
+    Draw polygons (lists of (x, y) points) in model space on layer, as
+    block references where a shape repeats; returns an InstanceReport.
+    to_point/to_variant build the point and coordinate arguments.
+    """
+    report = InstanceReport()
+    t0 = time.perf_counter()
+    polygons = list(polygons)
+    report.shapes = len(polygons)
+    shapes, degenerate = group_shapes(polygons, quantum)
+    msp = doc.ModelSpace
+    doc.Layers.Add(layer)  # the existing layer if there is one
+
+    def finish(entity):
+        entity.Layer = layer
+        report.handles.append(entity.Handle)
+
+    for shape in shapes:
+        if len(shape.placements) < min_count:
+            for x, y, angle, index in shape.placements:
+                xy, closed = polygon_ring(polygons[index])
+                pline = msp.AddLightWeightPolyline(to_variant(xy))
+                if closed:
+                    pline.Closed = True
+                finish(pline)
+                report.loose += 1
+            continue
+        name = _definition(doc, shape, report, to_point, to_variant)
+        cells = find_grid(shape.placements, quantum) if grid else None
+        if cells is not None:
+            # Spacings go in as whole numbers (the type library says Long); set the real ones after
+            minsert = msp.AddMInsertBlock(to_point(cells.x, cells.y), name, 1.0, 1.0, 1.0, cells.angle,
+                                          cells.rows, cells.columns, round(cells.row_spacing),
+                                          round(cells.column_spacing))
+            if cells.rows > 1 and cells.row_spacing != round(cells.row_spacing):
+                minsert.RowSpacing = cells.row_spacing
+            if cells.columns > 1 and cells.column_spacing != round(cells.column_spacing):
+                minsert.ColumnSpacing = cells.column_spacing
+            finish(minsert)
+            report.minserts += 1
+            continue
+        for x, y, angle, index in shape.placements:
+            finish(msp.InsertBlock(to_point(x, y), name, 1.0, 1.0, 1.0, angle))
+            report.inserts += 1
+    report.skipped = len(degenerate)
+    report.seconds = time.perf_counter() - t0
+    return report
@@ -0,0 +1,63 @@
+"""
+Build step for AutoCAD_Wrapper_lazy: writes the small index module
+(AutoCAD_Wrapper_index.py) that tells the lazy loader where each class and
+vtable lives inside AutoCAD_Wrapper.py, and packs the constants per enum
+for AutoCAD_Constants.
+
+Re-run this whenever AutoCAD_Wrapper.py is regenerated with makepy:
+
+    python build_lazy_wrapper.py
+"""
+import argparse
+import os
+import pprint
+
+from wrapper_source import SOURCE_DIR, WRAPPER_PATH, WrapperSource
+
+INDEX_PATH = os.path.join(SOURCE_DIR, "AutoCAD_Wrapper_index.py")
+
+HEADER = '''\
+# Generated by utils/build_lazy_wrapper.py from AutoCAD_Wrapper.py - do not edit.
+# Offsets are byte positions into the wrapper; rebuild after re-running makepy.
+'''
+
+
+def render_index(source):
+    """Return the text of the index module for a parsed WrapperSource."""
+    classes = {name: (c.start, c.end, c.lineno, c.kind, c.deps)
+               for name, c in source.classes.items()}
+    vtables = {name: tuple(span) for name, span in source.vtables.items()}
+    # One short string per enum; AutoCAD_Constants splits it on first use.
+    enums = {enum: " ".join(f"{name}={value}" for name, value in members)
+             for enum, members in source.enums.items()}
+    parts = [
+        HEADER,
+        "WRAPPER_SIZE = %d\n" % len(source.data),
+        "PREAMBLE_SPAN = %r\n" % (tuple(source.preamble),),
+        "\n# name -> (start, end, lineno, kind, deps)\n",
+        "CLASS_SPANS = %s\n" % pprint.pformat(classes, width=120),
+        "\nVTABLE_SPANS = %s\n" % pprint.pformat(vtables, width=120),
+        "\nCLSID_TO_NAME = %s\n" % pprint.pformat(source.maps["CLSIDToClassMap"], width=120),
+        "\nVTablesToClassMap = %s\n" % pprint.pformat(source.maps["VTablesToClassMap"], width=120),
+        "\nNamesToIIDMap = %s\n" % pprint.pformat(source.maps["NamesToIIDMap"], width=120),
+        "\n# enum -> 'member=value member=value ...'\n",
+        "ENUMS = %s\n" % pprint.pformat(enums, width=120),
+    ]
+    return "".join(parts)
+
+
+def build_index(wrapper_path=WRAPPER_PATH, index_path=INDEX_PATH):
+    source = WrapperSource(wrapper_path)
+    text = render_index(source)
+    with open(index_path, "w", newline="\n") as f:
+        f.write(text)
+    print(f"Indexed {len(source.classes)} classes and {len(source.vtables)} vtables -> {index_path}")
+    return index_path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the AutoCAD_Wrapper lazy-loading index")
+    parser.add_argument("--wrapper", default=WRAPPER_PATH)
+    parser.add_argument("--out", default=INDEX_PATH)
+    args = parser.parse_args()
+    build_index(args.wrapper, args.out)
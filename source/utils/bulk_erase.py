@@ -0,0 +1,134 @@
+"""
+Erase many entities with one SelectionSet.Erase instead of a Delete each.
+
+    report = bulk_erase(doc, (F.layer == "A-WALL-DEMO") & (F.space == MODEL))
+    report = bulk_erase(doc, handles=["2F1", "2F2", ...])
+    print(report)    # Erased 50000 of 50000 (0 failed, 0 missing) in 1.84s [select 0.41s, erase 1.40s, ...]
+
+The entities are gathered into a temporary selection set inside AutoCAD,
+from a selection_filter filter or from handles (selected through group
+code 5, HANDLE_CHUNK handles per Select, so no HandleToObject round trip
+per handle), and erased with one call.  What is still there afterwards
+(locked layers, objects another command holds open) is found with the
+same selection again, then retried in sets of ``chunk`` entities; only a
+chunk whose Erase fails falls back to Delete on each of its entities.
+Round trips stay constant while everything erases, however many
+entities there are.
+"""
+import time
+
+from com_arrays import object_variant
+from selection_filter import F, acSelectionSetAll, as_filter, filter_variants, selection_set
+
+HANDLE_CHUNK = 1000  # handles per Select filter
+CHUNK = 500  # entities per fallback Erase
+
+
+class EraseReport:
+    def __init__(self):
+        self.requested = 0  # entities matched (filter) or handles given
+        self.erased = 0
+        self.missing = 0  # handles that matched nothing
+        self.failed = []  # (handle, error text) of entities still there
+        self.chunks = 0  # fallback sets tried
+        self.deletes = 0  # fallback per-entity Delete calls
+        self.timings = {}  # phase -> seconds
+        self.seconds = 0.0
+
+    def _time(self, phase, start):
+        self.timings[phase] = self.timings.get(phase, 0.0) + time.perf_counter() - start
+
+    def as_dict(self):
+        return {"requested": self.requested, "erased": self.erased, "missing": self.missing,
+                "failed": len(self.failed), "chunks": self.chunks, "deletes": self.deletes,
+                "seconds": self.seconds, "timings": dict(self.timings)}
+
+    def __str__(self):
+        phases = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in self.timings.items())
+        return (f"Erased {self.erased} of {self.requested} ({len(self.failed)} failed, "
+                f"{self.missing} missing) in {self.seconds:.2f}s [{phases}]")
+
+
+def _select(sset, flt, handles, to_variants):
+    if handles is None:
+        codes, values = flt.compile()
+        sset.Select(acSelectionSetAll, None, None, *to_variants(codes, values))
+        return
+    for i in range(0, len(handles), HANDLE_CHUNK):
+        codes, values = F.handle.isin(handles[i:i + HANDLE_CHUNK]).compile()
+        sset.Select(acSelectionSetAll, None, None, *to_variants(codes, values))
+
+
+def _error_text(error):
+    excepinfo = getattr(error, "excepinfo", None)
+    return excepinfo[2] if excepinfo and excepinfo[2] else str(error)
+
+
+def bulk_erase(doc, flt=None, handles=None, chunk=CHUNK, to_variants=filter_variants,
+               to_objects=object_variant):
+    """
+    Erase the entities matching flt (a Filter or filter text), or with
+    these handles; returns an EraseReport.  to_variants/to_objects build
+    the filter and object-array arguments (plain tuples for fakes).
+    """
+    if (flt is None) == (handles is None):
+        raise ValueError("pass either a filter or handles")
+    if flt is not None:
+        flt = as_filter(flt)
+    if handles is not None:
+        handles = list(dict.fromkeys(h.upper() for h in handles))
+    report = EraseReport()
+    t0 = time.perf_counter()
+
+    # 1. One set, one Erase
+    with selection_set(doc) as sset:
+        start = time.perf_counter()
+        _select(sset, flt, handles, to_variants)
+        found = sset.Count
+        report._time("select", start)
+        report.requested = len(handles) if handles is not None else found
+        report.missing = report.requested - found
+        start = time.perf_counter()
+        try:
+            sset.Erase()
+        except Exception:
+            pass  # whatever survived is picked up below
+        report._time("erase", start)
+
+    # 2. Whatever is left: select it again and retry in chunks
+    start = time.perf_counter()
+    with selection_set(doc) as sset:
+        _select(sset, flt, handles, to_variants)
+        survivors = list(sset) if sset.Count else []
+    report._time("verify", start)
+    report.erased = found - len(survivors)
+
+    if survivors:
+        start = time.perf_counter()
+        for i in range(0, len(survivors), chunk):
+            part = survivors[i:i + chunk]
+            report.chunks += 1
+            with selection_set(doc) as sset:
+                sset.AddItems(to_objects(part))
+                try:
+                    sset.Erase()
+                    report.erased += len(part)
+                    continue
+                except Exception:
+                    pass
+            # This chunk refused as a whole: find out entity by entity
+            for obj in part:
+                report.deletes += 1
+                try:
+                    handle = obj.Handle
+                except Exception:
+                    report.erased += 1  # erased by the chunk Erase after all
+                    continue
+                try:
+                    obj.Delete()
+                    report.erased += 1
+                except Exception as e:
+                    report.failed.append((handle, _error_text(e)))
+        report._time("fallback", start)
+    report.seconds = time.perf_counter() - t0
+    return report
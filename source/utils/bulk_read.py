@@ -0,0 +1,163 @@
+"""
+Columnar property reads over many AutoCAD_Wrapper objects.
+
+    table = read_properties(msp_objects, ["Layer", "ObjectName", "Handle", "Area"])
+    table["Area"]          # float64 array, NaN where the entity has no Area
+    table.valid["Area"]    # bool mask of successful reads
+    table.errors["Area"]   # {index: exception}
+
+Instead of going through DispatchBaseClass.__getattr__ -> _ApplyTypes_ for
+every attribute, the DISPID and type signature of each property are looked
+up once per wrapper class in its ``_prop_map_get_`` and the read goes
+straight to ``_oleobj_.InvokeTypes``.  The number of cross-process calls
+is unchanged (one per entity and property); what goes away is the Python
+dispatch overhead around each call and the per-script bookkeeping.
+
+Entities that come back typed as their base interface (IAcadEntity from
+ModelSpace iteration or Item) do not list derived properties such as
+Closed or Area.  For those the ObjectName is read first and the concrete
+interface's DISPIDs are taken from the dispatch metadata index.
+"""
+import numpy as np
+
+import dispatch_metadata
+
+DISPATCH_PROPERTYGET = 2
+VT_DISPATCH = 9
+_FLOAT_VT = {4, 5, 6, 7}  # R4, R8, CY, DATE
+_INT_VT = {2, 3, 16, 17, 18, 19, 20, 21, 22, 23}
+_BOOL_VT = {11}
+
+
+class PropertyTable:
+    """Result of read_properties: one column per requested property."""
+
+    def __init__(self, names, count):
+        self.names = list(names)
+        self.count = count
+        self.columns = {}
+        self.valid = {}
+        self.errors = {name: {} for name in self.names}
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __len__(self):
+        return self.count
+
+    def row(self, i):
+        """Values of entity i as a dict, None for failed reads."""
+        return {name: (self.columns[name][i] if self.valid[name][i] else None) for name in self.names}
+
+    def failures(self):
+        return sum(len(e) for e in self.errors.values())
+
+
+class _Planner:
+    """Resolves (wrapper class, ObjectName) -> prop map entries, once each."""
+
+    def __init__(self, names, metadata):
+        self.names = names
+        self.metadata = metadata
+        self.plans = {}
+
+    def plan(self, cls, prop_map):
+        plan = self.plans.get(cls)
+        if plan is None:
+            plan = self.plans[cls] = [(name, prop_map.get(name)) for name in self.names]
+        return plan
+
+    def refine(self, cls, plan, object_name):
+        key = (cls, object_name)
+        refined = self.plans.get(key)
+        if refined is None:
+            if self.metadata is None:
+                self.metadata = dispatch_metadata.load_metadata()
+            meta = self.metadata.for_object_name(object_name)
+            extra = meta.prop_get if meta is not None else {}
+            refined = self.plans[key] = [(name, entry or extra.get(name)) for name, entry in plan]
+        return refined
+
+
+def read_properties(entities, names, as_numpy=True, metadata=None):
+    """
+    Read every property in `names` from every entity.  Failed or missing
+    reads never raise; they are recorded in the table's errors/valid.
+    Numeric and boolean properties come back as NumPy arrays when
+    as_numpy is set, everything else as lists.
+    """
+    entities = list(entities)
+    n = len(entities)
+    names = list(names)
+    values = {name: [None] * n for name in names}
+    ok = {name: np.zeros(n, dtype=bool) for name in names}
+    vtypes = {}
+    table = PropertyTable(names, n)
+    planner = _Planner(names, metadata)
+
+    for i, entity in enumerate(entities):
+        cls = type(entity)
+        prop_map = getattr(cls, "_prop_map_get_", None)
+        ole = entity.__dict__.get("_oleobj_") if hasattr(entity, "__dict__") else None
+        if prop_map is None or ole is None:
+            # Late-bound object: nothing to precompute, use normal attribute access.
+            for name in names:
+                try:
+                    values[name][i] = getattr(entity, name)
+                    ok[name][i] = True
+                except Exception as e:
+                    table.errors[name][i] = e
+            continue
+
+        plan = planner.plan(cls, prop_map)
+        known = {}
+        if any(entry is None for _name, entry in plan):
+            entry = prop_map.get("ObjectName")
+            if entry is not None:
+                try:
+                    known["ObjectName"] = ole.InvokeTypes(entry[0], 0, entry[1], entry[2], entry[3])
+                    plan = planner.refine(cls, plan, known["ObjectName"])
+                except Exception as e:
+                    if "ObjectName" in table.errors:
+                        table.errors["ObjectName"][i] = e
+
+        for name, entry in plan:
+            if name in known:
+                values[name][i] = known[name]
+                ok[name][i] = True
+                vtypes.setdefault(name, 8)
+                continue
+            if entry is None:
+                table.errors[name][i] = AttributeError(name)
+                continue
+            dispid, flags, ret_type, arg_types, user, result_clsid = entry
+            try:
+                value = ole.InvokeTypes(dispid, 0, flags, ret_type, arg_types)
+                if ret_type[0] == VT_DISPATCH and value is not None:
+                    value = entity._get_good_object_(value, user, result_clsid)
+                values[name][i] = value
+                ok[name][i] = True
+                vtypes.setdefault(name, ret_type[0])
+            except Exception as e:
+                table.errors[name][i] = e
+
+    for name in names:
+        table.valid[name] = ok[name]
+        table.columns[name] = _column(values[name], ok[name], vtypes.get(name), as_numpy)
+    return table
+
+
+def _column(values, ok, vt, as_numpy):
+    if not as_numpy or vt is None:
+        return values
+    if vt in _FLOAT_VT:
+        column = np.full(len(values), np.nan)
+    elif vt in _INT_VT:
+        column = np.zeros(len(values), dtype=np.int64)
+    elif vt in _BOOL_VT:
+        column = np.zeros(len(values), dtype=bool)
+    else:
+        return values
+    idx = np.flatnonzero(ok)
+    column[idx] = [values[i] for i in idx]
+    return column
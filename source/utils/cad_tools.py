@@ -1,6 +1,13 @@
 # cad_tools.py
-import matplotlib.pyplot as plt
-from pyautocad import Autocad, APoint
+import numpy as np
+
+from acad_session import get_session
+from bulk_erase import bulk_erase
+from com_arrays import double_variant, point_variant
+from draw_batch import DrawBatch
+from selection_filter import F, MODEL
+
+CLOSE_TOL = 1e-9  # a last vertex this close to the first one closes the polygon
 
 
 def plot_on_screen(polygons, title="Geometry Preview"):
@@ -8,6 +15,8 @@ def plot_on_screen(polygons, title="Geometry Preview"):
     Visualizes a list of closed polygons using Matplotlib.
     Expects polygons as lists of (x,y) tuples.
     """
+    import matplotlib.pyplot as plt
+
     print(f"Plotting {len(polygons)} shapes...")
 
     plt.figure(figsize=(10, 8))
@@ -39,59 +48,113 @@ def clear_layer(layer_name):
     Deletes ALL objects on a specific layer in ModelSpace.
     """
     try:
-        acad = Autocad(create_if_not_exists=True)
-        print(f"Connected to: {acad.doc.Name}")
+        session = get_session()
+        print(f"Connected to: {session.doc.Name}")
     except:
         print("Error: Could not connect to AutoCAD.")
         return
 
-    print(f"Searching for objects on layer '{layer_name}'...")
+    print(f"Erasing objects on layer '{layer_name}'...")
 
-    # Counter for deleted objects
-    count = 0
+    # AutoCAD selects the ModelSpace objects on the layer (case-insensitive,
+    # like the layer table) and erases them in one call
+    report = bulk_erase(session.doc, (F.layer == layer_name) & (F.space == MODEL))
+    for handle, error in report.failed:
+        print(f"   -> Could not delete {handle}: {error}")
 
-    # Iterate through ModelSpace (where you draw)
-    # Note: We iterate backwards or collect first to avoid issues while deleting
-    objects_to_delete = []
+    print(f"Deleted {report.erased} objects from layer '{layer_name}' in {report.seconds:.2f}s.")
 
-    for obj in acad.model:
-        try:
-            if obj.Layer.upper() == layer_name.upper():
-                objects_to_delete.append(obj)
-        except:
-            # Some objects might not have a Layer property (rare)
-            continue
-
-    # Delete them
-    for obj in objects_to_delete:
-        try:
-            obj.Delete()
-            count += 1
-        except:
-            pass
 
-    print(f"Deleted {count} objects from layer '{layer_name}'.")
+def polygon_ring(poly, tol=CLOSE_TOL):
+    """
+    (N, 2) vertices of poly and whether it is closed: a last vertex
+    repeating the first is dropped and the polygon marked closed instead.
+    """
+    if len(poly) == 0:
+        return np.zeros((0, 2)), False
+    xy = np.asarray(poly, dtype=np.float64).reshape(len(poly), -1)[:, :2]
+    closed = len(xy) >= 4 and bool(np.all(np.abs(xy[-1] - xy[0]) <= tol))
+    return (xy[:-1] if closed else xy), closed
 
-def send_to_autocad(polygons, layer_name="0"):
+
+def send_to_autocad(polygons, layer_name="0", mode="polyline", to_variant=double_variant,
+                    to_point=point_variant, run_mode="auto", watcher=None):
     """
     Sends a list of polygons to the active AutoCAD document on a specific layer.
+    mode="polyline" draws one LWPolyline per polygon (closed when its last
+    vertex repeats the first); mode="lines" draws a Line per edge.  Both are
+    recorded into a DrawBatch and sent with run_mode (see DrawBatch.run;
+    watcher is the command_runner.CommandWatcher it reuses in script mode).
+    run_mode="com" makes the wrapper calls one entity at a time instead.
+    mode="blocks" defines each repeated shape once as a block and inserts
+    it (block_instancing.insert_instances).
     """
+    if mode not in ("polyline", "lines", "blocks"):
+        raise ValueError(f"unknown mode {mode!r}")
+    if run_mode not in ("auto", "com", "script"):
+        raise ValueError(f"unknown run_mode {run_mode!r}")
     try:
-        acad = Autocad(create_if_not_exists=True)
-        print(f"Connected to: {acad.doc.Name}")
+        session = get_session()
+        print(f"Connected to: {session.doc.Name}")
     except Exception as e:
         print("Error: Could not connect to AutoCAD. Is it running?")
         return
 
     print(f"Sending {len(polygons)} objects to layer '{layer_name}'...")
 
+    if mode == "blocks":
+        from block_instancing import insert_instances
+
+        report = insert_instances(session.doc, polygons, layer=layer_name, to_point=to_point,
+                                  to_variant=to_variant)
+        print(f"Transfer complete: {report}")
+        return
+
+    if run_mode == "com":
+        _send_per_entity(session, polygons, layer_name, mode, to_variant, to_point)
+        print("Transfer complete.")
+        return
+
+    batch = DrawBatch()
+    for poly in polygons:
+        if mode == "polyline":
+            xy, closed = polygon_ring(poly)
+            if len(xy) >= 2:
+                batch.polyline(xy, closed=closed, layer=layer_name)
+        else:
+            for i in range(len(poly) - 1):
+                batch.line(poly[i][:2], poly[i + 1][:2], layer=layer_name)
+    handles = batch.run(session.doc, mode=run_mode, watcher=watcher, to_variant=to_variant)
+    refused = handles.count(None)
+    print("Transfer complete." if not refused else f"Transfer complete; AutoCAD refused {refused} objects.")
+
+
+def _send_per_entity(session, polygons, layer_name, mode, to_variant, to_point):
+    msp = session.model
+    if mode == "polyline":
+        try:
+            session.layers.Add(layer_name)  # the existing layer if there is one
+            layer = layer_name
+        except Exception:
+            layer = None  # new polylines stay on the current layer
+        for poly in polygons:
+            xy, closed = polygon_ring(poly)
+            if len(xy) < 2:
+                continue
+            pline = msp.AddLightWeightPolyline(to_variant(xy))
+            if closed:
+                pline.Closed = True
+            if layer is not None:
+                pline.Layer = layer
+        return
+
     for poly in polygons:
         # Draw the loop of lines for this polygon
         for i in range(len(poly) - 1):
-            p1 = APoint(poly[i][0], poly[i][1])
-            p2 = APoint(poly[i + 1][0], poly[i + 1][1])
+            p1 = to_point(poly[i][0], poly[i][1])
+            p2 = to_point(poly[i + 1][0], poly[i + 1][1])
 
-            line = acad.model.AddLine(p1, p2)
+            line = msp.AddLine(p1, p2)
 
             # Set Layer
             try:
@@ -99,5 +162,3 @@ def send_to_autocad(polygons, layer_name="0"):
             except:
                 # If layer doesn't exist, it defaults to current (usually 0)
                 pass
-
-    print("Transfer complete.")
\ No newline at end of file
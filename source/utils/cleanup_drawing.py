@@ -1,19 +1,22 @@
-import win32com.client
 import pythoncom
 
+from acad_session import get_session
+from bulk_edit import bulk_edit
+from selection_filter import F, MODEL, select
 
-def cleanup_drawing():
+
+def cleanup_drawing(raise_errors=False):
+    """Move layer-0 objects to AUDIT_REQUIRED and hide PDF underlays; raise_errors re-raises failures."""
     try:
         # 1. Connect to AutoCAD
-        acad = win32com.client.Dispatch("AutoCAD.Application")
-        doc = acad.ActiveDocument
-        msp = doc.ModelSpace
+        session = get_session()
+        doc = session.doc
         print(f"Connected to: {doc.Name}")
 
         # 2. Ensure "AUDIT_REQUIRED" layer exists
         # We try to add it; if it exists, AutoCAD just returns the existing layer.
         try:
-            audit_layer = doc.Layers.Add("AUDIT_REQUIRED")
+            audit_layer = session.layers.Add("AUDIT_REQUIRED")
             audit_layer.color = 30  # Orange color for visibility
         except Exception as e:
             print(f"Layer check note: {e}")
@@ -22,35 +25,31 @@ def cleanup_drawing():
         moved_count = 0
         hidden_pdfs = 0
 
-        # 3. Iterate through Model Space
-        # We count backwards or use a list to avoid indexing errors if we were deleting,
-        # but for modifying properties, a standard loop is usually fine in COM.
-        for obj in msp:
-
+        # 3. Select in AutoCAD, so only the objects to change cross over COM.
+        # One undo step and one regen for the whole batch; undone on error.
+        with bulk_edit(doc) as edit:
             # --- CHECK 1: Layer 0 ---
-            if obj.Layer == "0":
-                # Check if it is not a viewport or something critical (optional)
+            for obj in select(doc, (F.layer == "0") & (F.space == MODEL)):
                 obj.Layer = "AUDIT_REQUIRED"
                 moved_count += 1
 
             # --- CHECK 2: Hide PDFs ---
-            # ObjectName is the reliable COM property for type checking
-            # "AcDbPdfReference" is the internal name for a PDF underlay
-            if "AcDbPdfReference" in obj.ObjectName:
+            # PDFUNDERLAY is the DXF name of a PDF underlay (ObjectName "AcDbPdfReference")
+            for obj in select(doc, (F.type == "PDFUNDERLAY") & (F.space == MODEL)):
                 obj.Visible = False
                 hidden_pdfs += 1
 
-        # 4. Refresh to see changes
-        doc.Regen(1)
-
         print("-" * 30)
         print("CLEANUP REPORT")
         print(f"Objects moved from Layer 0: {moved_count}")
         print(f"PDFs hidden: {hidden_pdfs}")
+        print(f"Edit time: {edit.seconds:.2f}s")
         print("-" * 30)
 
     except Exception as e:
         print(f"Error: {e}")
+        if raise_errors:
+            raise
 
 
 if __name__ == "__main__":
@@ -0,0 +1,119 @@
+"""
+Coordinate arguments for AutoCAD's VT_ARRAY|VT_R8 parameters.
+
+AddLightWeightPolyline, Add3DPoly, AddPolyfaceMesh, the Coordinates
+setters and every point argument want one flat array of doubles.  Instead
+of building an APoint per vertex or a tuple of Python floats, hand these
+helpers an (N, 2)/(N, 3) float64 array:
+
+    xy = np.array([[0, 0], [10, 0], [10, 5]], dtype=float)
+    msp.AddLightWeightPolyline(double_variant(xy))
+    msp.Add3DPoly(double_variant(xy, dims=3))        # z padded with 0
+    text = ps.AddText("...", point_variant(10, 10), 2.5)
+
+The vertices are copied once, straight into an array.array('d') that
+pywin32 marshals into the SAFEARRAY.  A BufferPool keeps those buffers per
+length, so loops that send many same-sized shapes do not reallocate:
+
+    pool = BufferPool()
+    for panel in panels:                              # all (4, 2)
+        msp.AddLightWeightPolyline(double_variant(panel, pool=pool))
+
+A pooled buffer is reused by the next request of the same length, so pass
+it to COM before asking the pool for another one.
+"""
+import array
+from collections import OrderedDict
+
+import numpy as np
+
+VT_R8 = 5
+VT_DISPATCH = 9
+VT_ARRAY = 0x2000
+
+
+class BufferPool:
+    """Reusable array.array('d') buffers keyed by length (LRU of maxsize lengths)."""
+
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self._buffers = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, n):
+        buf = self._buffers.get(n)
+        if buf is None:
+            self.misses += 1
+            buf = self._buffers[n] = _new_buffer(n)
+            while len(self._buffers) > self.maxsize:
+                self._buffers.popitem(last=False)
+        else:
+            self.hits += 1
+            self._buffers.move_to_end(n)
+        return buf
+
+    def clear(self):
+        self._buffers.clear()
+
+
+def _new_buffer(n):
+    # Sequence repeat is a memcpy doubling loop, no per-item Python work
+    return array.array("d", [0.0]) * n
+
+
+def _point_array(points, dtype=None):
+    pts = np.asarray(points, dtype=dtype)
+    if pts.ndim == 1:
+        pts = pts.reshape(1, -1)
+    if pts.ndim != 2 or pts.shape[1] not in (2, 3):
+        raise ValueError(f"expected an (N, 2) or (N, 3) array of points, got shape {pts.shape}")
+    return pts
+
+
+def as_points(points):
+    """(N, d) float64 view of points; copies only if it is not already float64."""
+    return _point_array(points, np.float64)
+
+
+def flat_doubles(points, dims=None, pool=None):
+    """
+    Flat array.array('d') of points, x0 y0 [z0] x1 y1 [z1] ...
+
+    dims=2 drops z, dims=3 pads a missing z with 0; by default the input's
+    own width is kept.  The values are written into the buffer in one pass
+    (strided or non-float64 input is converted in the same pass).
+    """
+    pts = _point_array(points)  # as given: the copy into buf does the conversion
+    if pts.dtype.kind not in "biuf":
+        pts = pts.astype(np.float64)  # e.g. objects or strings, which copyto will not cast
+    n, width = pts.shape
+    dims = dims or width
+    buf = pool.get(n * dims) if pool is not None else _new_buffer(n * dims)
+    out = np.frombuffer(buf, dtype=np.float64).reshape(n, dims)
+    common = min(width, dims)
+    np.copyto(out[:, :common], pts[:, :common])
+    if dims > width:
+        out[:, width:] = 0.0
+    return buf
+
+
+def double_variant(points, dims=None, pool=None):
+    """VT_ARRAY|VT_R8 VARIANT of points, ready for any coordinate argument."""
+    import win32com.client
+
+    return win32com.client.VARIANT(VT_ARRAY | VT_R8, flat_doubles(points, dims, pool))
+
+
+def point_variant(x, y, z=0.0):
+    """A single 3D point argument."""
+    import win32com.client
+
+    return win32com.client.VARIANT(VT_ARRAY | VT_R8, array.array("d", (x, y, z)))
+
+
+def object_variant(objects):
+    """VT_ARRAY|VT_DISPATCH VARIANT of COM objects, e.g. for SelectionSet.AddItems."""
+    import win32com.client
+
+    return win32com.client.VARIANT(VT_ARRAY | VT_DISPATCH, list(objects))
@@ -0,0 +1,622 @@
+"""
+Record and replay the COM call stream of a script.
+
+On a workstation, capture a real session once:
+
+    python com_recorder.py record generate_presentation:generate_report -o report.comlog
+
+or from code:
+
+    log = CallLog("session.comlog")
+    log.install()                      # every Dispatch("AutoCAD.Application") is recorded
+    with log.phase("scan"):
+        ...
+    log.uninstall(); log.close()
+
+Then, anywhere (no AutoCAD, no pywin32):
+
+    python com_recorder.py summary report.comlog
+
+    replay = Replayer("report.comlog")
+    acad = replay.connect()            # answers every call from the file, in order
+
+RecordingOle sits in a wrapper's ``_oleobj_`` slot and logs each
+InvokeTypes/Invoke (and the IEnumVARIANT/QueryInterface calls around
+iteration) with its DISPID, flags, arguments, result or error, start time
+and duration.  COM objects in arguments and results are written as object
+references, so the replayer can rebuild the same object graph.
+
+A log file holds one session: a stream of marshal'd tuples, one per
+record, written in order (a new CallLog on the same path starts over).
+Object references are encoded as one-element lists ([ref]); every other
+sequence is stored as a tuple.
+"""
+import argparse
+import array
+import importlib
+import marshal
+import os
+import re
+import sys
+import time
+from collections import Counter, defaultdict
+
+import dispatch_metadata
+
+FORMAT_VERSION = 1
+DISPID_NEWENUM = -4
+# Methods of the raw interfaces (besides InvokeTypes/Invoke) that are round trips worth logging
+_LOGGED_METHODS = ("QueryInterface", "Next", "Skip", "Reset", "Clone", "GetIDsOfNames")
+
+
+class Ref(int):
+    """Object reference read back from a log."""
+
+    def __repr__(self):
+        return f"Ref({int(self)})"
+
+
+def _is_object(value):
+    return hasattr(value, "QueryInterface")
+
+
+class CallLog:
+    """Sink for the records of one session; in memory when path is None, else truncates path."""
+
+    def __init__(self, path=None, flush_every=256):
+        self.path = path
+        self.records = [] if path is None else None
+        self._file = open(path, "wb") if path is not None else None
+        self._pending = 0
+        self.flush_every = flush_every
+        self._next_ref = 0
+        self._t0 = time.perf_counter()
+        self._phase = None
+        self._installed = []
+        self.write(("H", FORMAT_VERSION, time.time()))
+
+    def now(self):
+        return time.perf_counter() - self._t0
+
+    def write(self, record):
+        if self._file is None:
+            self.records.append(record)
+            return
+        self._file.write(marshal.dumps(record))
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self._file.flush()
+            self._pending = 0
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def new_ref(self, ole):
+        ref = self._next_ref
+        self._next_ref += 1
+        interface = getattr(ole, "interface", None)
+        if isinstance(interface, str):
+            self.write(("T", ref, interface))
+        return ref
+
+    def root(self, ole, label=None):
+        """Start recording calls on ole (a raw object, not a wrapper)."""
+        proxy = RecordingOle(ole, self)
+        interface = getattr(ole, "interface", None)
+        if not isinstance(interface, str):
+            try:
+                interface = ole.GetTypeInfo().GetDocumentation(-1)[0]
+            except Exception:
+                interface = None
+        self.write(("R", proxy._ref, label, interface))
+        return proxy
+
+    def phase(self, name):
+        """Context manager: calls made inside are attributed to phase `name`."""
+        return _Phase(self, name)
+
+    def mark(self, name):
+        """Start phase `name` now (until the next mark)."""
+        self._phase = name
+        self.write(("P", name, self.now()))
+
+    def install(self):
+        """
+        Record every object obtained through win32com.client.Dispatch(progid)
+        and everything reached from it.  Undo with uninstall().
+        """
+        import win32com.client
+        import win32com.client.dynamic
+
+        client, dynamic = win32com.client, win32com.client.dynamic
+        original_dispatch = client.Dispatch
+        original_good = client._get_good_object_
+        original_single = dynamic.CDispatch._get_good_single_object_
+        log = self
+
+        def dispatch(target, *args, **kwargs):
+            obj = original_dispatch(target, *args, **kwargs)
+            if isinstance(target, str):
+                record(obj, log, label=target)
+            return obj
+
+        def good_object(obj, user_name=None, result_clsid=None):
+            # win32com only wraps real PyIDispatch results; proxies need the same treatment
+            if isinstance(obj, RecordingOle):
+                return original_dispatch(obj, user_name, result_clsid)
+            return original_good(obj, user_name, result_clsid)
+
+        def good_single_object(self, ob, userName=None, ReturnCLSID=None):
+            if isinstance(ob, RecordingOle):
+                return original_dispatch(ob, userName, ReturnCLSID)
+            return original_single(self, ob, userName, ReturnCLSID)
+
+        self._installed.append((client, "Dispatch", original_dispatch))
+        self._installed.append((client, "_get_good_object_", original_good))
+        self._installed.append((dynamic.CDispatch, "_get_good_single_object_", original_single))
+        client.Dispatch = dispatch
+        client._get_good_object_ = good_object
+        dynamic.CDispatch._get_good_single_object_ = good_single_object
+        return self
+
+    def uninstall(self):
+        while self._installed:
+            target, name, original = self._installed.pop()
+            setattr(target, name, original)
+
+
+class _Phase:
+    def __init__(self, log, name):
+        self.log = log
+        self.name = name
+
+    def __enter__(self):
+        self.previous = self.log._phase
+        self.log.mark(self.name)
+        return self
+
+    def __exit__(self, *exc):
+        self.log.mark(self.previous)
+
+
+def record(obj, log, label=None):
+    """
+    Swap obj's ``_oleobj_`` (a makepy wrapper, CDispatch or FakeDispatch)
+    for a recording proxy.  Returns obj.
+    """
+    ole = obj.__dict__["_oleobj_"]
+    if not isinstance(ole, RecordingOle):
+        obj.__dict__["_oleobj_"] = log.root(ole, label)
+    return obj
+
+
+class RecordingOle:
+    """Proxy for a raw COM object that logs every round trip through it."""
+
+    def __init__(self, ole, log):
+        self.__dict__["_ole"] = ole
+        self.__dict__["_log"] = log
+        self.__dict__["_ref"] = log.new_ref(ole)
+
+    def _call(self, fn, dispid, flags, args):
+        log = self._log
+        packed_args = _pack(args)
+        t = log.now()
+        try:
+            result = fn(*_unwrap(args))
+        except Exception as e:
+            log.write(("X", self._ref, dispid, flags, packed_args,
+                       (type(e).__name__,) + _pack(e.args), t, log.now() - t))
+            raise
+        dt = log.now() - t
+        result = self._adopt(result)
+        log.write(("C", self._ref, dispid, flags, packed_args, _pack(result), t, dt))
+        return result
+
+    def _adopt(self, value):
+        if isinstance(value, tuple):
+            return tuple(self._adopt(v) for v in value)
+        if _is_object(value) and not isinstance(value, RecordingOle):
+            return RecordingOle(value, self._log)
+        return value
+
+    def InvokeTypes(self, dispid, lcid, flags, ret_type, arg_types, *args):
+        return self._call(lambda *a: self._ole.InvokeTypes(dispid, lcid, flags, ret_type, arg_types, *a),
+                          dispid, flags, args)
+
+    def Invoke(self, dispid, lcid, flags, result_wanted, *args):
+        return self._call(lambda *a: self._ole.Invoke(dispid, lcid, flags, result_wanted, *a),
+                          dispid, flags, args)
+
+    def __getattr__(self, name):
+        attr = getattr(self._ole, name)
+        if name in _LOGGED_METHODS:
+            return lambda *args: self._call(attr, name, 0, args)
+        return attr
+
+    def __setattr__(self, name, value):
+        setattr(self._ole, name, value)
+
+    def __repr__(self):
+        return f"<RecordingOle #{self._ref} {self._ole!r}>"
+
+
+def _unwrap(value):
+    """Hand the real objects to COM: proxies (also inside wrappers) -> raw ole."""
+    if isinstance(value, RecordingOle):
+        return value._ole
+    if isinstance(value, (tuple, list)):
+        return type(value)(_unwrap(v) for v in value)
+    inner = getattr(value, "__dict__", {}).get("_oleobj_")
+    if isinstance(inner, RecordingOle):
+        return inner._ole
+    return value
+
+
+def _pack(value):
+    """Marshal-safe form of a COM argument or result."""
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return value
+    if isinstance(value, (RecordingOle, ReplayOle)):
+        return [value._ref]
+    if isinstance(value, (tuple, list, array.array)):
+        return tuple(_pack(v) for v in value)
+    if hasattr(value, "varianttype"):
+        return _pack(value.value)
+    if hasattr(value, "tolist"):
+        return _pack(value.tolist())
+    inner = getattr(value, "__dict__", {}).get("_oleobj_")
+    if isinstance(inner, (RecordingOle, ReplayOle)):
+        return [inner._ref]
+    if type(value).__name__.startswith("PyOle"):
+        return None  # pythoncom.Missing / Empty / ArgNotFound
+    return repr(value)
+
+
+def read_log(path):
+    """All records of a .comlog file, object references decoded to Ref."""
+    records = []
+    with open(path, "rb") as f:
+        while True:
+            try:
+                records.append(_decode(marshal.load(f)))
+            except EOFError:
+                break
+    if not records or records[0][0] != "H" or records[0][1] != FORMAT_VERSION:
+        raise ValueError(f"{path} is not a COM call log (version {FORMAT_VERSION})")
+    return records
+
+
+def _decode(value):
+    if isinstance(value, list):
+        return Ref(value[0])
+    if isinstance(value, tuple):
+        return tuple(_decode(v) for v in value)
+    return value
+
+
+def _refs(value):
+    if isinstance(value, Ref):
+        yield value
+    elif isinstance(value, tuple):
+        for v in value:
+            yield from _refs(v)
+
+
+# --- Replay ----------------------------------------------------------------
+
+class ReplayMismatch(AssertionError):
+    """The replayed program made a call the recording does not have next."""
+
+
+class ReplayedComError(Exception):
+    """A recorded COM failure, raised again at the same point of the replay."""
+
+    def __init__(self, type_name, *args):
+        super().__init__(*args)
+        self.type_name = type_name
+        self.hresult = args[0] if args else None
+        self.excepinfo = args[2] if len(args) > 2 else None
+
+
+class ReplayOle:
+    """Stands in for the object recorded as `ref`."""
+
+    def __init__(self, replayer, ref):
+        self._replayer = replayer
+        self._ref = ref
+        self.interface = replayer.interfaces.get(ref)
+        self.metadata = replayer.metadata
+
+    def InvokeTypes(self, dispid, lcid, flags, ret_type, arg_types, *args):
+        return self._replayer._answer(self._ref, dispid, flags, args)
+
+    def Invoke(self, dispid, lcid, flags, result_wanted, *args):
+        return self._replayer._answer(self._ref, dispid, flags, args)
+
+    def __getattr__(self, name):
+        if name in _LOGGED_METHODS:
+            return lambda *args: self._replayer._answer(self._ref, name, 0, args)
+        raise AttributeError(name)
+
+    def __repr__(self):
+        return f"<ReplayOle #{self._ref} {self.interface}>"
+
+
+class Replayer:
+    """
+    Plays a recording back deterministically: each call must match the next
+    recorded one (same object and DISPID; with strict=True also the same
+    flags and arguments) and gets the recorded result or error.  With
+    timing=True each call also takes as long as it did when recorded.
+    """
+
+    def __init__(self, source, strict=True, timing=False, metadata=None):
+        self.records = read_log(source) if isinstance(source, str) else list(source)
+        self.strict = strict
+        self.timing = timing
+        self._metadata = metadata
+        self.calls = [r for r in self.records if r[0] in ("C", "X")]
+        self.roots = [r for r in self.records if r[0] == "R"]
+        self.interfaces = infer_interfaces(self.records, self.metadata)
+        self.position = 0
+        self._objects = {}
+
+    @property
+    def metadata(self):
+        if self._metadata is None:
+            self._metadata = dispatch_metadata.load_metadata()
+        return self._metadata
+
+    def root(self, index=0):
+        """Raw object for the index-th recorded root."""
+        return self._object(self.roots[index][1])
+
+    def connect(self, index=0):
+        """Late-bound client over the index-th root, like fake_acad.FakeAutoCAD.connect()."""
+        from fake_acad import FakeDispatch
+        return FakeDispatch(self.root(index))
+
+    def done(self):
+        return self.position == len(self.calls)
+
+    def _object(self, ref):
+        obj = self._objects.get(ref)
+        if obj is None:
+            obj = self._objects[ref] = ReplayOle(self, ref)
+        return obj
+
+    def _answer(self, ref, dispid, flags, args):
+        if self.position >= len(self.calls):
+            raise ReplayMismatch(f"call #{self.position} on object {ref} (DISPID {dispid}) is past the recording")
+        rec = self.calls[self.position]
+        kind, rec_ref, rec_dispid, rec_flags, rec_args, outcome, _t, dt = rec
+        if rec_ref != ref or rec_dispid != dispid:
+            raise ReplayMismatch(f"call #{self.position}: got object {ref} DISPID {dispid}, "
+                                 f"recorded object {rec_ref} DISPID {rec_dispid}")
+        if self.strict and (rec_flags != flags or _decode(_pack(args)) != rec_args):
+            raise ReplayMismatch(f"call #{self.position}: arguments differ from the recording "
+                                 f"({args!r} vs {rec_args!r})")
+        self.position += 1
+        if self.timing and dt > 0:
+            time.sleep(dt)
+        if kind == "X":
+            raise ReplayedComError(*outcome)
+        return self._materialize(outcome)
+
+    def _materialize(self, value):
+        if isinstance(value, Ref):
+            return self._object(value)
+        if isinstance(value, tuple):
+            return tuple(self._materialize(v) for v in value)
+        return value
+
+
+# --- Analysis --------------------------------------------------------------
+
+def infer_interfaces(records, metadata=None):
+    """
+    ref -> interface name.  Taken from the recording where known, otherwise
+    from the result type the wrapper declares for the call that returned the
+    object (so Item() results are their declared IAcadEntity, as in makepy).
+    """
+    interfaces = {}
+    item_types = {}  # enumerator ref -> interface of the items it yields
+    for rec in records:
+        if rec[0] == "R" and rec[3]:
+            interfaces[rec[1]] = rec[3]
+        elif rec[0] == "T":
+            interfaces[rec[1]] = rec[2]
+        elif rec[0] == "C":
+            _kind, ref, dispid, flags, _args, result, _t, _dt = rec
+            new = [r for r in _refs(result) if r not in interfaces]
+            if not new:
+                continue
+            parent = interfaces.get(ref)
+            if dispid == "Next":
+                for r in new:
+                    if item_types.get(ref):
+                        interfaces[r] = item_types[ref]
+                continue
+            if dispid in ("QueryInterface", "Clone"):
+                for r in new:
+                    if parent:
+                        interfaces.setdefault(r, parent)
+                    item_types[r] = item_types.get(ref)
+                continue
+            if parent is None:
+                continue
+            if metadata is None:
+                metadata = dispatch_metadata.load_metadata()
+            if dispid == DISPID_NEWENUM:
+                item_types[new[0]] = _result_interface(metadata, parent, 0, 1)
+                continue
+            declared = _result_interface(metadata, parent, dispid, flags)
+            for r in new:
+                if declared:
+                    interfaces[r] = declared
+    return interfaces
+
+
+def _entry(meta, dispid, flags):
+    """(kind, name, entry) of the member of meta with dispid, given the invoke flags."""
+    order = (("put", meta.prop_put),) if flags & 12 else \
+        (("call", meta.methods), ("get", meta.prop_get)) if flags & 1 else \
+        (("get", meta.prop_get), ("call", meta.methods))
+    for kind, table in order:
+        for name, entry in table.items():
+            if (entry[0][0] if kind == "put" else entry[0]) == dispid:
+                return kind, name, entry
+    return None
+
+
+def _result_interface(metadata, interface, dispid, flags):
+    if interface not in metadata:
+        return None
+    found = _entry(metadata[interface], dispid, flags)
+    if found is None:
+        return None
+    kind, _name, entry = found
+    clsid = entry[-1] if kind in ("get", "call") else None
+    try:
+        return metadata.for_clsid(clsid).name if clsid else None
+    except KeyError:
+        return None
+
+
+def _member(metadata, interface, dispid, flags):
+    if isinstance(dispid, str):
+        return dispid
+    if interface in metadata:
+        found = _entry(metadata[interface], dispid, flags)
+        if found is not None:
+            return found[1]
+    return "_NewEnum" if dispid == DISPID_NEWENUM else f"DISPID {dispid}"
+
+
+class Summary:
+    """Call counts and COM time per interface, member and phase."""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.com_time = 0.0
+        self.wall_time = 0.0
+        self.by_interface = Counter()
+        self.by_member = defaultdict(lambda: [0, 0.0])  # (interface, member) -> [calls, seconds]
+        self.phases = {}  # name -> [calls, com seconds, wall seconds]
+
+    def hot_members(self, n=15):
+        return sorted(self.by_member.items(), key=lambda kv: kv[1][1], reverse=True)[:n]
+
+    def phase_shares(self):
+        """phase -> share of the total COM time spent in it."""
+        total = self.com_time or 1.0
+        return {name: v[1] / total for name, v in self.phases.items()}
+
+
+def summarize(records, metadata=None):
+    if metadata is None:
+        metadata = dispatch_metadata.load_metadata()
+    interfaces = infer_interfaces(records, metadata)
+    summary = Summary()
+    phase, phase_start = None, 0.0
+    end = 0.0
+    for rec in records:
+        if rec[0] == "P":
+            stats = summary.phases.setdefault(phase, [0, 0.0, 0.0])
+            stats[2] += rec[2] - phase_start
+            phase, phase_start = rec[1], rec[2]
+            continue
+        if rec[0] not in ("C", "X"):
+            continue
+        kind, ref, dispid, flags, _args, _outcome, t, dt = rec
+        interface = interfaces.get(ref) or ("IEnumVARIANT" if dispid in _LOGGED_METHODS else "?")
+        member = _member(metadata, interface, dispid, flags)
+        summary.calls += 1
+        summary.errors += kind == "X"
+        summary.com_time += dt
+        summary.by_interface[interface] += 1
+        entry = summary.by_member[(interface, member)]
+        entry[0] += 1
+        entry[1] += dt
+        stats = summary.phases.setdefault(phase, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += dt
+        end = max(end, t + dt)
+    summary.phases.setdefault(phase, [0, 0.0, 0.0])[2] += max(end - phase_start, 0.0)
+    summary.wall_time = end
+    summary.phases = {k: v for k, v in summary.phases.items() if v[0] or v[2]}
+    return summary
+
+
+def format_summary(summary, top=15):
+    lines = [f"{summary.calls} COM calls ({summary.errors} failed), "
+             f"{summary.com_time:.3f} s in COM of {summary.wall_time:.3f} s recorded", "",
+             "Calls per interface:"]
+    for interface, count in summary.by_interface.most_common():
+        lines.append(f"  {interface:<32} {count:>8}")
+    lines += ["", f"Hottest members (top {top} by COM time):"]
+    for (interface, member), (count, seconds) in summary.hot_members(top):
+        lines.append(f"  {interface + '.' + str(member):<48} {count:>8} {seconds * 1000:>10.1f} ms")
+    if summary.phases:
+        lines += ["", "Phases:"]
+        shares = summary.phase_shares()
+        for name, (count, com, wall) in summary.phases.items():
+            label = "(before first phase)" if name is None else str(name)
+            lines.append(f"  {label:<32} {count:>8} calls {com:>8.3f} s COM "
+                         f"({shares[name]:>5.1%} of COM time, {wall:.3f} s wall)")
+    return "\n".join(lines)
+
+
+# --- Command line ------------------------------------------------------------
+
+def _record_command(args):
+    module_name, _, func_name = args.target.partition(":")
+    sys.path.insert(0, os.getcwd())
+    func = getattr(importlib.import_module(module_name), func_name or "main")
+    log = CallLog(args.output)
+    log.install()
+    if args.phase_pattern:
+        import builtins
+        pattern = re.compile(args.phase_pattern)
+        original_print = builtins.print
+
+        def print_marking_phases(*values, **kwargs):
+            text = " ".join(str(v) for v in values).strip()
+            if pattern.search(text):
+                log.mark(text[:60])
+            original_print(*values, **kwargs)
+        builtins.print = print_marking_phases
+    try:
+        func()
+    finally:
+        if args.phase_pattern:
+            builtins.print = original_print
+        log.uninstall()
+        log.close()
+    print(f"Recorded session -> {args.output}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record or analyse COM call streams")
+    sub = parser.add_subparsers(dest="command", required=True)
+    rec = sub.add_parser("record", help="run module:function with every AutoCAD call recorded")
+    rec.add_argument("target", help="e.g. fix_facade_geometry:fix_facade_geometry_v2")
+    rec.add_argument("-o", "--output", default="session.comlog")
+    rec.add_argument("--phase-pattern", help="printed lines matching this regex start a new phase, "
+                                             r"e.g. '^\[Step'")
+    summ = sub.add_parser("summary", help="call counts, hot DISPIDs and phase shares of a recording")
+    summ.add_argument("log")
+    summ.add_argument("--top", type=int, default=15)
+    args = parser.parse_args(argv)
+    if args.command == "record":
+        _record_command(args)
+    else:
+        print(format_summary(summarize(read_log(args.log)), args.top))
+
+
+if __name__ == "__main__":
+    main()
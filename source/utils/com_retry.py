@@ -0,0 +1,258 @@
+"""
+Retry policy for COM calls that AutoCAD rejects while it is busy.
+
+    policy = RetryPolicy()
+    doc = policy.call(lambda: acad.ActiveDocument)
+    msp = retrying(doc.ModelSpace, policy)     # every get/set/call retried
+    msp.AddLine(p1, p2)
+    print(format_metrics(policy.metrics))
+
+While AutoCAD is running a command, showing a dialog or still starting,
+its message filter answers incoming calls with RPC_E_CALL_REJECTED or
+RPC_E_SERVERCALL_RETRYLATER.  Such a call was never executed, so retrying
+it is safe even for AddLine or Delete.  Any other error is raised at once.
+
+Waits grow exponentially from ``base`` up to ``max_delay`` with jitter,
+so several scripts hitting the same session do not retry in lockstep,
+and stop at ``attempts`` or ``deadline`` seconds.  After ``threshold``
+calls in a row have run out of retries the circuit opens: further calls
+raise CircuitOpen immediately for ``cooldown`` seconds instead of each
+waiting out its own backoff, then a single trial call decides whether to
+close it again.
+
+Metrics (calls, retries, seconds waited, give-ups, breaker trips, busy
+HRESULTs seen) accumulate in a RetryMetrics, by default the module-wide
+METRICS shared by every policy.
+"""
+import random
+import threading
+import time
+from collections import Counter
+
+RPC_E_CALL_REJECTED = -2147418111  # 0x80010001
+RPC_E_SERVERCALL_RETRYLATER = -2147417846  # 0x8001010A
+DISP_E_EXCEPTION = -2147352567
+BUSY_HRESULTS = frozenset({RPC_E_CALL_REJECTED, RPC_E_SERVERCALL_RETRYLATER})
+
+
+def com_hresult(error):
+    """HRESULT of a pywintypes.com_error (or anything shaped like one), else None."""
+    hresult = getattr(error, "hresult", None)
+    if hresult is None and getattr(error, "args", None) and isinstance(error.args[0], int):
+        hresult = error.args[0]
+    return hresult
+
+
+def is_busy(error):
+    """True for the rejections AutoCAD's message filter gives while busy."""
+    hresult = com_hresult(error)
+    if hresult in BUSY_HRESULTS:
+        return True
+    # Some AutoCAD calls wrap the rejection in a DISP_E_EXCEPTION
+    excepinfo = getattr(error, "excepinfo", None)
+    return hresult == DISP_E_EXCEPTION and bool(excepinfo) and excepinfo[5] in BUSY_HRESULTS
+
+
+class CircuitOpen(RuntimeError):
+    pass
+
+
+class RetryMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.calls = 0
+        self.retries = 0
+        self.waited = 0.0
+        self.gave_up = 0
+        self.breaker_trips = 0
+        self.short_circuited = 0
+        self.hresults = Counter()
+
+    def _record(self, **counts):
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def as_dict(self):
+        with self._lock:
+            return {"calls": self.calls, "retries": self.retries, "waited": self.waited,
+                    "gave_up": self.gave_up, "breaker_trips": self.breaker_trips,
+                    "short_circuited": self.short_circuited, "hresults": dict(self.hresults)}
+
+
+METRICS = RetryMetrics()
+
+
+def format_metrics(metrics=METRICS):
+    m = metrics.as_dict()
+    busy = ", ".join(f"0x{h & 0xFFFFFFFF:08X} x{n}" for h, n in m["hresults"].items()) or "none"
+    return (f"COM calls: {m['calls']}, retries: {m['retries']}, waited: {m['waited']:.2f}s, "
+            f"gave up: {m['gave_up']}, breaker trips: {m['breaker_trips']} "
+            f"({m['short_circuited']} calls refused), busy HRESULTs: {busy}")
+
+
+class RetryPolicy:
+    """
+    sleep, clock and rng are injectable for tests; retryable(error)
+    decides which errors are retried (default is_busy).
+    """
+
+    def __init__(self, attempts=8, base=0.05, factor=2.0, max_delay=2.0, jitter=0.5, deadline=30.0,
+                 threshold=3, cooldown=10.0, retryable=is_busy, metrics=None,
+                 sleep=time.sleep, clock=time.monotonic, rng=None):
+        self.attempts = attempts
+        self.base = base
+        self.factor = factor
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.deadline = deadline
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.retryable = retryable
+        self.metrics = metrics if metrics is not None else METRICS
+        self.sleep = sleep
+        self.clock = clock
+        self.rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._failures = 0  # calls in a row that ran out of retries
+        self._open_until = None
+
+    def delay(self, retry):
+        """Wait before retry number `retry` (0-based): capped exponential, less up to jitter."""
+        cap = min(self.max_delay, self.base * self.factor ** retry)
+        return cap * (1.0 - self.jitter * self.rng.random())
+
+    @property
+    def is_open(self):
+        return self._open_until is not None and self.clock() < self._open_until
+
+    def _admit(self):
+        with self._lock:
+            if self._open_until is None:
+                return
+            if self.clock() < self._open_until:
+                self.metrics._record(short_circuited=1)
+                raise CircuitOpen(f"AutoCAD rejected {self._failures} calls in a row; "
+                                  f"not retrying for {self._open_until - self.clock():.1f}s")
+            # Cooldown over: let this call through as the trial
+            self._open_until = None
+            self._failures = self.threshold - 1
+
+    def _outcome(self, gave_up):
+        with self._lock:
+            if not gave_up:
+                self._failures = 0
+                return
+            self._failures += 1
+            if self._failures >= self.threshold:
+                self._open_until = self.clock() + self.cooldown
+                self.metrics._record(breaker_trips=1)
+
+    def call(self, fn, *args, **kwargs):
+        """fn(*args, **kwargs), retried while it fails with a busy rejection."""
+        self._admit()
+        self.metrics._record(calls=1)
+        start = self.clock()
+        retry = 0
+        while True:
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                if not self.retryable(e):
+                    self._outcome(False)
+                    raise
+                with self.metrics._lock:
+                    self.metrics.hresults[com_hresult(e)] += 1
+                wait = self.delay(retry)
+                late = self.deadline is not None and self.clock() - start + wait > self.deadline
+                if retry + 1 >= self.attempts or late:
+                    self.metrics._record(gave_up=1)
+                    self._outcome(True)
+                    raise
+                self.sleep(wait)
+                self.metrics._record(retries=1, waited=wait)
+                retry += 1
+            else:
+                self._outcome(False)
+                return result
+
+    def __call__(self, fn):
+        """Decorator form: @policy"""
+        def wrapper(*args, **kwargs):
+            return self.call(fn, *args, **kwargs)
+
+        wrapper.__name__ = getattr(fn, "__name__", "wrapper")
+        wrapper.__doc__ = getattr(fn, "__doc__", None)
+        return wrapper
+
+
+DEFAULT_POLICY = RetryPolicy()
+
+
+class Retrying:
+    """
+    Wrapper object whose property gets, puts and method calls go through a
+    RetryPolicy (looking a method up is not a call and is not counted).
+    COM objects it returns are wrapped the same way.
+    """
+
+    def __init__(self, obj, policy=None):
+        self.__dict__["_target"] = obj
+        self.__dict__["_policy"] = policy or DEFAULT_POLICY
+
+    def __getattr__(self, name):
+        policy = self._policy
+        if _is_method(self._target, name):
+            value = getattr(self._target, name)  # binding a method is no call to AutoCAD
+        else:
+            value = policy.call(getattr, self._target, name)
+        if callable(value) and not hasattr(value, "_oleobj_"):
+            def method(*args, **kwargs):
+                kwargs = {key: _unwrap(arg) for key, arg in kwargs.items()}
+                return _retrying(policy.call(value, *map(_unwrap, args), **kwargs), policy)
+
+            return method
+        return _retrying(value, policy)
+
+    def __setattr__(self, name, value):
+        self._policy.call(setattr, self._target, name, _unwrap(value))
+
+    def __iter__(self):
+        for item in self._target:
+            yield _retrying(item, self._policy)
+
+    def __len__(self):
+        return self._policy.call(len, self._target)
+
+    def __eq__(self, other):
+        return self._target == _unwrap(other)
+
+    def __hash__(self):
+        return hash(self._target)
+
+    def __repr__(self):
+        return f"<Retrying {self._target!r}>"
+
+
+def _is_method(obj, name):
+    """True if obj.name is a method by the type info the wrapper already has."""
+    if callable(getattr(type(obj), name, None)):
+        return True  # makepy classes define their methods
+    olerepr = getattr(obj, "_olerepr_", None)  # late-bound Dispatch
+    return olerepr is not None and name in getattr(olerepr, "mapFuncs", ())
+
+
+def _unwrap(value):
+    return value._target if isinstance(value, Retrying) else value
+
+
+def _retrying(value, policy):
+    return Retrying(value, policy) if hasattr(value, "_oleobj_") else value
+
+
+def retrying(obj, policy=None):
+    """obj wrapped so every COM call on it (and on what it returns) is retried."""
+    return Retrying(obj, policy)
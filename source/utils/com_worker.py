@@ -0,0 +1,183 @@
+"""
+asyncio front-end for AutoCAD: one STA worker thread owns the COM objects.
+
+    async def main():
+        async with ComWorker() as acad:
+            layers = acad.call(lambda app: [l.Name for l in app.ActiveDocument.Layers])
+            pdf = asyncio.to_thread(render_report, data)      # CPU work meanwhile
+            names, _ = await asyncio.gather(layers, pdf)
+            count = await acad.call(count_entities, "A-WALL", timeout=30)
+
+    asyncio.run(main())
+
+Every call is a function fn(app, *args) that runs on the worker thread,
+where the thread's apartment was initialized and ``app`` is the
+``AutoCAD.Application`` dispatch it created.  COM objects belong to that
+apartment: do all the wrapper work inside fn and return plain values
+(names, numbers, tuples), not wrapper objects.
+
+At most ``maxsize`` calls are queued or running; call() waits for a free
+slot, so a producer that outruns AutoCAD is slowed down instead of
+queueing without bound.  Calls run one at a time in submission order.
+Cancelling the awaiting task, or its timeout expiring, drops a call that
+has not started yet.  A call already inside AutoCAD cannot be
+interrupted: it runs to the end and its result is discarded.  Between
+calls the worker pumps messages so COM events (document_mirror,
+command_runner) are still delivered on its thread.
+"""
+import asyncio
+import queue
+import threading
+
+IDLE_PUMP = 0.05  # seconds between message pumps while the queue is empty
+_STOP = object()
+
+
+class WorkerClosed(RuntimeError):
+    pass
+
+
+class _Job:
+    __slots__ = ("fn", "args", "kwargs", "future", "cancelled")
+
+    def __init__(self, fn, args, kwargs, future):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.future = future
+        self.cancelled = threading.Event()
+
+    def on_done(self, future):
+        if future.cancelled():
+            self.cancelled.set()  # tells the worker to skip it if it has not started
+
+
+def _connect_autocad():
+    import win32com.client
+
+    return win32com.client.Dispatch("AutoCAD.Application")
+
+
+class ComWorker:
+    """
+    connect() runs on the worker thread and returns the object passed to
+    every call.  With sta=True the thread calls CoInitialize (STA) and
+    pumps waiting messages between calls; sta=False is for in-process
+    fakes that need neither.
+    """
+
+    def __init__(self, connect=None, maxsize=64, sta=True):
+        self.connect = connect or _connect_autocad
+        self.maxsize = maxsize
+        self.sta = sta
+        self.completed = 0
+        self.skipped = 0
+        self.pending = 0  # calls queued or running
+        self._jobs = queue.SimpleQueue()
+        self._slots = None
+        self._loop = None
+        self._thread = None
+        self._closed = False
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def start(self):
+        """Start the worker thread and connect; connection errors are raised here."""
+        self._loop = asyncio.get_running_loop()
+        self._slots = asyncio.Semaphore(self.maxsize)
+        ready = self._loop.create_future()
+        self._thread = threading.Thread(target=self._run, args=(ready,), name="ComWorker", daemon=True)
+        self._thread.start()
+        await ready
+
+    async def call(self, fn, *args, timeout=None, **kwargs):
+        """Run fn(app, *args, **kwargs) on the worker; timeout covers queueing and running."""
+        return await asyncio.wait_for(self._submit(fn, args, kwargs), timeout)
+
+    async def _submit(self, fn, args, kwargs):
+        if self._closed:
+            raise WorkerClosed("ComWorker is closed")
+        await self._slots.acquire()
+        if self._closed:
+            self._slots.release()
+            raise WorkerClosed("ComWorker is closed")
+        self.pending += 1
+        future = self._loop.create_future()
+        job = _Job(fn, args, kwargs, future)
+        future.add_done_callback(job.on_done)
+        self._jobs.put(job)
+        return await future
+
+    def _release(self):
+        # The worker is done with a job (ran or skipped it): only now is its slot free,
+        # so a cancelled call still waiting in the queue keeps counting against maxsize
+        self.pending -= 1
+        self._slots.release()
+
+    async def close(self):
+        """Finish the calls already queued, then stop the worker and release COM."""
+        if self._thread is None or self._closed:
+            return
+        self._closed = True
+        self._jobs.put(_STOP)
+        await asyncio.to_thread(self._thread.join)
+
+    # --- worker thread ---
+
+    def _run(self, ready):
+        pythoncom = None
+        if self.sta:
+            import pythoncom
+
+            pythoncom.CoInitialize()
+        try:
+            try:
+                app = self.connect()
+            except BaseException as e:
+                self._loop.call_soon_threadsafe(ready.set_exception, e)
+                return
+            self._loop.call_soon_threadsafe(ready.set_result, None)
+            self._serve(app, pythoncom)
+            del app
+        finally:
+            if pythoncom is not None:
+                pythoncom.CoUninitialize()
+
+    def _serve(self, app, pythoncom):
+        while True:
+            try:
+                job = self._jobs.get(timeout=IDLE_PUMP if pythoncom is not None else None)
+            except queue.Empty:
+                pythoncom.PumpWaitingMessages()
+                continue
+            if job is _STOP:
+                return
+            if job.cancelled.is_set():
+                self.skipped += 1
+                self._loop.call_soon_threadsafe(self._release)
+                continue
+            try:
+                result = job.fn(app, *job.args, **job.kwargs)
+            except BaseException as e:
+                self._loop.call_soon_threadsafe(_settle, job.future, None, e)
+            else:
+                self._loop.call_soon_threadsafe(_settle, job.future, result, None)
+            self._loop.call_soon_threadsafe(self._release)
+            self.completed += 1
+            if pythoncom is not None:
+                pythoncom.PumpWaitingMessages()
+
+
+def _settle(future, result, error):
+    # Runs on the event loop; the awaiting task may have been cancelled meanwhile
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
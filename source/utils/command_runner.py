@@ -0,0 +1,161 @@
+"""
+Run an AutoCAD command and wait until it has actually finished.
+
+    elapsed = run_command(doc, "_SELALL _JOIN \\n", timeout=300, expect="JOIN")
+
+SendCommand only queues the string; instead of sleeping a fixed time the
+runner listens to _DAcadDocumentEvents and returns once OnEndCommand
+reports the expected command (by default the first word of the string,
+without its _ . - ' prefixes).  A LISP expression, a string starting with
+"(", completes on the OnEndLisp matching its OnBeginLisp and raises
+CommandCancelled on OnLispCancelled.  CommandTimeout is raised when
+nothing completes within timeout seconds; the command may still be
+running in AutoCAD then.
+
+Events only arrive while the client pumps messages, so the runner blocks
+in MsgWaitForMultipleObjects (woken by the next incoming message) and
+pumps in a loop.  To run several commands keep one CommandWatcher, which
+stays connected between them:
+
+    watcher = CommandWatcher(doc)
+    watcher.run("_.REGEN ")
+    watcher.run('(c:cleanup) ')
+    watcher.close()
+"""
+import time
+
+DEFAULT_TIMEOUT = 60.0
+POLL = 0.05
+
+
+class CommandError(Exception):
+    pass
+
+
+class CommandCancelled(CommandError):
+    pass
+
+
+class CommandTimeout(CommandError, TimeoutError):
+    pass
+
+
+def command_name(word):
+    """Global command name as OnBeginCommand/OnEndCommand report it."""
+    return word.lstrip("_.-'").upper()
+
+
+class _CommandEvents:
+    """User half of the WithEvents class; subclassed per watcher with `watcher` set."""
+
+    watcher = None
+
+    def OnBeginCommand(self, CommandName=None):
+        self.watcher._event("begin", CommandName)
+
+    def OnEndCommand(self, CommandName=None):
+        self.watcher._event("end", CommandName)
+
+    def OnBeginLisp(self, FirstLine=None):
+        self.watcher._event("begin_lisp", FirstLine)
+
+    def OnEndLisp(self):
+        self.watcher._event("end_lisp", None)
+
+    def OnLispCancelled(self):
+        self.watcher._event("lisp_cancelled", None)
+
+
+def _message_wait(seconds):
+    # Returns as soon as a message (an incoming event) is queued for this thread
+    import win32event
+
+    win32event.MsgWaitForMultipleObjects([], False, int(seconds * 1000), win32event.QS_ALLINPUT)
+
+
+class CommandWatcher:
+    """
+    events and pump default to win32com.client.WithEvents and
+    pythoncom.PumpWaitingMessages; wait(seconds) blocks until a message
+    may be waiting.
+    """
+
+    def __init__(self, doc, events=None, pump=None, wait=None):
+        if events is None or pump is None:
+            import pythoncom
+            import win32com.client
+
+            events = events or win32com.client.WithEvents
+            pump = pump or pythoncom.PumpWaitingMessages
+        self.doc = doc
+        self.pump = pump
+        self.wait = wait or _message_wait
+        self.log = []  # (event, argument) of the command being run
+        self._expect = None
+        self._lisp_depth = 0
+        self._done = False
+        self._cancelled = False
+        self._sink = events(doc, type("CommandEvents", (_CommandEvents,), {"watcher": self}))
+
+    def close(self):
+        if self._sink is not None:
+            self._sink.close()
+            self._sink = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _event(self, kind, arg):
+        if self._expect is None:
+            return  # left over from an earlier command
+        self.log.append((kind, arg))
+        if self._expect == "(":
+            if kind == "begin_lisp":
+                self._lisp_depth += 1
+            elif kind == "end_lisp":
+                self._lisp_depth -= 1
+                self._done = self._lisp_depth <= 0
+            elif kind == "lisp_cancelled":
+                self._cancelled = True
+        elif kind == "end" and command_name(arg or "") == self._expect:
+            self._done = True
+
+    def run(self, command, timeout=DEFAULT_TIMEOUT, expect=None):
+        """
+        SendCommand(command) and wait for it to complete; returns the
+        elapsed seconds.  expect names the command whose OnEndCommand
+        marks completion when the string runs several.
+        """
+        lisp = command.lstrip().startswith("(")
+        if expect is None:
+            expect = "(" if lisp else command_name(command.split()[0])
+        else:
+            expect = command_name(expect)
+        self.pump()  # drop events from before this command
+        self.log = []
+        self._expect, self._lisp_depth, self._done, self._cancelled = expect, 0, False, False
+        start = time.perf_counter()
+        try:
+            self.doc.SendCommand(command)
+            while True:
+                self.pump()
+                if self._cancelled:
+                    raise CommandCancelled(f"LISP cancelled: {command.strip()!r}")
+                elapsed = time.perf_counter() - start
+                if self._done:
+                    return elapsed
+                if elapsed >= timeout:
+                    what = command.strip() if lisp else expect
+                    raise CommandTimeout(f"{what!r} did not finish within {timeout:g}s")
+                self.wait(min(POLL, timeout - elapsed))
+        finally:
+            self._expect = None
+
+
+def run_command(doc, command, timeout=DEFAULT_TIMEOUT, expect=None, events=None, pump=None, wait=None):
+    """One-off CommandWatcher.run: connects, runs command, disconnects."""
+    with CommandWatcher(doc, events, pump, wait) as watcher:
+        return watcher.run(command, timeout, expect)
@@ -0,0 +1,146 @@
+"""
+Identity map for AutoCAD_Wrapper dispatch objects.
+
+Every typed wrapper method ends in ``Dispatch(ret, name, IID)``, so the
+same entity handed back twice (``IAcadModelSpace.Item(i)``,
+``IAcadSelectionSet.Item(i)``, ``AddLine`` then a later scan...) gets a
+fresh Python wrapper each time.  WrapperCache keys wrappers by the
+entity's ObjectID (or Handle) and hands back the live one instead:
+
+    cache = WrapperCache(maxsize=2048)
+    cache.install(AutoCAD_Wrapper)        # or AutoCAD_Wrapper_lazy
+    ...
+    area = cache.memoized(poly, "Area")   # one round trip per entity
+
+Wrappers are held weakly; the most recently used ``maxsize`` are also
+pinned in an LRU so a scan loop that drops its references still hits.
+Objects without an ObjectID (Application, Document, SelectionSet...) are
+passed straight through to win32com's Dispatch.
+
+Reading the key is itself one property get, so the cache pays off when
+wrappers carry memoized properties or are compared by identity, not as a
+way to save round trips on a single pass.
+"""
+import weakref
+from collections import OrderedDict
+
+import dispatch_metadata
+
+DISPATCH_PROPERTYGET = 2
+
+
+class WrapperCache:
+    def __init__(self, maxsize=1024, key="ObjectID", dispatch=None, metadata=None):
+        self.maxsize = maxsize
+        self.key_property = key
+        self._dispatch = dispatch
+        self._metadata = metadata
+        self._live = weakref.WeakValueDictionary()
+        self._recent = OrderedDict()
+        # result CLSID -> (dispid, retType) of the key property, or None if not keyable
+        self._key_args = {}
+        self.hits = 0
+        self.misses = 0
+        self.passthrough = 0
+        self._installed = []
+
+    def _key_for(self, result_clsid):
+        try:
+            return self._key_args[result_clsid]
+        except KeyError:
+            pass
+        if self._metadata is None:
+            self._metadata = dispatch_metadata.load_metadata()
+        args = None
+        try:
+            entry = self._metadata.for_clsid(result_clsid).prop_get.get(self.key_property)
+        except KeyError:
+            entry = None
+        if entry is not None:
+            args = (entry[0], entry[2])
+        self._key_args[result_clsid] = args
+        return args
+
+    def _wrap(self, ole, user_name, result_clsid, *args, **kwargs):
+        if self._dispatch is None:
+            from win32com.client import Dispatch
+            self._dispatch = Dispatch
+        return self._dispatch(ole, user_name, result_clsid, *args, **kwargs)
+
+    def dispatch(self, ole, user_name=None, result_clsid=None, *args, **kwargs):
+        """Drop-in for win32com.client.Dispatch as the wrapper calls it."""
+        key_args = self._key_for(result_clsid) if result_clsid else None
+        if key_args is None:
+            self.passthrough += 1
+            return self._wrap(ole, user_name, result_clsid, *args, **kwargs)
+
+        dispid, ret_type = key_args
+        try:
+            key = (ole.InvokeTypes(dispid, 0, DISPATCH_PROPERTYGET, ret_type, ()), result_clsid)
+        except Exception:
+            # Erased or proxy objects may refuse the key read; don't cache them.
+            self.passthrough += 1
+            return self._wrap(ole, user_name, result_clsid, *args, **kwargs)
+
+        wrapper = self._live.get(key)
+        if wrapper is None:
+            self.misses += 1
+            wrapper = self._wrap(ole, user_name, result_clsid, *args, **kwargs)
+            self._live[key] = wrapper
+        else:
+            self.hits += 1
+        self._touch(key, wrapper)
+        return wrapper
+
+    def _touch(self, key, wrapper):
+        self._recent[key] = wrapper
+        self._recent.move_to_end(key)
+        while len(self._recent) > self.maxsize:
+            self._recent.popitem(last=False)
+
+    def memoized(self, wrapper, name):
+        """
+        Read property `name` once per wrapper and remember it.  Values stay
+        until invalidate() or clear(); use for properties that do not change
+        during the job (ObjectName, Handle, Layer in a read-only report...).
+        """
+        memo = wrapper.__dict__.get("_memo_")
+        if memo is None:
+            # Bypass DispatchBaseClass.__setattr__, which would try a COM put.
+            memo = wrapper.__dict__["_memo_"] = {}
+        try:
+            return memo[name]
+        except KeyError:
+            value = memo[name] = getattr(wrapper, name)
+            return value
+
+    def invalidate(self, wrapper):
+        wrapper.__dict__.pop("_memo_", None)
+
+    def clear(self):
+        self._live.clear()
+        self._recent.clear()
+
+    def __len__(self):
+        return len(self._live)
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "passthrough": self.passthrough,
+                "live": len(self._live), "pinned": len(self._recent)}
+
+    def install(self, module):
+        """
+        Route module.Dispatch (used by every typed method of the makepy
+        wrapper) through this cache.  Undo with uninstall().
+        """
+        original = module.Dispatch
+        if self._dispatch is None:
+            self._dispatch = original
+        self._installed.append((module, original))
+        module.Dispatch = self.dispatch
+        return self
+
+    def uninstall(self):
+        while self._installed:
+            module, original = self._installed.pop()
+            module.Dispatch = original
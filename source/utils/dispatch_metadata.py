@@ -0,0 +1,294 @@
+"""
+Precompiled dispatch metadata for AutoCAD_Wrapper.
+
+AutoCAD_Wrapper.py rebuilds every ``_prop_map_get_``/``_prop_map_put_``
+dict and ``*_vtables_`` list as Python literals on each import.  This
+module moves that data into one binary file built ahead of time:
+
+    python dispatch_metadata.py            # writes AutoCAD_Wrapper.dispidx
+
+DispatchMetadata mmaps the file and decodes one interface at a time, on
+first access.  Per interface it returns the same values the generated
+module holds (plus the typed method signatures, which makepy only keeps
+as code):
+
+    meta = load_metadata()
+    meta["IAcadLWPolyline"].prop_get["Layer"]
+    # (1281, 2, (8, 0), (), 'Layer', None)
+
+File layout: a fixed header, then one marshal blob per interface, then a
+marshal'd directory {name: (offset, length, clsid)}.  marshal keeps the
+decode in C (tens of microseconds per interface); since its format may
+change between Python versions, the header records the version that wrote
+it and load_metadata() rebuilds on mismatch.
+"""
+import argparse
+import ast
+import marshal
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from collections import namedtuple
+
+from wrapper_source import SOURCE_DIR, WRAPPER_PATH, WrapperSource
+
+INDEX_PATH = os.path.join(SOURCE_DIR, "AutoCAD_Wrapper.dispidx")
+
+MAGIC = b"ACDISP02"
+# magic, wrapper size, python major, python minor, directory offset, directory length
+HEADER = struct.Struct("<8sIHHII")
+
+# ObjectName (the AcDb class AutoCAD reports) -> wrapper interface, where the
+# name is not simply "AcDb<X>" -> "IAcad<X>".
+OBJECT_NAME_INTERFACES = {
+    "AcDbPolyline": "IAcadLWPolyline",
+    "AcDb2dPolyline": "IAcadPolyline",
+    "AcDb3dPolyline": "IAcad3DPolyline",
+    "AcDbFace": "IAcad3DFace",
+    "AcDb3dSolid": "IAcad3DSolid",
+    "AcDbViewport": "IAcadPViewport",
+    "AcDbMline": "IAcadMLine",
+    "AcDbPdfReference": "IAcadUnderlay",
+    "AcDbDgnReference": "IAcadUnderlay",
+    "AcDbDwfReference": "IAcadDwfUnderlay",
+    "AcDbRotatedDimension": "IAcadDimRotated",
+    "AcDbAlignedDimension": "IAcadDimAligned",
+    "AcDbBlockTableRecord": "IAcadBlock",
+    "AcDbLayerTableRecord": "IAcadLayer",
+}
+
+# methods: name -> (dispid, wFlags, retType, argTypes, resultCLSID)
+InterfaceMetadata = namedtuple(
+    "InterfaceMetadata", "name clsid prop_get prop_put methods vtables vtables_dispatch")
+
+
+# --- Build -----------------------------------------------------------------
+
+class _BindLCID(ast.NodeTransformer):
+    def visit_Name(self, node):
+        if node.id == "LCID":
+            return ast.copy_location(ast.Constant(0), node)
+        return node
+
+
+def _literal(node):
+    # _prop_map_put_ refers to the module-level LCID (0x0); everything else is literal.
+    return ast.literal_eval(_BindLCID().visit(node))
+
+
+def _method_signature(func):
+    """(dispid, wFlags, retType, argTypes, resultCLSID) of a typed makepy method."""
+    sig = None
+    result_clsid = None
+    for node in ast.walk(func):
+        if not isinstance(node, ast.Call):
+            continue
+        callee = node.func
+        if isinstance(callee, ast.Attribute) and callee.attr == "InvokeTypes" and sig is None:
+            dispid, _lcid, flags, ret, args = node.args[:5]
+            sig = [_literal(dispid), _literal(flags), _literal(ret), _literal(args)]
+        elif isinstance(callee, ast.Attribute) and callee.attr == "_ApplyTypes_" and sig is None:
+            dispid, flags, ret, args, _user, clsid = node.args[:6]
+            sig = [_literal(dispid), _literal(flags), _literal(ret), _literal(args)]
+            result_clsid = _literal(clsid)
+        elif isinstance(callee, ast.Name) and callee.id == "Dispatch" and len(node.args) >= 3:
+            result_clsid = _literal(node.args[2])
+    if sig is None:
+        return None
+    return tuple(sig + [result_clsid])
+
+
+def extract_metadata(source):
+    """Collect InterfaceMetadata for every interface in a WrapperSource."""
+    interfaces = {}
+    for node in source.tree.body:
+        if not isinstance(node, ast.ClassDef) or source.classes[node.name].kind != "dispatch":
+            continue
+        prop_get, prop_put, methods = {}, {}, {}
+        for stmt in node.body:
+            if isinstance(stmt, ast.Assign) and isinstance(stmt.targets[0], ast.Name):
+                if stmt.targets[0].id == "_prop_map_get_":
+                    prop_get = _literal(stmt.value)
+                elif stmt.targets[0].id == "_prop_map_put_":
+                    prop_put = _literal(stmt.value)
+            elif isinstance(stmt, ast.FunctionDef) and not stmt.name.startswith("__"):
+                sig = _method_signature(stmt)
+                if sig is not None:
+                    methods[stmt.name] = sig
+        interfaces[node.name] = InterfaceMetadata(
+            node.name, source.classes[node.name].clsid, prop_get, prop_put, methods, None, None)
+
+    for name, span in source.vtables.items():
+        value = _literal(source.tree.body[_stmt_index(source, span)].value)
+        if name.endswith("_vtables_dispatch_"):
+            iface, field = name[:-len("_vtables_dispatch_")], "vtables_dispatch"
+        else:
+            iface, field = name[:-len("_vtables_")], "vtables"
+        meta = interfaces.get(iface) or InterfaceMetadata(iface, None, {}, {}, {}, None, None)
+        interfaces[iface] = meta._replace(**{field: value})
+    return interfaces
+
+
+def _stmt_index(source, span):
+    if not hasattr(source, "_stmt_by_line"):
+        source._stmt_by_line = {n.lineno: i for i, n in enumerate(source.tree.body)}
+    return source._stmt_by_line[span.lineno]
+
+
+def build_metadata(wrapper_path=WRAPPER_PATH, index_path=INDEX_PATH):
+    """Serialize the wrapper's dispatch metadata into index_path."""
+    source = WrapperSource(wrapper_path)
+    interfaces = extract_metadata(source)
+
+    directory = {}
+    # Written aside and moved into place: other processes may have the old index mmapped,
+    # or be building the same file (load_metadata rebuilds a stale index lazily)
+    fd, tmp = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(os.path.abspath(index_path)))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(b"\0" * HEADER.size)
+            for name in sorted(interfaces):
+                blob = marshal.dumps(tuple(interfaces[name]))
+                directory[name] = (f.tell(), len(blob), interfaces[name].clsid)
+                f.write(blob)
+            dir_blob = marshal.dumps(directory)
+            dir_at = f.tell()
+            f.write(dir_blob)
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, len(source.data), sys.version_info[0], sys.version_info[1],
+                                dir_at, len(dir_blob)))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, index_path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    print(f"Wrote metadata for {len(directory)} interfaces ({os.path.getsize(index_path) // 1024} KB) -> {index_path}")
+    return index_path
+
+
+# --- Load ------------------------------------------------------------------
+
+class DispatchMetadata:
+    """Read-only, lazily decoded view of a .dispidx file."""
+
+    def __init__(self, path=INDEX_PATH):
+        self.path = path
+        with open(path, "rb") as f:
+            self._buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)  # ValueError if empty
+        try:
+            magic, self.wrapper_size, major, minor, dir_at, dir_len = HEADER.unpack_from(self._buf, 0)
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a dispatch metadata index")
+            self.python_version = (major, minor)
+            self._directory = marshal.loads(self._buf[dir_at:dir_at + dir_len])
+        except (struct.error, EOFError, TypeError, ValueError) as e:
+            self._buf.close()
+            raise ValueError(f"{path} is not a complete dispatch metadata index") from e
+        self._by_clsid = {clsid: name for name, (_o, _l, clsid) in self._directory.items() if clsid}
+        self._cache = {}
+
+    def close(self):
+        self._cache.clear()
+        self._buf.close()
+
+    def __contains__(self, name):
+        return name in self._directory
+
+    def __iter__(self):
+        return iter(self._directory)
+
+    def __len__(self):
+        return len(self._directory)
+
+    def __getitem__(self, name):
+        meta = self._cache.get(name)
+        if meta is None:
+            off, length, _clsid = self._directory[name]
+            meta = self._cache[name] = InterfaceMetadata(*marshal.loads(self._buf[off:off + length]))
+        return meta
+
+    def for_clsid(self, clsid):
+        """Metadata of the interface whose CLSID (IID) is clsid."""
+        return self[self._by_clsid[str(clsid).upper()]]
+
+    def for_object_name(self, object_name):
+        """
+        Metadata of the most specific interface for an entity's ObjectName,
+        e.g. 'AcDbPolyline' -> IAcadLWPolyline.  None if there is none.
+        """
+        name = OBJECT_NAME_INTERFACES.get(object_name)
+        if name is None and object_name.startswith("AcDb"):
+            name = "IAcad" + object_name[4:]
+        return self[name] if name in self._directory else None
+
+    def decoded(self):
+        """Names of the interfaces decoded so far."""
+        return sorted(self._cache)
+
+
+def load_metadata(path=INDEX_PATH, wrapper_path=WRAPPER_PATH):
+    """Open the index, (re)building it first if missing or out of date."""
+    if os.path.exists(path):
+        try:
+            meta = DispatchMetadata(path)
+        except ValueError:
+            meta = None  # an older format, or cut short by a build that never finished
+        if meta is not None:
+            stale = os.path.exists(wrapper_path) and meta.wrapper_size != os.path.getsize(wrapper_path)
+            if not stale and meta.python_version == tuple(sys.version_info[:2]):
+                return meta
+            meta.close()
+    build_metadata(wrapper_path, path)
+    return DispatchMetadata(path)
+
+
+# --- Verification ----------------------------------------------------------
+
+
+def verify_against_module(meta, module):
+    """
+    Compare the index with an imported AutoCAD_Wrapper.  Returns a list of
+    mismatch descriptions; empty means exact equivalence.
+    """
+    problems = []
+    for name in meta:
+        m = meta[name]
+        cls = getattr(module, name, None)
+        if cls is not None and m.clsid is not None:
+            if cls._prop_map_get_ != m.prop_get:
+                problems.append(f"{name}._prop_map_get_")
+            if cls._prop_map_put_ != m.prop_put:
+                problems.append(f"{name}._prop_map_put_")
+        if m.vtables is not None and getattr(module, name + "_vtables_", None) != m.vtables:
+            problems.append(f"{name}_vtables_")
+        if m.vtables_dispatch is not None and \
+                getattr(module, name + "_vtables_dispatch_", None) != m.vtables_dispatch:
+            problems.append(f"{name}_vtables_dispatch_")
+    return problems
+
+
+def verify_against_source(meta, source):
+    """Same check as verify_against_module, against a parsed WrapperSource."""
+    problems = []
+    expected = extract_metadata(source)
+    if set(expected) != set(meta):
+        problems.append("interface sets differ")
+    for name, want in expected.items():
+        if name in meta and meta[name] != want:
+            problems.append(name)
+    return problems
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the binary dispatch metadata index")
+    parser.add_argument("--wrapper", default=WRAPPER_PATH)
+    parser.add_argument("--out", default=INDEX_PATH)
+    parser.add_argument("--verify", action="store_true", help="check the result against the wrapper source")
+    args = parser.parse_args()
+    build_metadata(args.wrapper, args.out)
+    if args.verify:
+        issues = verify_against_source(DispatchMetadata(args.out), WrapperSource(args.wrapper))
+        print("Index matches the wrapper." if not issues else f"Mismatches: {issues}")
@@ -0,0 +1,228 @@
+"""
+Handle-indexed, event-maintained copy of a drawing's entity attributes.
+
+    mirror = DocumentMirror(doc)            # connects the event sink, full read
+    ...                                     # edits, commands, other scripts
+    mirror.refresh()                        # applies only what changed since
+    mirror.layer_counts()                   # Counter: layer -> entity count
+    mirror.handles(layer="0")               # entities still on layer 0
+    mirror.open_polylines()                 # handles of LWPolylines not Closed
+
+The sink listens to _DAcadDocumentEvents.OnObjectAdded, OnObjectModified
+and OnObjectErased.  It does not call back into AutoCAD from inside the
+event (AutoCAD is in the middle of a change then); it only queues the
+object, or for OnObjectErased the ObjectID it is given.  refresh() pumps
+waiting messages so queued events are delivered, then reads ObjectID of
+each touched object and Handle plus the mirrored fields of each distinct
+survivor with bulk_read, so a repeat query costs O(changes) round trips
+instead of a rescan of ModelSpace.  Objects outside the mirrored spaces
+(layers, dictionaries, blocks) also raise these events and are dropped
+by OwnerID.
+
+resync() re-reads everything, e.g. after the sink was disconnected, after
+an operation that does not raise per-object events (opening another
+drawing into this document) or when in doubt.  refresh(force=True) does
+the same.
+
+Mirrored fields are read as bulk_read.read_properties returns them; a
+field the entity does not have is simply left out of its row.
+"""
+from collections import Counter
+
+from bulk_read import read_properties
+
+FIELDS = ("ObjectName", "Layer", "Closed")
+SPACES = ("ModelSpace",)
+
+_CHANGED = 0
+_ERASED = 1
+
+
+class _MirrorEvents:
+    """User half of the WithEvents class; subclassed per mirror with `mirror` set."""
+
+    mirror = None
+
+    def OnObjectAdded(self, Object=None):
+        self.mirror._queue(_CHANGED, Object)
+
+    def OnObjectModified(self, Object=None):
+        self.mirror._queue(_CHANGED, Object)
+
+    def OnObjectErased(self, ObjectID=None):
+        self.mirror._queue(_ERASED, ObjectID)
+
+
+class DocumentMirror:
+    """
+    events, pump and dispatch default to win32com.client.WithEvents,
+    pythoncom.PumpWaitingMessages and win32com.client.Dispatch (the
+    latter wraps the raw PyIDispatch an event hands over).
+    """
+
+    def __init__(self, doc, fields=FIELDS, spaces=SPACES, events=None, pump=None, dispatch=None,
+                 metadata=None):
+        if events is None or pump is None or dispatch is None:
+            import pythoncom
+            import win32com.client
+
+            events = events or win32com.client.WithEvents
+            pump = pump or pythoncom.PumpWaitingMessages
+            dispatch = dispatch or win32com.client.Dispatch
+        self.doc = doc
+        self.fields = tuple(fields)
+        self.spaces = tuple(spaces)
+        self.pump = pump
+        self.dispatch = dispatch
+        self.metadata = metadata
+        self.rows = {}  # handle -> {field: value}
+        self.ids = {}  # ObjectID -> handle, to resolve OnObjectErased
+        self._object_ids = {}  # handle -> ObjectID
+        self.by_layer = {}  # layer -> set of handles
+        self.by_name = {}  # ObjectName -> set of handles
+        self.owners = set()  # ObjectIDs of the mirrored spaces
+        self.events_seen = 0
+        self.refreshes = 0
+        self.resyncs = 0
+        self._pending = []
+        self._sink = events(doc, type("MirrorEvents", (_MirrorEvents,), {"mirror": self}))
+        self.resync()
+
+    def close(self):
+        """Disconnect the event sink; the rows stay as they were."""
+        if self._sink is not None:
+            self._sink.close()
+            self._sink = None
+
+    def _queue(self, kind, obj):
+        self._pending.append((kind, obj))
+
+    # --- keeping the rows current ---
+
+    def resync(self):
+        """Full re-read of the mirrored spaces; returns the number of rows."""
+        self._pending = []
+        self.rows.clear()
+        self.ids.clear()
+        self._object_ids.clear()
+        self.by_layer.clear()
+        self.by_name.clear()
+        self.owners.clear()
+        entities = []
+        for name in self.spaces:
+            space = getattr(self.doc, name)
+            self.owners.add(space.ObjectID)
+            entities.extend(space)
+        table = read_properties(entities, ("Handle", "ObjectID") + self.fields, as_numpy=False,
+                                metadata=self.metadata)
+        for i in range(len(entities)):
+            if table.valid["Handle"][i] and table.valid["ObjectID"][i]:
+                self._store(table["Handle"][i], table["ObjectID"][i], self._row(table, i))
+        self.resyncs += 1
+        return len(self.rows)
+
+    def refresh(self, force=False):
+        """
+        Deliver waiting events and apply them.  Returns the number of
+        entities whose row was added, updated or dropped.
+        """
+        self.pump()
+        if force or self._sink is None:
+            self.resync()
+            return len(self.rows)
+        pending, self._pending = self._pending, []
+        self.events_seen += len(pending)
+        self.refreshes += 1
+        if not pending:
+            return 0
+
+        # One ObjectID read per add/modify event; the last event for an ObjectID
+        # decides.  Objects erased since their event fail the read and are skipped.
+        touched = [obj for kind, obj in pending if kind == _CHANGED]
+        ids = read_properties([self._wrap(obj) for obj in touched], ["ObjectID"], as_numpy=False,
+                              metadata=self.metadata)
+        last = {}
+        i = 0
+        for kind, arg in pending:
+            if kind == _ERASED:
+                last[arg] = None
+                continue
+            if ids.valid["ObjectID"][i]:
+                last[ids["ObjectID"][i]] = arg
+            i += 1
+
+        changed = 0
+        live = []
+        for object_id, obj in last.items():
+            if obj is not None:
+                live.append((object_id, obj))
+            elif object_id in self.ids:
+                self._drop(self.ids[object_id])
+                changed += 1
+        if live:
+            table = read_properties([self._wrap(obj) for _id, obj in live], ("Handle", "OwnerID") + self.fields,
+                                    as_numpy=False, metadata=self.metadata)
+            for i, (object_id, _obj) in enumerate(live):
+                owned = table.valid["OwnerID"][i] and table["OwnerID"][i] in self.owners
+                if not owned or not table.valid["Handle"][i]:
+                    if object_id in self.ids:
+                        self._drop(self.ids[object_id])
+                        changed += 1
+                    continue
+                self._store(table["Handle"][i], object_id, self._row(table, i))
+                changed += 1
+        return changed
+
+    def _wrap(self, obj):
+        return obj if hasattr(obj, "_oleobj_") else self.dispatch(obj)
+
+    def _row(self, table, i):
+        return {name: table[name][i] for name in self.fields if table.valid[name][i]}
+
+    def _store(self, handle, object_id, row):
+        self._drop(handle)
+        self.rows[handle] = row
+        self.ids[object_id] = handle
+        self._object_ids[handle] = object_id
+        self.by_layer.setdefault(row.get("Layer"), set()).add(handle)
+        self.by_name.setdefault(row.get("ObjectName"), set()).add(handle)
+
+    def _drop(self, handle):
+        row = self.rows.pop(handle, None)
+        if row is None:
+            return False
+        del self.ids[self._object_ids.pop(handle)]
+        for index, key in ((self.by_layer, row.get("Layer")), (self.by_name, row.get("ObjectName"))):
+            members = index[key]
+            members.discard(handle)
+            if not members:
+                del index[key]
+        return True
+
+    # --- queries (no round trips) ---
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __contains__(self, handle):
+        return handle in self.rows
+
+    def row(self, handle):
+        return self.rows[handle]
+
+    def layer_counts(self):
+        return Counter({layer: len(handles) for layer, handles in self.by_layer.items()})
+
+    def handles(self, layer=None, object_name=None):
+        """Handles of the mirrored entities on layer and/or of ObjectName."""
+        result = None
+        if layer is not None:
+            result = set(self.by_layer.get(layer, ()))
+        if object_name is not None:
+            named = self.by_name.get(object_name, set())
+            result = set(named) if result is None else result & named
+        return set(self.rows) if result is None else result
+
+    def open_polylines(self):
+        """Handles of LWPolylines whose Closed flag is off."""
+        return {h for h in self.by_name.get("AcDbPolyline", ()) if not self.rows[h].get("Closed", True)}
@@ -0,0 +1,1724 @@
+"""
+In-process stand-in for an AutoCAD COM server.
+
+Lets the utils be run, tested and timed without AutoCAD (or Windows):
+
+    server = FakeAutoCAD(latency=0.0005)     # 0.5 ms per round trip
+    acad = server.connect()                  # behaves like Dispatch("AutoCAD.Application")
+    msp = acad.ActiveDocument.ModelSpace
+    pl = msp.AddLightWeightPolyline((0, 0, 10, 0, 10, 5, 0, 5))
+    pl.Closed = True
+    pl.Area                                  # 50.0
+    server.round_trips                       # 5
+
+The server-side objects (FakeDocument, FakeLWPolyline...) play the part of
+``_oleobj_``: they implement ``InvokeTypes``/``Invoke`` and dispatch on the
+DISPIDs and invoke flags listed for their interface in the dispatch
+metadata index, so the makepy wrapper classes, bulk_read and WrapperCache
+can be pointed at them unchanged.  FakeDispatch is the client side, the
+equivalent of a late-bound win32com Dispatch object.
+
+Covered: Application, Documents/Document, ModelSpace/PaperSpace (one
+layout, Layout1), Layers/Layer, Blocks/Block, SelectionSets/SelectionSet
+with ssget filter lists, LWPolyline, Line, PViewport, BlockReference,
+MInsertBlock and a little of Utility.
+restart() simulates AutoCAD being closed and started again.  With
+``server.proxies = True`` every object handed out gets its own
+``_oleobj_`` proxy, as pywin32 gives a new interface pointer per lookup;
+only QueryInterface(IID_IUnknown) on either leads to the same object.
+Any other
+member raises DISP_E_MEMBERNOTFOUND, as a real server would for an
+unknown DISPID.  Errors are FakeComError, shaped like pywintypes.com_error.
+
+Documents raise the _DAcadDocumentEvents object events (OnObjectAdded,
+OnObjectModified, OnObjectErased) and, from SendCommand, the command and
+LISP events for sinks connected with with_events().  As with a real STA
+client they are queued until the client pumps messages, here
+server.pump_events().  SendCommand runs the words of its string that name
+a command in ``command_handlers``; everything else counts as input to
+the running command.  Changes between StartUndoMark and EndUndoMark form
+an undo group, which the UNDO (or U) command reverts.
+"""
+import fnmatch
+import math
+import os
+import time
+from collections import Counter, deque, namedtuple
+
+import dispatch_metadata
+
+DISPATCH_METHOD = 1
+DISPATCH_PROPERTYGET = 2
+DISPATCH_PROPERTYPUT = 4
+DISPATCH_PROPERTYPUTREF = 8
+DISPID_NEWENUM = -4
+
+DISP_E_EXCEPTION = -2147352567
+DISP_E_MEMBERNOTFOUND = -2147352573
+RPC_E_CALL_REJECTED = -2147418111
+RPC_S_SERVER_UNAVAILABLE = -2147023174
+E_INVALIDARG = -2147024809
+E_FAIL = -2147467259
+# scodes AutoCAD puts in excepinfo[5] of a DISP_E_EXCEPTION
+ACAD_E_KEY_NOT_FOUND = -2145386476
+
+acModelSpace = 1
+acPaperSpace = 0
+acSelectionSetWindow = 0
+acSelectionSetCrossing = 1
+acSelectionSetLast = 4
+acSelectionSetAll = 5
+
+# Methods that change the object they are called on (raise OnObjectModified)
+_MUTATORS = {"SetCoordinate", "AddVertex", "SetBulge", "Move", "Display"}
+
+
+class FakeComError(Exception):
+    """Same args/attributes as pywintypes.com_error."""
+
+    def __init__(self, hresult, strerror, excepinfo=None, argerror=None):
+        super().__init__(hresult, strerror, excepinfo, argerror)
+        self.hresult = hresult
+        self.strerror = strerror
+        self.excepinfo = excepinfo
+        self.argerror = argerror
+
+
+def acad_error(text, scode=E_FAIL):
+    """An AutoCAD-side failure, reported the way AutoCAD does (DISP_E_EXCEPTION)."""
+    return FakeComError(DISP_E_EXCEPTION, "Exception occurred.",
+                        (0, "AutoCAD.Application", text, None, 0, scode), None)
+
+
+def _missing(arg):
+    # makepy passes pythoncom.Missing/Empty/ArgNotFound for omitted optional args
+    return arg is None or type(arg).__name__.startswith("PyOle")
+
+
+def _values(arg):
+    """Plain sequence from a VARIANT, tuple, list, array.array or NumPy array."""
+    if hasattr(arg, "varianttype"):
+        arg = arg.value
+    if hasattr(arg, "ravel"):
+        arg = arg.ravel().tolist()
+    return list(arg)
+
+
+def _floats(arg):
+    return tuple(float(v) for v in _values(arg))
+
+
+def _point(arg):
+    p = _floats(arg)
+    return p + (0.0,) * (3 - len(p)) if len(p) < 3 else p[:3]
+
+
+class _Enum:
+    """IEnumVARIANT over a snapshot; every Next() is a round trip."""
+
+    def __init__(self, server, items):
+        self._server = server
+        self._items = list(items)
+        self._pos = 0
+        self._generation = server.generation
+
+    def QueryInterface(self, iid, *args):
+        return self
+
+    def Next(self, count=1):
+        if self._generation != self._server.generation:
+            raise FakeComError(RPC_S_SERVER_UNAVAILABLE, "The RPC server is unavailable.")
+        self._server._round_trip("IEnumVARIANT", "Next")
+        chunk = self._items[self._pos:self._pos + count]
+        self._pos += len(chunk)
+        return tuple(chunk)
+
+    def Skip(self, count):
+        self._pos += count
+
+    def Reset(self):
+        self._pos = 0
+
+    def Clone(self):
+        clone = _Enum(self._server, self._items)
+        clone._pos = self._pos
+        return clone
+
+
+class FakeComObject:
+    """Server-side object: what a wrapper keeps in ``_oleobj_``."""
+
+    interface = None
+
+    def __init__(self, server):
+        self._server = server
+        self._generation = server.generation
+
+    def InvokeTypes(self, dispid, lcid, flags, ret_type, arg_types, *args):
+        return self._server._invoke(self, dispid, flags, args)
+
+    def Invoke(self, dispid, lcid, flags, result_wanted, *args):
+        return self._server._invoke(self, dispid, flags, args)
+
+    def QueryInterface(self, iid, *args):
+        return self
+
+    @property
+    def metadata(self):
+        return self._server.metadata
+
+    def get_Application(self):
+        return self._server.application
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.interface}>"
+
+
+class FakeDbObject(FakeComObject):
+    """Anything with a Handle and an ObjectID in a document's database."""
+
+    object_name = None
+
+    def __init__(self, doc):
+        super().__init__(doc._server)
+        self.document = doc
+        self.handle, self.object_id = doc._register(self)
+        self.erased = False
+
+    def get_Handle(self):
+        return self.handle
+
+    def get_ObjectID(self):
+        return self.object_id
+
+    def get_ObjectName(self):
+        return self.object_name
+
+    def get_Document(self):
+        return self.document
+
+
+class FakeEntity(FakeDbObject):
+    dxf_name = None
+
+    def __init__(self, doc, space, layer="0"):
+        super().__init__(doc)
+        self.space = space
+        self.layer = layer
+        self.color = 256  # acByLayer
+        self.linetype = "ByLayer"
+        self.lineweight = -1  # acLnWtByLayer
+        self.visible = True
+
+    def get_OwnerID(self):
+        return self.space.object_id
+
+    def get_EntityName(self):
+        return self.object_name
+
+    def get_Layer(self):
+        return self.layer
+
+    def put_Layer(self, name):
+        # AutoCAD refuses a layer that is not in the table
+        self.layer = self.document.layer(name).name
+
+    def get_color(self):
+        return self.color
+
+    def put_color(self, value):
+        self.color = int(value)
+
+    def get_Linetype(self):
+        return self.linetype
+
+    def put_Linetype(self, value):
+        self.linetype = value
+
+    def get_Lineweight(self):
+        return self.lineweight
+
+    def put_Lineweight(self, value):
+        self.lineweight = int(value)
+
+    def get_Visible(self):
+        return self.visible
+
+    def put_Visible(self, value):
+        self.visible = bool(value)
+
+    def Delete(self):
+        self.document._erase(self)
+
+    def Erase(self):
+        self.document._erase(self)
+
+    def Update(self):
+        pass
+
+    def Highlight(self, flag):
+        pass
+
+    def GetBoundingBox(self, min_point=None, max_point=None):
+        lo, hi = self.bounds()
+        return lo + (0.0,), hi + (0.0,)
+
+    def Move(self, from_point, to_point):
+        a, b = _point(from_point), _point(to_point)
+        self.translate(b[0] - a[0], b[1] - a[1])
+
+    def bounds(self):
+        """((xmin, ymin), (xmax, ymax)) in drawing units."""
+        raise NotImplementedError
+
+    def translate(self, dx, dy):
+        raise NotImplementedError
+
+
+class FakeLine(FakeEntity):
+    interface = "IAcadLine"
+    object_name = "AcDbLine"
+    dxf_name = "LINE"
+
+    def __init__(self, doc, space, start, end, layer="0"):
+        super().__init__(doc, space, layer)
+        self.start = _point(start)
+        self.end = _point(end)
+
+    def get_StartPoint(self):
+        return self.start
+
+    def put_StartPoint(self, value):
+        self.start = _point(value)
+
+    def get_EndPoint(self):
+        return self.end
+
+    def put_EndPoint(self, value):
+        self.end = _point(value)
+
+    def get_Delta(self):
+        return tuple(e - s for s, e in zip(self.start, self.end))
+
+    def get_Length(self):
+        return math.dist(self.start, self.end)
+
+    def get_Angle(self):
+        return math.atan2(self.end[1] - self.start[1], self.end[0] - self.start[0]) % (2 * math.pi)
+
+    def bounds(self):
+        xs, ys = (self.start[0], self.end[0]), (self.start[1], self.end[1])
+        return (min(xs), min(ys)), (max(xs), max(ys))
+
+    def translate(self, dx, dy):
+        self.start = (self.start[0] + dx, self.start[1] + dy, self.start[2])
+        self.end = (self.end[0] + dx, self.end[1] + dy, self.end[2])
+
+
+class FakeLWPolyline(FakeEntity):
+    interface = "IAcadLWPolyline"
+    object_name = "AcDbPolyline"
+    dxf_name = "LWPOLYLINE"
+
+    def __init__(self, doc, space, coordinates, closed=False, bulges=None, layer="0"):
+        super().__init__(doc, space, layer)
+        self.set_coordinates(coordinates)
+        self.closed = bool(closed)
+        self.elevation = 0.0
+        if bulges is not None:
+            self.bulges = [float(b) for b in bulges]
+
+    def set_coordinates(self, coordinates):
+        flat = _floats(coordinates)
+        if len(flat) < 4 or len(flat) % 2:
+            raise acad_error("Invalid argument Coordinates", E_INVALIDARG)
+        self.vertices = [(flat[i], flat[i + 1]) for i in range(0, len(flat), 2)]
+        old = getattr(self, "bulges", [])
+        self.bulges = (old + [0.0] * len(self.vertices))[:len(self.vertices)]
+
+    def _vertex_index(self, index):
+        if not 0 <= index < len(self.vertices):
+            raise acad_error("Invalid index", E_INVALIDARG)
+        return index
+
+    def get_Coordinates(self):
+        return tuple(c for v in self.vertices for c in v)
+
+    def put_Coordinates(self, value):
+        self.set_coordinates(value)
+
+    def Coordinate(self, index):
+        return self.vertices[self._vertex_index(index)]
+
+    def SetCoordinate(self, index, point):
+        self.vertices[self._vertex_index(index)] = _floats(point)[:2]
+
+    def AddVertex(self, index, point):
+        if not 0 <= index <= len(self.vertices):
+            raise acad_error("Invalid index", E_INVALIDARG)
+        self.vertices.insert(index, _floats(point)[:2])
+        self.bulges.insert(index, 0.0)
+
+    def GetBulge(self, index):
+        return self.bulges[self._vertex_index(index)]
+
+    def SetBulge(self, index, bulge):
+        self.bulges[self._vertex_index(index)] = float(bulge)
+
+    def get_Closed(self):
+        return self.closed
+
+    def put_Closed(self, value):
+        self.closed = bool(value)
+
+    def get_Elevation(self):
+        return self.elevation
+
+    def put_Elevation(self, value):
+        self.elevation = float(value)
+
+    def _segments(self):
+        n = len(self.vertices)
+        for i in range(n if self.closed else n - 1):
+            yield self.vertices[i], self.vertices[(i + 1) % n], self.bulges[i]
+
+    def get_Length(self):
+        total = 0.0
+        for a, b, bulge in self._segments():
+            chord = math.dist(a, b)
+            if bulge:
+                theta = 4 * math.atan(abs(bulge))
+                total += chord / (2 * math.sin(theta / 2)) * theta
+            else:
+                total += chord
+        return total
+
+    def get_Area(self):
+        # AutoCAD reports the area of open polylines as if they were closed
+        n = len(self.vertices)
+        area = 0.0
+        for i in range(n):
+            (x0, y0), (x1, y1) = self.vertices[i], self.vertices[(i + 1) % n]
+            area += x0 * y1 - x1 * y0
+            bulge = self.bulges[i] if (self.closed or i < n - 1) else 0.0
+            if bulge:
+                theta = 4 * math.atan(bulge)
+                r = math.dist((x0, y0), (x1, y1)) / (2 * math.sin(abs(theta) / 2))
+                area += r * r * (theta - math.sin(theta))  # twice the signed segment area
+        return abs(area) / 2
+
+    def bounds(self):
+        # Chord bounds: arcs bulging past their chord are not included.
+        xs = [v[0] for v in self.vertices]
+        ys = [v[1] for v in self.vertices]
+        return (min(xs), min(ys)), (max(xs), max(ys))
+
+    def translate(self, dx, dy):
+        self.vertices = [(x + dx, y + dy) for x, y in self.vertices]
+
+
+class FakePViewport(FakeEntity):
+    interface = "IAcadPViewport"
+    object_name = "AcDbViewport"
+    dxf_name = "VIEWPORT"
+
+    def __init__(self, doc, space, center, width, height, layer="0"):
+        super().__init__(doc, space, layer)
+        self.center = _point(center)
+        self.width = float(width)
+        self.height = float(height)
+        self.custom_scale = 1.0
+        self.display_locked = False
+        self.on = False
+
+    def get_Center(self):
+        return self.center
+
+    def put_Center(self, value):
+        self.center = _point(value)
+
+    def get_Width(self):
+        return self.width
+
+    def put_Width(self, value):
+        self.width = float(value)
+
+    def get_Height(self):
+        return self.height
+
+    def put_Height(self, value):
+        self.height = float(value)
+
+    def get_CustomScale(self):
+        return self.custom_scale
+
+    def put_CustomScale(self, value):
+        if self.display_locked:
+            raise acad_error("Viewport is locked")
+        self.custom_scale = float(value)
+
+    def get_DisplayLocked(self):
+        return self.display_locked
+
+    def put_DisplayLocked(self, value):
+        self.display_locked = bool(value)
+
+    def get_ViewportOn(self):
+        return self.on
+
+    def put_ViewportOn(self, value):
+        self.on = bool(value)
+
+    def Display(self, status):
+        self.on = bool(status)
+
+    def bounds(self):
+        cx, cy = self.center[:2]
+        return (cx - self.width / 2, cy - self.height / 2), (cx + self.width / 2, cy + self.height / 2)
+
+    def translate(self, dx, dy):
+        self.center = (self.center[0] + dx, self.center[1] + dy, self.center[2])
+
+
+class FakeBlockReference(FakeEntity):
+    interface = "IAcadBlockReference"
+    object_name = "AcDbBlockReference"
+    dxf_name = "INSERT"
+
+    def __init__(self, doc, space, block, point, xscale=1.0, yscale=1.0, zscale=1.0, rotation=0.0,
+                 layer="0"):
+        super().__init__(doc, space, layer)
+        self.block = block
+        self.insertion = _point(point)
+        self.scales = [float(xscale), float(yscale), float(zscale)]
+        self.rotation = float(rotation)
+
+    @property
+    def block_name(self):
+        return self.block.name
+
+    def get_Name(self):
+        return self.block.name
+
+    def get_EffectiveName(self):
+        return self.block.name
+
+    def get_InsertionPoint(self):
+        return self.insertion
+
+    def put_InsertionPoint(self, value):
+        self.insertion = _point(value)
+
+    def get_Rotation(self):
+        return self.rotation
+
+    def put_Rotation(self, value):
+        self.rotation = float(value)
+
+    def get_XScaleFactor(self):
+        return self.scales[0]
+
+    def get_YScaleFactor(self):
+        return self.scales[1]
+
+    def get_ZScaleFactor(self):
+        return self.scales[2]
+
+    def offsets(self):
+        """Block-frame offsets of the copies this reference draws."""
+        return [(0.0, 0.0)]
+
+    def polygons(self):
+        """World vertices of every polyline of the block, per copy drawn."""
+        cos, sin = math.cos(self.rotation), math.sin(self.rotation)
+        (bx, by, _), (ix, iy, _) = self.block.origin, self.insertion
+        sx, sy = self.scales[:2]
+        out = []
+        for dx, dy in self.offsets():
+            for entity in self.block.entities():
+                if isinstance(entity, FakeLWPolyline):
+                    local = [((x - bx) * sx + dx, (y - by) * sy + dy) for x, y in entity.vertices]
+                    out.append([(ix + x * cos - y * sin, iy + x * sin + y * cos) for x, y in local])
+        return out
+
+    def bounds(self):
+        points = [p for polygon in self.polygons() for p in polygon] or [self.insertion[:2]]
+        xs, ys = [p[0] for p in points], [p[1] for p in points]
+        return (min(xs), min(ys)), (max(xs), max(ys))
+
+    def translate(self, dx, dy):
+        self.insertion = (self.insertion[0] + dx, self.insertion[1] + dy, self.insertion[2])
+
+
+class FakeMInsertBlock(FakeBlockReference):
+    interface = "IAcadMInsertBlock"
+    object_name = "AcDbMInsertBlock"
+
+    def __init__(self, doc, space, block, point, xscale, yscale, zscale, rotation, rows, columns,
+                 row_spacing, column_spacing, layer="0"):
+        super().__init__(doc, space, block, point, xscale, yscale, zscale, rotation, layer)
+        self.rows = int(rows)
+        self.columns = int(columns)
+        self.row_spacing = float(row_spacing)
+        self.column_spacing = float(column_spacing)
+
+    def get_Rows(self):
+        return self.rows
+
+    def put_Rows(self, value):
+        self.rows = int(value)
+
+    def get_Columns(self):
+        return self.columns
+
+    def put_Columns(self, value):
+        self.columns = int(value)
+
+    def get_RowSpacing(self):
+        return self.row_spacing
+
+    def put_RowSpacing(self, value):
+        self.row_spacing = float(value)
+
+    def get_ColumnSpacing(self):
+        return self.column_spacing
+
+    def put_ColumnSpacing(self, value):
+        self.column_spacing = float(value)
+
+    def offsets(self):
+        return [(c * self.column_spacing, r * self.row_spacing)
+                for r in range(self.rows) for c in range(self.columns)]
+
+
+class FakeBlockSpace(FakeDbObject):
+    """ModelSpace or PaperSpace: an ordered entity container."""
+
+    def __init__(self, doc, name, interface):
+        super().__init__(doc)
+        self.name = name
+        self.interface = interface
+        self.object_name = "AcDbBlockTableRecord"
+        self.items = {}  # handle -> entity, in creation order
+        self._list = None
+
+    def entities(self):
+        if self._list is None:
+            self._list = list(self.items.values())
+        return self._list
+
+    def add(self, entity):
+        self.items[entity.handle] = entity
+        self._list = None
+        self.document._added(entity)
+        return entity
+
+    def remove(self, entity):
+        if self.items.pop(entity.handle, None) is not None:
+            self._list = None
+
+    def get_Name(self):
+        return self.name
+
+    def get_Count(self):
+        return len(self.items)
+
+    def Item(self, index):
+        if not isinstance(index, int) or not 0 <= index < len(self.items):
+            raise acad_error("Invalid index", E_INVALIDARG)
+        return self.entities()[index]
+
+    def _new_enum(self):
+        return self.entities()
+
+    def AddLine(self, start, end):
+        return self.add(FakeLine(self.document, self, start, end, self.document.active_layer))
+
+    def AddLightWeightPolyline(self, coordinates):
+        return self.add(FakeLWPolyline(self.document, self, coordinates, layer=self.document.active_layer))
+
+    def AddPViewport(self, center, width, height):
+        if self.interface != "IAcadPaperSpace":
+            raise acad_error("Viewports can only be added to paper space")
+        return self.add(FakePViewport(self.document, self, center, width, height, self.document.active_layer))
+
+    def InsertBlock(self, point, name, xscale, yscale, zscale, rotation, password=None):
+        block = self.document.blocks.get(name)
+        return self.add(FakeBlockReference(self.document, self, block, point, xscale, yscale, zscale,
+                                           rotation, self.document.active_layer))
+
+    def AddMInsertBlock(self, point, name, xscale, yscale, zscale, rotation, rows, columns,
+                        row_spacing, column_spacing, password=None):
+        # The type library declares the spacings as Long: fractions are lost on the way in
+        block = self.document.blocks.get(name)
+        return self.add(FakeMInsertBlock(self.document, self, block, point, xscale, yscale, zscale,
+                                         rotation, rows, columns, int(row_spacing), int(column_spacing),
+                                         self.document.active_layer))
+
+
+class FakeBlock(FakeBlockSpace):
+    """A block definition: entities drawn by the references to it."""
+
+    def __init__(self, doc, name, origin):
+        super().__init__(doc, name, "IAcadBlock")
+        self.origin = _point(origin)
+
+    def get_Origin(self):
+        return self.origin
+
+    def get_IsLayout(self):
+        return False
+
+    def get_IsXRef(self):
+        return False
+
+
+class FakeBlocks(FakeDbObject):
+    interface = "IAcadBlocks"
+    object_name = "AcDbBlockTable"
+
+    def __init__(self, doc):
+        super().__init__(doc)
+        self.by_name = {}  # upper-cased name -> block; block names are case-insensitive
+
+    def get(self, name):
+        block = self.by_name.get(str(name).upper())
+        if block is None:
+            raise acad_error("Key not found", ACAD_E_KEY_NOT_FOUND)
+        return block
+
+    def get_Count(self):
+        return len(self.by_name)
+
+    def Item(self, index):
+        if isinstance(index, int):
+            blocks = list(self.by_name.values())
+            if not 0 <= index < len(blocks):
+                raise acad_error("Invalid index", E_INVALIDARG)
+            return blocks[index]
+        return self.get(index)
+
+    def Add(self, origin, name):
+        # An existing definition comes back as it is, like Layers.Add
+        block = self.by_name.get(name.upper())
+        if block is None:
+            block = self.by_name[name.upper()] = FakeBlock(self.document, name, origin)
+            self.document._added(block)
+        return block
+
+    def _new_enum(self):
+        return list(self.by_name.values())
+
+
+class FakeLayer(FakeDbObject):
+    interface = "IAcadLayer"
+    object_name = "AcDbLayerTableRecord"
+
+    def __init__(self, doc, name):
+        super().__init__(doc)
+        self.name = name
+        self.color = 7
+        self.on = True
+        self.frozen = False
+        self.locked = False
+
+    def get_Name(self):
+        return self.name
+
+    def put_Name(self, value):
+        self.document.layers.rename(self, value)
+
+    def get_color(self):
+        return self.color
+
+    def put_color(self, value):
+        self.color = int(value)
+
+    def get_LayerOn(self):
+        return self.on
+
+    def put_LayerOn(self, value):
+        self.on = bool(value)
+
+    def get_Freeze(self):
+        return self.frozen
+
+    def put_Freeze(self, value):
+        self.frozen = bool(value)
+
+    def get_Lock(self):
+        return self.locked
+
+    def put_Lock(self, value):
+        self.locked = bool(value)
+
+    def Delete(self):
+        self.document.layers.delete(self)
+
+
+class FakeLayers(FakeDbObject):
+    interface = "IAcadLayers"
+    object_name = "AcDbLayerTable"
+
+    def __init__(self, doc):
+        super().__init__(doc)
+        self.by_name = {}  # upper-cased name -> layer; layer names are case-insensitive
+
+    def get(self, name):
+        layer = self.by_name.get(str(name).upper())
+        if layer is None:
+            raise acad_error("Key not found", ACAD_E_KEY_NOT_FOUND)
+        return layer
+
+    def add(self, name):
+        layer = self.by_name.get(name.upper())
+        if layer is None:
+            layer = self.by_name[name.upper()] = FakeLayer(self.document, name)
+            self.document._added(layer)
+        return layer
+
+    def rename(self, layer, name):
+        if name.upper() in self.by_name and self.by_name[name.upper()] is not layer:
+            raise acad_error("Duplicate record name", E_INVALIDARG)
+        del self.by_name[layer.name.upper()]
+        layer.name = name
+        self.by_name[name.upper()] = layer
+
+    def delete(self, layer):
+        in_use = any(e.layer.upper() == layer.name.upper() for e in self.document.all_entities())
+        if layer.name == "0" or in_use:
+            raise acad_error("Object is referenced")
+        del self.by_name[layer.name.upper()]
+        self.document._erase(layer)
+
+    def get_Count(self):
+        return len(self.by_name)
+
+    def Item(self, index):
+        if isinstance(index, int):
+            layers = list(self.by_name.values())
+            if not 0 <= index < len(layers):
+                raise acad_error("Invalid index", E_INVALIDARG)
+            return layers[index]
+        return self.get(index)
+
+    def Add(self, name):
+        return self.add(name)
+
+    def _new_enum(self):
+        return list(self.by_name.values())
+
+
+class FakeSelectionSet(FakeComObject):
+    interface = "IAcadSelectionSet"
+
+    def __init__(self, doc, name):
+        super().__init__(doc._server)
+        self.document = doc
+        self.name = name
+        self.items = []
+
+    def get_Name(self):
+        return self.name
+
+    def get_Count(self):
+        return len(self.items)
+
+    def Item(self, index):
+        if not isinstance(index, int) or not 0 <= index < len(self.items):
+            raise acad_error("Invalid index", E_INVALIDARG)
+        return self.items[index]
+
+    def _new_enum(self):
+        return self.items
+
+    def Select(self, mode, point1=None, point2=None, filter_type=None, filter_data=None):
+        doc = self.document
+        if mode == acSelectionSetAll:
+            candidates = doc.all_entities()
+        elif mode == acSelectionSetLast:
+            candidates = doc.all_entities()[-1:]
+        elif mode in (acSelectionSetWindow, acSelectionSetCrossing):
+            a, b = _point(point1), _point(point2)
+            lo = (min(a[0], b[0]), min(a[1], b[1]))
+            hi = (max(a[0], b[0]), max(a[1], b[1]))
+            inside = _inside if mode == acSelectionSetWindow else _crossing
+            candidates = [e for e in doc.active_block().entities() if inside(e.bounds(), lo, hi)]
+        else:
+            raise acad_error(f"Selection mode {mode} is not supported by the fake", E_INVALIDARG)
+        if not _missing(filter_type):
+            codes, values = _values(filter_type), _values(filter_data)
+            candidates = [e for e in candidates if matches_filter(e, codes, values)]
+        seen = set(map(id, self.items))
+        self.items.extend(e for e in candidates if id(e) not in seen)
+
+    def AddItems(self, objects):
+        seen = set(map(id, self.items))
+        for obj in _values(objects):
+            obj = getattr(obj, "_oleobj_", obj)
+            if id(obj) not in seen:
+                self.items.append(obj)
+                seen.add(id(obj))
+
+    def RemoveItems(self, objects):
+        drop = {id(getattr(obj, "_oleobj_", obj)) for obj in _values(objects)}
+        self.items = [e for e in self.items if id(e) not in drop]
+
+    def Erase(self):
+        # Erases what it can; entities on locked layers stay in the set and the call fails
+        kept = []
+        for entity in self.items:
+            if entity.erased:
+                continue
+            if self.document.layers.get(entity.layer).locked:
+                kept.append(entity)
+            else:
+                self.document._erase(entity)
+        self.items = kept
+        if kept:
+            raise acad_error(f"{len(kept)} were on a locked layer")
+
+    def Clear(self):
+        self.items = []
+
+    def Delete(self):
+        self.document.selection_sets.sets.pop(self.name.upper(), None)
+
+    def Highlight(self, flag):
+        pass
+
+    def Update(self):
+        pass
+
+
+class FakeSelectionSets(FakeComObject):
+    interface = "IAcadSelectionSets"
+
+    def __init__(self, doc):
+        super().__init__(doc._server)
+        self.document = doc
+        self.sets = {}  # upper-cased name -> set
+
+    def get_Count(self):
+        return len(self.sets)
+
+    def Add(self, name):
+        if name.upper() in self.sets:
+            raise acad_error("Duplicate record name", E_INVALIDARG)
+        sset = self.sets[name.upper()] = FakeSelectionSet(self.document, name)
+        return sset
+
+    def Item(self, index):
+        if isinstance(index, int):
+            sets = list(self.sets.values())
+            if not 0 <= index < len(sets):
+                raise acad_error("Invalid index", E_INVALIDARG)
+            return sets[index]
+        try:
+            return self.sets[str(index).upper()]
+        except KeyError:
+            raise acad_error("Key not found", ACAD_E_KEY_NOT_FOUND) from None
+
+    def _new_enum(self):
+        return list(self.sets.values())
+
+
+def _inside(bounds, lo, hi):
+    (x0, y0), (x1, y1) = bounds
+    return lo[0] <= x0 and lo[1] <= y0 and x1 <= hi[0] and y1 <= hi[1]
+
+
+def _crossing(bounds, lo, hi):
+    (x0, y0), (x1, y1) = bounds
+    return x0 <= hi[0] and lo[0] <= x1 and y0 <= hi[1] and lo[1] <= y1
+
+
+def _wildcard(pattern, value):
+    """AutoCAD wcmatch subset: comma-separated alternatives, ~ negation, * ? # @ . and ` escapes."""
+    pattern, negate = (pattern[1:], True) if pattern.startswith("~") else (pattern, False)
+    hit = any(_wcmatch(p, value.upper()) for p in _split_unescaped(pattern.upper()))
+    return hit != negate
+
+
+def _split_unescaped(pattern):
+    parts, current, i = [], "", 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "`" and i + 1 < len(pattern):
+            current += pattern[i:i + 2]
+            i += 2
+            continue
+        if c == ",":
+            parts.append(current)
+            current = ""
+        else:
+            current += c
+        i += 1
+    return parts + [current]
+
+
+def _wcmatch(pattern, value):
+    # Translate to an fnmatch pattern: ` escapes, # digit, @ letter, . non-alphanumeric
+    out, i = "", 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "`" and i + 1 < len(pattern):
+            i += 1
+            out += "[" + pattern[i] + "]" if pattern[i] in "*?[]" else pattern[i]
+        elif c == "#":
+            out += "[0-9]"
+        elif c == "@":
+            out += "[A-Z]"
+        elif c == ".":
+            out += "[!A-Z0-9]"
+        else:
+            out += c
+        i += 1
+    return fnmatch.fnmatchcase(value, out)
+
+
+def _group_value(entity, code):
+    """The entity's value for a DXF group code, None if it has none."""
+    if code == 0:
+        return entity.dxf_name
+    if code == 2:
+        return getattr(entity, "block_name", None)
+    if code == 5:
+        return entity.handle
+    if code == 6:
+        return entity.linetype
+    if code == 8:
+        return entity.layer
+    if code == 38:
+        return getattr(entity, "elevation", None)
+    if code == 62:
+        return entity.color
+    if code == 67:
+        return int(entity.space is entity.document.paper_space)
+    if code == 370:
+        return entity.lineweight
+    if code == 410:
+        return "Layout1" if entity.space is entity.document.paper_space else "Model"
+    if code == 70:
+        return int(entity.closed) if hasattr(entity, "closed") else None
+    raise acad_error(f"DXF group code {code} is not supported by the fake", E_INVALIDARG)
+
+
+_RELATIONAL = {
+    "*": lambda a, b: True,
+    "=": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    "/=": lambda a, b: a != b,
+    "<>": lambda a, b: a != b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+    "&": lambda a, b: bool(int(a) & int(b)),
+    "&=": lambda a, b: int(a) & int(b) == int(b),
+}
+
+
+def _parse_filter(pairs, i=0, closing=None):
+    """Filter list -> nested terms: ("test", code, value, op) or (group, [terms])."""
+    terms = []
+    op = None
+    while i < len(pairs):
+        code, value = pairs[i]
+        i += 1
+        if code == -4 and value.startswith("<") and value[1:].upper() in ("AND", "OR", "XOR", "NOT"):
+            name = value[1:].upper()
+            sub, i = _parse_filter(pairs, i, name + ">")
+            if (name == "NOT" and len(sub) != 1) or (name == "XOR" and len(sub) != 2):
+                raise acad_error(f"Bad {name} grouping in selection filter", E_INVALIDARG)
+            terms.append((name, sub))
+        elif code == -4 and value.upper() in ("AND>", "OR>", "XOR>", "NOT>"):
+            if value.upper() != closing:
+                raise acad_error(f"Unexpected {value} in selection filter", E_INVALIDARG)
+            return terms, i
+        elif code == -4:
+            if value not in _RELATIONAL:
+                raise acad_error(f"Bad relational operator {value!r}", E_INVALIDARG)
+            op = value
+        else:
+            terms.append(("test", code, value, op))
+            op = None
+    if closing is not None:
+        raise acad_error(f"Missing {closing} in selection filter", E_INVALIDARG)
+    return terms, i
+
+
+def _evaluate(entity, term):
+    kind = term[0]
+    if kind == "test":
+        _, code, value, op = term
+        actual = _group_value(entity, code)
+        if actual is None:
+            return False
+        if isinstance(value, str) and op is None:
+            return _wildcard(value, str(actual))
+        return _RELATIONAL[op or "="](actual, value)
+    results = [_evaluate(entity, t) for t in term[1]]
+    if kind == "AND":
+        return all(results)
+    if kind == "OR":
+        return any(results)
+    if kind == "XOR":
+        return results[0] != results[1]
+    return not results[0]
+
+
+def matches_filter(entity, codes, values):
+    """
+    ssget-style filter: the tests are ANDed, with -4 groupings (<AND, <OR,
+    <XOR, <NOT) and relational operators before numeric tests.  Group
+    codes 0, 5, 6, 8, 62, 67, 410 and 70 (closed flag) are known.
+    """
+    terms, _ = _parse_filter(list(zip(codes, values)))
+    return all(_evaluate(entity, term) for term in terms)
+
+
+class FakeLayout(FakeComObject):
+    interface = "IAcadLayout"
+
+    def __init__(self, server, name):
+        super().__init__(server)
+        self.name = name
+
+    def get_Name(self):
+        return self.name
+
+
+class FakeUtility(FakeComObject):
+    interface = "IAcadUtility"
+
+    def DistanceToReal(self, text, unit):
+        return float(text)
+
+    def RealToString(self, value, unit, precision):
+        return f"{value:.{precision}f}"
+
+
+class FakeDocument(FakeComObject):
+    interface = "IAcadDocument"
+
+    def __init__(self, server, name="Drawing1.dwg"):
+        super().__init__(server)
+        self.name = name
+        self.path = ""
+        self._next_handle = 0x1F
+        self.sinks = []  # event sinks, see with_events
+        self.by_handle = {}
+        self.by_id = {}
+        self.active_layer = "0"
+        self.active_space = acModelSpace
+        self.commands = []
+        self.regens = 0
+        self.undo_marks = 0
+        self.undo_groups = []  # closed StartUndoMark/EndUndoMark groups, see undo()
+        self._journal = None  # changes of the open group
+        self._undo_depth = 0
+        self.variables = {"CMDECHO": 1, "FILEDIA": 1, "OSMODE": 0, "PICKFIRST": 1, "REGENMODE": 1,
+                          "HIGHLIGHT": 1, "UNDOCTL": 5}
+        # global command name -> handler(doc); a handler returning False leaves
+        # its command waiting for input (no OnEndCommand)
+        self.command_handlers = {"REGEN": FakeDocument.Regen, "SELALL": None, "ZOOM": None,
+                                 "UNDO": FakeDocument.undo, "U": FakeDocument.undo}
+        # handler(doc, expression) for "(...)" strings; False cancels the LISP
+        self.lisp_handler = None
+        self.model_space = FakeBlockSpace(self, "*Model_Space", "IAcadModelSpace")
+        self.paper_space = FakeBlockSpace(self, "*Paper_Space", "IAcadPaperSpace")
+        self.layers = FakeLayers(self)
+        self.layers.add("0")
+        self.blocks = FakeBlocks(self)
+        self.selection_sets = FakeSelectionSets(self)
+        self.utility = FakeUtility(server)
+        self.layouts = {acModelSpace: FakeLayout(server, "Model"), acPaperSpace: FakeLayout(server, "Layout1")}
+        self.saves = 0
+        self.closed = False
+
+    # --- store ---
+
+    def _register(self, obj):
+        handle = f"{self._next_handle:X}"
+        object_id = 0x7FF000000000 + self._next_handle * 8
+        self._next_handle += 1
+        self.by_handle[handle] = obj
+        self.by_id[object_id] = obj
+        return handle, object_id
+
+    def _added(self, obj):
+        if self._journal is not None:
+            self._journal.append(("added", obj, None))
+        self._fire("OnObjectAdded", obj)
+
+    def _changing(self, obj):
+        # Before a put or mutator: remember the object's state for undo
+        if self._journal is not None:
+            state = {k: list(v) if isinstance(v, list) else v for k, v in vars(obj).items()}
+            self._journal.append(("changed", obj, state))
+
+    def _modified(self, obj):
+        self._fire("OnObjectModified", obj)
+
+    def _erase(self, obj):
+        if obj.erased:
+            raise acad_error("Object was erased")
+        if isinstance(obj, FakeEntity) and self.layers.get(obj.layer).locked:
+            raise acad_error("On locked layer")
+        if self._journal is not None:
+            self._journal.append(("erased", obj, None))
+        self._fire("OnObjectErased", obj.object_id)
+        obj.erased = True
+        self.by_handle.pop(obj.handle, None)
+        self.by_id.pop(obj.object_id, None)
+        if isinstance(obj, FakeEntity):
+            obj.space.remove(obj)
+
+    def _fire(self, event, *args):
+        for sink in self.sinks:
+            self._server.pending_events.append((sink, event, args))
+
+    def advise(self, sink):
+        self.sinks.append(sink)
+
+    def unadvise(self, sink):
+        self.sinks.remove(sink)
+
+    def all_entities(self):
+        return self.model_space.entities() + self.paper_space.entities()
+
+    def active_block(self):
+        return self.model_space if self.active_space == acModelSpace else self.paper_space
+
+    def layer(self, name):
+        """The FakeLayer called name; Key not found if there is none."""
+        return self.layers.get(name)
+
+    # Seeding helpers: build a drawing without paying simulated round trips.
+
+    def add_layer(self, name):
+        return self.layers.add(name)
+
+    def add_line(self, start, end, layer="0", paper=False):
+        space = self.paper_space if paper else self.model_space
+        return space.add(FakeLine(self, space, start, end, self.layer(layer).name))
+
+    def add_polyline(self, coordinates, closed=False, bulges=None, layer="0", paper=False):
+        space = self.paper_space if paper else self.model_space
+        return space.add(FakeLWPolyline(self, space, coordinates, closed, bulges, self.layer(layer).name))
+
+    def add_viewport(self, center, width, height, layer="0"):
+        return self.paper_space.add(FakePViewport(self, self.paper_space, center, width, height,
+                                                  self.layer(layer).name))
+
+    # --- IAcadDocument ---
+
+    def get_Name(self):
+        return self.name
+
+    def get_FullName(self):
+        return os.path.join(self.path, self.name) if self.path else self.name
+
+    def get_Path(self):
+        return self.path
+
+    def get_ModelSpace(self):
+        return self.model_space
+
+    def get_PaperSpace(self):
+        return self.paper_space
+
+    def get_Layers(self):
+        return self.layers
+
+    def get_Blocks(self):
+        return self.blocks
+
+    def get_SelectionSets(self):
+        return self.selection_sets
+
+    def get_Utility(self):
+        return self.utility
+
+    def get_ActiveSpace(self):
+        return self.active_space
+
+    def put_ActiveSpace(self, value):
+        self.active_space = int(value)
+
+    def get_ActiveLayout(self):
+        return self.layouts[self.active_space]
+
+    def get_ActiveLayer(self):
+        return self.layer(self.active_layer)
+
+    def put_ActiveLayer(self, layer):
+        self.active_layer = getattr(layer, "_oleobj_", layer).name
+
+    def HandleToObject(self, handle):
+        try:
+            return self.by_handle[handle.upper()]
+        except KeyError:
+            raise acad_error("Key not found", ACAD_E_KEY_NOT_FOUND) from None
+
+    def ObjectIdToObject(self, object_id):
+        try:
+            return self.by_id[object_id]
+        except KeyError:
+            raise acad_error("Key not found", ACAD_E_KEY_NOT_FOUND) from None
+
+    def Regen(self, which=None):
+        self.regens += 1
+
+    def SendCommand(self, command):
+        self.commands.append(command)
+        text = command.strip()
+        if text.startswith("("):
+            self._fire("OnBeginLisp", text)
+            ok = self.lisp_handler is None or self.lisp_handler(self, text) is not False
+            self._fire("OnEndLisp" if ok else "OnLispCancelled")
+            return
+        for word in text.split():
+            name = word.lstrip("_.-'").upper()
+            if name not in self.command_handlers:
+                continue  # input to the previous command
+            handler = self.command_handlers[name]
+            self._fire("OnBeginCommand", name)
+            if handler is not None and handler(self) is False:
+                return
+            self._fire("OnEndCommand", name)
+
+    def Save(self):
+        self.saves += 1
+
+    def Close(self, save_changes=None, file_name=None):
+        if save_changes:
+            self.Save()
+        self.closed = True
+        self._server.close_document(self)
+
+    def StartUndoMark(self):
+        self.undo_marks += 1
+        self._undo_depth += 1
+        if self._undo_depth == 1:
+            self._journal = []
+
+    def EndUndoMark(self):
+        # Marks nest; only the outermost pair makes a group
+        if self._undo_depth == 0:
+            return
+        self._undo_depth -= 1
+        if self._undo_depth == 0:
+            self.undo_groups.append(self._journal)
+            self._journal = None
+
+    def undo(self):
+        """The UNDO command: reverts the last undo group."""
+        if not self.undo_groups:
+            return
+        for kind, obj, state in reversed(self.undo_groups.pop()):
+            if kind == "changed":
+                vars(obj).update(state)
+                self._fire("OnObjectModified", obj)
+            elif kind == "added":
+                self._fire("OnObjectErased", obj.object_id)
+                obj.erased = True
+                self.by_handle.pop(obj.handle, None)
+                self.by_id.pop(obj.object_id, None)
+                if isinstance(obj, FakeEntity):
+                    obj.space.remove(obj)
+                elif isinstance(obj, FakeLayer):
+                    self.layers.by_name.pop(obj.name.upper(), None)
+                elif isinstance(obj, FakeBlock):
+                    self.blocks.by_name.pop(obj.name.upper(), None)
+            else:
+                obj.erased = False
+                self.by_handle[obj.handle] = obj
+                self.by_id[obj.object_id] = obj
+                if isinstance(obj, FakeEntity):
+                    # Back in its place: handles follow creation order
+                    items = obj.space.items
+                    items[obj.handle] = obj
+                    obj.space.items = dict(sorted(items.items(), key=lambda kv: int(kv[0], 16)))
+                    obj.space._list = None
+                self._fire("OnObjectAdded", obj)
+
+    def GetVariable(self, name):
+        try:
+            return self.variables[name.upper()]
+        except KeyError:
+            raise acad_error("Error getting system variable", E_INVALIDARG) from None
+
+    def SetVariable(self, name, value):
+        if name.upper() not in self.variables:
+            raise acad_error("Error setting system variable", E_INVALIDARG)
+        self.variables[name.upper()] = value
+
+
+class FakeDocuments(FakeComObject):
+    interface = "IAcadDocuments"
+
+    def get_Count(self):
+        return len(self._server.documents)
+
+    def Item(self, index):
+        docs = self._server.documents
+        if isinstance(index, str):
+            for doc in docs:
+                if doc.name.upper() == index.upper():
+                    return doc
+        elif 0 <= int(index) < len(docs):
+            return docs[int(index)]
+        raise FakeComError(E_INVALIDARG, "The parameter is incorrect.")
+
+    def _new_enum(self):
+        return list(self._server.documents)
+
+    def Add(self, template=None):
+        server = self._server
+        doc = FakeDocument(server, f"Drawing{len(server.documents) + 1}.dwg")
+        server.documents.append(doc)
+        server.document = doc
+        return doc
+
+    def Open(self, name, read_only=None, password=None):
+        """Opens an existing file as a new, active document; server.open_handler(doc) fills it."""
+        server = self._server
+        if not os.path.isfile(name):
+            raise acad_error(f"Invalid file name: {name}")
+        doc = FakeDocument(server, os.path.basename(name))
+        doc.path = os.path.dirname(os.path.abspath(name))
+        if server.open_handler is not None:
+            server.open_handler(doc)
+        server.documents.append(doc)
+        server.document = doc
+        return doc
+
+    def Close(self):
+        for doc in list(self._server.documents):
+            doc.Close()
+
+
+class FakeApplication(FakeComObject):
+    interface = "IAcadApplication"
+
+    def __init__(self, server):
+        super().__init__(server)
+        self.visible = True
+
+    def get_ActiveDocument(self):
+        if self._server.document is None:
+            raise acad_error("No document is open")
+        return self._server.document
+
+    def get_Documents(self):
+        return self._server.documents_collection
+
+    def put_ActiveDocument(self, doc):
+        self._server.document = getattr(doc, "_oleobj_", doc)
+
+    def get_Name(self):
+        return "AutoCAD"
+
+    def get_Version(self):
+        return "25.0s (LMS Tech)"
+
+    def get_Visible(self):
+        return self.visible
+
+    def put_Visible(self, value):
+        self.visible = bool(value)
+
+    def Update(self):
+        pass
+
+    def ZoomExtents(self):
+        pass
+
+    def ZoomAll(self):
+        pass
+
+
+class FakeAutoCAD:
+    """
+    The fake server: application, documents and the round-trip clock.
+
+    latency is the simulated cost of one cross-process call in seconds, or
+    a callable (interface, member) -> seconds for per-member costs.
+    """
+
+    def __init__(self, latency=0.0, metadata=None, connect_latency=0.0):
+        self.latency = latency
+        self.connect_latency = connect_latency  # Dispatch("AutoCAD.Application") itself
+        self.connections = 0
+        self.generation = 0  # bumped by restart(); objects of older generations are dead
+        self.metadata = metadata if metadata is not None else dispatch_metadata.load_metadata()
+        self.calls = Counter()  # (interface, member) -> count
+        self.round_trips = 0
+        # Simulated busy server: reject this many calls / every call until this perf_counter time
+        self.reject_calls = 0
+        self.busy_until = 0.0
+        self.rejected = 0
+        self.pending_events = deque()  # (sink, event name, args), delivered by pump_events
+        self.open_handler = None  # handler(doc) run by Documents.Open to fill the drawing
+        self.proxies = False  # a separate _OleProxy per object handed out, see the module docstring
+        self._tables = {}
+        self._start()
+
+    def _start(self):
+        self.application = FakeApplication(self)
+        self.documents_collection = FakeDocuments(self)
+        self.document = FakeDocument(self)
+        self.documents = [self.document]
+
+    def connect(self):
+        """Client-side Application object, as Dispatch("AutoCAD.Application") returns it."""
+        self.connections += 1
+        if self.connect_latency > 0:
+            _wait(self.connect_latency)
+        return _wrap(self.application)
+
+    def restart(self):
+        """AutoCAD closed and started again: every object handed out so far is disconnected."""
+        self.generation += 1
+        self._start()
+
+    def close_document(self, doc):
+        if doc in self.documents:
+            self.documents.remove(doc)
+        if self.document is doc:
+            self.document = self.documents[-1] if self.documents else None
+
+    def pump_events(self):
+        """Deliver the queued events, as PumpWaitingMessages does; returns how many."""
+        delivered = 0
+        while self.pending_events:
+            sink, event, args = self.pending_events.popleft()
+            handler = getattr(sink, event, None)
+            if handler is not None:
+                handler(*args)
+            delivered += 1
+        return delivered
+
+    def reset_counters(self):
+        self.calls.clear()
+        self.round_trips = 0
+        self.rejected = 0
+        self.connections = 0
+
+    def _round_trip(self, interface, member):
+        self.round_trips += 1
+        self.calls[(interface, member)] += 1
+        delay = self.latency(interface, member) if callable(self.latency) else self.latency
+        if delay > 0:
+            _wait(delay)
+        if self.reject_calls or (self.busy_until and time.perf_counter() < self.busy_until):
+            self.reject_calls = max(0, self.reject_calls - 1)
+            self.rejected += 1
+            raise FakeComError(RPC_E_CALL_REJECTED, "Call was rejected by callee.")
+
+    def _table(self, interface):
+        """(dispid, kind) -> member name for one interface, from the metadata."""
+        table = self._tables.get(interface)
+        if table is None:
+            meta = self.metadata[interface]
+            table = {}
+            for name, entry in meta.prop_get.items():
+                table[(entry[0], "get")] = name
+            for name, entry in meta.prop_put.items():
+                table[(entry[0][0], "put")] = name
+            for name, entry in meta.methods.items():
+                table[(entry[0], "call")] = name
+            self._tables[interface] = table
+        return table
+
+    def _invoke(self, obj, dispid, flags, args):
+        if obj._generation != self.generation:
+            raise FakeComError(RPC_S_SERVER_UNAVAILABLE, "The RPC server is unavailable.")
+        if dispid == DISPID_NEWENUM:
+            self._round_trip(obj.interface, "_NewEnum")
+            if not hasattr(obj, "_new_enum"):
+                raise FakeComError(DISP_E_MEMBERNOTFOUND, "Member not found.")
+            return _Enum(self, obj._new_enum())
+
+        table = self._table(obj.interface)
+        if flags & (DISPATCH_PROPERTYPUT | DISPATCH_PROPERTYPUTREF):
+            kinds = ("put",)
+        elif flags & DISPATCH_METHOD:
+            kinds = ("call", "get")
+        else:
+            kinds = ("get", "call")
+        for kind in kinds:
+            name = table.get((dispid, kind))
+            if name is not None:
+                break
+        self._round_trip(obj.interface, name if name is not None else dispid)
+        handler = None
+        if name is not None:
+            handler = getattr(obj, name if kind == "call" else f"{kind}_{name}", None)
+        if handler is None:
+            raise FakeComError(DISP_E_MEMBERNOTFOUND, "Member not found.")
+        if getattr(obj, "erased", False):
+            raise acad_error("Object was erased")
+        changes = isinstance(obj, FakeDbObject) and (kind == "put" or name in _MUTATORS)
+        if changes:
+            obj.document._changing(obj)
+        result = handler(*(None if _missing(a) else a for a in args))
+        if changes:
+            obj.document._modified(obj)
+        return result
+
+
+def _wait(seconds):
+    # time.sleep overshoots by ~0.1 ms; spin for sub-millisecond latencies
+    if seconds >= 0.002:
+        time.sleep(seconds)
+        return
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class _EventConnection:
+    def __init__(self, ole):
+        self._ole = ole
+
+    def close(self):
+        if self._ole is not None:
+            self._ole.unadvise(self)
+            self._ole = None
+
+
+def with_events(disp, user_event_class):
+    """
+    win32com.client.WithEvents for fake documents: an instance of
+    user_event_class whose On* methods receive the document's events
+    (Object arguments are raw server objects, like a PyIDispatch;
+    OnObjectErased gets the ObjectID, as declared in the type library).
+    close() disconnects it.
+    """
+    ole = disp._oleobj_
+    instance = type("COMEventClass", (_EventConnection, user_event_class), {})(ole)
+    if "__init__" in vars(user_event_class):
+        user_event_class.__init__(instance)
+    ole.advise(instance)
+    return instance
+
+
+class _Method:
+    def __init__(self, target, name, entry):
+        self._target = target
+        self._name = name
+        self._entry = entry
+
+    def __call__(self, *args):
+        dispid, flags, ret_type, arg_types, _clsid = self._entry
+        ole = self._target._oleobj_
+        return _wrap(ole.InvokeTypes(dispid, 0, flags, ret_type, arg_types, *args))
+
+
+class _OleProxy:
+    """One client-side interface pointer to a server object (server.proxies)."""
+
+    def __init__(self, target):
+        self._target = target
+
+    def InvokeTypes(self, dispid, lcid, flags, ret_type, arg_types, *args):
+        return self._target.InvokeTypes(dispid, lcid, flags, ret_type, arg_types, *map(_unproxy, args))
+
+    def Invoke(self, dispid, lcid, flags, result_wanted, *args):
+        return self._target.Invoke(dispid, lcid, flags, result_wanted, *map(_unproxy, args))
+
+    def QueryInterface(self, iid, *args):
+        return self._target  # COM identity: IUnknown is the same for every pointer to an object
+
+    def __getattr__(self, name):
+        return getattr(self._target, name)
+
+    def __repr__(self):
+        return f"<_OleProxy {self._target!r}>"
+
+
+def _unproxy(value):
+    if isinstance(value, _OleProxy):
+        return value._target
+    if isinstance(value, tuple):
+        return tuple(_unproxy(v) for v in value)
+    return value
+
+
+def _wrap(value):
+    # Anything with InvokeTypes: server objects, or proxies such as com_recorder's
+    if hasattr(value, "InvokeTypes"):
+        if isinstance(value, FakeComObject) and value._server.proxies:
+            value = _OleProxy(value)
+        return FakeDispatch(value)
+    if isinstance(value, tuple) and value and hasattr(value[0], "InvokeTypes"):
+        return tuple(_wrap(v) for v in value)
+    return value
+
+
+_OleRepr = namedtuple("_OleRepr", "mapFuncs")
+
+
+class FakeDispatch:
+    """
+    Late-bound client object, like win32com's dynamic Dispatch.  Works over
+    anything that has InvokeTypes/Invoke plus ``interface`` and ``metadata``
+    attributes: FakeComObject, or a recording/replay proxy around one.
+    """
+
+    def __init__(self, ole):
+        self.__dict__["_oleobj_"] = ole
+
+    def _meta(self):
+        return self._oleobj_.metadata[self._oleobj_.interface]
+
+    @property
+    def _olerepr_(self):
+        # Where win32com's dynamic Dispatch keeps the type info; only its methods are filled in
+        return _OleRepr(self._meta().methods)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        meta = self._meta()
+        entry = meta.prop_get.get(name)
+        if entry is not None:
+            return _wrap(self._oleobj_.InvokeTypes(entry[0], 0, entry[1], entry[2], entry[3]))
+        entry = meta.methods.get(name)
+        if entry is not None:
+            return _Method(self, name, entry)
+        raise AttributeError(f"{self._oleobj_.interface}.{name}")
+
+    def __setattr__(self, name, value):
+        entry = self._meta().prop_put.get(name)
+        if entry is None:
+            raise AttributeError(f"Property '{self._oleobj_.interface}.{name}' can not be set.")
+        dispid, lcid, flags, _ = entry[0]
+        self._oleobj_.Invoke(dispid, lcid, flags, 0, getattr(value, "_oleobj_", value))
+
+    def __iter__(self):
+        enum = self._oleobj_.InvokeTypes(DISPID_NEWENUM, 0, DISPATCH_METHOD | DISPATCH_PROPERTYGET,
+                                         (13, 10), ())
+        while True:
+            chunk = enum.Next(1)
+            if not chunk:
+                return
+            yield _wrap(chunk[0])
+
+    def __len__(self):
+        return self.Count
+
+    def __getitem__(self, index):
+        return self.Item(index)
+
+    def __eq__(self, other):
+        return self._oleobj_ is getattr(other, "_oleobj_", other)
+
+    def __hash__(self):
+        return id(self._oleobj_)
+
+    def __repr__(self):
+        return f"<FakeDispatch {self._oleobj_.interface}>"
@@ -3,6 +3,11 @@ from fpdf import FPDF
 import os
 from datetime import datetime
 
+from AutoCAD_Constants import AcColor
+from acad_session import get_session
+from bulk_read import read_properties
+from com_arrays import point_variant
+
 # --- CONFIGURATION ---
 OUTPUT_DIR = r"C:\CAD_Exports"
 DWG_PDF_NAME = "Facade_Design_Plot.pdf"
@@ -19,14 +24,13 @@ def add_title_block(doc):
     try:
         paper_space = doc.PaperSpace
         # Coordinates (X, Y, Z) - Adjust 10,10 to fit your specific Title Block margin
-        pt = win32com.client.VARIANT(win32com.client.pythoncom.VT_ARRAY | win32com.client.pythoncom.VT_R8,
-                                     (10.0, 10.0, 0.0))
+        pt = point_variant(10.0, 10.0, 0.0)
 
         text_content = f"Designed by: {AUTHOR_NAME} | {AUTHOR_EMAIL} | {datetime.now().strftime('%Y-%m-%d')}"
         text_obj = paper_space.AddText(text_content, pt, 2.5)
 
         # User requested lowercase attribute
-        text_obj.color = 7
+        text_obj.color = AcColor.acWhite
 
     except Exception as e:
         print(f"Title block note: {e}")
@@ -56,32 +60,33 @@ def merge_pdfs_acrobat(pdf_list, output_path):
         print(f"Acrobat Error: {e}")
 
 
-def generate_report():
-    acad = win32com.client.Dispatch("AutoCAD.Application")
-    doc = acad.ActiveDocument
+def generate_report(output_dir=None):
+    """Plot, report and package the active drawing into output_dir (default OUTPUT_DIR)."""
+    doc = get_session().doc
+    output_dir = output_dir or OUTPUT_DIR
 
-    if not os.path.exists(OUTPUT_DIR):
-        os.makedirs(OUTPUT_DIR)
+    # exist_ok: parallel batch workers may create it at the same time
+    os.makedirs(output_dir, exist_ok=True)
 
     # 1. GATHER DATA (Read Only)
     print("Scanning Geometry...")
     layer_stats = {}
 
-    for obj in doc.ModelSpace:
-        l_name = obj.Layer
-        raw_type = obj.ObjectName.replace("AcDb", "")
+    # One columnar read instead of four __getattr__ round trips per object
+    entities = list(doc.ModelSpace)
+    props = read_properties(entities, ["Layer", "ObjectName", "Closed", "Area"])
+
+    for i in range(len(entities)):
+        l_name = props["Layer"][i]
+        raw_type = props["ObjectName"][i].replace("AcDb", "")
 
         # Refine type description (e.g. Check if Polyline is Closed)
         obj_desc = raw_type
-        if "Polyline" in raw_type:
-            # Check closed status safely
-            try:
-                if obj.Closed:
-                    obj_desc = "Polyline (Closed)"
-                else:
-                    obj_desc = "Polyline (Open)"
-            except:
-                pass
+        if "Polyline" in raw_type and props.valid["Closed"][i]:
+            if props["Closed"][i]:
+                obj_desc = "Polyline (Closed)"
+            else:
+                obj_desc = "Polyline (Open)"
 
         if l_name not in layer_stats:
             layer_stats[l_name] = {'count': 0, 'area': 0.0, 'types': {}}
@@ -95,15 +100,13 @@ def generate_report():
         else:
             layer_stats[l_name]['types'][obj_desc] = 1
 
-        # Sum Area
-        try:
-            layer_stats[l_name]['area'] += obj.Area
-        except:
-            pass
+        # Sum Area (entities without an Area are simply not valid here)
+        if props.valid["Area"][i]:
+            layer_stats[l_name]['area'] += props["Area"][i]
 
     # 2. PLOT DRAWING
     add_title_block(doc)
-    dwg_pdf_path = os.path.join(OUTPUT_DIR, DWG_PDF_NAME)
+    dwg_pdf_path = os.path.join(output_dir, DWG_PDF_NAME)
     doc.ActiveLayout.ConfigName = "DWG To PDF.pc3"
     doc.Plot.PlotToFile(dwg_pdf_path)
 
@@ -137,11 +140,11 @@ def generate_report():
         row = f"{layer:<20} | {data['count']:<6} | {area_m2:<10.2f} | {comp_str}"
         pdf.cell(w=0, h=8, text=row, new_x="LMARGIN", new_y="NEXT")
 
-    report_pdf_path = os.path.join(OUTPUT_DIR, REPORT_PDF_NAME)
+    report_pdf_path = os.path.join(output_dir, REPORT_PDF_NAME)
     pdf.output(report_pdf_path)
 
     # 4. MERGE
-    final_path = os.path.join(OUTPUT_DIR, FINAL_PACKAGE)
+    final_path = os.path.join(output_dir, FINAL_PACKAGE)
     merge_pdfs_acrobat([dwg_pdf_path, report_pdf_path], final_path)
 
 
@@ -1,7 +1,15 @@
 import win32com.client
 import pythoncom
 import os
-import time
+
+from com_retry import RetryPolicy, format_metrics, retrying
+
+
+def _connect():
+    acad = win32com.client.Dispatch("AutoCAD.Application")
+    # Check if AutoCAD is responsive by asking for a simple property
+    state = acad.Visible
+    return acad.ActiveDocument
 
 
 def import_door_photo_robust(image_path):
@@ -11,26 +19,14 @@ def import_door_photo_robust(image_path):
         print(f"Error: File not found at {abs_path}")
         return
 
-    acad = None
-    doc = None
-
-    # 2. Connection Retry Loop (Fixes 'Call rejected')
-    for i in range(5):
-        try:
-            # Check if we need to initialize COM for this thread
-            pythoncom.CoInitialize()
-            acad = win32com.client.Dispatch("AutoCAD.Application")
-
-            # Check if AutoCAD is responsive by asking for a simple property
-            state = acad.Visible
-            doc = acad.ActiveDocument
-            break  # Success!
-        except Exception as e:
-            print(f"AutoCAD busy... retrying ({i + 1}/5)")
-            time.sleep(2)  # Wait 2 seconds and try again
-
-    if doc is None:
-        print("Could not connect to AutoCAD. Is a dialog box open?")
+    # 2. Connect, retrying while AutoCAD rejects calls (Fixes 'Call rejected')
+    pythoncom.CoInitialize()
+    policy = RetryPolicy(deadline=20.0)
+    try:
+        doc = retrying(policy.call(_connect), policy)
+    except Exception as e:
+        print(f"Could not connect to AutoCAD ({e}). Is a dialog box open?")
+        print(format_metrics(policy.metrics))
         return
 
     # 3. Import Logic
@@ -59,6 +55,7 @@ def import_door_photo_robust(image_path):
 
     except Exception as e:
         print(f"Import failed: {e}")
+    print(format_metrics(policy.metrics))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,197 @@
+"""
+Many polylines as one set of NumPy arrays (CSR layout).
+
+    batch = read_polylines(polys)
+    batch.xy[batch.offsets[i]:batch.offsets[i + 1]]   # vertices of polyline i
+    batch.areas()                                     # (P,) float64, bulges included
+    batch.bounds()                                    # (P, 4) xmin ymin xmax ymax
+
+``xy`` holds every vertex of every polyline back to back, ``offsets`` the
+start of each polyline (length P + 1), ``bulges`` the bulge stored at each
+vertex and ``closed`` the Closed flag of each polyline.  Polylines that
+could not be read get zero vertices and valid[i] = False.
+
+Coordinates and Closed come through bulk_read.read_properties; the bulges
+need one GetBulge call per vertex, so pass bulges=False when the drawing
+is known to be straight-segment only.  LWPolylines report 2D coordinates,
+IAcadPolyline (AcDb2dPolyline) 3D ones; z is kept in ``z``.
+"""
+import itertools
+
+import numpy as np
+
+import dispatch_metadata
+from bulk_read import read_properties
+
+# ObjectName -> values per vertex in Coordinates
+_COORD_DIMS = {"AcDbPolyline": 2, "AcDb2dPolyline": 3}
+
+
+class PolylineBatch:
+    def __init__(self, xy, z, offsets, bulges, closed, valid, objects=None):
+        self.xy = xy
+        self.z = z
+        self.offsets = offsets
+        self.bulges = bulges
+        self.closed = closed
+        self.valid = valid
+        self.objects = objects
+
+    @classmethod
+    def from_vertices(cls, polygons, closed=None, bulges=None):
+        """Build a batch from Python data: a list of (n_i, 2) vertex sequences."""
+        arrays = [np.asarray(p, dtype=np.float64).reshape(-1, 2) for p in polygons]
+        counts = np.array([len(a) for a in arrays], dtype=np.int64)
+        offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        xy = np.concatenate(arrays) if arrays else np.zeros((0, 2))
+        bulge = np.zeros(len(xy)) if bulges is None else np.concatenate(
+            [np.asarray(b, dtype=np.float64) for b in bulges])
+        flags = np.zeros(len(arrays), dtype=bool) if closed is None else np.asarray(closed, dtype=bool)
+        return cls(xy, np.zeros(len(xy)), offsets, bulge, flags, np.ones(len(arrays), dtype=bool))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def counts(self):
+        return np.diff(self.offsets)
+
+    def vertices(self, i):
+        return self.xy[self.offsets[i]:self.offsets[i + 1]]
+
+    def _next_index(self):
+        # Index of the following vertex, wrapping to the first one within each polyline
+        nxt = np.arange(1, len(self.xy) + 1)
+        counts = self.counts()
+        last = self.offsets[1:][counts > 0] - 1
+        nxt[last] = self.offsets[:-1][counts > 0]
+        return nxt
+
+    def _segment_mask(self):
+        # The closing segment (last vertex -> first) only exists on closed polylines
+        mask = np.ones(len(self.xy), dtype=bool)
+        counts = self.counts()
+        open_ = (~self.closed) & (counts > 0)
+        mask[self.offsets[1:][open_] - 1] = False
+        return mask
+
+    def _reduce(self, values, empty=0.0):
+        out = np.full(len(self), empty, dtype=np.float64)
+        nonempty = self.counts() > 0
+        if nonempty.any():
+            out[nonempty] = np.add.reduceat(values, self.offsets[:-1][nonempty])
+        return out
+
+    def areas(self):
+        """Enclosed area per polyline, as AutoCAD's Area (open ones taken as closed)."""
+        nxt = self._next_index()
+        x, y = self.xy[:, 0], self.xy[:, 1]
+        twice = x * y[nxt] - x[nxt] * y
+        bulge = np.where(self._segment_mask(), self.bulges, 0.0)
+        arcs = bulge != 0
+        if arcs.any():
+            theta = 4 * np.arctan(bulge[arcs])
+            chord = np.hypot(x[nxt][arcs] - x[arcs], y[nxt][arcs] - y[arcs])
+            r = chord / (2 * np.sin(np.abs(theta) / 2))
+            twice[arcs] += r * r * (theta - np.sin(theta))
+        return np.abs(self._reduce(twice)) / 2
+
+    def lengths(self):
+        """Length per polyline, arcs included, closing segment only if closed."""
+        nxt = self._next_index()
+        chord = np.hypot(self.xy[nxt, 0] - self.xy[:, 0], self.xy[nxt, 1] - self.xy[:, 1])
+        seg = chord.copy()
+        arcs = self.bulges != 0
+        if arcs.any():
+            theta = 4 * np.arctan(np.abs(self.bulges[arcs]))
+            seg[arcs] = chord[arcs] / (2 * np.sin(theta / 2)) * theta
+        return self._reduce(np.where(self._segment_mask(), seg, 0.0))
+
+    def bounds(self):
+        """(P, 4) xmin, ymin, xmax, ymax of the vertices; NaN for empty polylines."""
+        out = np.full((len(self), 4), np.nan)
+        nonempty = self.counts() > 0
+        if nonempty.any():
+            starts = self.offsets[:-1][nonempty]
+            out[nonempty, 0:2] = np.minimum.reduceat(self.xy, starts)
+            out[nonempty, 2:4] = np.maximum.reduceat(self.xy, starts)
+        return out
+
+    def closure_gaps(self):
+        """Distance from the last vertex back to the first, per polyline."""
+        gaps = np.full(len(self), np.nan)
+        nonempty = self.counts() > 0
+        first = self.xy[self.offsets[:-1][nonempty]]
+        last = self.xy[self.offsets[1:][nonempty] - 1]
+        gaps[nonempty] = np.hypot(*(last - first).T)
+        return gaps
+
+    def nearly_closed(self, tol=1e-6):
+        """Open polylines whose ends already meet within tol (should just be Closed)."""
+        return ~self.closed & (self.closure_gaps() <= tol)
+
+
+def read_polylines(polylines, bulges=True, metadata=None):
+    """Read Coordinates, Closed (and bulges) of many polylines into a PolylineBatch."""
+    polylines = list(polylines)
+    table = read_properties(polylines, ["ObjectName", "Coordinates", "Closed"], metadata=metadata)
+    n = len(polylines)
+    valid = table.valid["Coordinates"] & table.valid["ObjectName"]
+    dims = np.array([_COORD_DIMS.get(table["ObjectName"][i], 0) if valid[i] else 0 for i in range(n)],
+                    dtype=np.int64)
+    valid &= dims > 0
+    coords = [table["Coordinates"][i] if valid[i] else () for i in range(n)]
+    flat_counts = np.array([len(c) for c in coords], dtype=np.int64)
+    flat = np.fromiter(itertools.chain.from_iterable(coords), dtype=np.float64, count=int(flat_counts.sum()))
+
+    counts = np.where(valid, flat_counts // np.maximum(dims, 1), 0)
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    flat_starts = np.concatenate(([0], np.cumsum(flat_counts)[:-1])) if n else np.zeros(0, dtype=np.int64)
+
+    # Position of each vertex's x in the flat array, for mixed 2D/3D input
+    dims_v = np.repeat(dims, counts)
+    local = np.arange(offsets[-1]) - np.repeat(offsets[:-1], counts)
+    at = np.repeat(flat_starts, counts) + local * dims_v
+    xy = np.column_stack((flat[at], flat[at + 1])) if len(at) else np.zeros((0, 2))
+    z = np.zeros(len(at))
+    three = dims_v == 3
+    z[three] = flat[at[three] + 2]
+
+    closed = np.zeros(n, dtype=bool)
+    closed[table.valid["Closed"]] = np.asarray(table["Closed"], dtype=bool)[table.valid["Closed"]]
+
+    bulge = np.zeros(len(xy))
+    if bulges:
+        getter = _BulgeReader(metadata)
+        for i in np.flatnonzero(counts):
+            try:
+                bulge[offsets[i]:offsets[i + 1]] = getter.read(polylines[i], table["ObjectName"][i], counts[i])
+            except Exception:
+                valid[i] = False
+    return PolylineBatch(xy, z, offsets, bulge, closed, valid, polylines)
+
+
+class _BulgeReader:
+    """GetBulge(i) through the typed method signature when the object has one."""
+
+    def __init__(self, metadata):
+        self.metadata = metadata
+        self.signatures = {}
+
+    def signature(self, object_name):
+        sig = self.signatures.get(object_name, False)
+        if sig is False:
+            if self.metadata is None:
+                self.metadata = dispatch_metadata.load_metadata()
+            meta = self.metadata.for_object_name(object_name)
+            sig = self.signatures[object_name] = meta.methods.get("GetBulge") if meta else None
+        return sig
+
+    def read(self, polyline, object_name, count):
+        ole = polyline.__dict__.get("_oleobj_") if hasattr(polyline, "__dict__") else None
+        sig = self.signature(object_name)
+        if ole is not None and sig is not None:
+            dispid, flags, ret_type, arg_types, _clsid = sig
+            return [ole.InvokeTypes(dispid, 0, flags, ret_type, arg_types, k) for k in range(count)]
+        return [polyline.GetBulge(k) for k in range(count)]
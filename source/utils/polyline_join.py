@@ -0,0 +1,291 @@
+"""
+Join touching lines and open polylines into polylines, without _JOIN.
+
+    report = join_drawing(doc)                   # model space, every layer
+    report = join_drawing(doc, F.layer == "A-GLAZ", tol=1e-4)
+    print(report)    # 1200 pieces -> 300 polylines (300 closed), 0 skipped in 0.84s [...]
+
+The geometry is read once (bulk_read), joined here and written back as
+one DrawBatch of LWPolylines; the pieces that went into them are then
+erased with bulk_erase.  The result does not depend on what AutoCAD
+happens to pick first, and there is no command to wait for.
+
+join_paths() is the offline part and works on plain vertex arrays:
+
+    result = join_paths([[(0, 0), (1, 0)], [(1, 0), (1, 1)], [(1, 1), (0, 0)]])
+    result.paths[0], result.closed[0]       # [[0, 0], [1, 0], [1, 1]], True
+
+Endpoints closer than ``tol`` are snapped together through a hash grid
+of tol-sized cells (each endpoint only looks at the 3x3 cells around
+it), so snapping and chaining are both linear in the number of pieces.
+Pieces are chained through endpoints that exactly two pieces share;
+where three or more meet, the chains stop, as JOIN does.  A chain that
+comes back to where it started is a closed ring (unless it only doubles
+back over itself, as a duplicated or reversed line does; those pieces
+are left alone).  Only pieces with the
+same layer, color, linetype, lineweight and elevation are joined, and the
+polyline made from them gets those; lines sloping in Z and polylines
+with arcs are left as they are.
+"""
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from bulk_erase import bulk_erase
+from bulk_read import read_properties
+from com_arrays import double_variant, object_variant
+from draw_batch import DrawBatch
+from polyline_batch import read_polylines
+from selection_filter import F, MODEL, as_filter, filter_variants, select
+
+TOL = 1e-6
+
+JoinResult = namedtuple("JoinResult", "paths closed sources degenerate")
+JoinResult.__doc__ = """\
+paths: (k, 2) vertex arrays, the closing vertex of closed ones dropped;
+closed: bool array, one per path; sources: the input indices each path
+was made of, in order; degenerate: inputs whose two ends snap to one
+point without enclosing anything (zero-length lines), left out of paths."""
+
+
+def snap_points(points, tol=TOL):
+    """
+    Node index per point: points within tol of an earlier node's point
+    get that node.  Returns (nodes, node_points) with node_points the
+    coordinates of the first point of each node.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if tol <= 0:
+        raise ValueError("tol must be positive")
+    cells = np.floor(points / tol).astype(np.int64).tolist()
+    xy = points.tolist()
+    grid = {}  # (cx, cy) -> node indices with their first point in that cell
+    firsts = []
+    nodes = np.empty(len(xy), dtype=np.int64)
+    tol2 = tol * tol
+    for i, ((x, y), (cx, cy)) in enumerate(zip(xy, cells)):
+        found = -1
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                for node in grid.get((gx, gy), ()):
+                    fx, fy = firsts[node]
+                    if (fx - x) ** 2 + (fy - y) ** 2 <= tol2:
+                        found = node
+                        break
+                if found >= 0:
+                    break
+            if found >= 0:
+                break
+        if found < 0:
+            found = len(firsts)
+            firsts.append((x, y))
+            grid.setdefault((cx, cy), []).append(found)
+        nodes[i] = found
+    return nodes, np.array(firsts, dtype=np.float64).reshape(-1, 2)
+
+
+def join_paths(paths, tol=TOL):
+    """Chain open vertex paths (lines are two-vertex paths) that meet end to end; returns a JoinResult."""
+    paths = [np.asarray(p, dtype=np.float64).reshape(-1, 2) for p in paths]
+    if any(len(p) < 2 for p in paths):
+        raise ValueError("every path needs at least two vertices")
+    ends = np.array([(p[0], p[-1]) for p in paths], dtype=np.float64).reshape(-1, 2)
+    nodes, node_xy = snap_points(ends, tol)
+    a, b = nodes[0::2].tolist(), nodes[1::2].tolist()
+
+    out_paths, out_closed, out_sources, degenerate = [], [], [], []
+    adjacency = [[] for _ in range(len(node_xy))]
+    for i in range(len(paths)):
+        if a[i] != b[i]:
+            adjacency[a[i]].append(i)
+            adjacency[b[i]].append(i)
+        elif len(paths[i]) >= 3 and len(np.unique(paths[i][:-1], axis=0)) >= 3:
+            # Its own ends meet: a ring by itself, not joined to anything else
+            ring = paths[i][:-1].copy()
+            ring[0] = node_xy[a[i]]
+            out_paths.append(ring)
+            out_closed.append(True)
+            out_sources.append([i])
+        else:
+            degenerate.append(i)
+    used = [False] * len(paths)
+
+    def walk(start, edge):
+        # Follow the chain from node start along edge until it ends, branches or closes
+        pieces, sources, joints, node = [], [], [], start
+        while True:
+            used[edge] = True
+            sources.append(edge)
+            joints.append(node)
+            forward = a[edge] == node
+            pieces.append((paths[edge] if forward else paths[edge][::-1])[:-1])
+            node = b[edge] if forward else a[edge]
+            if node == start or len(adjacency[node]) != 2:
+                break
+            edge = adjacency[node][0] if adjacency[node][0] != edge else adjacency[node][1]
+            if used[edge]:
+                break
+        if node == start and len(np.unique(np.concatenate(pieces), axis=0)) < 3:
+            # Back where it started without enclosing anything (a piece and its duplicate
+            # or reverse): a doubled-back polyline would replace both, so keep them as they are
+            for edge in sources:
+                out_paths.append(paths[edge])
+                out_closed.append(False)
+                out_sources.append([edge])
+            return
+        closed = node == start
+        if not closed:
+            pieces.append(node_xy[node][None])
+        vertices = np.concatenate(pieces)
+        # Snap the joints: each piece starts exactly on the node it shares with the one before
+        vertices[np.cumsum([0] + [len(p) for p in pieces[:len(sources) - 1]])] = node_xy[joints]
+        out_paths.append(vertices)
+        out_closed.append(closed)
+        out_sources.append(sources)
+
+    # Chains run between nodes where the count of pieces is not two...
+    for node, edges in enumerate(adjacency):
+        if len(edges) != 2:
+            for edge in edges:
+                if not used[edge]:
+                    walk(node, edge)
+    # ...and whatever is left is made of pure rings
+    for node, edges in enumerate(adjacency):
+        for edge in edges:
+            if not used[edge]:
+                walk(node, edge)
+    return JoinResult(out_paths, np.array(out_closed, dtype=bool), out_sources, degenerate)
+
+
+# --- in a drawing ---
+
+class JoinReport:
+    def __init__(self):
+        self.pieces = 0  # lines and open polylines read
+        self.skipped = 0  # polylines with arcs, sloped lines, entities that could not be read
+        self.degenerate = 0  # zero-length pieces, left alone
+        self.polylines = 0  # replacement polylines made
+        self.closed = 0  # of which closed
+        self.failed = 0  # replacements AutoCAD refused; their pieces are kept
+        self.erased = 0  # pieces erased after their replacement was made
+        self.timings = {}  # phase -> seconds
+        self.seconds = 0.0
+
+    def _time(self, phase, start):
+        self.timings[phase] = self.timings.get(phase, 0.0) + time.perf_counter() - start
+
+    def as_dict(self):
+        return {"pieces": self.pieces, "skipped": self.skipped, "degenerate": self.degenerate,
+                "polylines": self.polylines, "closed": self.closed, "failed": self.failed,
+                "erased": self.erased, "seconds": self.seconds, "timings": dict(self.timings)}
+
+    def __str__(self):
+        phases = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in self.timings.items())
+        return (f"{self.pieces} pieces -> {self.polylines} polylines ({self.closed} closed), "
+                f"{self.skipped} skipped, {self.failed} failed in {self.seconds:.2f}s [{phases}]")
+
+
+STYLE = ["Layer", "color", "Linetype", "Lineweight"]  # what a joined polyline takes over, besides elevation
+
+
+def _explicit(value):
+    """value, or None where it is ByLayer (color 256, lineweight -1, linetype "ByLayer"), the default."""
+    if isinstance(value, str):
+        return None if value.upper() == "BYLAYER" else value
+    return None if value in (256, -1) else value
+
+
+def _read_pieces(objects, bulges, report):
+    """
+    (layer, color, linetype, lineweight, elevation) -> ([(k, 2) vertices], [handle])
+    of the level lines and arc-free open polylines.
+    """
+    names = ["ObjectName", "Handle"] + STYLE
+    table = read_properties(objects, names, as_numpy=False)
+    ok = [all(table.valid[name][i] for name in names) for i in range(len(objects))]
+    lines = [i for i in range(len(objects)) if ok[i] and table["ObjectName"][i] == "AcDbLine"]
+    polys = [i for i in range(len(objects)) if ok[i] and table["ObjectName"][i] == "AcDbPolyline"]
+    report.skipped += len(objects) - len(lines) - len(polys)
+    groups = {}
+
+    def add(i, elevation, path):
+        key = tuple(table[name][i] for name in STYLE) + (float(elevation),)
+        paths, handles = groups.setdefault(key, ([], []))
+        paths.append(path)
+        handles.append(table["Handle"][i])
+
+    ends = read_properties([objects[i] for i in lines], ["StartPoint", "EndPoint"], as_numpy=False)
+    for k, i in enumerate(lines):
+        start, end = ends["StartPoint"][k], ends["EndPoint"][k]
+        # A polyline has one elevation: lines that slope in Z stay lines
+        if ends.valid["StartPoint"][k] and ends.valid["EndPoint"][k] and start[2] == end[2]:
+            add(i, start[2], [tuple(start)[:2], tuple(end)[:2]])
+        else:
+            report.skipped += 1
+    batch = read_polylines([objects[i] for i in polys], bulges=bulges)
+    levels = read_properties([objects[i] for i in polys], ["Elevation"], as_numpy=False)
+    for k, i in enumerate(polys):
+        start, stop = batch.offsets[k], batch.offsets[k + 1]
+        if (batch.valid[k] and levels.valid["Elevation"][k] and stop - start >= 2
+                and not batch.bulges[start:stop].any()):
+            add(i, levels["Elevation"][k], batch.xy[start:stop])
+        else:
+            report.skipped += 1
+    return groups
+
+
+def join_drawing(doc, flt=None, tol=TOL, bulges=True, mode="auto", watcher=None,
+                 to_variant=double_variant, to_variants=filter_variants, to_objects=object_variant):
+    """
+    Join the lines and open LWPolylines in model space (those matching flt
+    too, if given) into polylines; returns a JoinReport.  bulges=False
+    skips reading bulges, for drawings known to have no arcs.  mode and
+    watcher go to DrawBatch.run; the to_* hooks build COM arguments (plain
+    tuples for fakes).
+    """
+    report = JoinReport()
+    t0 = time.perf_counter()
+    target = ((F.type == "LINE") | ((F.type == "LWPOLYLINE") & ~F.flags.has(1))) & (F.space == MODEL)
+    if flt is not None:
+        target = target & as_filter(flt)
+
+    start = time.perf_counter()
+    objects = select(doc, target, to_variants=to_variants)
+    report.pieces = len(objects)
+    report._time("select", start)
+
+    start = time.perf_counter()
+    groups = _read_pieces(objects, bulges, report)
+    report._time("read", start)
+
+    start = time.perf_counter()
+    draw = DrawBatch()
+    replaced = []  # handles of the pieces behind each queued polyline
+    for (layer, color, linetype, lineweight, elevation), (paths, handles) in groups.items():
+        result = join_paths(paths, tol)
+        report.degenerate += len(result.degenerate)
+        for path, closed, sources in zip(result.paths, result.closed.tolist(), result.sources):
+            if len(sources) == 1 and not closed:
+                continue  # nothing to join it to: leave the original
+            draw.polyline(path, closed=closed, layer=layer, elevation=elevation, color=_explicit(color),
+                          linetype=_explicit(linetype), lineweight=_explicit(lineweight))
+            replaced.append([handles[s] for s in sources])
+            report.closed += closed
+    report._time("join", start)
+
+    if draw.ops:
+        start = time.perf_counter()
+        made = draw.run(doc, mode=mode, watcher=watcher, to_variant=to_variant)
+        report._time("draw", start)
+        report.polylines = sum(handle is not None for handle in made)
+        report.failed = len(made) - report.polylines
+        report.closed -= sum(draw.ops[k][2] for k, handle in enumerate(made) if handle is None)
+        pieces = [h for handle, handles in zip(made, replaced) if handle is not None for h in handles]
+        if pieces:
+            start = time.perf_counter()
+            report.erased = bulk_erase(doc, handles=pieces, to_variants=to_variants,
+                                       to_objects=to_objects).erased
+            report._time("erase", start)
+    report.seconds = time.perf_counter() - t0
+    return report
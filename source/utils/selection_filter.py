@@ -0,0 +1,305 @@
+"""
+Selection filters: let AutoCAD pick the entities instead of testing each
+one in Python.
+
+    from selection_filter import F, compile_filter, selection
+
+    flt = (F.layer == "A-GLAZ") & F.type.isin({"LWPOLYLINE", "LINE"})
+    flt = compile_filter('layer == "A-GLAZ" and type in {"LWPOLYLINE", "LINE"}')   # same filter
+    with selection(doc, flt) as ss:         # a named selection set, deleted on exit
+        print(ss.Count)
+        for obj in ss: ...
+
+A filter compiles to the DXF group-code lists that
+IAcadSelectionSet.Select takes as FilterType/FilterData, so the test runs
+inside AutoCAD and only matching entities come back over COM:
+
+    flt.pairs()   # [(8, 'A-GLAZ'), (0, 'LINE,LWPOLYLINE')]
+
+Fields are the F attributes (type, layer, color, linetype, handle, block,
+space, layout, flags).  Strings compare case-insensitively, as AutoCAD
+does; == matches the text exactly, .like() takes an AutoCAD wildcard
+pattern ("A-*", "WALL-##", "[AB]*", "~X*"), .isin() any of several values.
+Numbers also take <, <=, >, >=, and flags.has(bits) tests bits (flags.has(1)
+is a closed polyline).  Combine with & (and), | (or) and ~ (not); the
+comparison operators bind looser than these, so parenthesize each test.
+compile_filter() accepts the same tests as a Python expression written
+with and/or/not.
+
+Select mode acSelectionSetAll looks at model space and every layout, so
+restrict with F.space == MODEL or F.layout == name when that matters.
+"""
+import array
+import ast
+import uuid
+from contextlib import contextmanager
+
+acSelectionSetAll = 5
+MODEL = 0  # values of F.space (group 67)
+PAPER = 1
+PREFIX = "PYSEL_"  # name prefix of the selection sets made here
+
+VT_I2 = 2
+VT_VARIANT = 12
+VT_ARRAY = 0x2000
+
+_WILDCARD_CHARS = set("#@.*?~[],`")
+
+
+def escape(text):
+    """text as a wildcard pattern that only matches itself."""
+    return "".join("`" + c if c in _WILDCARD_CHARS else c for c in str(text))
+
+
+class Filter:
+    """A node of a filter expression; pairs() gives its DXF group codes."""
+
+    def __and__(self, other):
+        return _All(self, other)
+
+    def __or__(self, other):
+        return _Any(self, other)
+
+    def __invert__(self):
+        return _Not(self)
+
+    def pairs(self):
+        """(group code, value) list for the whole filter (top level ANDs implicitly)."""
+        return self._pairs(top=True)
+
+    def compile(self):
+        """(FilterType, FilterData) as two tuples."""
+        pairs = self.pairs()
+        return tuple(code for code, _ in pairs), tuple(value for _, value in pairs)
+
+    def __repr__(self):
+        return f"<Filter {self.pairs()!r}>"
+
+
+class _Test(Filter):
+    def __init__(self, code, value, op=None):
+        self.code = code
+        self.value = value
+        self.op = op  # relational operator for numbers, e.g. ">="
+
+    def _pairs(self, top=False):
+        return ([(-4, self.op)] if self.op else []) + [(self.code, self.value)]
+
+
+class _Group(Filter):
+    name = None
+
+    def __init__(self, *terms):
+        self.terms = []
+        for term in terms:
+            # (a & b) & c is one AND group, not two
+            self.terms.extend(term.terms if type(term) is type(self) else [term])
+
+    def _inner(self):
+        return [pair for term in self.terms for pair in term._pairs()]
+
+    def _pairs(self, top=False):
+        return [(-4, f"<{self.name}")] + self._inner() + [(-4, f"{self.name}>")]
+
+
+class _All(_Group):
+    name = "AND"
+
+    def _pairs(self, top=False):
+        return self._inner() if top else super()._pairs()
+
+
+class _Any(_Group):
+    name = "OR"
+
+    def _inner(self):
+        # Wildcard tests on the same string field merge into one "A,B" pattern
+        merged, pairs = {}, []
+        for term in self.terms:
+            if (isinstance(term, _Test) and term.op is None and isinstance(term.value, str)
+                    and not term.value.startswith("~")):
+                if term.code in merged:
+                    i = merged[term.code]
+                    pairs[i] = (term.code, pairs[i][1] + "," + term.value)
+                    continue
+                merged[term.code] = len(pairs)
+            pairs.extend(term._pairs())
+        return pairs
+
+    def _pairs(self, top=False):
+        inner = self._inner()
+        return inner if len(inner) == 1 else [(-4, "<OR")] + inner + [(-4, "OR>")]
+
+
+class _Not(_Group):
+    name = "NOT"
+
+    def __init__(self, term):
+        super().__init__()
+        self.terms = [term]
+
+    def _inner(self):
+        # A nested AND keeps its own <AND ... AND>: NOT takes a single operand
+        return self.terms[0]._pairs()
+
+
+class Field:
+    """One DXF group code; comparing it gives a Filter."""
+
+    def __init__(self, name, code, text=True):
+        self.name = name
+        self.code = code
+        self.text = text
+
+    def _number(self, op, value):
+        if self.text:
+            raise TypeError(f"{self.name} is text; {op} needs a numeric field")
+        return _Test(self.code, value, op)
+
+    def __eq__(self, value):
+        return _Test(self.code, escape(value)) if self.text else _Test(self.code, value)
+
+    def __ne__(self, value):
+        return _Not(self == value) if self.text else _Test(self.code, value, "!=")
+
+    def __lt__(self, value):
+        return self._number("<", value)
+
+    def __le__(self, value):
+        return self._number("<=", value)
+
+    def __gt__(self, value):
+        return self._number(">", value)
+
+    def __ge__(self, value):
+        return self._number(">=", value)
+
+    __hash__ = object.__hash__
+
+    def like(self, pattern):
+        if not self.text:
+            raise TypeError(f"{self.name} is a number; like() needs a text field")
+        return _Test(self.code, pattern)
+
+    def isin(self, values):
+        values = sorted(values) if isinstance(values, (set, frozenset)) else list(values)
+        if not values:
+            raise ValueError(f"{self.name}.isin() needs at least one value")
+        if self.text:
+            return _Test(self.code, ",".join(escape(v) for v in values))
+        return _Any(*(self == v for v in values))
+
+    def has(self, bits):
+        """All of these bits set (relational operator &=)."""
+        return self._number("&=", bits)
+
+    def __repr__(self):
+        return f"<Field {self.name} ({self.code})>"
+
+
+class F:
+    type = Field("type", 0)  # DXF entity name: LINE, LWPOLYLINE, INSERT, VIEWPORT...
+    handle = Field("handle", 5)
+    linetype = Field("linetype", 6)
+    layer = Field("layer", 8)
+    block = Field("block", 2)  # block name of an INSERT
+    color = Field("color", 62, text=False)
+    space = Field("space", 67, text=False)  # MODEL or PAPER
+    layout = Field("layout", 410)
+    flags = Field("flags", 70, text=False)
+
+
+_FIELDS = {name: value for name, value in vars(F).items() if isinstance(value, Field)}
+_COMPARE = {ast.Eq: "__eq__", ast.NotEq: "__ne__", ast.Lt: "__lt__", ast.LtE: "__le__",
+            ast.Gt: "__gt__", ast.GtE: "__ge__"}
+
+
+def compile_filter(text):
+    """Filter from a Python expression over the F fields, e.g. 'layer == "0" and not type == "VIEWPORT"'."""
+    return _build(ast.parse(text, mode="eval").body, text)
+
+
+def _build(node, text):
+    if isinstance(node, ast.BoolOp):
+        terms = [_build(v, text) for v in node.values]
+        return _All(*terms) if isinstance(node.op, ast.And) else _Any(*terms)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        return _Not(_build(node.operand, text))
+    if isinstance(node, ast.Compare) and len(node.ops) == 1:
+        field, op, value = _field(node.left, text), node.ops[0], _constant(node.comparators[0], text)
+        if isinstance(op, (ast.In, ast.NotIn)):
+            test = field.isin(value)
+            return test if isinstance(op, ast.In) else _Not(test)
+        if type(op) in _COMPARE:
+            return getattr(field, _COMPARE[type(op)])(value)
+    if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+            and node.func.attr in ("like", "has", "isin") and len(node.args) == 1):
+        return getattr(_field(node.func.value, text), node.func.attr)(_constant(node.args[0], text))
+    raise ValueError(f"unsupported filter expression: {ast.get_source_segment(text, node)}")
+
+
+def _field(node, text):
+    if isinstance(node, ast.Name) and node.id in _FIELDS:
+        return _FIELDS[node.id]
+    raise ValueError(f"not a filter field: {ast.get_source_segment(text, node)} "
+                     f"(fields: {', '.join(_FIELDS)})")
+
+
+def _constant(node, text):
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        raise ValueError(f"not a constant: {ast.get_source_segment(text, node)}") from None
+
+
+def as_filter(flt):
+    return compile_filter(flt) if isinstance(flt, str) else flt
+
+
+def filter_variants(codes, values):
+    """FilterType (VT_ARRAY|VT_I2) and FilterData (VT_ARRAY|VT_VARIANT) arguments."""
+    import win32com.client
+
+    return (win32com.client.VARIANT(VT_ARRAY | VT_I2, array.array("h", codes)),
+            win32com.client.VARIANT(VT_ARRAY | VT_VARIANT, list(values)))
+
+
+def purge_selection_sets(doc, prefix=PREFIX):
+    """Delete selection sets left behind under prefix (e.g. by a crashed run); returns how many."""
+    sets = doc.SelectionSets
+    stale = [s for s in sets if s.Name.upper().startswith(prefix.upper())]
+    for sset in stale:
+        sset.Delete()
+    return len(stale)
+
+
+@contextmanager
+def selection_set(doc, name=None):
+    """
+    An empty named selection set, deleted again on exit.  AutoCAD allows a
+    limited number of named sets per drawing, so sets are never left behind.
+    """
+    sset = doc.SelectionSets.Add(name or PREFIX + uuid.uuid4().hex[:12].upper())
+    try:
+        yield sset
+    finally:
+        sset.Delete()
+
+
+@contextmanager
+def selection(doc, flt=None, mode=acSelectionSetAll, name=None, to_variants=filter_variants):
+    """A selection set of the entities matching flt (a Filter or filter text), deleted on exit."""
+    with selection_set(doc, name) as sset:
+        if flt is None:
+            sset.Select(mode)
+        else:
+            codes, values = as_filter(flt).compile()
+            filter_type, filter_data = to_variants(codes, values)
+            sset.Select(mode, None, None, filter_type, filter_data)
+        yield sset
+
+
+def select(doc, flt, mode=acSelectionSetAll, to_variants=filter_variants):
+    """The matching entities as a list (the selection set itself is gone)."""
+    with selection(doc, flt, mode, to_variants=to_variants) as sset:
+        return list(sset)
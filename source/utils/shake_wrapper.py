@@ -0,0 +1,198 @@
+"""
+Emit a slim AutoCAD_Wrapper with only the interfaces a project reaches.
+
+    python shake_wrapper.py                          # scan source/utils and examples
+    python shake_wrapper.py --scan my_script.py      # scan specific files/dirs
+    python shake_wrapper.py --keep IAcadDocument IAcadLWPolyline --all-members
+
+Starting from IAcadApplication (what Dispatch("AutoCAD.Application")
+returns) plus any interface named in the scanned code, the generator
+follows the result types of the members the code actually uses: a script
+that touches ``doc.ModelSpace`` and ``msp.AddLine`` keeps IAcadModelSpace
+and IAcadLine, not the fifty other types ModelSpace's Add* methods return.
+ObjectName strings ("AcDbPolyline") pull in their interface as well.
+--all-members follows every member instead (the full transitive closure).
+
+Class bodies, DISPIDs, vtables and registration maps are copied verbatim
+from AutoCAD_Wrapper.py, so the result can be imported in its place:
+
+    import AutoCAD_Wrapper_slim as AutoCAD_Wrapper
+
+A call that returns an interface left out still works: win32com finds no
+class for its CLSID and hands back a late-bound dispatch object.
+``constants`` is the lazy, enum-grouped view from AutoCAD_Constants.
+"""
+import argparse
+import ast
+import glob
+import os
+import pprint
+
+from dispatch_metadata import OBJECT_NAME_INTERFACES, extract_metadata
+from wrapper_source import SOURCE_DIR, WRAPPER_PATH, WrapperSource
+
+SLIM_PATH = os.path.join(SOURCE_DIR, "AutoCAD_Wrapper_slim.py")
+DEFAULT_SCAN = [os.path.join(SOURCE_DIR, "utils"), os.path.join(os.path.dirname(SOURCE_DIR), "examples")]
+ROOTS = ("IAcadApplication",)
+
+# Build/test tooling that names interfaces without using them
+_TOOLING = {"wrapper_source.py", "build_lazy_wrapper.py", "dispatch_metadata.py", "shake_wrapper.py",
+            "fake_acad.py", "com_recorder.py"}
+
+
+def _python_files(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            yield from sorted(p for p in glob.glob(os.path.join(path, "**", "*.py"), recursive=True)
+                              if os.path.basename(p) not in _TOOLING)
+        else:
+            yield path
+
+
+def scan_names(paths):
+    """Every identifier, attribute name and string constant in the given scripts."""
+    names = set()
+    for path in _python_files(paths):
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=path)
+        # Docstrings mention interfaces without using them
+        docstrings = {id(node.body[0].value) for node in ast.walk(tree)
+                      if isinstance(node, (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef))
+                      and ast.get_docstring(node) is not None}
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Attribute):
+                names.add(node.attr)
+            elif isinstance(node, ast.Name):
+                names.add(node.id)
+            elif isinstance(node, ast.Constant) and isinstance(node.value, str) and id(node) not in docstrings:
+                names.update(node.value.replace(",", " ").split())
+    return names
+
+
+def _object_name_interface(name):
+    if name in OBJECT_NAME_INTERFACES:
+        return OBJECT_NAME_INTERFACES[name]
+    return "IAcad" + name[4:] if name.startswith("AcDb") else None
+
+
+def reachable(interfaces, roots, used=None):
+    """
+    Names of the interfaces reachable from roots through member result
+    types.  used limits which members are followed (None: all of them).
+    """
+    by_clsid = {m.clsid.upper(): name for name, m in interfaces.items() if m.clsid}
+    keep = set()
+    stack = [r for r in roots if r in interfaces]
+    while stack:
+        name = stack.pop()
+        if name in keep:
+            continue
+        keep.add(name)
+        meta = interfaces[name]
+        for table in (meta.prop_get, meta.methods):
+            for member, entry in table.items():
+                if used is not None and member not in used:
+                    continue
+                result = by_clsid.get(str(entry[-1]).upper()) if entry[-1] else None
+                if result is not None and result not in keep:
+                    stack.append(result)
+    return keep
+
+
+def select_classes(source, interfaces, keep):
+    """Wrapper classes to emit: kept interfaces, their coclasses and what those need."""
+    selected = set(keep)
+    for name, info in source.classes.items():
+        # A coclass comes along with its interface (AcadApplication with IAcadApplication)
+        if info.kind == "coclass" and any(d in keep for d in info.deps):
+            selected.add(name)
+    stack = list(selected)
+    while stack:
+        for dep in source.classes[stack.pop()].deps:
+            if dep not in selected:
+                selected.add(dep)
+                stack.append(dep)
+    return selected
+
+
+def render_slim(source, selected, total_interfaces):
+    # Original order: makepy already puts every class after the ones it refers to
+    classes = [name for name in source.classes if name in selected and name != "constants"]
+    iids = {name: iid for name, iid in source.maps["NamesToIIDMap"].items() if name in selected}
+    clsid_map = {clsid: name for clsid, name in source.maps["CLSIDToClassMap"].items() if name in selected}
+    vtable_map = {iid: name for iid, name in source.maps["VTablesToClassMap"].items() if name in selected}
+    kept_interfaces = sum(source.classes[n].kind == "dispatch" for n in classes)
+
+    head = source.text[:source.preamble.start].rstrip("\n")
+    parts = [
+        head, "\n",
+        f"# Slim build by utils/shake_wrapper.py: {kept_interfaces} of {total_interfaces} interfaces.\n",
+        "# Regenerate it instead of editing; class bodies are copied from AutoCAD_Wrapper.py.\n\n",
+        source.source(source.preamble),
+        # makepy imports these just before the first class that needs them
+        "from win32com.client import DispatchBaseClass\n",
+        "from win32com.client import CoClassBaseClass\n\n",
+    ]
+    for name in classes:
+        parts.append(source.source(source.classes[name][1:3]))
+        parts.append("\n\n")
+    for name, span in source.vtables.items():
+        owner = name[:-len("_vtables_dispatch_")] if name.endswith("_vtables_dispatch_") \
+            else name[:-len("_vtables_")]
+        if owner in selected:
+            parts.append(source.source(span))
+            parts.append("\n")
+    parts += [
+        "\nRecordMap = {\n}\n\n",
+        "CLSIDToClassMap = {\n",
+        "".join(f"\t{clsid!r} : {name},\n" for clsid, name in clsid_map.items()),
+        "}\n",
+        "CLSIDToPackageMap = {}\n",
+        "win32com.client.CLSIDToClass.RegisterCLSIDsFromDict( CLSIDToClassMap )\n",
+        "VTablesToPackageMap = {}\n",
+        "VTablesToClassMap = %s\n" % pprint.pformat(vtable_map, width=120),
+        "\nNamesToIIDMap = %s\n" % pprint.pformat(iids, width=120),
+        "\n# Lazy enum-grouped constants instead of makepy's 898-entry class\n",
+        "from AutoCAD_Constants import constants\n",
+        "if constants not in win32com.client.constants.__dicts__:\n",
+        "\twin32com.client.constants.__dicts__.append(constants)\n",
+    ]
+    return "".join(parts)
+
+
+def build_slim(out_path=SLIM_PATH, wrapper_path=WRAPPER_PATH, scan=None, keep=(), all_members=False):
+    """Write the slim wrapper; returns the names of the interfaces kept."""
+    source = WrapperSource(wrapper_path)
+    interfaces = extract_metadata(source)
+    roots = set(ROOTS) | set(keep)
+    used = None
+    if scan is not None or not keep:
+        names = scan_names(scan if scan is not None else DEFAULT_SCAN)
+        roots |= {n for n in names if n in interfaces}
+        roots |= {_object_name_interface(n) for n in names if n.startswith("AcDb")} & set(interfaces)
+        used = None if all_members else names
+    elif not all_members:
+        used = set()  # allow-list only: just the named interfaces
+    kept = reachable(interfaces, roots, used)
+    selected = select_classes(source, interfaces, kept)
+    total = sum(c.kind == "dispatch" for c in source.classes.values())
+    text = render_slim(source, selected, total)
+    with open(out_path, "w", newline="\n") as f:
+        f.write(text)
+    interfaces_kept = sorted(n for n in selected if source.classes[n].kind == "dispatch")
+    print(f"Kept {len(interfaces_kept)} of {total} interfaces ({len(selected)} classes, "
+          f"{len(text) // 1024} KB of {len(source.data) // 1024} KB) -> {out_path}")
+    return interfaces_kept
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a tree-shaken AutoCAD_Wrapper")
+    parser.add_argument("--scan", nargs="+", help="scripts or directories to scan (default: source/utils and examples)")
+    parser.add_argument("--keep", nargs="+", default=[], help="interfaces to keep regardless of the scan")
+    parser.add_argument("--all-members", action="store_true",
+                        help="follow the result type of every member, not just the ones the code uses")
+    parser.add_argument("--wrapper", default=WRAPPER_PATH)
+    parser.add_argument("--out", default=SLIM_PATH)
+    args = parser.parse_args()
+    kept = build_slim(args.out, args.wrapper, args.scan, args.keep, args.all_members)
+    print(" ".join(kept))
@@ -0,0 +1,140 @@
+"""
+Static reader for the makepy module AutoCAD_Wrapper.py.
+
+The generated module cannot be imported without pywin32, and importing it
+runs all 31k lines anyway.  WrapperSource parses the file with ``ast``
+instead and records where every class, vtable list and registration map
+lives, so build steps can slice the module without executing it.
+"""
+import ast
+import os
+import re
+from collections import namedtuple
+
+SOURCE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WRAPPER_PATH = os.path.join(SOURCE_DIR, "AutoCAD_Wrapper.py")
+
+# start/end are byte offsets into the wrapper file, lineno is 1-based.
+# kind is "dispatch", "coclass", "events" or "constants"; deps lists the
+# other wrapper classes that must exist before this class body can run.
+ClassInfo = namedtuple("ClassInfo", "name start end lineno kind clsid deps")
+Span = namedtuple("Span", "start end lineno")
+
+# makepy flattens every enum into `class constants`, tagging each member:
+#     acRed                         =1          # from enum AcColor
+_ENUM_MEMBER = re.compile(r"^\t(\w+)\s*=(-?\d+)\s*# from enum (\w+)$", re.M)
+
+MAP_NAMES = ("RecordMap", "CLSIDToClassMap", "CLSIDToPackageMap",
+             "VTablesToPackageMap", "VTablesToClassMap", "NamesToIIDMap")
+
+
+class WrapperSource:
+    """Parsed view of AutoCAD_Wrapper.py (or any makepy output)."""
+
+    def __init__(self, path=WRAPPER_PATH):
+        self.path = path
+        with open(path, "rb") as f:
+            self.data = f.read()
+        # makepy declares 'mbcs', which only exists on Windows; the AutoCAD
+        # dump is plain ASCII so decode it directly.
+        self.text = self.data.decode("ascii")
+        self.tree = ast.parse(self.text, filename=path)
+
+        self._line_starts = [0]
+        pos = self.text.find("\n")
+        while pos != -1:
+            self._line_starts.append(pos + 1)
+            pos = self.text.find("\n", pos + 1)
+
+        self.classes = {}
+        self.vtables = {}
+        self.maps = {}
+        self.enums = {}
+        self.preamble = None
+        self._scan()
+
+    def offset(self, lineno, col=0):
+        return self._line_starts[lineno - 1] + col
+
+    def span_of(self, node):
+        """Byte range of a statement, through the end of its last line so a
+        trailing comment (makepy's '# from enum X') is kept."""
+        start = self.offset(node.lineno, node.col_offset)
+        if node.end_lineno < len(self._line_starts):
+            end = self._line_starts[node.end_lineno] - 1
+        else:
+            end = len(self.text)
+        return start, end
+
+    def source(self, span):
+        return self.text[span[0]:span[1]]
+
+    def _scan(self):
+        body = self.tree.body
+        # Everything between the module docstring and the first class is the
+        # preamble: imports, default arg markers, CLSID, LCID...
+        first = 1 if isinstance(body[0], ast.Expr) else 0
+        first_class = next(n for n in body if isinstance(n, ast.ClassDef))
+        self.preamble = Span(self.offset(body[first].lineno),
+                             self.offset(first_class.lineno),
+                             body[first].lineno)
+
+        for node in body:
+            if isinstance(node, ast.ClassDef):
+                start, end = self.span_of(node)
+                self.classes[node.name] = ClassInfo(node.name, start, end, node.lineno,
+                                                    _class_kind(node), _class_clsid(node), ())
+            elif isinstance(node, ast.Assign) and len(node.targets) == 1 \
+                    and isinstance(node.targets[0], ast.Name):
+                name = node.targets[0].id
+                if name.endswith("_vtables_") or name.endswith("_vtables_dispatch_"):
+                    start, end = self.span_of(node)
+                    self.vtables[name] = Span(start, end, node.lineno)
+                elif name in MAP_NAMES:
+                    self.maps[name] = _map_literal(node.value)
+
+        if "constants" in self.classes:
+            for name, value, enum in _ENUM_MEMBER.findall(self.source(self.classes["constants"][1:3])):
+                self.enums.setdefault(enum, []).append((name, int(value)))
+
+        # Resolve dependencies once every class name is known.
+        for node in body:
+            if isinstance(node, ast.ClassDef):
+                deps = sorted({n.id for n in ast.walk(node)
+                               if isinstance(n, ast.Name) and n.id != node.name
+                               and n.id in self.classes})
+                self.classes[node.name] = self.classes[node.name]._replace(deps=tuple(deps))
+
+    def class_node(self, name):
+        for node in self.tree.body:
+            if isinstance(node, ast.ClassDef) and node.name == name:
+                return node
+        raise KeyError(name)
+
+
+def _class_kind(node):
+    bases = [b.id for b in node.bases if isinstance(b, ast.Name)]
+    if "DispatchBaseClass" in bases:
+        return "dispatch"
+    if "CoClassBaseClass" in bases:
+        return "coclass"
+    if node.name == "constants":
+        return "constants"
+    return "events"
+
+
+def _class_clsid(node):
+    for stmt in node.body:
+        if isinstance(stmt, ast.Assign):
+            names = [t.id for t in stmt.targets if isinstance(t, ast.Name)]
+            if "CLSID" in names and isinstance(stmt.value, ast.Call) and stmt.value.args:
+                return stmt.value.args[0].value
+    return None
+
+
+def _map_literal(value):
+    """Registration maps hold either class names (bare Names) or strings."""
+    result = {}
+    for k, v in zip(value.keys, value.values):
+        result[k.value] = v.id if isinstance(v, ast.Name) else v.value
+    return result
@@ -0,0 +1,11 @@
+import os
+import sys
+
+# The scripts import each other flat (`import AutoCAD_Wrapper`, `import cad_tools`),
+# so put source/ and source/utils/ on the path the same way the IDE does
+# (and examples/, whose scripts are tested too).
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for _path in (os.path.join(_ROOT, "source"), os.path.join(_ROOT, "source", "utils"),
+              os.path.join(_ROOT, "examples")):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
@@ -0,0 +1,75 @@
+import unittest
+
+from acad_session import AcadSession, get_session, reset_session
+from fake_acad import FakeAutoCAD, FakeDocument
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestAcadSession(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeAutoCAD()
+        self.clock = FakeClock()
+        self.session = AcadSession(connect=self.server.connect, probe_interval=2.0, clock=self.clock)
+
+    def test_connects_once_and_caches_objects(self):
+        msp = self.session.model
+        msp.AddLine((0, 0, 0), (1, 0, 0))
+        self.server.reset_counters()
+        for _ in range(10):
+            self.assertIs(self.session.model, msp)
+            self.assertIs(self.session.layers, self.session.layers)
+        self.session.utility.RealToString(1.5, 2, 3)
+        self.assertEqual(self.server.connections, 0)
+        self.assertEqual(self.session.connects, 1)
+        self.assertEqual(self.session.probes, 0)
+        # Only the Layers and Utility lookups went to AutoCAD
+        self.assertEqual(self.server.round_trips, 3)
+
+        self.clock.now = 2.5
+        self.session.model.AddLine((1, 0, 0), (2, 0, 0))
+        self.assertEqual(self.session.probes, 1)
+        self.assertEqual(self.server.document.model_space.get_Count(), 2)
+
+    def test_reconnects_after_autocad_restart(self):
+        self.session.model.AddLine((0, 0, 0), (1, 0, 0))
+        self.server.restart()
+        self.clock.now = 5.0
+        self.session.model.AddLine((0, 0, 0), (1, 0, 0))
+        self.assertEqual((self.session.connects, self.session.reconnects), (2, 1))
+        self.assertEqual(self.server.document.model_space.get_Count(), 1)
+
+        # Within the probe interval the stale objects are only noticed by run()
+        self.session.model.AddLine((0, 0, 0), (1, 0, 0))
+        self.server.restart()
+        self.session.run(lambda s: s.model.AddLine((0, 0, 0), (1, 0, 0)))
+        self.assertEqual((self.session.connects, self.session.reconnects), (3, 2))
+        self.assertEqual(self.server.document.model_space.get_Count(), 1)
+
+    def test_switching_documents_refreshes_cache(self):
+        first = self.session.model
+        other = FakeDocument(self.server, name="Other.dwg")
+        self.server.documents.append(other)
+        self.server.document = other
+        self.clock.now = 3.0
+        self.assertEqual(self.session.doc.Name, "Other.dwg")
+        self.assertIsNot(self.session.model, first)
+        self.session.model.AddLine((0, 0, 0), (1, 0, 0))
+        self.assertEqual(other.model_space.get_Count(), 1)
+        self.assertEqual(self.session.connects, 1)
+
+    def test_get_session_is_per_thread_singleton(self):
+        reset_session()
+        try:
+            session = get_session(connect=self.server.connect)
+            self.assertIs(get_session(), session)
+            session.model.AddLine((0, 0, 0), (1, 0, 0))
+            self.assertEqual(self.server.connections, 1)
+        finally:
+            reset_session()
@@ -0,0 +1,39 @@
+import importlib
+import unittest
+
+import AutoCAD_Constants
+from wrapper_source import WrapperSource
+
+
+class TestAutoCADConstants(unittest.TestCase):
+    def test_forward_and_reverse_lookup(self):
+        color = AutoCAD_Constants.AcColor
+        self.assertEqual(color.acRed, 1)
+        self.assertEqual(color.name_of(256), "acByLayer")
+        self.assertEqual(color[7], "acWhite")
+        self.assertIsNone(color.name_of(30))
+        self.assertEqual(sorted(AutoCAD_Constants.AcSaveAsType.names_of(12)), ["ac2000_dwg", "acR15_dwg"])
+
+    def test_groups_built_on_first_touch(self):
+        importlib.reload(AutoCAD_Constants)
+        self.assertEqual(AutoCAD_Constants.built_groups(), [])
+        AutoCAD_Constants.AcWindowState.acMax
+        self.assertIn("AcWindowState", AutoCAD_Constants.built_groups())
+
+    def test_flat_view_matches_makepy_constants(self):
+        flat = AutoCAD_Constants.constants
+        count = 0
+        for enum, members in WrapperSource().enums.items():
+            for name, value in members:
+                self.assertIn(name, flat)
+                self.assertEqual(flat[name], value)
+                self.assertEqual(AutoCAD_Constants.enum_of(name), enum)
+                count += 1
+        self.assertEqual(count, 898)
+        self.assertNotIn("acNotAConstant", flat)
+        with self.assertRaises(AttributeError):
+            flat.acNotAConstant
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from batch_runner import format_report, run_batch
+from fake_acad import FakeAutoCAD
+
+
+def stand_in():
+    # One fake AutoCAD per worker; every opened drawing holds one line
+    server = FakeAutoCAD()
+    server.open_handler = lambda doc: doc.add_line((0, 0), (1, 0))
+    return server.connect()
+
+
+def count_lines(doc):
+    return doc.ModelSpace.Count
+
+
+def add_line(doc):
+    doc.ModelSpace.AddLine((0, 0, 0), (0, 1, 0))
+    return doc.Name
+
+
+def fail_on_bad(doc):
+    if doc.Name.startswith("bad"):
+        raise ValueError("broken geometry")
+
+
+def restart_once(doc):
+    # AutoCAD goes away the first time a "flaky" drawing is processed
+    marker = os.path.join(doc.Path, doc.Name + ".seen")
+    if doc.Name.startswith("flaky") and not os.path.exists(marker):
+        open(marker, "w").close()
+        doc._oleobj_._server.restart()
+    return doc.Name
+
+
+def crash_or_hang(doc):
+    if doc.Name.startswith("crash"):
+        os._exit(3)
+    if doc.Name.startswith("hang"):
+        time.sleep(30)
+
+
+class TestBatchRunner(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def drawings(self, *names):
+        paths = []
+        for name in names:
+            path = os.path.join(self.tmp, name)
+            open(path, "w").close()
+            paths.append(path)
+        return paths
+
+    def test_pipeline_runs_over_every_drawing(self):
+        paths = self.drawings("a.dwg", "b.dwg", "c.dwg", "d.dwg", "e.dwg")
+        seen = []
+        results = run_batch(paths, [count_lines, add_line, "tests.test_batch_runner:count_lines"],
+                            workers=2, connect=stand_in, sta=False, on_result=seen.append)
+        self.assertEqual([r.path for r in results], paths)
+        self.assertEqual(len(seen), 5)
+        for path, r in zip(paths, results):
+            self.assertTrue(r.ok, r.error)
+            self.assertEqual(r.results, [1, os.path.basename(path), 2])
+            self.assertEqual([name for name, _ in r.timings],
+                             ["open", "count_lines", "add_line", "tests.test_batch_runner:count_lines",
+                              "save"])
+            self.assertIn(r.worker, (0, 1))
+        self.assertIn("5 of 5 drawings done, 0 failed", format_report(results))
+
+    def test_failing_step_only_fails_its_file(self):
+        paths = self.drawings("a.dwg", "bad.dwg", "c.dwg")
+        results = run_batch(paths, [fail_on_bad], workers=1, connect=stand_in, sta=False)
+        self.assertEqual([r.ok for r in results], [True, False, True])
+        self.assertEqual(results[1].error, "ValueError: broken geometry")
+        self.assertEqual([name for name, _ in results[1].timings], ["open"])  # not saved
+
+    def test_restarts_autocad_and_retries_the_file(self):
+        paths = self.drawings("a.dwg", "flaky.dwg", "c.dwg")
+        results = run_batch(paths, [restart_once], workers=1, connect=stand_in, sta=False)
+        self.assertTrue(all(r.ok for r in results), [r.error for r in results])
+        self.assertEqual([r.attempts for r in results], [1, 2, 1])
+
+    def test_dead_or_hung_worker_is_replaced(self):
+        paths = self.drawings("a.dwg", "crash.dwg", "hang.dwg", "d.dwg")
+        results = run_batch(paths, [crash_or_hang], workers=1, connect=stand_in, sta=False,
+                            file_timeout=2.0)
+        self.assertEqual([r.ok for r in results], [True, False, False, True])
+        self.assertEqual(results[1].error, "worker exited with code 3")
+        self.assertEqual(results[2].error, "timed out after 2s")
@@ -0,0 +1,109 @@
+import math
+import unittest
+
+import numpy as np
+
+from block_instancing import PREFIX, canonical_pose, find_grid, group_shapes, insert_instances
+import facade_builder as fb
+from com_arrays import flat_doubles
+from fake_acad import FakeAutoCAD
+
+
+def plain_point(x, y, z=0.0):
+    return (x, y, z)
+
+
+def placed(poly, dx, dy, angle):
+    cos, sin = math.cos(angle), math.sin(angle)
+    return [(dx + x * cos - y * sin, dy + x * sin + y * cos) for x, y in poly]
+
+
+def ring_set(polygons):
+    """Polygons as rotation-independent sets of rounded vertices."""
+    return sorted(tuple(sorted((round(x, 9) + 0.0, round(y, 9) + 0.0) for x, y in p)) for p in polygons)
+
+
+L_SHAPE = [(0, 0), (2, 0), (2, 1), (1, 1), (1, 3), (0, 3), (0, 0)]
+
+
+class TestCanonicalShapes(unittest.TestCase):
+    def test_congruent_shapes_share_a_key(self):
+        moved = placed(L_SHAPE, 5.0, -2.0, 0.7)
+        reversed_ = list(reversed(placed(L_SHAPE, -3.0, 4.0, 2.0)))
+        mirrored = [(-x, y) for x, y in L_SHAPE]
+        keys = [canonical_pose(p)[0] for p in (L_SHAPE, moved, reversed_, mirrored)]
+        self.assertEqual(keys[0], keys[1])
+        self.assertEqual(keys[0], keys[2])
+        self.assertNotEqual(keys[0], keys[3])
+        # The placement puts the canonical outline back where the polygon was
+        key, vertices, closed, (x, y, angle) = canonical_pose(moved)
+        self.assertTrue(closed)
+        self.assertEqual(ring_set([placed(vertices, x, y, angle)]), ring_set([moved[:-1]]))
+
+    def test_fewer_than_two_vertices(self):
+        self.assertIsNone(canonical_pose([]))
+        self.assertIsNone(canonical_pose([(0, 0)]))
+        shapes, degenerate = group_shapes([[], L_SHAPE, [(4, 4)]])
+        self.assertEqual(([len(s.placements) for s in shapes], degenerate), ([1], [0, 2]))
+
+    def test_facade_grids(self):
+        shapes, degenerate = group_shapes(fb.get_window_rects() + fb.get_door_rects())
+        self.assertEqual([len(s.placements) for s in shapes], [12, 3])
+        self.assertEqual(degenerate, [])
+        windows = find_grid(shapes[0].placements)
+        self.assertEqual((windows.rows, windows.columns, windows.angle), (4, 3, 0.0))
+        self.assertAlmostEqual(windows.row_spacing, 3.0)
+        self.assertAlmostEqual(windows.column_spacing, 10.0 - 0.5 * fb.X_INSET)
+        # A rotated grid is still a grid; a missing cell is not
+        turned = [placed(p, 0.0, 0.0, 0.3) for p in fb.get_window_rects()]
+        self.assertEqual(find_grid(group_shapes(turned)[0][0].placements)[3:5], (4, 3))
+        self.assertIsNone(find_grid(group_shapes(fb.get_window_rects()[1:])[0][0].placements))
+
+
+class TestInsertInstances(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeAutoCAD()
+        self.store = self.server.document
+        self.doc = self.server.connect().ActiveDocument
+
+    def insert(self, polygons, **kwargs):
+        return insert_instances(self.doc, polygons, layer="A-GLAZ", to_point=plain_point,
+                                to_variant=flat_doubles, **kwargs)
+
+    def drawn(self):
+        polygons = []
+        for entity in self.store.model_space.entities():
+            polygons.extend(entity.polygons() if hasattr(entity, "polygons") else [entity.vertices])
+        return polygons
+
+    def test_facade_as_minserts(self):
+        polygons = fb.get_window_rects() + fb.get_door_rects() + fb.get_stair_windows()
+        report = self.insert(polygons)
+        self.assertEqual((report.blocks, report.minserts, report.inserts, report.loose), (3, 3, 0, 0))
+        self.assertEqual(self.store.model_space.get_Count(), 3)
+        self.assertEqual(ring_set(self.drawn()), ring_set(p[:-1] for p in polygons))
+        self.assertTrue(all(e.layer == "A-GLAZ" for e in self.store.model_space.entities()))
+        self.assertTrue(all(b.name.startswith(PREFIX) for b in self.store.blocks.by_name.values()))
+
+    def test_scattered_and_single_shapes(self):
+        scattered = [placed(L_SHAPE, 10.0 * k, k * k, 0.5 * k) for k in range(4)]
+        odd_one = [(0, 20), (3, 20), (0, 25), (0, 20)]
+        report = self.insert(scattered + [odd_one])
+        self.assertEqual((report.blocks, report.inserts, report.minserts, report.loose), (1, 4, 0, 1))
+        self.assertEqual(ring_set(self.drawn()), ring_set(p[:-1] for p in scattered + [odd_one]))
+        # Drawing the same shapes again reuses the definition
+        self.assertEqual(self.insert(scattered).reused, 1)
+        self.assertEqual(self.store.blocks.get_Count(), 1)
+
+    def test_fewer_round_trips_than_polylines(self):
+        polygons = [[(x, y), (x + 1, y), (x + 1, y + 1), (x, y + 1), (x, y)]
+                    for x in np.arange(10) * 3.0 for y in np.arange(10) * 3.5]
+        self.insert(polygons)
+        blocks = self.server.round_trips
+        self.server.reset_counters()
+        self.insert(polygons, min_count=len(polygons) + 1)  # every shape loose
+        self.assertLess(blocks * 20, self.server.round_trips)
+
+
+if __name__ == "__main__":
+    unittest.main()
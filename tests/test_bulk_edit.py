@@ -0,0 +1,89 @@
+import time
+import unittest
+
+from bulk_edit import FAST_VARIABLES, _depth, bulk_edit
+from command_runner import CommandWatcher
+from fake_acad import FakeAutoCAD, FakeComError, with_events
+
+
+class TestBulkEdit(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeAutoCAD()
+        self.store = self.server.document
+        self.store.add_layer("AUDIT")
+        self.lines = [self.store.add_line((i, 0), (i, 1)) for i in range(5)]
+        self.doc = self.server.connect().ActiveDocument
+        self.watcher = CommandWatcher(self.doc, events=with_events, pump=self.server.pump_events,
+                                      wait=time.sleep)
+
+    def tearDown(self):
+        self.watcher.close()
+
+    def test_one_undo_group_fast_variables_and_one_regen(self):
+        before = dict(self.store.variables)
+        with bulk_edit(self.doc, watcher=self.watcher) as edit:
+            for obj in self.doc.ModelSpace:
+                obj.Layer = "AUDIT"
+            for name, value in FAST_VARIABLES.items():
+                self.assertEqual(self.store.variables[name], value)
+        self.assertEqual(self.store.variables, before)
+        self.assertEqual(edit.saved, {"CMDECHO": 1, "REGENMODE": 1, "HIGHLIGHT": 1})
+        self.assertEqual((self.store.undo_marks, len(self.store.undo_groups), self.store.regens), (1, 1, 1))
+        self.assertEqual({line.layer for line in self.lines}, {"AUDIT"})
+        self.assertFalse(edit.rolled_back)
+
+    def test_exception_rolls_back(self):
+        before = dict(self.store.variables)
+        with self.assertRaises(RuntimeError):
+            with bulk_edit(self.doc, watcher=self.watcher) as edit:
+                msp = self.doc.ModelSpace
+                msp.Item(0).Layer = "AUDIT"
+                msp.Item(1).Move((0, 0, 0), (5, 5, 0))
+                msp.Item(2).Delete()
+                msp.AddLine((0, 0, 0), (9, 9, 0))
+                raise RuntimeError("half way")
+        self.assertTrue(edit.rolled_back)
+        self.assertEqual(self.store.model_space.entities(), self.lines)
+        self.assertEqual(self.lines[0].layer, "0")
+        self.assertEqual(self.lines[1].bounds(), ((1.0, 0.0), (1.0, 1.0)))
+        self.assertIs(self.doc.HandleToObject(self.lines[2].handle)._oleobj_, self.lines[2])
+        self.assertEqual(self.store.variables, before)
+        self.assertEqual(self.store.regens, 1)
+
+    def test_failed_entry_restores_variables(self):
+        def refuse():
+            raise FakeComError(-2147418111, "Call was rejected by callee.")
+
+        before = dict(self.store.variables)
+        self.store.StartUndoMark = refuse
+        with self.assertRaises(FakeComError):
+            with bulk_edit(self.doc, watcher=self.watcher):
+                self.fail("the block ran")
+        self.assertEqual(self.store.variables, before)
+        self.assertEqual(_depth, {})
+        del self.store.StartUndoMark
+        with bulk_edit(self.doc, watcher=self.watcher):
+            pass
+        self.assertEqual((self.store.undo_marks, len(self.store.undo_groups)), (1, 1))
+
+    def test_nested_blocks_share_the_outer_group(self):
+        with bulk_edit(self.doc, variables={"CMDECHO": 0, "NOSUCHVAR": 1}, watcher=self.watcher):
+            self.doc.ModelSpace.Item(0).Layer = "AUDIT"
+            with bulk_edit(self.doc, watcher=self.watcher) as inner:
+                self.doc.ModelSpace.Item(1).Layer = "AUDIT"
+            self.assertEqual(self.store.regens, 0)
+            self.assertEqual(inner.saved, {"REGENMODE": 1, "HIGHLIGHT": 1})
+        self.assertEqual((self.store.undo_marks, len(self.store.undo_groups), self.store.regens), (1, 1, 1))
+        self.store.undo()
+        self.assertEqual({line.layer for line in self.lines}, {"0"})
+
+    def test_nesting_through_separately_fetched_documents(self):
+        self.server.proxies = True  # every lookup hands out a new _oleobj_, as pywin32 does
+        outer_doc, inner_doc = (self.server.connect().ActiveDocument for _ in range(2))
+        self.assertIsNot(outer_doc._oleobj_, inner_doc._oleobj_)
+        with bulk_edit(outer_doc, watcher=self.watcher):
+            outer_doc.ModelSpace.Item(0).Layer = "AUDIT"
+            with bulk_edit(inner_doc, watcher=self.watcher):
+                inner_doc.ModelSpace.Item(1).Layer = "AUDIT"
+            self.assertEqual(self.store.regens, 0)
+        self.assertEqual((self.store.undo_marks, len(self.store.undo_groups), self.store.regens), (1, 1, 1))
@@ -0,0 +1,65 @@
+import unittest
+
+import bulk_erase as be
+from fake_acad import FakeAutoCAD
+from selection_filter import F, MODEL
+
+
+def plain_filter(codes, values):
+    return codes, values
+
+
+def plain_objects(objects):
+    return list(objects)
+
+
+class TestBulkErase(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeAutoCAD()
+        self.store = self.server.document
+        self.doc = self.server.connect().ActiveDocument
+        self.store.add_layer("A-DEMO")
+        self.store.add_layer("A-KEEP")
+
+    def erase(self, *args, **kwargs):
+        return be.bulk_erase(self.doc, *args, to_variants=plain_filter, to_objects=plain_objects, **kwargs)
+
+    def test_filter_erase_is_constant_round_trips(self):
+        for i in range(3000):
+            self.store.add_line((i, 0), (i, 1), layer="A-DEMO")
+        keep = self.store.add_line((0, 0), (1, 1), layer="A-KEEP")
+        paper = self.store.add_line((0, 0), (1, 1), layer="A-DEMO", paper=True)
+        self.server.reset_counters()
+        report = self.erase((F.layer == "a-demo") & (F.space == MODEL))
+        self.assertEqual((report.requested, report.erased, report.failed, report.chunks), (3000, 3000, [], 0))
+        self.assertLess(self.server.round_trips, 15)
+        self.assertEqual(self.store.model_space.entities(), [keep])
+        self.assertFalse(paper.erased)
+        self.assertEqual(set(report.timings), {"select", "erase", "verify"})
+        self.assertEqual(self.doc.SelectionSets.Count, 0)
+
+    def test_erase_by_handles(self):
+        lines = [self.store.add_line((i, 0), (i, 1)) for i in range(30)]
+        handles = [line.handle.lower() for line in lines[:25]] + ["FFFF"]
+        old, be.HANDLE_CHUNK = be.HANDLE_CHUNK, 10
+        try:
+            report = self.erase(handles=handles)
+        finally:
+            be.HANDLE_CHUNK = old
+        self.assertEqual((report.requested, report.erased, report.missing), (26, 25, 1))
+        self.assertEqual(self.store.model_space.entities(), lines[25:])
+        self.assertIn("Erased 25 of 26 (0 failed, 1 missing)", str(report))
+
+    def test_locked_entities_fall_back_to_chunks(self):
+        for i in range(20):
+            self.store.add_line((i, 0), (i, 1), layer="A-DEMO")
+        locked = [self.store.add_line((i, 0), (i, 1), layer="A-KEEP") for i in range(5)]
+        self.store.layer("A-KEEP").locked = True
+        report = self.erase('layer in ["A-DEMO", "A-KEEP"]', chunk=2)
+        self.assertEqual((report.requested, report.erased), (25, 20))
+        self.assertEqual(report.chunks, 3)
+        self.assertEqual(report.deletes, 5)
+        self.assertEqual(report.failed, [(e.handle, "On locked layer") for e in locked])
+        self.assertEqual(self.store.model_space.entities(), locked)
+        with self.assertRaises(ValueError):
+            self.erase()
@@ -0,0 +1,65 @@
+import unittest
+
+import numpy as np
+
+import dispatch_metadata
+from bulk_read import read_properties
+
+
+class FakeOle:
+    """Serves property reads by DISPID for one concrete interface."""
+
+    def __init__(self, interface, **props):
+        meta = dispatch_metadata.load_metadata()[interface]
+        self.by_dispid = {meta.prop_get[k][0]: v for k, v in props.items()}
+        self.calls = 0
+
+    def InvokeTypes(self, dispid, lcid, flags, ret_type, arg_types, *args):
+        self.calls += 1
+        if dispid not in self.by_dispid:
+            raise Exception("Member not found")
+        return self.by_dispid[dispid]
+
+
+def typed(interface):
+    """A class shaped like a makepy wrapper class (prop map + _oleobj_)."""
+    meta = dispatch_metadata.load_metadata()[interface]
+
+    class Wrapper:
+        _prop_map_get_ = meta.prop_get
+
+        def __init__(self, ole):
+            self.__dict__["_oleobj_"] = ole
+    return Wrapper
+
+
+class TestReadProperties(unittest.TestCase):
+    def setUp(self):
+        Entity = typed("IAcadEntity")
+        self.poly = FakeOle("IAcadLWPolyline", Layer="A-GLAZ", ObjectName="AcDbPolyline",
+                            Handle="2F", Area=4.0, Closed=True)
+        self.line = FakeOle("IAcadLine", Layer="0", ObjectName="AcDbLine", Handle="30")
+        self.entities = [Entity(self.poly), Entity(self.line)]
+
+    def test_columnar_results(self):
+        table = read_properties(self.entities, ["Layer", "ObjectName", "Handle", "Area", "Closed"])
+        self.assertEqual(table["Layer"], ["A-GLAZ", "0"])
+        self.assertIsInstance(table["Area"], np.ndarray)
+        self.assertEqual(table["Area"][0], 4.0)
+        self.assertTrue(np.isnan(table["Area"][1]))
+        self.assertEqual(table.valid["Closed"].tolist(), [True, False])
+        self.assertIn(1, table.errors["Area"])
+
+    def test_derived_properties_resolved_from_object_name(self):
+        read_properties(self.entities, ["Area", "Closed"])
+        # ObjectName + Area + Closed for the polyline; the line has neither.
+        self.assertEqual(self.poly.calls, 3)
+        self.assertEqual(self.line.calls, 1)
+
+    def test_object_name_not_read_twice(self):
+        read_properties(self.entities, ["ObjectName", "Area"])
+        self.assertEqual(self.poly.calls, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import time
+import unittest
+
+from acad_session import get_session, reset_session
+from cad_tools import polygon_ring, send_to_autocad
+from com_arrays import flat_doubles
+from command_runner import CommandWatcher
+from fake_acad import FakeAutoCAD, with_events
+from tests.test_draw_batch import fake_db_run
+
+
+def plain_point(x, y, z=0.0):
+    return (x, y, z)
+
+
+def rect(x, y, w=1.0, h=1.0):
+    return [(x, y), (x + w, y), (x + w, y + h), (x, y + h), (x, y)]
+
+
+class TestSendToAutocad(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeAutoCAD()
+        self.store = self.server.document
+        self.store.add_layer("A-GLAZ")
+        self.store.lisp_handler = fake_db_run
+        reset_session()
+        self.doc = get_session(connect=self.server.connect).doc
+        self.addCleanup(reset_session)
+        self.watcher = CommandWatcher(self.doc, events=with_events, pump=self.server.pump_events,
+                                      wait=time.sleep)
+        self.addCleanup(self.watcher.close)
+        self.server.reset_counters()
+
+    def send(self, polygons, **kwargs):
+        send_to_autocad(polygons, kwargs.pop("layer_name", "A-GLAZ"), to_variant=flat_doubles,
+                        to_point=plain_point, watcher=self.watcher, **kwargs)
+
+    def test_one_closed_polyline_per_ring(self):
+        self.send([rect(0, 0), rect(2, 0, 1, 2)])
+        entities = list(self.doc.ModelSpace)
+        self.assertEqual([(e.ObjectName, e.Layer, e.Closed) for e in entities],
+                         [("AcDbPolyline", "A-GLAZ", True)] * 2)
+        self.assertEqual([e.Area for e in entities], [1.0, 2.0])
+        self.assertEqual(list(entities[1].Coordinates), [2, 0, 3, 0, 3, 2, 2, 2])
+
+    def test_one_submission_for_many_rings(self):
+        rings = [rect(3 * k, 0) for k in range(20)]
+        self.send(rings)
+        self.assertEqual(self.server.round_trips, 2)  # the document's Name, then the batch
+        self.assertEqual([(e.ObjectName, e.Layer, e.Closed) for e in self.doc.ModelSpace],
+                         [("AcDbPolyline", "A-GLAZ", True)] * 20)
+        self.server.reset_counters()
+        self.send(rings, mode="lines", run_mode="script")
+        self.assertEqual(self.server.round_trips, 2)
+        self.assertEqual(sum(e.ObjectName == "AcDbLine" for e in self.doc.ModelSpace), 80)
+
+    def test_per_entity_com_calls(self):
+        rings = [rect(3 * k, 0) for k in range(20)]
+        self.send(rings, run_mode="com")
+        polyline_trips = self.server.round_trips
+        self.server.reset_counters()
+        self.send(rings, mode="lines", run_mode="com")
+        self.assertEqual(self.server.calls[("IAcadModelSpace", "AddLine")], 80)
+        self.assertLess(polyline_trips * 2, self.server.round_trips)
+        self.assertEqual(self.store.commands, [])
+
+    def test_open_polygons_and_rings(self):
+        xy, closed = polygon_ring([(0, 0, 5), (1, 0, 5), (1, 1, 5)])
+        self.assertEqual((xy.tolist(), closed), ([[0, 0], [1, 0], [1, 1]], False))
+        self.send([[(0, 0), (1, 0), (1, 1)]], layer_name="NEW-LAYER")
+        (pline,) = self.doc.ModelSpace
+        self.assertEqual((pline.Closed, pline.Layer), (False, "NEW-LAYER"))
+        xy, closed = polygon_ring([])
+        self.assertEqual((xy.shape, closed), ((0, 2), False))
+        self.send([[], [(0, 0)], rect(0, 0)], run_mode="com")
+        self.assertEqual(len(self.doc.ModelSpace), 2)
+        with self.assertRaises(ValueError):
+            self.send([rect(0, 0)], mode="hatch")
+        with self.assertRaises(ValueError):
+            self.send([rect(0, 0)], run_mode="lisp")
+
+
+if __name__ == "__main__":
+    unittest.main()
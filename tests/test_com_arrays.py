@@ -0,0 +1,45 @@
+import array
+import unittest
+
+import numpy as np
+
+from com_arrays import BufferPool, flat_doubles
+from fake_acad import FakeAutoCAD
+
+
+class TestComArrays(unittest.TestCase):
+    def setUp(self):
+        self.xy = np.array([[0.0, 0.0], [10.0, 0.0], [10.0, 5.0]])
+
+    def test_flat_layout(self):
+        buf = flat_doubles(self.xy)
+        self.assertIsInstance(buf, array.array)
+        self.assertEqual(buf.tolist(), [0, 0, 10, 0, 10, 5])
+        self.assertEqual(flat_doubles(self.xy, dims=3).tolist(), [0, 0, 0, 10, 0, 0, 10, 5, 0])
+        xyz = np.array([[1, 2, 3], [4, 5, 6]])  # ints, converted on the way in
+        self.assertEqual(flat_doubles(xyz, dims=2).tolist(), [1, 2, 4, 5])
+
+    def test_strided_input(self):
+        grid = np.arange(12, dtype=float).reshape(3, 4)
+        self.assertEqual(flat_doubles(grid[:, ::2]).tolist(), [0, 2, 4, 6, 8, 10])
+        ints = np.arange(12).reshape(3, 4)[:, 1::2]  # int64 and strided: converted while copying
+        self.assertEqual(flat_doubles(ints, dims=3).tolist(), [1, 3, 0, 5, 7, 0, 9, 11, 0])
+        self.assertEqual(flat_doubles([["1.5", "2"]]).tolist(), [1.5, 2.0])
+
+    def test_pool_reuses_buffers_per_length(self):
+        pool = BufferPool()
+        first = flat_doubles(self.xy, pool=pool)
+        again = flat_doubles(self.xy + 1, pool=pool)
+        self.assertIs(first, again)
+        self.assertEqual(again[0], 1.0)
+        self.assertIsNot(flat_doubles(self.xy[:2], pool=pool), first)
+        self.assertEqual((pool.hits, pool.misses), (1, 2))
+
+    def test_accepted_as_coordinates(self):
+        msp = FakeAutoCAD().connect().ActiveDocument.ModelSpace
+        pl = msp.AddLightWeightPolyline(flat_doubles(self.xy))
+        self.assertEqual(pl.Coordinates, (0.0, 0.0, 10.0, 0.0, 10.0, 5.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
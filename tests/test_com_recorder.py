@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+
+from com_recorder import CallLog, Replayer, ReplayMismatch, ReplayedComError, read_log, record, summarize
+from fake_acad import FakeAutoCAD, FakeComError
+
+
+def session(acad, log=None):
+    """A small draw-then-scan script; returns what it read back."""
+    msp = acad.ActiveDocument.ModelSpace
+    pl = msp.AddLightWeightPolyline((0, 0, 4, 0, 4, 4))
+    pl.Closed = True
+    msp.AddLine((0, 0, 0), (1, 1, 0))
+    seen = [(e.ObjectName, e.Handle) for e in msp]
+    try:
+        pl.Layer = "MISSING"
+    except (FakeComError, ReplayedComError) as e:
+        seen.append(e.hresult)
+    return seen
+
+
+class TestComRecorder(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), "session.comlog")
+        log = CallLog(self.path)
+        acad = record(FakeAutoCAD().connect(), log, "AutoCAD.Application")
+        with log.phase("draw"):
+            self.recorded = session(acad)
+        log.close()
+
+    def test_log_round_trip(self):
+        records = read_log(self.path)
+        calls = [r for r in records if r[0] in ("C", "X")]
+        self.assertEqual(records[0][0], "H")
+        self.assertEqual(sum(r[0] == "X" for r in calls), 1)
+        self.assertTrue(all(r[7] >= 0 for r in calls))
+
+    def test_replay_is_deterministic(self):
+        replay = Replayer(self.path)
+        self.assertEqual(session(replay.connect()), self.recorded)
+        self.assertTrue(replay.done())
+
+    def test_replay_detects_divergence(self):
+        replay = Replayer(self.path)
+        msp = replay.connect().ActiveDocument.ModelSpace
+        with self.assertRaises(ReplayMismatch):
+            msp.AddLightWeightPolyline((0, 0, 1, 1))
+
+    def test_second_recording_replaces_the_first(self):
+        log = CallLog(self.path)
+        acad = record(FakeAutoCAD().connect(), log, "AutoCAD.Application")
+        recorded = session(acad)
+        log.close()
+        self.assertEqual(sum(r[0] == "H" for r in read_log(self.path)), 1)
+        replay = Replayer(self.path)
+        self.assertEqual(session(replay.connect()), recorded)
+        self.assertTrue(replay.done())
+
+    def test_summary(self):
+        summary = summarize(read_log(self.path))
+        self.assertEqual(summary.by_interface["IAcadModelSpace"], 3)
+        self.assertEqual(summary.by_member[("IAcadLWPolyline", "Closed")][0], 1)
+        self.assertEqual(summary.phases["draw"][0], summary.calls)
+        self.assertAlmostEqual(sum(summary.phase_shares().values()), 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import random
+import unittest
+
+from com_retry import CircuitOpen, RetryMetrics, RetryPolicy, format_metrics, is_busy, retrying
+from fake_acad import RPC_E_CALL_REJECTED, FakeAutoCAD, FakeComError, FakeDispatch, acad_error
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class ModelSpace:
+    """Shaped like the makepy class: methods with named parameters calling InvokeTypes."""
+
+    def __init__(self, disp):
+        self._oleobj_ = disp._oleobj_
+
+    def AddLine(self, StartPoint, EndPoint):
+        return FakeDispatch(self._oleobj_.InvokeTypes(1581, 0, 1, (9, 0), ((12, 1), (12, 1)),
+                                                      StartPoint, EndPoint))
+
+
+class TestComRetry(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeAutoCAD()
+        self.clock = FakeClock()
+        self.metrics = RetryMetrics()
+        self.policy = RetryPolicy(attempts=5, base=0.1, max_delay=0.5, threshold=2, cooldown=5.0,
+                                  metrics=self.metrics, sleep=self.clock.sleep, clock=self.clock,
+                                  rng=random.Random(1))
+
+    def test_busy_calls_are_retried_with_backoff(self):
+        doc = retrying(self.server.connect().ActiveDocument, self.policy)
+        trips = self.server.round_trips
+        self.server.reject_calls = 3
+        line = doc.ModelSpace.AddLine((0, 0, 0), (1, 0, 0))
+        line.Layer = "0"
+        self.assertEqual(self.server.document.model_space.get_Count(), 1)
+        self.assertEqual(len(self.clock.sleeps), 3)
+        for retry, wait in enumerate(self.clock.sleeps):
+            cap = min(0.5, 0.1 * 2 ** retry)
+            self.assertTrue(cap * 0.5 <= wait <= cap)
+        m = self.metrics.as_dict()
+        # ModelSpace, the AddLine call, the Layer put: one per round trip that went through
+        self.assertEqual((m["calls"], m["retries"], m["hresults"]), (3, 3, {RPC_E_CALL_REJECTED: 3}))
+        self.assertEqual(m["calls"] + m["retries"], self.server.round_trips - trips)
+        self.assertAlmostEqual(m["waited"], sum(self.clock.sleeps))
+        self.assertIn("retries: 3", format_metrics(self.metrics))
+
+    def test_keyword_arguments(self):
+        msp = retrying(ModelSpace(self.server.connect().ActiveDocument.ModelSpace), self.policy)
+        self.server.reject_calls = 2
+        line = msp.AddLine(StartPoint=(0, 0, 0), EndPoint=(2, 0, 0))
+        self.assertEqual(line.Length, 2.0)
+        self.assertEqual((self.metrics.as_dict()["calls"], len(self.clock.sleeps)), (2, 2))
+
+    def test_other_errors_are_not_retried(self):
+        self.assertFalse(is_busy(acad_error("Key not found")))
+        wrapped = acad_error("busy", RPC_E_CALL_REJECTED)
+        self.assertTrue(is_busy(wrapped))
+        doc = retrying(self.server.connect().ActiveDocument, self.policy)
+        with self.assertRaises(FakeComError):
+            doc.HandleToObject("FFFF")
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_circuit_breaker(self):
+        self.server.reject_calls = 10 ** 6
+        app = retrying(self.server.connect(), self.policy)
+        for _ in range(2):
+            with self.assertRaises(FakeComError):
+                app.Visible
+        self.assertTrue(self.policy.is_open)
+        trips = self.server.round_trips
+        with self.assertRaises(CircuitOpen):
+            app.Visible
+        self.assertEqual(self.server.round_trips, trips)
+        # After the cooldown one trial call goes through and closes it
+        self.clock.now += 5.0
+        self.server.reject_calls = 0
+        self.assertTrue(app.Visible)
+        self.assertFalse(self.policy.is_open)
+        m = self.metrics.as_dict()
+        self.assertEqual((m["gave_up"], m["breaker_trips"], m["short_circuited"]), (2, 1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
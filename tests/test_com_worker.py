@@ -0,0 +1,75 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from com_worker import ComWorker, WorkerClosed
+from fake_acad import FakeAutoCAD
+
+
+def count_on_layer(app, layer):
+    return sum(1 for e in app.ActiveDocument.ModelSpace if e.Layer == layer)
+
+
+class TestComWorker(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.server = FakeAutoCAD(latency=0.005)
+        self.server.document.add_layer("A-WALL")
+        for i in range(10):
+            self.server.document.add_line((i, 0), (i, 1), layer="A-WALL" if i < 4 else "0")
+        self.worker = ComWorker(self.server.connect, maxsize=2, sta=False)
+
+    async def test_calls_run_on_the_worker_while_the_loop_works(self):
+        com_started, cpu_started = threading.Event(), threading.Event()
+
+        def scan(app, layer):
+            com_started.set()
+            # Each side waits for the other to be under way: only true overlap gets both through
+            return threading.get_ident(), cpu_started.wait(5), count_on_layer(app, layer)
+
+        def render():  # e.g. rendering a PDF page
+            cpu_started.set()
+            return com_started.wait(5)
+
+        async with self.worker as acad:
+            (thread, overlapped, count), cpu_overlapped = await asyncio.gather(
+                acad.call(scan, "A-WALL"), asyncio.to_thread(render))
+        self.assertEqual(count, 4)
+        self.assertNotEqual(thread, threading.get_ident())
+        self.assertTrue(overlapped and cpu_overlapped)
+
+    async def test_bounded_queue_and_errors(self):
+        seen = []
+        async with self.worker as acad:
+            async def one(i):
+                seen.append(acad.pending)
+                return await acad.call(lambda app: app.ActiveDocument.HandleToObject("FFFF") if i == 3 else i)
+            results = await asyncio.gather(*(one(i) for i in range(6)), return_exceptions=True)
+        self.assertEqual(results[:3], [0, 1, 2])
+        self.assertEqual(type(results[3]).__name__, "FakeComError")
+        self.assertLessEqual(max(seen), 2)
+        self.assertEqual(self.worker.completed, 6)
+        with self.assertRaises(WorkerClosed):
+            await self.worker.call(count_on_layer, "0")
+
+    async def test_timeout_and_cancel_skip_queued_calls(self):
+        ran = []
+        self.worker.maxsize = 3
+        async with self.worker as acad:
+            slow = asyncio.ensure_future(acad.call(lambda app: time.sleep(0.1) or "slow"))
+            await asyncio.sleep(0.01)  # the worker is inside the slow call now
+            with self.assertRaises(asyncio.TimeoutError):
+                await acad.call(lambda app: ran.append("timed out"), timeout=0.02)
+            queued = asyncio.ensure_future(acad.call(lambda app: ran.append("cancelled")))
+            await asyncio.sleep(0)
+            queued.cancel()
+            await asyncio.sleep(0)
+            self.assertEqual(acad.pending, 3)  # dropped calls hold their slot until the worker skips them
+            self.assertEqual(await slow, "slow")
+            self.assertEqual(await acad.call(count_on_layer, "0"), 6)
+        self.assertEqual(ran, [])
+        self.assertEqual(self.worker.skipped, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
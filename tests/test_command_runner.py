@@ -0,0 +1,45 @@
+import time
+import unittest
+
+from command_runner import CommandCancelled, CommandTimeout, CommandWatcher, run_command
+from fake_acad import FakeAutoCAD, with_events
+
+
+class TestCommandRunner(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeAutoCAD()
+        self.store = self.server.document
+        self.doc = self.server.connect().ActiveDocument
+        self.hooks = dict(events=with_events, pump=self.server.pump_events, wait=time.sleep)
+
+    def test_waits_for_the_expected_command(self):
+        joined = []
+        self.store.command_handlers["JOIN"] = lambda doc: joined.append(len(doc.commands))
+        elapsed = run_command(self.doc, "_SELALL _JOIN \n", timeout=1, expect="JOIN", **self.hooks)
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(joined, [1])
+        self.assertEqual(self.store.sinks, [])
+
+    def test_timeout_when_the_command_never_ends(self):
+        self.store.command_handlers["JOIN"] = lambda doc: False  # sits at its prompt
+        start = time.perf_counter()
+        with self.assertRaises(CommandTimeout):
+            run_command(self.doc, "_SELALL _JOIN \n", timeout=0.1, expect="JOIN", **self.hooks)
+        # SELALL's OnEndCommand does not count as JOIN completing
+        self.assertLess(time.perf_counter() - start, 0.5)
+
+    def test_lisp_end_and_cancel(self):
+        self.store.lisp_handler = lambda doc, expr: "*error*" not in expr
+        with CommandWatcher(self.doc, **self.hooks) as watcher:
+            watcher.run('(setvar "OSMODE" 0) ', timeout=1)
+            self.assertEqual([kind for kind, _ in watcher.log], ["begin_lisp", "end_lisp"])
+            start = time.perf_counter()
+            with self.assertRaises(CommandCancelled):
+                watcher.run("(*error* 1) ", timeout=5)
+            self.assertLess(time.perf_counter() - start, 0.5)
+            self.assertLess(watcher.run("_.REGEN ", timeout=1), 0.5)
+        self.assertEqual(self.store.regens, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
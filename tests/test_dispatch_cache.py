@@ -0,0 +1,74 @@
+import gc
+import types
+import unittest
+
+from dispatch_cache import WrapperCache
+
+LINE_IID = "{0C3FF8D9-DF63-4B64-8291-B04431B64553}"
+DOC_IID = "{33C800EE-ECF8-4602-9A55-2B59DAC0F496}"
+
+
+class FakeOle:
+    """Answers ObjectID (DISPID 1029) and Layer, counting every call."""
+
+    def __init__(self, object_id, layer="0"):
+        self.object_id = object_id
+        self.layer = layer
+        self.calls = []
+
+    def InvokeTypes(self, dispid, lcid, flags, ret_type, arg_types, *args):
+        self.calls.append(dispid)
+        return {1029: self.object_id, 1281: self.layer}[dispid]
+
+
+class Wrapper:
+    def __init__(self, ole, user_name, clsid):
+        self.__dict__["_oleobj_"] = ole
+
+    @property
+    def Layer(self):
+        return self._oleobj_.InvokeTypes(1281, 0, 2, (8, 0), ())
+
+
+class TestWrapperCache(unittest.TestCase):
+    def test_same_object_id_reuses_wrapper(self):
+        cache = WrapperCache(maxsize=2, dispatch=Wrapper)
+        first = cache.dispatch(FakeOle(42), "Item", LINE_IID)
+        again = cache.dispatch(FakeOle(42), "Item", LINE_IID)
+        other = cache.dispatch(FakeOle(43), "Item", LINE_IID)
+        self.assertIs(first, again)
+        self.assertIsNot(first, other)
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_lru_bound_and_weak_release(self):
+        cache = WrapperCache(maxsize=2, dispatch=Wrapper)
+        for oid in range(10):
+            cache.dispatch(FakeOle(oid), "Item", LINE_IID)
+        gc.collect()
+        self.assertEqual(len(cache), 2)
+
+    def test_objects_without_object_id_pass_through(self):
+        cache = WrapperCache(dispatch=Wrapper)
+        ole = FakeOle(1)
+        cache.dispatch(ole, "ActiveDocument", DOC_IID)
+        self.assertEqual(ole.calls, [])
+        self.assertEqual(cache.stats()["passthrough"], 1)
+
+    def test_memoized_property_reads_once(self):
+        cache = WrapperCache(dispatch=Wrapper)
+        ole = FakeOle(7, layer="A-GLAZ")
+        wrapper = cache.dispatch(ole, "Item", LINE_IID)
+        for _ in range(3):
+            self.assertEqual(cache.memoized(wrapper, "Layer"), "A-GLAZ")
+        self.assertEqual(ole.calls.count(1281), 1)
+
+    def test_install_patches_module_dispatch(self):
+        module = types.SimpleNamespace(Dispatch=Wrapper)
+        cache = WrapperCache().install(module)
+        self.assertEqual(module.Dispatch, cache.dispatch)
+        cache.uninstall()
+        self.assertIs(module.Dispatch, Wrapper)
+
+
+if __name__ == '__main__':
+    unittest.main()
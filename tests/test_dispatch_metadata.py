@@ -0,0 +1,98 @@
+import ast
+import os
+import tempfile
+import unittest
+
+import dispatch_metadata
+
+
+class _Literals(ast.NodeTransformer):
+    # LCID is the module's 0x0, IID('{...}') a CLSID string
+    def visit_Name(self, node):
+        return ast.Constant(0) if node.id == "LCID" else node
+
+    def visit_Call(self, node):
+        return node.args[0] if getattr(node.func, "id", None) == "IID" else node
+
+
+def read_wrapper_maps(path=dispatch_metadata.WRAPPER_PATH):
+    """
+    name -> (CLSID, _prop_map_get_, _prop_map_put_, {method: (dispid, flags)})
+    for every class of the wrapper with property maps, read with plain ast
+    and literal_eval rather than through WrapperSource/extract_metadata.
+    """
+    with open(path, "rb") as f:
+        tree = ast.parse(f.read().decode("ascii"))
+    classes = {}
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        values, methods = {}, {}
+        for stmt in node.body:
+            if isinstance(stmt, ast.Assign) and isinstance(stmt.targets[0], ast.Name):
+                if stmt.targets[0].id in ("CLSID", "_prop_map_get_", "_prop_map_put_"):
+                    values[stmt.targets[0].id] = ast.literal_eval(_Literals().visit(stmt.value))
+            elif isinstance(stmt, ast.FunctionDef) and not stmt.name.startswith("__"):
+                calls = [c for c in ast.walk(stmt) if isinstance(c, ast.Call)
+                         and getattr(c.func, "attr", None) in ("InvokeTypes", "_ApplyTypes_")]
+                if calls:
+                    args = calls[0].args
+                    flags = args[2] if calls[0].func.attr == "InvokeTypes" else args[1]
+                    methods[stmt.name] = (ast.literal_eval(args[0]), ast.literal_eval(flags))
+        if "_prop_map_get_" in values:
+            classes[node.name] = (values.get("CLSID"), values["_prop_map_get_"],
+                                  values.get("_prop_map_put_", {}), methods)
+    return classes
+
+
+class TestDispatchMetadata(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmp.name, "AutoCAD_Wrapper.dispidx")
+        dispatch_metadata.build_metadata(index_path=cls.path)
+        cls.meta = dispatch_metadata.DispatchMetadata(cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.meta.close()
+        cls.tmp.cleanup()
+
+    def test_matches_wrapper_exactly(self):
+        classes = read_wrapper_maps()
+        self.assertEqual(set(classes), {name for name in self.meta if self.meta[name].clsid is not None})
+        for name, (clsid, prop_get, prop_put, methods) in classes.items():
+            meta = self.meta[name]
+            self.assertEqual((meta.clsid, meta.prop_get, meta.prop_put), (clsid, prop_get, prop_put), name)
+            self.assertEqual({m: sig[:2] for m, sig in meta.methods.items()}, methods, name)
+
+    def test_known_entries(self):
+        poly = self.meta["IAcadLWPolyline"]
+        self.assertEqual(poly.prop_get["Layer"], (1281, 2, (8, 0), (), "Layer", None))
+        self.assertEqual(poly.prop_put["Closed"][0][2], 4)
+        add_line = self.meta["IAcadModelSpace"].methods["AddLine"]
+        self.assertEqual(add_line[0], 1581)
+        self.assertEqual(self.meta.for_clsid(add_line[4]).name, "IAcadLine")
+
+    def test_partial_index_is_rebuilt(self):
+        path = os.path.join(self.tmp.name, "partial.dispidx")
+        with open(self.path, "rb") as f:
+            data = f.read()
+        for cut in (0, dispatch_metadata.HEADER.size - 1, len(data) // 2):
+            with open(path, "wb") as f:
+                f.write(data[:cut])
+            meta = dispatch_metadata.load_metadata(path)
+            self.assertEqual(meta["IAcadLayer"], self.meta["IAcadLayer"])
+            meta.close()
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ["AutoCAD_Wrapper.dispidx", "partial.dispidx"])
+
+    def test_decodes_on_demand(self):
+        meta = dispatch_metadata.DispatchMetadata(self.path)
+        self.assertEqual(meta.decoded(), [])
+        meta["IAcadLayer"]
+        self.assertEqual(meta.decoded(), ["IAcadLayer"])
+        meta.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+
+from document_mirror import DocumentMirror
+from fake_acad import FakeAutoCAD, FakeDispatch, with_events
+
+
+class TestDocumentMirror(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeAutoCAD()
+        store = self.server.document
+        store.add_layer("A-WALL")
+        for i in range(20):
+            store.add_line((i, 0), (i, 1), layer="A-WALL" if i % 2 else "0")
+        self.open_pl = store.add_polyline((0, 0, 5, 0, 5, 5))
+        store.add_polyline((0, 0, 1, 0, 1, 1), closed=True, layer="A-WALL")
+        self.doc = self.server.connect().ActiveDocument
+        self.mirror = DocumentMirror(self.doc, events=with_events, pump=self.server.pump_events,
+                                     dispatch=FakeDispatch)
+
+    def test_initial_sync(self):
+        self.assertEqual(len(self.mirror), 22)
+        self.assertEqual(self.mirror.layer_counts(), {"0": 11, "A-WALL": 11})
+        self.assertEqual(self.mirror.open_polylines(), {self.open_pl.handle})
+        self.assertEqual(len(self.mirror.handles(layer="A-WALL", object_name="AcDbLine")), 10)
+
+    def test_refresh_costs_only_the_changes(self):
+        msp = self.doc.ModelSpace
+        line = msp.AddLine((0, 0, 0), (9, 9, 0))
+        line.Layer = "A-WALL"
+        pl = FakeDispatch(self.open_pl)
+        pl.Closed = True
+        self.doc.HandleToObject(self.server.document.model_space.entities()[0].handle).Delete()
+        self.server.reset_counters()
+
+        self.assertEqual(self.mirror.refresh(), 3)
+        # ObjectID of the 3 touched objects (the erase event carries it), then
+        # Handle, OwnerID, ObjectName, Layer (+ Closed) of the 2 survivors
+        self.assertEqual(self.server.round_trips, 3 + 4 + 5)
+        self.assertEqual(self.mirror.layer_counts(), {"0": 10, "A-WALL": 12})
+        self.assertEqual(self.mirror.open_polylines(), set())
+        self.assertEqual(self.mirror.row(line.Handle)["Layer"], "A-WALL")
+        self.server.reset_counters()
+        self.assertEqual(self.mirror.refresh(), 0)
+        self.assertEqual(self.server.round_trips, 0)
+
+    def test_non_entities_and_undone_adds_are_ignored(self):
+        layer = self.doc.Layers.Add("A-DOOR")
+        layer.LayerOn = False
+        line = self.doc.ModelSpace.AddLine((0, 0, 0), (1, 0, 0))
+        line.Delete()
+        self.assertEqual(self.mirror.refresh(), 0)
+        self.assertEqual(len(self.mirror), 22)
+        self.assertNotIn("A-DOOR", self.mirror.layer_counts())
+
+    def test_resync_after_close(self):
+        self.mirror.close()
+        self.server.document.add_line((0, 0), (2, 0), layer="A-WALL")
+        self.assertFalse(self.server.pending_events)
+        self.assertEqual(self.mirror.refresh(), 23)
+        self.assertEqual(self.mirror.resyncs, 2)
+        self.assertEqual(self.mirror.layer_counts()["A-WALL"], 12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+import os
+import re
+import time
+import unittest
+
+from command_runner import CommandWatcher
+from com_arrays import flat_doubles
+from draw_batch import DrawBatch, lisp_number
+from fake_acad import FakeAutoCAD, FakeComError, with_events
+
+
+def read_sexpr(text):
+    """Just enough of the Lisp reader for db:run calls: lists, strings, numbers, symbols."""
+    tokens = re.findall(r'"(?:\\.|[^"\\])*"|[()\']|[^\s()\']+', text)
+
+    def parse(i):
+        token = tokens[i]
+        if token == "(":
+            items, i = [], i + 1
+            while tokens[i] != ")":
+                item, i = parse(i)
+                items.append(item)
+            return items, i + 1
+        if token == "'":
+            return parse(i + 1)
+        if token.startswith('"'):
+            return re.sub(r'\\(.)', r'\1', token[1:-1]), i + 1
+        try:
+            return float(token), i + 1
+        except ValueError:
+            return token, i + 1
+
+    return parse(0)[0]
+
+
+STYLE_ATTRIBUTES = {62: "color", 6: "linetype", 370: "lineweight"}  # DXF group code -> fake attribute
+
+
+def fake_db_run(doc, expression):
+    """Stands in for AutoLISP evaluating the batch payload against the fake store."""
+    if expression.startswith("(load "):
+        with open(read_sexpr(expression)[1]) as f:
+            expression = f.read()
+    _, layers, ops, out, token = read_sexpr(expression[expression.rindex("(db:run "):])
+    for name in layers:
+        doc.add_layer(name)
+    results = []
+    for op in ops:
+        kind, args = op[0], op[1:]
+        try:
+            if kind == "L":
+                e = doc.add_line(args[1], args[2], layer=args[0] or doc.active_layer)
+            elif kind == "P":
+                verts = args[4:]
+                e = doc.add_polyline([c for v in verts for c in v[:2]], closed=bool(args[1]),
+                                     bulges=[v[2] for v in verts], layer=args[0] or doc.active_layer)
+                e.elevation = args[3]
+                for code, _, value in args[2]:
+                    setattr(e, STYLE_ATTRIBUTES[int(code)], value if isinstance(value, str) else int(value))
+            elif kind == "Y":
+                e = doc.HandleToObject(args[0])
+                e.layer = doc.layer(args[1]).name
+            else:
+                e = doc.HandleToObject(args[0])
+                doc._erase(e)
+            results.append(e.handle)
+        except FakeComError:
+            results.append("nil")
+    with open(out, "w") as f:
+        f.write("\n".join(results + ["END " + token]) + "\n")
+
+
+class TestDrawBatch(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeAutoCAD()
+        self.store = self.server.document
+        self.store.lisp_handler = fake_db_run
+        self.doc = self.server.connect().ActiveDocument
+        self.watcher = CommandWatcher(self.doc, events=with_events, pump=self.server.pump_events,
+                                      wait=time.sleep)
+        self.old = self.store.add_line((0, 0), (1, 1))
+
+    def tearDown(self):
+        self.watcher.close()
+
+    def build(self, n):
+        batch = DrawBatch()
+        for i in range(n):
+            batch.line((i, 0), (i, 1.5e-5), layer="A-WALL")
+        batch.polyline([(0, 0), (4, 0), (4, 2)], closed=True, layer='Say "hi"', bulges=[0, 0.5, 0],
+                       elevation=2.5, color=1, lineweight=25)
+        batch.set_layer(self.old.handle, "A-WALL")
+        batch.erase("FFFF")
+        return batch
+
+    def test_script_mode_is_one_round_trip(self):
+        batch = self.build(200)
+        self.server.reset_counters()
+        handles = batch.run(self.doc, mode="script", watcher=self.watcher)
+        self.assertEqual(self.server.round_trips, 1)
+        self.assertEqual(len(handles), 203)
+        self.assertEqual(handles[-2:], [self.old.handle, None])
+        pl = self.store.HandleToObject(handles[200])
+        self.assertEqual((pl.layer, pl.closed, pl.bulges), ('Say "hi"', True, [0.0, 0.5, 0.0]))
+        self.assertEqual(self.store.HandleToObject(handles[5]).end, (5.0, 1.5e-5, 0.0))
+        self.assertEqual(self.old.layer, "A-WALL")
+        self.assertEqual(self.store.commands[-1][:7], "(load \"")
+        script = self.store.commands[-1][7:-3]
+        self.assertFalse(os.path.exists(script) or os.path.exists(script[:-4] + ".txt"))
+
+    def test_com_mode_matches_script_mode(self):
+        batch = self.build(3)
+        com = batch.run(self.doc, mode="auto", to_variant=flat_doubles)
+        self.assertGreater(self.server.round_trips, len(batch))
+        self.assertEqual(com[-1], None)
+        script = self.build(3).run(self.doc, mode="script", watcher=self.watcher)
+        self.assertTrue(self.store.commands[-1].startswith("(progn"))
+        for a, b in zip(com[:4], script[:4]):
+            ea, eb = self.store.HandleToObject(a), self.store.HandleToObject(b)
+            self.assertEqual((type(ea), ea.layer), (type(eb), eb.layer))
+        self.assertEqual(self.store.HandleToObject(com[3]).bulges, [0.0, 0.5, 0.0])
+        styles = [(e.elevation, e.color, e.linetype, e.lineweight)
+                  for e in (self.store.HandleToObject(h) for h in (com[3], script[3]))]
+        self.assertEqual(styles, [(2.5, 1, "ByLayer", 25)] * 2)
+
+    def test_lisp_literals(self):
+        self.assertEqual(lisp_number(2), "2.0")
+        self.assertEqual(float(lisp_number(1.5e-5)), 1.5e-5)
+        self.assertNotIn("e", lisp_number(1.5e-5))
+        for value in (1.5e-20, -3.25e-12, 6.02e23, 1e300):
+            text = lisp_number(value)
+            self.assertEqual(float(text), value)
+            self.assertNotIn("e", text)
+        with self.assertRaises(ValueError):
+            DrawBatch().polyline([(0, 0)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+import numpy as np
+
+import facade_builder as fb
+
+
+def loop_rects(centers, sills, width, height):
+    # The nested loops the list functions used to run
+    return [[(x - width / 2, y), (x + width / 2, y), (x + width / 2, y + height),
+             (x - width / 2, y + height), (x - width / 2, y)] for x in centers for y in sills]
+
+
+class TestFacadeBuilder(unittest.TestCase):
+    def test_list_outputs_unchanged(self):
+        self.assertEqual(fb.get_window_rects(), loop_rects(fb.get_col_centers(), fb.SILL_HEIGHTS, 1.0, 1.0))
+        self.assertEqual(fb.get_door_rects(), loop_rects(fb.get_col_centers(), [0.0], 1.0, 2.0))
+        self.assertEqual(fb.get_stair_windows(), loop_rects(fb.get_stair_centers(), [2.5], 1.0, 10.0))
+
+    def test_rings_and_metadata(self):
+        openings = fb.facade_openings()
+        self.assertEqual(openings.rings.shape, (17, 5, 2))
+        self.assertEqual(openings.rings.dtype, np.float64)
+        np.testing.assert_array_equal(openings.rings[:, 0], openings.rings[:, 4])
+        windows = openings.select("window")
+        self.assertEqual(len(windows), 12)
+        self.assertEqual(windows.meta["bay"].tolist(), [0] * 4 + [1] * 4 + [2] * 4)
+        self.assertEqual(windows.meta["level"].tolist(), [0, 1, 2, 3] * 3)
+        self.assertEqual(openings.select(fb.KIND_STAIR).meta["height"].tolist(), [10.0, 10.0])
+
+    def test_rects_view(self):
+        openings = fb.window_openings()
+        view = openings.rects
+        self.assertEqual(len(view), 12)
+        self.assertEqual(view[5], fb.get_window_rects()[5])
+        self.assertEqual(list(view[-2:]), fb.get_window_rects()[-2:])
+        self.assertIs(view.rings, openings.rings)
+
+    def test_sizes_broadcast_per_opening(self):
+        openings = fb.grid_openings(fb.KIND_WINDOW, [0.0, 10.0], [1.0, 4.0], width=[[1.0], [2.0]], height=1.5)
+        self.assertEqual(openings.meta["width"].tolist(), [1.0, 1.0, 2.0, 2.0])
+        self.assertEqual(openings.rings[3].tolist(), [[9.0, 4.0], [11.0, 4.0], [11.0, 5.5], [9.0, 5.5], [9.0, 4.0]])
+        self.assertEqual(len(fb.Openings.concat([])), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
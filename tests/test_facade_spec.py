@@ -0,0 +1,82 @@
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import facade_builder as fb
+from facade_spec import GeometryCache, build_facade, load_spec, spec_hash
+
+SPEC_PATH = os.path.join(os.path.dirname(fb.__file__), "facade.json")
+
+
+class TestFacadeSpec(unittest.TestCase):
+    def setUp(self):
+        self.spec = load_spec(SPEC_PATH)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_example_spec_is_the_builtin_facade(self):
+        facade = build_facade(self.spec)
+        np.testing.assert_array_equal(facade.openings.rings, fb.facade_openings().rings)
+        layers = facade.by_layer()
+        self.assertEqual(layers["A-GLAZ"], fb.get_window_rects())
+        self.assertEqual(layers["A-DOOR"], fb.get_door_rects())
+        self.assertEqual(layers["A-STAIR-GLAZ"], fb.get_stair_windows())
+
+    def test_toml_ranges_and_subsets(self):
+        path = os.path.join(self.tmp.name, "tower.toml")
+        with open(path, "w") as f:
+            f.write('bays = {start = 2.0, spacing = 4.0, count = 5}\n'
+                    'levels = {start = 1.0, spacing = 3.0, count = 10}\n'
+                    '[[openings]]\nname = "slot"\nbays = [0, 4]\nlevels = [2, 3]\nheight = 2.5\n')
+        slot = build_facade(load_spec(path)).parts[0].openings
+        self.assertEqual(slot.meta["bay"].tolist(), [0, 0, 4, 4])
+        self.assertEqual(slot.meta["level"].tolist(), [2, 3, 2, 3])
+        self.assertEqual(slot.rings[3].tolist(), [[17.5, 10.0], [18.5, 10.0], [18.5, 12.5], [17.5, 12.5], [17.5, 10.0]])
+        with self.assertRaises(ValueError):
+            build_facade({"bays": [0.0], "openings": [{"bays": [3]}]})
+
+    def test_sweep_rebuilds_only_changed_parts(self):
+        cache = GeometryCache(self.tmp.name)
+        first = build_facade(self.spec, cache)
+        self.assertEqual((cache.hits, cache.misses), (0, 4))
+        variant = json.loads(json.dumps(self.spec))
+        variant["openings"][1]["height"] = 2.2  # taller doors only
+        second = build_facade(variant, cache)
+        self.assertEqual((cache.hits, cache.misses), (3, 5))
+        self.assertNotEqual(spec_hash(variant), spec_hash(self.spec))
+        self.assertEqual(second.parts[0].key, first.parts[0].key)
+        np.testing.assert_array_equal(second.parts[0].openings.rings, first.parts[0].openings.rings)
+        self.assertEqual(second.parts[1].openings.rings[:, 2, 1].tolist(), [2.2] * 3)
+
+    def test_eviction_keeps_most_recent(self):
+        cache = GeometryCache(self.tmp.name)
+        big = fb.grid_openings(fb.KIND_WINDOW, np.arange(100.0), np.arange(10.0))
+        for n, key in enumerate("abcde"):
+            cache.put(key, big)
+            cache.max_bytes = min(cache.max_bytes, 3 * cache.size())  # room for three
+            os.utime(cache._path(key), ns=(n * 10**9, n * 10**9))  # a is the oldest, e the newest
+        self.assertLessEqual(cache.size(), cache.max_bytes)
+        self.assertIsNone(cache.get("a"))
+        self.assertIsNotNone(cache.get("e"))
+        self.assertEqual(cache.evictions, 2)
+
+    def test_corrupt_entry_is_a_miss(self):
+        cache = GeometryCache(self.tmp.name)
+        openings = fb.grid_openings(fb.KIND_DOOR, [1.0, 2.0], [0.0])
+        cache.put("k", openings)
+        with open(cache._path("k"), "r+b") as f:
+            f.write(b"not a zip file")  # overwrites the archive header
+        self.assertIsNone(cache.get("k"))
+        with open(cache._path("k"), "wb"):
+            pass  # empty, as a crash before the first write would leave it
+        self.assertIsNone(cache.get("k"))
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+        cache.put("k", openings)
+        np.testing.assert_array_equal(cache.get("k").rings, openings.rings)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import time
+import unittest
+
+import dispatch_metadata
+from bulk_read import read_properties
+from fake_acad import (DISP_E_MEMBERNOTFOUND, ACAD_E_KEY_NOT_FOUND, FakeAutoCAD, FakeComError,
+                       acSelectionSetAll)
+
+
+class TestFakeAutoCAD(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeAutoCAD()
+        self.doc = self.server.connect().ActiveDocument
+        self.msp = self.doc.ModelSpace
+
+    def test_entities_through_client_objects(self):
+        pl = self.msp.AddLightWeightPolyline((0, 0, 10, 0, 10, 5, 0, 5))
+        pl.Closed = True
+        self.msp.AddLine((0, 0, 0), (3, 4, 0))
+        self.assertEqual(pl.ObjectName, "AcDbPolyline")
+        self.assertEqual(pl.Area, 50.0)
+        self.assertEqual(pl.Length, 30.0)
+        self.assertEqual([e.ObjectName for e in self.msp], ["AcDbPolyline", "AcDbLine"])
+        self.assertEqual(self.doc.HandleToObject(pl.Handle), pl)
+
+    def test_dispatch_by_wrapper_dispids(self):
+        line = self.server.document.add_line((0, 0), (3, 4))
+        meta = dispatch_metadata.load_metadata()["IAcadLine"]
+        dispid, flags, ret_type, arg_types = meta.prop_get["Length"][:4]
+        self.assertEqual(line.InvokeTypes(dispid, 0, flags, ret_type, arg_types), 5.0)
+        with self.assertRaises(FakeComError) as ctx:
+            line.InvokeTypes(99999, 0, 2, (5, 0), ())
+        self.assertEqual(ctx.exception.hresult, DISP_E_MEMBERNOTFOUND)
+
+    def test_typed_wrapper_reads(self):
+        store = self.server.document
+        store.add_layer("A-GLAZ")
+        store.add_polyline((0, 0, 2, 0, 2, 2), closed=True, layer="A-GLAZ")
+        store.add_line((0, 0), (1, 0))
+
+        class Entity:
+            _prop_map_get_ = dispatch_metadata.load_metadata()["IAcadEntity"].prop_get
+
+            def __init__(self, ole):
+                self.__dict__["_oleobj_"] = ole
+
+        table = read_properties([Entity(e) for e in store.model_space.entities()], ["Layer", "Area"])
+        self.assertEqual(table["Layer"], ["A-GLAZ", "0"])
+        self.assertEqual(table["Area"][0], 2.0)
+        self.assertEqual(table.valid["Area"].tolist(), [True, False])
+
+    def test_layers_and_selection_sets(self):
+        line = self.msp.AddLine((0, 0, 0), (1, 0, 0))
+        with self.assertRaises(FakeComError) as ctx:
+            line.Layer = "A-WALL"
+        self.assertEqual(ctx.exception.excepinfo[5], ACAD_E_KEY_NOT_FOUND)
+        self.doc.Layers.Add("A-WALL")
+        line.Layer = "A-WALL"
+        self.msp.AddLine((0, 1, 0), (1, 1, 0))
+
+        sset = self.doc.SelectionSets.Add("WALLS")
+        sset.Select(acSelectionSetAll, None, None, (0, 8), ("LINE", "A-*"))
+        self.assertEqual(sset.Count, 1)
+        sset.Erase()
+        self.assertEqual(self.msp.Count, 1)
+
+    def test_latency_per_round_trip(self):
+        self.server.latency = 0.002
+        self.server.reset_counters()
+        t0 = time.perf_counter()
+        for _ in range(5):
+            self.doc.Name
+        self.assertGreaterEqual(time.perf_counter() - t0, 0.01)
+        self.assertEqual(self.server.round_trips, 5)
+        self.assertEqual(self.server.calls[("IAcadDocument", "Name")], 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+
+import AutoCAD_Wrapper_index
+import build_lazy_wrapper
+from wrapper_source import WrapperSource
+
+
+class TestLazyWrapperIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.source = WrapperSource()
+
+    def test_index_is_current(self):
+        """The committed index must match a fresh build of AutoCAD_Wrapper.py."""
+        with open(AutoCAD_Wrapper_index.__file__) as f:
+            committed = f.read()
+        self.assertEqual(committed, build_lazy_wrapper.render_index(self.source),
+                         "Run utils/build_lazy_wrapper.py to refresh the index.")
+
+    def test_spans_slice_whole_classes(self):
+        data = self.source.data
+        for name, (start, end, lineno, kind, deps) in AutoCAD_Wrapper_index.CLASS_SPANS.items():
+            self.assertTrue(data[start:end].startswith(b"class " + name.encode()), name)
+            for dep in deps:
+                self.assertIn(dep, AutoCAD_Wrapper_index.CLASS_SPANS)
+
+    def test_every_registered_clsid_is_indexed(self):
+        for clsid, name in AutoCAD_Wrapper_index.CLSID_TO_NAME.items():
+            self.assertIn(name, AutoCAD_Wrapper_index.CLASS_SPANS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import math
+import unittest
+
+import numpy as np
+
+from fake_acad import FakeAutoCAD
+from polyline_batch import PolylineBatch, read_polylines
+
+
+class TestPolylineBatch(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeAutoCAD()
+        doc = self.server.document
+        doc.add_polyline((0, 0, 10, 0, 10, 5, 0, 5), closed=True)
+        doc.add_polyline((0, 0, 4, 0, 4, 4), bulges=(1.0, 0, 0), closed=True)
+        doc.add_polyline((0, 0, 3, 0, 3, 3, 0, 0))
+        msp = self.server.connect().ActiveDocument.ModelSpace
+        self.polys = list(msp)
+        self.batch = read_polylines(self.polys)
+
+    def test_csr_layout(self):
+        self.assertEqual(self.batch.offsets.tolist(), [0, 4, 7, 11])
+        self.assertEqual(self.batch.vertices(1).tolist(), [[0, 0], [4, 0], [4, 4]])
+        self.assertEqual(self.batch.bulges[4], 1.0)
+        self.assertEqual(self.batch.closed.tolist(), [True, True, False])
+        self.assertTrue(self.batch.valid.all())
+
+    def test_vectorized_geometry_matches_autocad(self):
+        expected_area = [p.Area for p in self.polys]
+        expected_length = [p.Length for p in self.polys]
+        np.testing.assert_allclose(self.batch.areas(), expected_area)
+        np.testing.assert_allclose(self.batch.lengths(), expected_length)
+        self.assertEqual(self.batch.bounds()[0].tolist(), [0, 0, 10, 5])
+        self.assertEqual(self.batch.nearly_closed().tolist(), [False, False, True])
+
+    def test_skip_bulges_and_failed_reads(self):
+        self.server.document.add_line((0, 0), (1, 1))
+        self.server.reset_counters()
+        batch = read_polylines(list(self.server.connect().ActiveDocument.ModelSpace), bulges=False)
+        self.assertEqual(self.server.calls[("IAcadLWPolyline", "GetBulge")], 0)
+        self.assertEqual(batch.valid.tolist(), [True, True, True, False])
+        self.assertEqual(batch.counts()[3], 0)
+        self.assertTrue(math.isnan(batch.bounds()[3, 0]))
+
+    def test_from_vertices(self):
+        batch = PolylineBatch.from_vertices([[(0, 0), (2, 0), (2, 2)], [(0, 0), (1, 0), (1, 1), (0, 1)]],
+                                            closed=[True, True])
+        self.assertEqual(batch.areas().tolist(), [2.0, 1.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import random
+import unittest
+
+import numpy as np
+
+from com_arrays import flat_doubles
+from fake_acad import FakeAutoCAD
+from polyline_join import join_drawing, join_paths, snap_points
+
+
+def plain_filter(codes, values):
+    return codes, values
+
+
+def plain_objects(objects):
+    return list(objects)
+
+
+def square_soup(n, size=1.0, jitter=1e-8, seed=0):
+    """n unit squares as four lines each, shuffled, some reversed, ends off by up to jitter."""
+    rng = random.Random(seed)
+    lines = []
+    for k in range(n):
+        x0 = 3.0 * k
+        corners = [(x0, 0.0), (x0 + size, 0.0), (x0 + size, size), (x0, size)]
+        for i in range(4):
+            p, q = corners[i], corners[(i + 1) % 4]
+            q = (q[0] + rng.uniform(-jitter, jitter), q[1] + rng.uniform(-jitter, jitter))
+            lines.append([q, p] if rng.random() < 0.5 else [p, q])
+    rng.shuffle(lines)
+    return lines
+
+
+class TestJoinPaths(unittest.TestCase):
+    def test_segment_soup_becomes_closed_rings(self):
+        result = join_paths(square_soup(200), tol=1e-6)
+        self.assertEqual(len(result.paths), 200)
+        self.assertTrue(result.closed.all())
+        self.assertEqual(sorted(len(s) for s in result.sources), [4] * 200)
+        areas = [0.5 * abs(np.dot(p[:, 0], np.roll(p[:, 1], -1)) - np.dot(p[:, 1], np.roll(p[:, 0], -1)))
+                 for p in result.paths]
+        np.testing.assert_allclose(areas, 1.0, atol=1e-6)
+
+    def test_chains_stop_at_branches_and_keep_polyline_vertices(self):
+        result = join_paths([[(0, 0), (1, 0)], [(2, 1), (2, 0), (1, 0)], [(1, 0), (1, -1)],
+                             [(5, 0), (6, 0)], [(6, 0), (6, 1), (7, 1)], [(3, 3), (3, 3)]])
+        by_sources = {tuple(s): (p.tolist(), c) for p, c, s in zip(*result[:3])}
+        self.assertEqual(by_sources[(3, 4)], ([[5, 0], [6, 0], [6, 1], [7, 1]], False))
+        self.assertEqual(len(result.paths), 4)  # three arms meet at (1, 0): nothing joins there
+        self.assertEqual(result.degenerate, [5])
+
+    def test_duplicate_and_reversed_pieces_are_left_alone(self):
+        result = join_paths([[(0, 0), (1, 0)], [(1, 0), (0, 0)], [(5, 0), (6, 0)], [(5, 0), (6, 0)],
+                             [(0, 2), (1, 2)], [(1, 2), (1, 3)], [(1, 3), (0, 2)]])
+        by_sources = {tuple(s): (p.tolist(), c) for p, c, s in zip(*result[:3])}
+        self.assertEqual(by_sources, {(0,): ([[0, 0], [1, 0]], False), (1,): ([[1, 0], [0, 0]], False),
+                                      (2,): ([[5, 0], [6, 0]], False), (3,): ([[5, 0], [6, 0]], False),
+                                      (4, 5, 6): ([[0, 2], [1, 2], [1, 3]], True)})
+
+    def test_snapping_across_cell_borders(self):
+        tol = 1e-3
+        nodes, firsts = snap_points([(0.0, 0.0), (0.0009999, 0.0), (-0.0005, -0.0005), (0.0021, 0.0)], tol)
+        self.assertEqual(nodes.tolist(), [0, 0, 0, 1])
+        self.assertEqual(firsts.tolist(), [[0.0, 0.0], [0.0021, 0.0]])
+
+
+class TestJoinDrawing(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeAutoCAD()
+        self.store = self.server.document
+        self.doc = self.server.connect().ActiveDocument
+        self.store.add_layer("A-GLAZ")
+
+    def test_join_in_drawing(self):
+        for p, q in square_soup(3, jitter=0.0):
+            self.store.add_line(p, q, layer="A-GLAZ")
+        self.store.add_polyline((10, 10, 11, 10, 11, 11, 10, 11, 10, 10), layer="A-GLAZ")  # open, ends meet
+        self.store.add_polyline((20, 0, 21, 0, 21, 1), bulges=(0.5, 0, 0))
+        self.store.add_line((20, 1), (20, 0))  # meets an arc polyline: left alone
+        report = join_drawing(self.doc, mode="com", to_variant=flat_doubles, to_variants=plain_filter,
+                              to_objects=plain_objects)
+        self.assertEqual((report.pieces, report.skipped, report.polylines, report.closed), (15, 1, 4, 4))
+        self.assertEqual((report.erased, report.failed), (13, 0))
+        names = sorted((e.ObjectName, e.Layer, e.Closed if e.ObjectName == "AcDbPolyline" else None)
+                       for e in self.doc.ModelSpace)
+        self.assertEqual(names, [("AcDbLine", "0", None), ("AcDbPolyline", "0", False)]
+                         + [("AcDbPolyline", "A-GLAZ", True)] * 4)
+        areas = sorted(e.Area for e in self.doc.ModelSpace if e.Layer == "A-GLAZ")
+        np.testing.assert_allclose(areas, [1.0] * 4)
+
+    def test_join_keeps_color_linetype_lineweight_and_elevation(self):
+        def square(x0, z=0.0, **style):
+            corners = [(x0, 0.0, z), (x0 + 1, 0.0, z), (x0 + 1, 1.0, z), (x0, 1.0, z)]
+            for i in range(4):
+                line = self.store.add_line(corners[i], corners[(i + 1) % 4], layer="A-GLAZ")
+                for name, value in style.items():
+                    setattr(line, name, value)
+
+        square(0.0, z=3.0, color=1, linetype="DASHED", lineweight=35)
+        square(0.0, z=0.0)  # the same outline lower down: a ring of its own
+        square(5.0, color=2)
+        self.store.add_line((5, 0, 0), (6, 0, 1))  # sloped: left alone
+        report = join_drawing(self.doc, mode="com", to_variant=flat_doubles, to_variants=plain_filter,
+                              to_objects=plain_objects)
+        self.assertEqual((report.polylines, report.closed, report.skipped, report.erased), (3, 3, 1, 12))
+        styles = sorted((e.Elevation, e.color, e.Linetype, e.Lineweight, e.Area)
+                        for e in self.doc.ModelSpace if e.ObjectName == "AcDbPolyline")
+        self.assertEqual(styles, [(0.0, 2, "ByLayer", -1, 1.0), (0.0, 256, "ByLayer", -1, 1.0),
+                                  (3.0, 1, "DASHED", 35, 1.0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
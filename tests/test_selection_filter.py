@@ -0,0 +1,85 @@
+import random
+import unittest
+
+from fake_acad import FakeAutoCAD, matches_filter
+from selection_filter import F, MODEL, PAPER, compile_filter, purge_selection_sets, select, selection
+
+
+def plain(codes, values):
+    return codes, values
+
+
+class TestSelectionFilter(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeAutoCAD()
+        self.store = self.server.document
+        self.doc = self.server.connect().ActiveDocument
+        for name in ("A-GLAZ", "A-WALL", "X.1", "X-1"):
+            self.store.add_layer(name)
+
+    def test_compiles_to_group_codes(self):
+        built = (F.layer == "A-GLAZ") & F.type.isin({"LWPOLYLINE", "LINE"})
+        text = compile_filter('layer == "A-GLAZ" and type in {"LWPOLYLINE", "LINE"}')
+        self.assertEqual(built.pairs(), [(8, "A-GLAZ"), (0, "LINE,LWPOLYLINE")])
+        self.assertEqual(text.pairs(), built.pairs())
+        self.assertEqual((F.layer == "X.1").pairs(), [(8, "X`.1")])
+        self.assertEqual(compile_filter('(layer.like("A-*") or color >= 3) and not flags.has(1)').pairs(),
+                         [(-4, "<OR"), (8, "A-*"), (-4, ">="), (62, 3), (-4, "OR>"),
+                          (-4, "<NOT"), (-4, "&="), (70, 1), (-4, "NOT>")])
+        self.assertEqual(((F.type == "LINE") | (F.type == "ARC")).compile(), ((0,), ("LINE,ARC",)))
+        with self.assertRaises(ValueError):
+            compile_filter("layer.upper() == 'A'")
+        with self.assertRaises(TypeError):
+            F.layer > "A"
+
+    def test_only_matching_entities_cross_over(self):
+        for i in range(50):
+            self.store.add_line((i, 0), (i, 1), layer="A-WALL")
+        for i in range(5):
+            self.store.add_polyline((0, 0, 1, 0, 1, 1), closed=i % 2 == 0, layer="A-GLAZ")
+        self.store.add_line((0, 0), (1, 1), layer="A-GLAZ", paper=True)
+        self.server.reset_counters()
+
+        with selection(self.doc, (F.layer == "a-glaz") & (F.space == MODEL), to_variants=plain) as ss:
+            self.assertEqual(ss.Count, 5)
+            self.assertEqual(self.doc.SelectionSets.Count, 1)
+        self.assertEqual(self.doc.SelectionSets.Count, 0)  # deleted on exit
+        closed = select(self.doc, 'type == "LWPOLYLINE" and flags.has(1)', to_variants=plain)
+        self.assertEqual(len(closed), 3)
+        self.assertLess(self.server.round_trips, 30)
+
+        paper = select(self.doc, (F.space == PAPER) & (F.layout == "Layout1"), to_variants=plain)
+        self.assertEqual([e.Layer for e in paper], ["A-GLAZ"])
+
+    def test_fake_agrees_with_python_predicates(self):
+        rng = random.Random(7)
+        layers = ["0", "A-GLAZ", "A-WALL", "X.1", "X-1"]
+        entities = []
+        for i in range(60):
+            layer = rng.choice(layers)
+            if rng.random() < 0.5:
+                e = self.store.add_line((0, 0), (1, i), layer=layer)
+            else:
+                e = self.store.add_polyline((0, 0, 1, 0, 1, i), closed=rng.random() < 0.5, layer=layer)
+            e.color = rng.randrange(1, 8)
+            entities.append(e)
+        cases = [
+            ((F.layer == "X.1"), lambda e: e.layer == "X.1"),
+            (F.layer.like("A-*") & (F.color > 3), lambda e: e.layer.startswith("A-") and e.color > 3),
+            (~(F.layer.isin(["0", "X-1"]) | (F.color == 2)),
+             lambda e: not (e.layer in ("0", "X-1") or e.color == 2)),
+            ((F.type == "LWPOLYLINE") & ~F.flags.has(1) & (F.layer != "0"),
+             lambda e: e.dxf_name == "LWPOLYLINE" and not e.closed and e.layer != "0"),
+            (F.color.isin([1, 5]) | (F.layer.like("~A-*") & (F.color <= 2)),
+             lambda e: e.color in (1, 5) or (not e.layer.startswith("A-") and e.color <= 2)),
+        ]
+        for flt, predicate in cases:
+            codes, values = flt.compile()
+            self.assertEqual([matches_filter(e, codes, values) for e in entities],
+                             [predicate(e) for e in entities], flt.pairs())
+
+    def test_purges_stale_selection_sets(self):
+        self.doc.SelectionSets.Add("PYSEL_LEFTOVER")
+        self.doc.SelectionSets.Add("USER_SET")
+        self.assertEqual(purge_selection_sets(self.doc), 1)
+        self.assertEqual([s.Name for s in self.doc.SelectionSets], ["USER_SET"])
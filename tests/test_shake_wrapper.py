@@ -0,0 +1,55 @@
+import ast
+import os
+import tempfile
+import unittest
+
+import shake_wrapper
+from dispatch_metadata import extract_metadata
+from wrapper_source import WrapperSource
+
+
+class TestShakeWrapper(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.source = WrapperSource()
+        cls.interfaces = extract_metadata(cls.source)
+
+    def test_only_used_members_are_followed(self):
+        used = {"ActiveDocument", "ModelSpace", "AddLine"}
+        kept = shake_wrapper.reachable(self.interfaces, ["IAcadApplication"], used)
+        self.assertEqual(kept, {"IAcadApplication", "IAcadDocument", "IAcadModelSpace", "IAcadLine"})
+        everything = shake_wrapper.reachable(self.interfaces, ["IAcadApplication"])
+        self.assertGreater(len(everything), 100)
+        self.assertLessEqual(kept, everything)
+
+    def test_scan_ignores_docstrings(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "script.py")
+            with open(path, "w") as f:
+                f.write('"""Mentions AddPolyfaceMesh."""\n'
+                        'def f(doc):\n    """And IAcadHatch."""\n'
+                        '    return doc.ModelSpace.AddLine, "AcDbPolyline, AcDbLine"\n')
+            names = shake_wrapper.scan_names([path])
+        self.assertTrue({"ModelSpace", "AddLine", "AcDbPolyline", "AcDbLine"} <= names)
+        self.assertFalse({"AddPolyfaceMesh", "IAcadHatch"} & names)
+
+    def test_slim_wrapper_keeps_classes_and_maps(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            out = os.path.join(tmp, "AutoCAD_Wrapper_slim.py")
+            kept = shake_wrapper.build_slim(out, keep=["IAcadLWPolyline"])
+            with open(out, encoding="ascii") as f:
+                text = f.read()
+        self.assertEqual(kept, ["IAcadApplication", "IAcadLWPolyline"])
+        tree = ast.parse(text)
+        classes = {node.name for node in tree.body if isinstance(node, ast.ClassDef)}
+        self.assertTrue({"IAcadApplication", "AcadApplication", "IAcadLWPolyline", "AcadLWPolyline"} <= classes)
+        self.assertNotIn("IAcadHatch", classes)
+        self.assertNotIn("constants", classes)
+        self.assertIn("from win32com.client import DispatchBaseClass\n", text)
+        registered = next(node.value for node in tree.body if isinstance(node, ast.Assign)
+                          and node.targets[0].id == "CLSIDToClassMap")
+        self.assertTrue({v.id for v in registered.values} <= classes)
+
+
+if __name__ == '__main__':
+    unittest.main()